@@ -11,13 +11,15 @@ import httpx
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 from fastapi import APIRouter, HTTPException, Depends, WebSocket, WebSocketDisconnect
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 import structlog
-import json
 
 # 데이터베이스 및 모델 임포트
 from app.models.database import get_db, Tenant, Service
-from app.core.database_manager import db_manager
+from app.core.database_manager import db_manager, table_consistency_keys
+from app.core.monitoring_broadcaster import MonitoringBroadcaster
+from app.core.response_cache import TENANT_WRITE_TABLES, cached_endpoint, response_cache_status
 
 logger = structlog.get_logger(__name__)
 
@@ -27,7 +29,11 @@ router = APIRouter(prefix="/simulator/monitoring/advanced", tags=["advanced-moni
 # 시뮬레이터 URL
 SIMULATOR_URL = "http://localhost:6360"
 
+# [advice from AI] 테넌시/서비스 최근 쓰기가 복제본에 반영되기 전이면 primary에서 조회
+TENANT_READ_KEYS = table_consistency_keys(TENANT_WRITE_TABLES)
+
 @router.get("/realtime")
+@cached_endpoint(invalidate_on=TENANT_WRITE_TABLES)
 async def get_realtime_monitoring_data():
     """
     실시간 모니터링 데이터 - 테넌시별 리소스 사용률
@@ -36,11 +42,10 @@ async def get_realtime_monitoring_data():
         logger.info("실시간 모니터링 데이터 조회 시작")
         
         # 데이터베이스에서 활성 테넌시 조회
-        db = db_manager.get_session()
-        try:
-            active_tenants = db.query(Tenant).filter(Tenant.status.in_(["running", "deploying"])).all()
-        finally:
-            db.close()
+        async with db_manager.get_async_session(read_only=True, consistency_key=TENANT_READ_KEYS) as db:
+            active_tenants = (await db.scalars(
+                select(Tenant).where(Tenant.status.in_(["running", "deploying"]))
+            )).all()
         
         # 시뮬레이터 데이터 조회
         simulator_data = await get_simulator_health_data()
@@ -94,6 +99,7 @@ async def get_realtime_monitoring_data():
 
 
 @router.get("/tenants")
+@cached_endpoint(invalidate_on=TENANT_WRITE_TABLES)
 async def get_tenant_comparison_data():
     """
     테넌시별 성능 비교 데이터
@@ -102,14 +108,18 @@ async def get_tenant_comparison_data():
         logger.info("테넌시 비교 데이터 조회 시작")
         
         # 데이터베이스에서 테넌시 조회
-        db = db_manager.get_session()
-        try:
-            tenants = db.query(Tenant).all()
+        async with db_manager.get_async_session(read_only=True, consistency_key=TENANT_READ_KEYS) as db:
+            tenants = (await db.scalars(select(Tenant))).all()
+            
+            # 테넌시별 서비스 개수 (단일 집계 쿼리)
+            services_counts = dict((await db.execute(
+                select(Service.tenant_id, func.count(Service.id)).group_by(Service.tenant_id)
+            )).all())
             
             comparison_data = []
             for tenant in tenants:
                 # 서비스 개수 계산
-                services_count = db.query(Service).filter(Service.tenant_id == tenant.tenant_id).count()
+                services_count = services_counts.get(tenant.tenant_id, 0)
                 
                 # 테넌시별 성능 메트릭 생성
                 performance_metrics = generate_tenant_performance_metrics(tenant, services_count)
@@ -140,8 +150,6 @@ async def get_tenant_comparison_data():
                     "health_status": determine_health_status(performance_metrics),
                     "sla_status": "meeting" if performance_metrics["availability"] >= 99.5 else "warning"
                 })
-        finally:
-            db.close()
         
         logger.info(f"테넌시 비교 데이터 생성 완료: {len(comparison_data)}개 테넌시")
         
@@ -253,11 +261,8 @@ async def get_monitoring_alerts():
         logger.info("모니터링 알림 조회 시작")
         
         # 데이터베이스에서 테넌시 조회
-        db = db_manager.get_session()
-        try:
-            tenants = db.query(Tenant).all()
-        finally:
-            db.close()
+        async with db_manager.get_async_session(read_only=True, consistency_key=TENANT_READ_KEYS) as db:
+            tenants = (await db.scalars(select(Tenant))).all()
         
         # 알림 생성
         alerts = []
@@ -330,66 +335,70 @@ async def get_monitoring_alerts():
         )
 
 
+@router.get("/cache")
+async def get_response_cache_status():
+    """
+    대시보드 응답 캐시 상태 (엔드포인트별 항목 수, 적중/공유 계산/무효화 횟수)
+    """
+    return {"success": True, "caches": response_cache_status(), "timestamp": datetime.now().isoformat()}
+
+
+async def build_monitoring_bundle() -> Dict[str, Any]:
+    """WebSocket 통합 데이터 패키지 (실시간/테넌시 비교/SLA/알림)"""
+    realtime_data, tenant_data, sla_data, alerts_data = await asyncio.gather(
+        get_realtime_monitoring_data(),
+        get_tenant_comparison_data(),
+        get_sla_metrics(),
+        get_monitoring_alerts()
+    )
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "type": "monitoring_update",
+        "data": {
+            "realtime": realtime_data,
+            "tenants": tenant_data,
+            "sla": sla_data,
+            "alerts": alerts_data
+        }
+    }
+
+
+# [advice from AI] 연결 수와 관계없이 주기마다 한 번만 계산/직렬화 (구독자가 없으면 중지)
+monitoring_broadcaster = MonitoringBroadcaster(build_monitoring_bundle)
+
+
+@router.get("/ws/status")
+async def get_websocket_stream_status():
+    """
+    실시간 모니터링 WebSocket 스트림 상태 (구독자 수, 생산/전달/버림 횟수)
+    """
+    return {"success": True, "stream": monitoring_broadcaster.status(), "timestamp": datetime.now().isoformat()}
+
+
 @router.websocket("/ws/realtime")
 async def websocket_realtime_monitoring(websocket: WebSocket):
     """
     실시간 모니터링 데이터 WebSocket 스트리밍
-    - 5초마다 최신 모니터링 데이터 전송
+    - 5초마다 최신 모니터링 데이터 전송 (공유 생산자가 계산한 메시지를 구독)
     - 클라이언트 연결 관리
     """
     await websocket.accept()
     logger.info("WebSocket 실시간 모니터링 연결 수락")
+    queue = monitoring_broadcaster.subscribe()
     
     try:
         while True:
-            try:
-                # 실시간 데이터 수집
-                realtime_data = await get_realtime_monitoring_data()
-                tenant_data = await get_tenant_comparison_data()
-                sla_data = await get_sla_metrics()
-                alerts_data = await get_monitoring_alerts()
-                
-                # 통합 데이터 패키지 생성
-                streaming_data = {
-                    "timestamp": datetime.now().isoformat(),
-                    "type": "monitoring_update",
-                    "data": {
-                        "realtime": realtime_data,
-                        "tenants": tenant_data,
-                        "sla": sla_data,
-                        "alerts": alerts_data
-                    }
-                }
-                
-                # 클라이언트로 데이터 전송
-                await websocket.send_text(json.dumps(streaming_data, ensure_ascii=False))
-                logger.debug("WebSocket 모니터링 데이터 전송 완료")
-                
-                # 5초 대기
-                await asyncio.sleep(5)
-                
-            except WebSocketDisconnect:
-                logger.info("WebSocket 클라이언트 연결 해제")
-                break
-            except Exception as e:
-                logger.error(f"WebSocket 데이터 전송 오류: {e}")
-                # 오류 발생 시 클라이언트에 알림
-                error_message = {
-                    "timestamp": datetime.now().isoformat(),
-                    "type": "error",
-                    "message": f"데이터 수집 오류: {str(e)}"
-                }
-                try:
-                    await websocket.send_text(json.dumps(error_message, ensure_ascii=False))
-                except:
-                    break
-                await asyncio.sleep(10)  # 오류 시 10초 대기
+            message = await queue.get()
+            # 클라이언트로 데이터 전송
+            await websocket.send_text(message)
+            logger.debug("WebSocket 모니터링 데이터 전송 완료")
                 
     except WebSocketDisconnect:
         logger.info("WebSocket 연결 종료")
     except Exception as e:
         logger.error(f"WebSocket 연결 오류: {e}")
     finally:
+        monitoring_broadcaster.unsubscribe(queue)
         logger.info("WebSocket 실시간 모니터링 연결 정리")
 
 
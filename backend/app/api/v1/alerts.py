@@ -11,15 +11,22 @@ from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, func, select, bindparam
 import uuid
 import asyncio
 import logging
-import httpx
 import json
 
 from app.models.database import Alert, SessionLocal
-from app.core.database_manager import get_db_session
+from app.core.database_manager import db_manager, get_db_session, get_async_read_db_session
+from app.core.alert_aggregator import alert_aggregator, FOLDED, SUPPRESSED
+from app.services.alert_sync import ALERT_ROW_FIELDS, SimulatorAlertSync
+from app.services.threshold_evaluator import ThresholdEvaluator
+from app.core.anomaly_detector import AnomalyDetector
+from app.core.alert_stream import (
+    AlertCountCache, alert_sort_key, decode_cursor, encode_cursor, keyset_query, merge_alert_pages, recent_page
+)
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -63,6 +70,8 @@ class AlertResponse(BaseModel):
     timestamp: datetime
     created_at: datetime
     updated_at: Optional[datetime]
+    occurrence_count: int = 1  # [advice from AI] 집계된 반복 발생 횟수
+    last_seen_at: Optional[datetime] = None
 
 class AlertListResponse(BaseModel):
     """알림 목록 응답 모델"""
@@ -82,91 +91,18 @@ class AlertUpdateStatus(BaseModel):
 recent_alerts: List[Dict[str, Any]] = []
 RECENT_ALERTS_TTL = 10 * 60  # 10분
 
-# [advice from AI] K8s 시뮬레이터 동기화 함수
-async def sync_alerts_from_k8s_simulator():
-    """K8s 시뮬레이터에서 알림을 가져와 ECP 시스템에 동기화"""
-    try:
-        async with httpx.AsyncClient() as client:
-            # K8s 시뮬레이터에서 알림 데이터 가져오기
-            response = await client.get("http://k8s-simulator-backend:8000/sla/alerts/history", timeout=10.0)
-            
-            if response.status_code == 200:
-                simulator_data = response.json()
-                simulator_alerts = simulator_data.get('alerts', [])
-                
-                logger.info(f"K8s 시뮬레이터에서 {len(simulator_alerts)}개 알림 조회")
-                
-                if simulator_alerts:
-                    # 새로운 알림만 필터링하고 ECP 형식으로 변환
-                    for sim_alert in simulator_alerts[-5:]:  # 최근 5개만
-                        alert_id = f"k8s-sim-{sim_alert.get('id', 'unknown')}"
-                        
-                        # 중복 확인
-                        existing = next((a for a in recent_alerts if a.get('alert_id') == alert_id), None)
-                        if existing:
-                            continue
-                            
-                        # [advice from AI] 테넌시 정보 추가 - 랜덤하게 기존 테넌시 중 하나 선택
-                        import random
-                        
-                        # 기존 테넌시 목록 가져오기 (안전한 방법)
-                        selected_tenant = None
-                        try:
-                            async with httpx.AsyncClient() as tenant_client:
-                                tenant_res = await tenant_client.get("http://localhost:8001/api/v1/tenants/", timeout=5.0)
-                                if tenant_res.status_code == 200:
-                                    tenant_data = tenant_res.json()
-                                    existing_tenants = tenant_data.get('tenants', [])
-                                    if existing_tenants and len(existing_tenants) > 0:
-                                        selected_tenant = random.choice(existing_tenants)
-                                    else:
-                                        selected_tenant = None
-                                else:
-                                    selected_tenant = None
-                        except Exception as e:
-                            logger.warning(f"테넌시 정보 조회 실패: {e}")
-                            selected_tenant = None
-                        
-                        ecp_alert = {
-                            "id": sim_alert.get('id', 0),  # [advice from AI] DB ID 필드 추가
-                            "alert_id": alert_id,
-                            "title": f"[K8s] {sim_alert.get('type', 'System Alert')}",
-                            "message": sim_alert.get('message', '알림 메시지'),
-                            "severity": sim_alert.get('severity', 'info'),
-                            "category": "system",
-                            "source": "k8s-simulator",
-                            "timestamp": datetime.fromisoformat(sim_alert.get('timestamp', datetime.utcnow().isoformat()).replace('Z', '+00:00')),
-                            "created_at": datetime.fromisoformat(sim_alert.get('timestamp', datetime.utcnow().isoformat()).replace('Z', '+00:00')),  # [advice from AI] created_at 필드 추가
-                            "updated_at": None,  # [advice from AI] updated_at 필드 추가
-                            "status": "resolved" if sim_alert.get('resolved', False) else "active",
-                            "resolved": sim_alert.get('resolved', False),
-                            "resolved_at": None,
-                            "resolved_by": None,
-                            "tenant_id": selected_tenant.get('tenant_id') if selected_tenant and isinstance(selected_tenant, dict) else None,  # [advice from AI] 안전한 테넌시 ID 추가
-                            "service_name": sim_alert.get('service', 'system'),
-                            "resource_type": None,
-                            "metric_value": None,
-                            "threshold_value": None,
-                            "tags": {
-                                "source": "k8s-simulator", 
-                                "original_id": sim_alert.get('id'),
-                                "tenant_name": selected_tenant.get('name', '시스템') if selected_tenant and isinstance(selected_tenant, dict) else '시스템'  # [advice from AI] 안전한 테넌시 이름 추가
-                            },
-                            "alert_metadata": {"original_alert": sim_alert, "tenant_info": selected_tenant}  # [advice from AI] 테넌시 정보 메타데이터 추가
-                        }
-                        
-                        # 메모리에 추가
-                        recent_alerts.append(ecp_alert)
-                        logger.info(f"새 알림 추가: {alert_id}")
-                
-                return len(simulator_alerts)
-            else:
-                logger.warning(f"K8s 시뮬레이터 응답 오류: {response.status_code}")
-                return 0
-                
-    except Exception as e:
-        logger.error(f"K8s 시뮬레이터 동기화 실패: {e}")
-        return 0
+# [advice from AI] 필터별 알림 개수 캐시 (목록 조회마다 COUNT 실행 방지)
+alert_count_cache = AlertCountCache()
+
+# [advice from AI] 시뮬레이터 알림은 백그라운드 증분 동기화로 DB에 저장 (조회 시 업스트림 호출 없음)
+def _remember_recent_alerts(alerts: List[Dict[str, Any]]):
+    """동기화된 알림을 메모리 최근 버퍼에도 추가 (복제본 반영 전에도 즉시 표시)"""
+    recent_alerts.extend(alerts)
+
+simulator_alert_sync = SimulatorAlertSync(on_alerts=_remember_recent_alerts, aggregator=alert_aggregator)
+
+# [advice from AI] 집계된 반복 알림의 횟수/최근 발생 시각 DB 반영 주기(초)
+ALERT_AGGREGATION_FLUSH_INTERVAL = 5
 
 def get_db():
     """데이터베이스 세션 의존성"""
@@ -218,10 +154,32 @@ async def create_alert(
             "is_recent": True  # 최근 데이터 표시
         }
         
+        # [advice from AI] 같은 지문의 반복 알림은 기존 알림에 합치고, 새 지문은 발생 속도 제한
+        aggregation = alert_aggregator.ingest(alert_dict)
+        if aggregation.outcome == FOLDED:
+            return {
+                "success": True,
+                "alert_id": aggregation.alert["alert_id"],
+                "aggregated": True,
+                "occurrence_count": aggregation.alert["occurrence_count"],
+                "message": "기존 알림에 합쳐졌습니다.",
+                "timestamp": current_time
+            }
+        if aggregation.outcome == SUPPRESSED:
+            logger.warning(f"알림 발생 속도 제한으로 저장 생략: {alert_data.title}")
+            return {
+                "success": False,
+                "alert_id": None,
+                "suppressed": True,
+                "message": "알림 발생 속도 제한으로 저장하지 않았습니다.",
+                "timestamp": current_time
+            }
+        
         recent_alerts.insert(0, alert_dict)  # 최신 순으로 삽입
         
         # 백그라운드에서 DB 저장
-        background_tasks.add_task(save_alert_to_db, alert_data, alert_id, current_time, db)
+        background_tasks.add_task(save_alert_to_db, alert_data, alert_id, current_time, db,
+                                  aggregation.fingerprint)
         
         logger.info(f"알림 생성됨: {alert_id} - {alert_data.title}")
         
@@ -236,7 +194,8 @@ async def create_alert(
         logger.error(f"알림 생성 실패: {e}")
         raise HTTPException(status_code=500, detail=f"알림 생성 실패: {str(e)}")
 
-async def save_alert_to_db(alert_data: AlertCreate, alert_id: str, timestamp: datetime, db: Session):
+async def save_alert_to_db(alert_data: AlertCreate, alert_id: str, timestamp: datetime, db: Session,
+                           fingerprint: Optional[str] = None):
     """백그라운드에서 알림을 DB에 저장"""
     try:
         db_alert = Alert(
@@ -253,7 +212,9 @@ async def save_alert_to_db(alert_data: AlertCreate, alert_id: str, timestamp: da
             source=alert_data.source,
             tags=alert_data.tags,
             alert_metadata=alert_data.alert_metadata,
-            timestamp=timestamp
+            timestamp=timestamp,
+            fingerprint=fingerprint,
+            last_seen_at=timestamp
         )
         
         db.add(db_alert)
@@ -266,175 +227,107 @@ async def save_alert_to_db(alert_data: AlertCreate, alert_id: str, timestamp: da
         db.rollback()
         logger.error(f"알림 DB 저장 실패: {alert_id} - {e}")
 
+def _alert_filters(severity: Optional[str], category: Optional[str],
+                   tenant_id: Optional[str], status: Optional[str]) -> List[Any]:
+    """알림 조회 필터 조건"""
+    filters = []
+    if severity:
+        filters.append(Alert.severity == severity)
+    if category:
+        filters.append(Alert.category == category)
+    if tenant_id:
+        filters.append(Alert.tenant_id == tenant_id)
+    if status:
+        filters.append(Alert.status == status)
+    return filters
+
+def _alert_to_dict(db_alert: Alert) -> Dict[str, Any]:
+    """DB 알림을 응답 딕셔너리로 변환"""
+    return {
+        "id": db_alert.id,
+        "alert_id": db_alert.alert_id,
+        "title": db_alert.title,
+        "message": db_alert.message,
+        "severity": db_alert.severity,
+        "category": db_alert.category,
+        "tenant_id": db_alert.tenant_id,
+        "service_name": db_alert.service_name,
+        "resource_type": db_alert.resource_type,
+        "metric_value": db_alert.metric_value,
+        "threshold_value": db_alert.threshold_value,
+        "status": db_alert.status,
+        "resolved": db_alert.resolved,
+        "resolved_at": db_alert.resolved_at,
+        "resolved_by": db_alert.resolved_by,
+        "source": db_alert.source,
+        "tags": db_alert.tags,
+        "alert_metadata": db_alert.alert_metadata,
+        "timestamp": db_alert.timestamp,
+        "created_at": db_alert.created_at,
+        "updated_at": db_alert.updated_at,
+        "occurrence_count": db_alert.occurrence_count or 1,
+        "last_seen_at": db_alert.last_seen_at,
+        "is_recent": False
+    }
+
+def _recent_alert_matches(severity: Optional[str], category: Optional[str],
+                          tenant_id: Optional[str], status: Optional[str]):
+    """메모리 알림 필터 조건 (DB 필터와 동일)"""
+    def matches(alert: Dict[str, Any]) -> bool:
+        return ((not severity or alert.get('severity') == severity)
+                and (not category or alert.get('category') == category)
+                and (not tenant_id or alert.get('tenant_id') == tenant_id)
+                and (not status or alert.get('status') == status))
+    return matches
+
 @router.get("/", response_model=AlertListResponse)
 async def get_alerts(
-    page: int = Query(1, ge=1, description="페이지 번호"),
+    page: int = Query(1, ge=1, description="페이지 번호 (응답 표시용, 2 이상은 cursor와 함께만 허용)"),
     page_size: int = Query(50, ge=1, le=200, description="페이지 크기"),  # [advice from AI] 기본값 20→50, 최대값 100→200으로 증가
     severity: Optional[str] = Query(None, description="심각도 필터"),
     category: Optional[str] = Query(None, description="카테고리 필터"),
     tenant_id: Optional[str] = Query(None, description="테넌트 ID 필터"),
     status: Optional[str] = Query(None, description="상태 필터"),
     include_recent: bool = Query(True, description="최근 메모리 데이터 포함"),
-    cursor: Optional[str] = Query(None, description="페이지네이션 커서"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="페이지네이션 커서 (이전 응답의 next_cursor)"),
+    db: AsyncSession = Depends(get_async_read_db_session)
 ):
     """
-    알림 목록 조회 (페이지네이션 + 무한 스크롤)
-    - 첫 페이지: 메모리의 최근 데이터 + DB 데이터
-    - 이후 페이지: DB 데이터만
+    알림 목록 조회 (keyset 커서 페이지네이션 + 무한 스크롤)
+    - (timestamp, alert_id) 내림차순, 커서 이후 page_size개만 조회 (OFFSET 미사용)
+    - 메모리 최근 알림과 DB 알림을 병합, 중복 alert_id 제거
+    - total_count는 필터별 캐시된 근사값
+    - 커서 전용: 다음 페이지는 이전 응답의 next_cursor로 요청 (page는 표시용 번호만 되돌려줌)
+      cursor 없이 page>1 요청은 오프셋 이동이 지원되지 않으므로 400
     """
+    if page > 1 and not cursor:
+        raise HTTPException(status_code=400,
+                            detail="page>1 요청에는 cursor가 필요합니다 (이전 응답의 next_cursor 사용)")
     try:
-        # [advice from AI] K8s 시뮬레이터에서 최신 알림 동기화 (첫 페이지일 때만)
-        if page == 1 and include_recent:
-            await sync_alerts_from_k8s_simulator()
-        
-        alerts = []
-        total_count = 0
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        filters = _alert_filters(severity, category, tenant_id, status)
         
-        # 첫 페이지이고 최근 데이터 포함 요청 시
-        if page == 1 and include_recent:
-            # 메모리의 최근 알림 필터링
-            filtered_recent = recent_alerts
-            
-            if severity:
-                filtered_recent = [a for a in filtered_recent if a.get('severity') == severity]
-            if category:
-                filtered_recent = [a for a in filtered_recent if a.get('category') == category]
-            if tenant_id:
-                filtered_recent = [a for a in filtered_recent if a.get('tenant_id') == tenant_id]
-            if status:
-                filtered_recent = [a for a in filtered_recent if a.get('status') == status]
-            
-            alerts.extend(filtered_recent)  # [advice from AI] 페이지 크기 제한 제거하여 모든 메모리 알림 표시
-            
-        # [advice from AI] 첫 페이지에서는 모든 DB 알림을 가져와서 합치기
-        if page == 1:
-            # 첫 페이지: 모든 DB 알림 가져오기 (메모리에 없는 것들)
-            query = db.query(Alert).order_by(desc(Alert.timestamp))
-            
-            # 필터 적용
-            if severity:
-                query = query.filter(Alert.severity == severity)
-            if category:
-                query = query.filter(Alert.category == category)
-            if tenant_id:
-                query = query.filter(Alert.tenant_id == tenant_id)
-            if status:
-                query = query.filter(Alert.status == status)
-            
-            # 메모리에 있는 알림 ID들 수집
-            memory_alert_ids = {a.get('alert_id') for a in alerts}
-            
-            # 메모리에 없는 모든 DB 알림들 가져오기
-            db_alerts = query.filter(~Alert.alert_id.in_(memory_alert_ids)).all()
-            
-            # DB 알림을 딕셔너리로 변환
-            for db_alert in db_alerts:
-                alerts.append({
-                    "id": db_alert.id,
-                    "alert_id": db_alert.alert_id,
-                    "title": db_alert.title,
-                    "message": db_alert.message,
-                    "severity": db_alert.severity,
-                    "category": db_alert.category,
-                    "tenant_id": db_alert.tenant_id,
-                    "service_name": db_alert.service_name,
-                    "resource_type": db_alert.resource_type,
-                    "metric_value": db_alert.metric_value,
-                    "threshold_value": db_alert.threshold_value,
-                    "status": db_alert.status,
-                    "resolved": db_alert.resolved,
-                    "resolved_at": db_alert.resolved_at,
-                    "resolved_by": db_alert.resolved_by,
-                    "source": db_alert.source,
-                    "tags": db_alert.tags,
-                    "alert_metadata": db_alert.alert_metadata,
-                    "timestamp": db_alert.timestamp,
-                    "created_at": db_alert.created_at,
-                    "updated_at": db_alert.updated_at,
-                    "is_recent": False
-                })
-            
-            # [advice from AI] 시간순으로 정렬 (최신 순) - datetime 객체 처리 개선
-            def safe_timestamp(alert):
-                ts = alert.get('timestamp')
-                if ts is None:
-                    return datetime.min.replace(tzinfo=None)
-                if isinstance(ts, str):
-                    try:
-                        # ISO 형식 문자열을 datetime으로 변환
-                        dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                        # 시간대 정보 제거하여 naive datetime으로 변환
-                        return dt.replace(tzinfo=None)
-                    except:
-                        return datetime.min.replace(tzinfo=None)
-                elif hasattr(ts, 'replace'):
-                    # datetime 객체인 경우 시간대 정보 제거
-                    return ts.replace(tzinfo=None)
-                return datetime.min.replace(tzinfo=None)
-            
-            alerts.sort(key=safe_timestamp, reverse=True)
-            
-        else:
-            # 2페이지 이후: DB에서만 페이지네이션으로 가져오기
-            query = db.query(Alert).order_by(desc(Alert.timestamp))
-            
-            # 필터 적용
-            if severity:
-                query = query.filter(Alert.severity == severity)
-            if category:
-                query = query.filter(Alert.category == category)
-            if tenant_id:
-                query = query.filter(Alert.tenant_id == tenant_id)
-            if status:
-                query = query.filter(Alert.status == status)
-            
-            offset = (page - 1) * page_size
-            db_alerts = query.offset(offset).limit(page_size).all()
-            
-            # DB 알림을 딕셔너리로 변환
-            for db_alert in db_alerts:
-                alerts.append({
-                    "id": db_alert.id,
-                    "alert_id": db_alert.alert_id,
-                    "title": db_alert.title,
-                    "message": db_alert.message,
-                    "severity": db_alert.severity,
-                    "category": db_alert.category,
-                    "tenant_id": db_alert.tenant_id,
-                    "service_name": db_alert.service_name,
-                    "resource_type": db_alert.resource_type,
-                    "metric_value": db_alert.metric_value,
-                    "threshold_value": db_alert.threshold_value,
-                    "status": db_alert.status,
-                    "resolved": db_alert.resolved,
-                    "resolved_at": db_alert.resolved_at,
-                    "resolved_by": db_alert.resolved_by,
-                    "source": db_alert.source,
-                    "tags": db_alert.tags,
-                    "alert_metadata": db_alert.alert_metadata,
-                    "timestamp": db_alert.timestamp,
-                    "created_at": db_alert.created_at,
-                    "updated_at": db_alert.updated_at,
-                    "is_recent": False
-                })
+        # 메모리 최근 알림 (커서 이후 상위 page_size + 1개)
+        recent = []
+        if include_recent:
+            recent = recent_page(recent_alerts, _recent_alert_matches(severity, category, tenant_id, status),
+                                 after, page_size + 1)
         
-        # 전체 개수 계산
-        count_query = db.query(Alert)
-        if severity:
-            count_query = count_query.filter(Alert.severity == severity)
-        if category:
-            count_query = count_query.filter(Alert.category == category)
-        if tenant_id:
-            count_query = count_query.filter(Alert.tenant_id == tenant_id)
-        if status:
-            count_query = count_query.filter(Alert.status == status)
+        # DB 알림 (메모리와 겹칠 수 있는 개수만큼 여유 있게 조회)
+        db_alerts = (await db.scalars(keyset_query(filters, after, page_size + 1 + len(recent)))).all()
+        alerts, has_more = merge_alert_pages(recent, [_alert_to_dict(a) for a in db_alerts], page_size)
         
-        total_count = count_query.count() + (len(recent_alerts) if page == 1 and include_recent else 0)
+        # 전체 개수 (근사값 - 필터별 TTL 캐시)
+        async def count_alerts() -> int:
+            return await db.scalar(select(func.count(Alert.id)).where(*filters))
+        db_count = await alert_count_cache.get((severity, category, tenant_id, status), count_alerts)
+        total_count = max(db_count, len(alerts))
         
-        # 다음 페이지 존재 여부
-        has_more = len(alerts) == page_size and total_count > page * page_size
-        next_cursor = f"{page + 1}" if has_more else None
+        next_cursor = encode_cursor(alert_sort_key(alerts[-1])) if has_more else None
         
         return AlertListResponse(
             alerts=alerts,
@@ -449,6 +342,38 @@ async def get_alerts(
         logger.error(f"알림 목록 조회 실패: {e}")
         raise HTTPException(status_code=500, detail=f"알림 목록 조회 실패: {str(e)}")
 
+@router.get("/sync/status", response_model=Dict[str, Any])
+async def get_alert_sync_status():
+    """시뮬레이터 알림 동기화 상태 (커서, 처리 건수)"""
+    return simulator_alert_sync.status()
+
+@router.get("/aggregation/status", response_model=Dict[str, Any])
+async def get_alert_aggregation_status():
+    """알림 집계 상태 (열린 지문 수, 처리 결과별 건수, 중복 제거 비율)"""
+    return alert_aggregator.status()
+
+@router.get("/thresholds/status", response_model=Dict[str, Any])
+async def get_threshold_engine_status():
+    """임계값 규칙 엔진 상태 (규칙/시계열/발생 중 개수, 틱별 평가 비용)"""
+    return threshold_evaluator.status()
+
+@router.get("/anomalies/status", response_model=Dict[str, Any])
+async def get_anomaly_detector_status():
+    """이상 탐지기 상태 (시계열 수, 이상 상태 개수, 틱별 평가 비용)"""
+    return anomaly_detector.status()
+
+@router.get("/anomalies/series", response_model=Dict[str, Any])
+async def get_anomaly_series_state(
+    tenant_id: Optional[str] = Query(None, description="테넌트 ID"),
+    service_name: Optional[str] = Query(None, description="서비스명"),
+    hour: Optional[int] = Query(None, ge=0, le=23, description="시간대 기준선 (기본: 현재 시각)")
+):
+    """시계열 하나의 이상 탐지 기준선/상태 (디버깅용)"""
+    state = anomaly_detector.series_state(tenant_id, service_name, hour)
+    if state is None:
+        raise HTTPException(status_code=404, detail="추적 중인 시계열이 아닙니다.")
+    return state
+
 @router.put("/{alert_id}/status", response_model=Dict[str, Any])
 async def update_alert_status(
     alert_id: str,
@@ -474,6 +399,8 @@ async def update_alert_status(
         
         db_alert.status = status_update.status
         db_alert.resolved = status_update.status == 'resolved'
+        if db_alert.resolved:
+            alert_aggregator.forget(alert_id)  # 해결 후 재발생은 새 알림
         if status_update.status == 'resolved':
             db_alert.resolved_at = datetime.utcnow()
             db_alert.resolved_by = status_update.resolved_by
@@ -509,6 +436,8 @@ async def delete_alert(alert_id: str, db: Session = Depends(get_db)):
         
         db.delete(db_alert)
         db.commit()
+        alert_count_cache.invalidate()
+        alert_aggregator.forget(alert_id)
         
         return {
             "success": True,
@@ -551,3 +480,99 @@ async def start_cleanup_task():
     while True:
         await asyncio.sleep(300)  # 5분마다 실행
         await cleanup_old_alerts()
+
+# [advice from AI] 집계 변경분(발생 횟수/최근 발생 시각)을 한 번에 DB 반영
+def _write_aggregate_updates(updates: List[Dict[str, Any]]):
+    stmt = (
+        Alert.__table__.update()
+        .where(Alert.alert_id == bindparam('b_alert_id'))
+        .values(occurrence_count=bindparam('b_count'), last_seen_at=bindparam('b_last_seen'))
+    )
+    with db_manager.get_session() as db:
+        db.connection().execute(stmt, updates)
+        db.commit()
+
+async def flush_alert_aggregates() -> int:
+    """집계 변경분 DB 반영, 반영 건수 반환"""
+    updates = alert_aggregator.drain_updates()
+    if updates:
+        await asyncio.to_thread(_write_aggregate_updates, updates)
+    return len(updates)
+
+async def start_aggregation_flush_task():
+    """집계 반영 태스크 시작"""
+    while True:
+        await asyncio.sleep(ALERT_AGGREGATION_FLUSH_INTERVAL)
+        try:
+            await flush_alert_aggregates()
+        except Exception as e:
+            logger.error(f"알림 집계 반영 실패: {e}")
+
+# [advice from AI] 임계값 규칙 엔진/이상 탐지기 상태 전이 → 알림 발생/해제
+threshold_alert_ids: Dict[tuple, str] = {}  # (테넌시, 서비스, 메트릭, 규칙 종류) → 발생 중 알림 id
+
+def _apply_threshold_alerts(new_alerts: List[Dict[str, Any]], resolved_ids: List[str], resolved_at: datetime):
+    with db_manager.get_session() as db:
+        if resolved_ids:
+            db.query(Alert).filter(Alert.alert_id.in_(resolved_ids), Alert.resolved == False).update(
+                {"status": "resolved", "resolved": True, "resolved_at": resolved_at,
+                 "resolved_by": "threshold-engine"},
+                synchronize_session=False
+            )
+        db.add_all(Alert(**{field: alert[field] for field in ALERT_ROW_FIELDS if field in alert})
+                   for alert in new_alerts)
+        db.commit()
+
+async def record_threshold_transitions(transitions):
+    """상태 전이 반영 - 발생/상향은 새 알림, 하향/해제는 기존 알림 해결 처리"""
+    current_time = datetime.utcnow()
+    new_alerts, resolved_ids = [], []
+    for transition in transitions:
+        previous_id = threshold_alert_ids.pop(transition.key, None)
+        if previous_id:
+            resolved_ids.append(previous_id)
+            alert_aggregator.forget(previous_id)
+        if not transition.firing:
+            continue
+        is_anomaly = transition.kind == "anomaly"
+        source = "anomaly-detector" if is_anomaly else "threshold-engine"
+        alert_dict = {
+            "id": len(recent_alerts) + len(new_alerts) + 1,
+            "alert_id": f"{'anomaly' if is_anomaly else 'threshold'}_{uuid.uuid4().hex[:8]}",
+            "title": transition.title,
+            "message": transition.message,
+            "severity": transition.current,
+            "category": transition.category,
+            "tenant_id": transition.tenant_id,
+            "service_name": transition.service_name,
+            "resource_type": transition.metric,
+            "metric_value": transition.value,
+            "threshold_value": transition.threshold,
+            "status": "active",
+            "resolved": False,
+            "resolved_at": None,
+            "resolved_by": None,
+            "source": source,
+            "tags": {"rule": transition.kind, "previous_level": transition.previous},
+            "alert_metadata": {"z_score": round(transition.z_score, 3)} if is_anomaly else None,
+            "timestamp": current_time,
+            "created_at": current_time,
+            "updated_at": None
+        }
+        aggregation = alert_aggregator.ingest(alert_dict, source=source)
+        if aggregation.outcome == SUPPRESSED:
+            continue
+        threshold_alert_ids[transition.key] = aggregation.alert["alert_id"]
+        if aggregation.outcome != FOLDED:
+            new_alerts.append(alert_dict)
+
+    if new_alerts or resolved_ids:
+        await asyncio.to_thread(_apply_threshold_alerts, new_alerts, resolved_ids, current_time)
+    recent_alerts.extend(new_alerts)
+    for alert in recent_alerts:
+        if alert.get("alert_id") in resolved_ids:
+            alert.update(status="resolved", resolved=True, resolved_at=current_time, resolved_by="threshold-engine")
+
+anomaly_detector = AnomalyDetector()
+threshold_evaluator = ThresholdEvaluator(on_transitions=record_threshold_transitions,
+                                         anomaly_detector=anomaly_detector)
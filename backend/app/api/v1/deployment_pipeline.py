@@ -13,13 +13,13 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 import asyncio
 import json
-import yaml
 from sqlalchemy.orm import Session
 
 from app.core.database_manager import db_manager
 from app.models.database import CICDImage
 from app.core.k8s_orchestrator import K8sOrchestrator
 from app.services.k8s_simulator_client import K8sSimulatorClient
+from app.core import yaml_io
 
 router = APIRouter()
 
@@ -209,7 +209,7 @@ async def generate_k8s_manifest(request: DeploymentRequest, image_info: CICDImag
             "labels": {
                 "app": request.service_name,
                 "version": request.image_tag,
-                "managed-by": "ecp-ai-orchestrator"
+                "app.kubernetes.io/managed-by": "ecp-orchestrator"
             }
         },
         "spec": {
@@ -290,9 +290,7 @@ async def generate_k8s_manifest(request: DeploymentRequest, image_info: CICDImag
     }
     
     # YAML 문자열로 변환
-    yaml_content = yaml.dump(manifest, default_flow_style=False)
-    yaml_content += "---\n"
-    yaml_content += yaml.dump(service_manifest, default_flow_style=False)
+    yaml_content = yaml_io.dump_all([manifest, service_manifest])
     
     return yaml_content
 
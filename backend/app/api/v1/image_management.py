@@ -8,6 +8,7 @@ ECP-AI 이미지 관리 및 배포 시스템 REST API
 """
 
 import asyncio
+import uuid
 from typing import Dict, Any, Optional, List
 from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
 from pydantic import BaseModel, Field
@@ -82,6 +83,16 @@ class DeploymentRequest(BaseModel):
     change_cause: Optional[str] = Field(None, description="변경 사유")
 
 
+class ImageVersionRegisterRequest(BaseModel):
+    """이미지 버전 등록 요청 (일괄 등록 항목)"""
+    service_name: str = Field(..., description="서비스 이름")
+    image_name: str = Field(..., description="이미지 이름")
+    image_tag: str = Field(..., description="이미지 태그")
+    full_image_name: str = Field(..., description="전체 이미지 이름")
+    git_commit: str = Field(..., description="Git 커밋")
+    git_branch: str = Field(..., description="Git 브랜치")
+
+
 @router.get("/registries")
 async def get_registries():
     """등록된 이미지 레지스트리 목록 조회"""
@@ -651,6 +662,50 @@ async def register_image_version(
         )
 
 
+@router.post("/versions/register-batch")
+async def register_image_versions(requests: List[ImageVersionRegisterRequest]):
+    """이미지 버전 일괄 등록 (멀티 서비스 빌드 파이프라인용, 단일 트랜잭션)"""
+    try:
+        from datetime import datetime
+        
+        build_timestamp = datetime.now()
+        image_versions = [
+            ImageVersion(
+                # 같은 배치/같은 초의 동일 서비스·태그도 서로 덮어쓰지 않도록 고유 접미사
+                id=f"{r.service_name}-{r.image_tag}-{int(build_timestamp.timestamp())}-{uuid.uuid4().hex[:8]}",
+                service_name=r.service_name,
+                image_name=r.image_name,
+                image_tag=r.image_tag,
+                full_image_name=r.full_image_name,
+                git_commit=r.git_commit,
+                git_branch=r.git_branch,
+                build_timestamp=build_timestamp,
+                status=ImageStatus.BUILDING
+            )
+            for r in requests
+        ]
+        
+        registered = await asyncio.to_thread(_image_tracker.register_image_versions, image_versions)
+        if image_versions and registered == 0:
+            raise HTTPException(status_code=500, detail="이미지 버전 일괄 등록 실패")
+        
+        return {
+            "success": True,
+            "message": "이미지 버전 일괄 등록 완료",
+            "registered": registered,
+            "image_version_ids": [v.id for v in image_versions]
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("이미지 버전 일괄 등록 실패", error=str(e))
+        raise HTTPException(
+            status_code=500,
+            detail=f"이미지 버전 일괄 등록 실패: {str(e)}"
+        )
+
+
 @router.get("/versions/{service_name}")
 async def get_image_versions(service_name: str, limit: int = 10):
     """서비스별 이미지 버전 목록 조회"""
@@ -750,6 +805,28 @@ async def get_deployment_health():
         )
 
 
+@router.get("/deployments/rollback-report")
+async def get_rollback_report(tenant_id: Optional[str] = None):
+    """서비스별 롤백 대상 이미지 리포트 (전체 또는 테넌시)"""
+    try:
+        report = _image_tracker.get_rollback_report(tenant_id)
+        
+        return {
+            "success": True,
+            "tenant_id": tenant_id,
+            "services": report,
+            "count": len(report),
+            "would_change": sum(1 for entry in report if entry["would_change"])
+        }
+        
+    except Exception as e:
+        logger.error("롤백 리포트 조회 실패", error=str(e))
+        raise HTTPException(
+            status_code=500,
+            detail=f"롤백 리포트 조회 실패: {str(e)}"
+        )
+
+
 @router.get("/deployments/{tenant_id}/history")
 async def get_deployment_history(tenant_id: str, service_name: str, limit: int = 20):
     """테넌시별 배포 히스토리 조회"""
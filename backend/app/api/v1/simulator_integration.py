@@ -1,6 +1,7 @@
 # [advice from AI] K8S Simulator 연동 API 라우터
 from fastapi import APIRouter, HTTPException, Request, Depends, BackgroundTasks
 from typing import Dict, Any, Optional
+import httpx
 import logging
 from sqlalchemy.orm import Session
 
@@ -17,6 +18,18 @@ router = APIRouter()
 # [advice from AI] 매니페스트 생성기 인스턴스
 manifest_generator = ManifestGenerator()
 
+def _simulator_error_detail(response: httpx.Response) -> str:
+    """시뮬레이터 오류 응답에서 메시지 추출 (422는 리소스별 오류 목록 포함)"""
+    try:
+        detail = response.json().get("detail")
+    except ValueError:
+        return response.text or "알 수 없는 오류"
+    if isinstance(detail, dict):
+        message = detail.get("message", "알 수 없는 오류")
+        errors = detail.get("errors") or []
+        return f"{message} ({'; '.join(errors)})" if errors else message
+    return str(detail or "알 수 없는 오류")
+
 @router.post("/simulator/deploy/{tenant_id}")
 async def deploy_to_simulator(
     tenant_id: str,
@@ -60,22 +73,22 @@ async def deploy_to_simulator(
                 detail="K8S Simulator에 연결할 수 없습니다. 시스템 관리자에게 문의하세요."
             )
         
-        # 매니페스트 파싱 및 검증
-        parse_result = await simulator_client.parse_manifest(manifest_content, tenant_id)
-        if parse_result.get("status") != "success":
+        # [advice from AI] 검증+파싱+배포를 단일 요청으로 수행 (검증 실패는 시뮬레이터가 400/422로 응답)
+        logger.info(f"Deploying tenant {tenant_id} to K8S Simulator")
+        try:
+            deployment_result = await simulator_client.apply_manifest(
+                manifest_content,
+                tenant_id=tenant_id,
+                deployment_mode="production"
+            )
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code not in (400, 422):
+                raise
             raise HTTPException(
                 status_code=400,
-                detail=f"매니페스트 검증 실패: {parse_result.get('message', '알 수 없는 오류')}"
+                detail=f"매니페스트 검증 실패: {_simulator_error_detail(e.response)}"
             )
         
-        # 시뮬레이터에 배포
-        logger.info(f"Deploying tenant {tenant_id} to K8S Simulator")
-        deployment_result = await simulator_client.deploy_manifest(
-            manifest_content=manifest_content,
-            tenant_id=tenant_id,
-            deployment_mode="production"
-        )
-        
         # [advice from AI] 백그라운드에서 모니터링 데이터 수집 시작
         background_tasks.add_task(start_monitoring_collection, tenant_id)
         
@@ -83,9 +96,9 @@ async def deploy_to_simulator(
             "status": "success",
             "tenant_id": tenant_id,
             "deployment_result": deployment_result,
-            "manifest_resources": parse_result.get("count", 0),
-            "monitoring_dashboard": deployment_result.get("monitoring_dashboard"),
-            "websocket_url": deployment_result.get("websocket_url"),
+            "manifest_resources": deployment_result.get("parsed_count", 0),
+            "monitoring_dashboard": f"{simulator_client.external_url}/monitoring/tenant/{tenant_id}",
+            "websocket_url": "ws://localhost:6360/ws/monitoring",
             "message": "시뮬레이터 배포가 완료되었습니다. 고급 모니터링이 자동으로 시작됩니다."
         }
         
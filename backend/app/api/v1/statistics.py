@@ -4,20 +4,27 @@ ECP-AI Kubernetes Orchestrator 통계 엔드포인트
 """
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
-from typing import Dict, List, Optional
+from sqlalchemy import func, and_, select
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
 import random
 
-from app.core.database_manager import get_db_session
+from app.core.database_manager import db_manager, async_read_db_session_for, table_consistency_keys
+from app.core.response_cache import TENANT_WRITE_TABLES, cached_endpoint
+from app.core.stats_snapshot import stats_snapshot
 from app.models.database import Tenant, Service
 # from app.models.tenant_specs import TenantSummary  # [advice from AI] 사용하지 않는 import 제거
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# [advice from AI] 테넌시/서비스 최근 쓰기(생성 직후 등)가 복제본에 반영되기 전이면 primary에서 집계
+TENANT_READ_KEYS = table_consistency_keys(TENANT_WRITE_TABLES)
+get_tenant_tables_read_session = async_read_db_session_for(*TENANT_WRITE_TABLES)
+
 # [advice from AI] 가상 이미지 데이터 생성 - 서비스별 이미지 정보
 def _generate_virtual_image_data():
     """
@@ -158,84 +165,120 @@ def _generate_virtual_image_data():
     
     return virtual_images
 
+# [advice from AI] 통계 집계는 SQL GROUP BY로 계산하고 구역별 스냅샷으로 캐시
+# (테넌시/서비스 쓰기 시 해당 구역만 무효화, 응답에 스냅샷 계산 시각 포함)
+CICD_SERVICES = [
+    'callbot', 'chatbot', 'advisor', 'stt', 'tts', 'ta', 'qa', 'nlp', 'aicm',
+    'tts-server', 'nlp-server', 'aicm-server', 'stt-server', 'ta-server', 'qa-server',
+    'infrastructure', 'database', 'monitoring', 'ai_service'
+]
+RESOURCE_PRESETS = ("small", "medium", "large")
+
+
+def _compute_tenant_counts(session: Session) -> Dict[str, Any]:
+    """상태별/프리셋별 테넌시 수, 최근 7일 생성 추이"""
+    by_status = session.execute(
+        select(Tenant.status, func.count(Tenant.tenant_id)).group_by(Tenant.status)
+    ).all()
+    by_preset = session.execute(
+        select(Tenant.preset, func.count(Tenant.tenant_id)).group_by(Tenant.preset)
+    ).all()
+    seven_days_ago = datetime.now() - timedelta(days=7)
+    recent = session.execute(
+        select(func.date(Tenant.created_at), func.count(Tenant.tenant_id))
+        .where(Tenant.created_at >= seven_days_ago)
+        .group_by(func.date(Tenant.created_at))
+        .order_by(func.date(Tenant.created_at))
+    ).all()
+    return {
+        "by_status": [{"status": status, "count": count} for status, count in by_status],
+        "by_preset": [{"preset": preset, "count": count} for preset, count in by_preset],
+        "recent_growth": [{"date": str(date), "count": count} for date, count in recent],
+    }
+
+
+def _compute_resource_totals(session: Session) -> Dict[str, Any]:
+    """실행 중 테넌시 리소스 합계 (정수 단위 컬럼 SUM, 프리셋별 GROUP BY - 할당량 인덱스 사용)"""
+    rows = session.execute(
+        select(Tenant.preset,
+               func.coalesce(func.sum(Tenant.cpu_millicores), 0),
+               func.coalesce(func.sum(Tenant.memory_mib), 0),
+               func.coalesce(func.sum(Tenant.gpu_limit), 0),
+               func.coalesce(func.sum(Tenant.storage_mib), 0))
+        .where(Tenant.status == 'running')
+        .group_by(Tenant.preset)
+    ).all()
+
+    totals = {"cpu": 0, "memory": 0, "gpu": 0, "storage": 0}
+    by_preset = {key: {preset: 0 for preset in RESOURCE_PRESETS} for key in ("cpu", "memory", "gpu")}
+    for preset, cpu, memory, gpu, storage in rows:
+        values = {"cpu": int(cpu), "memory": int(memory), "gpu": int(gpu), "storage": int(storage) // 1024}
+        for key, value in values.items():
+            totals[key] += value
+            if key in by_preset and preset in by_preset[key]:
+                by_preset[key][preset] += value
+    return {"totals": totals, "by_preset": by_preset}
+
+
+def _compute_service_totals(session: Session) -> Dict[str, Any]:
+    """실행 중 테넌시의 서비스별 배포 수/테넌시 수/리소스 요청 합계"""
+    service_name = func.lower(Service.service_name)
+    rows = session.execute(
+        select(service_name, func.count(Service.id), func.count(func.distinct(Service.tenant_id)),
+               func.sum(Service.cpu_millicores), func.sum(Service.memory_mib))
+        .where(Service.tenant_id.in_(select(Tenant.tenant_id).where(Tenant.status == 'running')))
+        .group_by(service_name)
+    ).all()
+
+    service_stats = {name: {"deployed": 0, "tenants": 0, "resources": {}} for name in CICD_SERVICES}
+    deployed_total = 0
+    for name, deployed, tenants, cpu, memory in rows:
+        deployed_total += deployed
+        if name not in service_stats:
+            continue
+        resources = {key: int(value) for key, value in (("cpu", cpu), ("memory", memory)) if value is not None}
+        service_stats[name].update(deployed=deployed, tenants=tenants, resources=resources)
+    return {"deployed_total": deployed_total, "service_details": service_stats}
+
+
+async def _snapshot(db: AsyncSession, section: str,
+                    compute: Callable[[Session], Dict[str, Any]]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    return await stats_snapshot.get(section, lambda: db.run_sync(compute))
+
+
 @router.get("/overview")
-async def get_statistics_overview(db: Session = Depends(get_db_session)):
+@cached_endpoint(invalidate_on=TENANT_WRITE_TABLES)
+async def get_statistics_overview():
     """
     전체 통계 개요 조회
     - 총 테넌시 수, 활성 테넌시 수, 서비스별 분포 등
+    - 공유 계산/백그라운드 재계산이 요청 범위 밖에서도 실행되므로 세션을 직접 열어 사용
     """
     try:
-        # [advice from AI] 실제 DB 기반 통계 계산
-        total_tenants = db.query(func.count(Tenant.tenant_id)).scalar()
-        active_tenants = db.query(func.count(Tenant.tenant_id)).filter(
-            Tenant.status == 'running'
-        ).scalar()
-        
-        # 테넌시별 프리셋 분포
-        tenants_by_preset = db.query(
-            Tenant.preset,
-            func.count(Tenant.tenant_id).label('count')
-        ).group_by(Tenant.preset).all()
-        
-        # 서비스별 테넌시 수 (CICD 기준 20개 서비스)
-        service_distribution = {
-            'callbot': 0,
-            'chatbot': 0, 
-            'advisor': 0,
-            'stt': 0,
-            'tts': 0,
-            'ta': 0,
-            'qa': 0,
-            'nlp': 0,
-            'aicm': 0,
-            'tts-server': 0,
-            'nlp-server': 0,
-            'aicm-server': 0,
-            'stt-server': 0,
-            'ta-server': 0,
-            'qa-server': 0,
-            'infrastructure': 0,
-            'database': 0,
-            'monitoring': 0,
-            'ai_service': 0,
-            'total_services': 20  # CICD 기준 총 서비스 수
-        }
+        async with db_manager.get_async_session(read_only=True, consistency_key=TENANT_READ_KEYS) as db:
+            tenant_counts, tenants_meta = await _snapshot(db, "tenants", _compute_tenant_counts)
+            resources, resources_meta = await _snapshot(db, "resources", _compute_resource_totals)
+            services, services_meta = await _snapshot(db, "services", _compute_service_totals)
         
-        # 실제 배포된 서비스 수 계산
-        deployed_services = 0
-        for tenant in db.query(Tenant).filter(Tenant.status == 'running').all():
-            if tenant.services:
-                deployed_services += len(tenant.services)
-        
-        # 리소스 사용량 계산
-        total_cpu = 0
-        total_memory = 0
-        total_gpu = 0
-        
-        for tenant in db.query(Tenant).filter(Tenant.status == 'running').all():
-            if tenant.cpu_limit:
-                total_cpu += _parse_resource_value(tenant.cpu_limit)
-            if tenant.memory_limit:
-                total_memory += _parse_resource_value(tenant.memory_limit)
-            if tenant.gpu_limit:
-                total_gpu += tenant.gpu_limit
+        by_status = {row["status"]: row["count"] for row in tenant_counts["by_status"]}
+        totals = resources["totals"]
+        # 가장 오래된 구역 기준 스냅샷 정보
+        snapshot = max((tenants_meta, resources_meta, services_meta), key=lambda meta: meta["age_seconds"])
         
         return {
             "status": "success",
             "timestamp": datetime.now().isoformat(),
+            "snapshot": snapshot,
             "overview": {
-                "total_tenants": total_tenants,
-                "active_tenants": active_tenants,
+                "total_tenants": sum(by_status.values()),
+                "active_tenants": by_status.get('running', 0),
                 "total_services": 20,  # CICD 기준
-                "deployed_services": deployed_services,
-                "tenants_by_preset": [
-                    {"preset": preset, "count": count} 
-                    for preset, count in tenants_by_preset
-                ],
+                "deployed_services": services["deployed_total"],
+                "tenants_by_preset": tenant_counts["by_preset"],
                 "resource_usage": {
-                    "total_cpu": f"{total_cpu}m",
-                    "total_memory": f"{total_memory}Mi",
-                    "total_gpu": total_gpu
+                    "total_cpu": f"{totals['cpu']}m",
+                    "total_memory": f"{totals['memory']}Mi",
+                    "total_gpu": totals["gpu"]
                 }
             }
         }
@@ -245,52 +288,18 @@ async def get_statistics_overview(db: Session = Depends(get_db_session)):
         raise HTTPException(status_code=500, detail=f"통계 조회 실패: {str(e)}")
 
 @router.get("/tenants")
-async def get_tenant_statistics(db: Session = Depends(get_db_session)):
+async def get_tenant_statistics(db: AsyncSession = Depends(get_tenant_tables_read_session)):
     """
     테넌시 상세 통계 조회
     """
     try:
-        # [advice from AI] 테넌시별 상세 통계
-        tenants_by_status = db.query(
-            Tenant.status,
-            func.count(Tenant.tenant_id).label('count')
-        ).group_by(Tenant.status).all()
-        
-        tenants_by_preset = db.query(
-            Tenant.preset,
-            func.count(Tenant.tenant_id).label('count')
-        ).group_by(Tenant.preset).all()
-        
-        # 최근 7일간 테넌시 생성 추이
-        seven_days_ago = datetime.now() - timedelta(days=7)
-        recent_tenants = db.query(
-            func.date(Tenant.created_at).label('date'),
-            func.count(Tenant.tenant_id).label('count')
-        ).filter(
-            Tenant.created_at >= seven_days_ago
-        ).group_by(
-            func.date(Tenant.created_at)
-        ).order_by(
-            func.date(Tenant.created_at)
-        ).all()
+        tenant_counts, snapshot = await _snapshot(db, "tenants", _compute_tenant_counts)
         
         return {
             "status": "success",
             "timestamp": datetime.now().isoformat(),
-            "tenants": {
-                "by_status": [
-                    {"status": status, "count": count} 
-                    for status, count in tenants_by_status
-                ],
-                "by_preset": [
-                    {"preset": preset, "count": count} 
-                    for preset, count in tenants_by_preset
-                ],
-                "recent_growth": [
-                    {"date": str(date), "count": count} 
-                    for date, count in recent_tenants
-                ]
-            }
+            "snapshot": snapshot,
+            "tenants": tenant_counts
         }
         
     except Exception as e:
@@ -298,64 +307,18 @@ async def get_tenant_statistics(db: Session = Depends(get_db_session)):
         raise HTTPException(status_code=500, detail=f"테넌시 통계 조회 실패: {str(e)}")
 
 @router.get("/services")
-async def get_service_statistics(db: Session = Depends(get_db_session)):
+async def get_service_statistics(db: AsyncSession = Depends(get_tenant_tables_read_session)):
     """
     서비스별 통계 조회 (CICD 기준 20개 서비스)
     """
     try:
-        # [advice from AI] CICD 서비스별 통계
-        service_stats = {
-            "callbot": {"deployed": 0, "tenants": 0, "resources": {}},
-            "chatbot": {"deployed": 0, "tenants": 0, "resources": {}},
-            "advisor": {"deployed": 0, "tenants": 0, "resources": {}},
-            "stt": {"deployed": 0, "tenants": 0, "resources": {}},
-            "tts": {"deployed": 0, "tenants": 0, "resources": {}},
-            "ta": {"deployed": 0, "tenants": 0, "resources": {}},
-            "qa": {"deployed": 0, "tenants": 0, "resources": {}},
-            "nlp": {"deployed": 0, "tenants": 0, "resources": {}},
-            "aicm": {"deployed": 0, "tenants": 0, "resources": {}},
-            "tts-server": {"deployed": 0, "tenants": 0, "resources": {}},
-            "nlp-server": {"deployed": 0, "tenants": 0, "resources": {}},
-            "aicm-server": {"deployed": 0, "tenants": 0, "resources": {}},
-            "stt-server": {"deployed": 0, "tenants": 0, "resources": {}},
-            "ta-server": {"deployed": 0, "tenants": 0, "resources": {}},
-            "qa-server": {"deployed": 0, "tenants": 0, "resources": {}},
-            "infrastructure": {"deployed": 0, "tenants": 0, "resources": {}},
-            "database": {"deployed": 0, "tenants": 0, "resources": {}},
-            "monitoring": {"deployed": 0, "tenants": 0, "resources": {}},
-            "ai_service": {"deployed": 0, "tenants": 0, "resources": {}}
-        }
-        
-        # 활성 테넌시에서 서비스별 통계 계산
-        active_tenants = db.query(Tenant).filter(Tenant.status == 'running').all()
-        
-        for tenant in active_tenants:
-            if hasattr(tenant, 'services') and tenant.services:
-                # [advice from AI] 서비스 데이터가 JSON 형태인지 확인
-                if isinstance(tenant.services, list):
-                    for service in tenant.services:
-                        if isinstance(service, dict):
-                            service_name = service.get('name', '').lower()
-                        else:
-                            service_name = str(service).lower()
-                        
-                        if service_name in service_stats:
-                            service_stats[service_name]["deployed"] += 1
-                            service_stats[service_name]["tenants"] += 1
-                            
-                            # 리소스 사용량 누적
-                            if isinstance(service, dict):
-                                if service.get('cpu_request'):
-                                    current_cpu = service_stats[service_name]["resources"].get('cpu', 0)
-                                    service_stats[service_name]["resources"]["cpu"] = current_cpu + _parse_resource_value(service['cpu_request'])
-                                
-                                if service.get('memory_request'):
-                                    current_memory = service_stats[service_name]["resources"].get('memory', 0)
-                                    service_stats[service_name]["resources"]["memory"] = current_memory + _parse_resource_value(service['memory_request'])
+        services, snapshot = await _snapshot(db, "services", _compute_service_totals)
+        service_stats = services["service_details"]
         
         return {
             "status": "success",
             "timestamp": datetime.now().isoformat(),
+            "snapshot": snapshot,
             "services": {
                 "total_services": 20,
                 "deployed_services": sum(1 for s in service_stats.values() if s["deployed"] > 0),
@@ -416,64 +379,30 @@ async def get_image_statistics():
         raise HTTPException(status_code=500, detail=f"이미지 통계 조회 실패: {str(e)}")
 
 @router.get("/resources")
-async def get_resource_statistics(db: Session = Depends(get_db_session)):
+async def get_resource_statistics(db: AsyncSession = Depends(get_tenant_tables_read_session)):
     """
     리소스 사용량 통계 조회
     """
     try:
-        # [advice from AI] 리소스 사용량 통계
-        active_tenants = db.query(Tenant).filter(Tenant.status == 'running').all()
-        
-        total_cpu = 0
-        total_memory = 0
-        total_gpu = 0
-        total_storage = 0
-        
-        cpu_by_preset = {"small": 0, "medium": 0, "large": 0}
-        memory_by_preset = {"small": 0, "medium": 0, "large": 0}
-        gpu_by_preset = {"small": 0, "medium": 0, "large": 0}
-        
-        for tenant in active_tenants:
-            if tenant.cpu_limit:
-                cpu_value = _parse_resource_value(tenant.cpu_limit)
-                total_cpu += cpu_value
-                if tenant.preset in cpu_by_preset:
-                    cpu_by_preset[tenant.preset] += cpu_value
-            
-            if tenant.memory_limit:
-                memory_value = _parse_resource_value(tenant.memory_limit)
-                total_memory += memory_value
-                if tenant.preset in memory_by_preset:
-                    memory_by_preset[tenant.preset] += memory_value
-            
-            if tenant.gpu_limit:
-                total_gpu += tenant.gpu_limit
-                if tenant.preset in gpu_by_preset:
-                    gpu_by_preset[tenant.preset] += tenant.gpu_limit
-            
-            if tenant.storage_limit:
-                storage_value = _parse_resource_value(tenant.storage_limit)
-                total_storage += storage_value
+        resources, snapshot = await _snapshot(db, "resources", _compute_resource_totals)
+        totals = resources["totals"]
         
         return {
             "status": "success",
             "timestamp": datetime.now().isoformat(),
+            "snapshot": snapshot,
             "resources": {
                 "total_usage": {
-                    "cpu": f"{total_cpu}m",
-                    "memory": f"{total_memory}Mi",
-                    "gpu": total_gpu,
-                    "storage": f"{total_storage}Gi"
-                },
-                "by_preset": {
-                    "cpu": cpu_by_preset,
-                    "memory": memory_by_preset,
-                    "gpu": gpu_by_preset
+                    "cpu": f"{totals['cpu']}m",
+                    "memory": f"{totals['memory']}Mi",
+                    "gpu": totals["gpu"],
+                    "storage": f"{totals['storage']}Gi"
                 },
+                "by_preset": resources["by_preset"],
                 "utilization": {
-                    "cpu_percent": min(100, (total_cpu / 100000) * 100),  # 예시 기준
-                    "memory_percent": min(100, (total_memory / 1000000) * 100),  # 예시 기준
-                    "gpu_percent": min(100, (total_gpu / 100) * 100)  # 예시 기준
+                    "cpu_percent": min(100, (totals['cpu'] / 100000) * 100),  # 예시 기준
+                    "memory_percent": min(100, (totals['memory'] / 1000000) * 100),  # 예시 기준
+                    "gpu_percent": min(100, (totals['gpu'] / 100) * 100)  # 예시 기준
                 }
             }
         }
@@ -482,24 +411,7 @@ async def get_resource_statistics(db: Session = Depends(get_db_session)):
         logger.error(f"리소스 통계 조회 실패: {e}")
         raise HTTPException(status_code=500, detail=f"리소스 통계 조회 실패: {str(e)}")
 
-def _parse_resource_value(resource_str: str) -> int:
-    """
-    리소스 문자열을 숫자로 파싱
-    예: "1000m" -> 1000, "1Gi" -> 1024
-    """
-    if not resource_str:
-        return 0
-    
-    try:
-        if resource_str.endswith('m'):
-            return int(resource_str[:-1])
-        elif resource_str.endswith('Mi'):
-            return int(resource_str[:-2])
-        elif resource_str.endswith('Gi'):
-            return int(resource_str[:-2]) * 1024
-        elif resource_str.endswith('i'):
-            return int(resource_str[:-1])
-        else:
-            return int(resource_str)
-    except ValueError:
-        return 0
+@router.get("/snapshot")
+async def get_statistics_snapshot_status():
+    """통계 스냅샷 상태 (구역별 계산 시각, 무효화된 구역, 캐시 적중 수)"""
+    return stats_snapshot.status()
@@ -26,6 +26,7 @@ from app.core.tenant_manager import TenantManager
 from app.core.resource_calculator import ResourceCalculator, ResourceRequirements
 from app.core.k8s_orchestrator import K8sOrchestrator
 from app.core.manifest_generator import ManifestGenerator
+from app.core.manifest_diff import resources_from_manifests
 from app.models.tenant_specs import (
     TenantSpecs, TenantCreateRequest, ServiceRequirements,
     PresetType, GPUType, EnvironmentVariable, VolumeMount,
@@ -41,8 +42,12 @@ from app.core.ecp_calculator_adapter import ECPCalculatorAdapter
 
 # [advice from AI] 데이터베이스 모델 임포트 추가
 from app.models.database import get_db, Tenant, Service, MonitoringData, DashboardConfig
-from app.core.database_manager import db_manager
-from sqlalchemy.orm import Session
+from app.services.manifest_store import save_manifest_version, list_manifest_versions, load_manifest
+from app.core.database_manager import db_manager, async_read_db_session_for
+from app.core.response_cache import TENANT_WRITE_TABLES, cached_endpoint
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only
 
 logger = structlog.get_logger(__name__)
 
@@ -67,6 +72,14 @@ def get_db_session(x_demo_mode: Optional[str] = Header(None)):
     finally:
         session.close()
 
+async def get_tenant_read_session(tenant_id: str):
+    """
+    테넌시 단건 조회용 읽기 세션
+    - 해당 테넌시의 최근 쓰기(생성/상태 변경)가 복제본에 반영되기 전이면 primary 사용
+    """
+    async with db_manager.get_async_session(read_only=True, consistency_key=tenant_id) as session:
+        yield session
+
 # 전역 의존성 (실제 구현에서는 Dependency Injection 사용)
 tenant_manager = None
 k8s_orchestrator = None
@@ -187,20 +200,30 @@ class TenantListResponse(BaseModel):
 # 데이터베이스 연동 함수들
 # ==========================================
 
-async def get_tenants_from_db(db: Session) -> List[Dict[str, Any]]:
+# [advice from AI] 목록 조회에 필요한 컬럼만 로드 (매니페스트/설정 JSON 등 대용량 컬럼 제외)
+TENANT_LIST_COLUMNS = (
+    Tenant.id, Tenant.tenant_id, Tenant.name, Tenant.preset, Tenant.is_demo, Tenant.status,
+    Tenant.service_requirements, Tenant.resources, Tenant.gpu_type, Tenant.gpu_limit, Tenant.created_at,
+)
+
+async def get_tenants_from_db(db: AsyncSession) -> List[Dict[str, Any]]:
     """데이터베이스에서 테넌시 목록 조회"""
     try:
         # 테넌시 및 서비스 정보 조회
-        tenants = db.query(Tenant).all()
+        tenants = (await db.scalars(select(Tenant).options(load_only(*TENANT_LIST_COLUMNS)))).all()
         tenant_summaries = []
         
+        # [advice from AI] 서비스 이름은 테넌시별 반복 조회 대신 한 번에 조회
+        service_names_by_tenant: Dict[str, List[str]] = {}
+        for service_tenant_id, service_name in (await db.execute(select(Service.tenant_id, Service.service_name))).all():
+            service_names_by_tenant.setdefault(service_tenant_id, []).append(service_name)
+        
         for tenant in tenants:
             # [advice from AI] Service 테이블에서 실제 서비스 개수 조회 (service_requirements는 처리량 데이터)
-            services = db.query(Service).filter(Service.tenant_id == tenant.tenant_id).all()
-            total_services = len(services)
+            service_names = service_names_by_tenant.get(tenant.tenant_id, [])
+            total_services = len(service_names)
             
             # [advice from AI] 실제 배포된 서비스에서 서비스 구성 추출 (service_name 기준)
-            service_names = [s.service_name for s in services] if services else []
             service_config = {
                 "callbot": service_names.count("callbot"),
                 "chatbot": service_names.count("chatbot"), 
@@ -301,7 +324,7 @@ async def create_tenant_in_db(db: Session, tenant_data: dict) -> Tenant:
 
 async def deploy_tenant_to_simulator(
     tenant_id: str, 
-    manifest_content: str, 
+    manifest_content: Dict[str, str], 
     tenant_specs: TenantSpecs
 ):
     """
@@ -313,67 +336,48 @@ async def deploy_tenant_to_simulator(
     try:
         logger.info("시뮬레이터 배포 백그라운드 작업 시작", tenant_id=tenant_id)
         
-        # 시뮬레이터 API 호출
+        # 시뮬레이터 API 호출 - 검증/파싱/배포를 단일 요청으로 처리
         import httpx
+        from app.services.k8s_simulator_client import K8sSimulatorClient
         simulator_url = os.getenv('K8S_SIMULATOR_EXTERNAL_URL', 'http://localhost:6360')
+        simulator_client = K8sSimulatorClient(base_url=simulator_url)
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # 1. 시뮬레이터 연결 확인
-            try:
-                health_response = await client.get(f"{simulator_url}/")
-                if health_response.status_code != 200:
-                    raise Exception("시뮬레이터 연결 실패")
-                logger.info("시뮬레이터 연결 확인 완료", tenant_id=tenant_id)
-            except Exception as health_error:
-                logger.error("시뮬레이터 연결 실패", tenant_id=tenant_id, error=str(health_error))
-                await update_tenant_status(tenant_id, "deploy_failed", f"시뮬레이터 연결 실패: {str(health_error)}")
-                return
+        try:
+            deploy_result = await simulator_client.apply_manifest(
+                manifest_content,
+                tenant_id=tenant_id,
+                namespace=f"{tenant_id}-ecp-ai"
+            )
+            logger.info("시뮬레이터 배포 시작 완료", tenant_id=tenant_id,
+                       deployed_count=deploy_result.get("deployed_count"),
+                       parse_cached=deploy_result.get("parse_cached"),
+                       content_hash=deploy_result.get("content_hash"))
             
-            # 2. 매니페스트 파싱 및 검증
-            try:
-                parse_response = await client.post(
-                    f"{simulator_url}/k8s/manifest/parse",
-                    json={
-                        "manifest": manifest_content,
-                        "tenant_id": tenant_id
-                    }
-                )
-                if parse_response.status_code != 200:
-                    raise Exception(f"매니페스트 검증 실패: {parse_response.text}")
-                logger.info("매니페스트 검증 완료", tenant_id=tenant_id)
-            except Exception as parse_error:
-                logger.error("매니페스트 검증 실패", tenant_id=tenant_id, error=str(parse_error))
-                await update_tenant_status(tenant_id, "deploy_failed", f"매니페스트 검증 실패: {str(parse_error)}")
-                return
+            # [advice from AI] 즉시 running으로 변경하지 않고, 자동 완료 타이머 시작
+            await update_tenant_status(tenant_id, "deploying", "시뮬레이터 배포 진행 중 - 자동 완료 대기")
             
-            # 3. 시뮬레이터에 배포
-            try:
-                deploy_response = await client.post(
-                    f"{simulator_url}/k8s/manifest/deploy",
-                    json={
-                        "manifest": manifest_content,
-                        "tenant_id": tenant_id
-                    }
-                )
-                if deploy_response.status_code != 200:
-                    raise Exception(f"시뮬레이터 배포 실패: {deploy_response.text}")
-                
-                deploy_result = deploy_response.json()
-                logger.info("시뮬레이터 배포 시작 완료", tenant_id=tenant_id, result=deploy_result)
-                
-                # [advice from AI] 즉시 running으로 변경하지 않고, 자동 완료 타이머 시작
-                await update_tenant_status(tenant_id, "deploying", "시뮬레이터 배포 진행 중 - 자동 완료 대기")
-                
-                # 백그라운드에서 자동 완료 처리 (60-120초 후)
-                import asyncio
-                import random
-                deployment_duration = random.randint(60, 120)  # 1-2분 랜덤
-                asyncio.create_task(auto_complete_deployment(tenant_id, deployment_duration))
-                
-            except Exception as deploy_error:
-                logger.error("시뮬레이터 배포 실패", tenant_id=tenant_id, error=str(deploy_error))
-                await update_tenant_status(tenant_id, "deploy_failed", f"시뮬레이터 배포 실패: {str(deploy_error)}")
-                return
+            # 백그라운드에서 자동 완료 처리 (60-120초 후)
+            import asyncio
+            import random
+            deployment_duration = random.randint(60, 120)  # 1-2분 랜덤
+            asyncio.create_task(auto_complete_deployment(tenant_id, deployment_duration))
+            
+        except httpx.RequestError as connect_error:
+            logger.error("시뮬레이터 연결 실패", tenant_id=tenant_id, error=str(connect_error))
+            await update_tenant_status(tenant_id, "deploy_failed", f"시뮬레이터 연결 실패: {str(connect_error)}")
+            return
+        except httpx.HTTPStatusError as status_error:
+            # 400/422: 매니페스트 검증 실패, 그 외: 배포 실패
+            response = status_error.response
+            if response.status_code in (400, 422):
+                logger.error("매니페스트 검증 실패", tenant_id=tenant_id, error=response.text)
+                await update_tenant_status(tenant_id, "deploy_failed", f"매니페스트 검증 실패: {response.text}")
+            else:
+                logger.error("시뮬레이터 배포 실패", tenant_id=tenant_id, error=response.text)
+                await update_tenant_status(tenant_id, "deploy_failed", f"시뮬레이터 배포 실패: {response.text}")
+            return
+        finally:
+            await simulator_client.close()
         
         logger.info("시뮬레이터 배포 백그라운드 작업 완료", tenant_id=tenant_id)
         
@@ -438,18 +442,20 @@ async def check_and_fix_stuck_deployments():
         # DB 세션 생성
         db = next(get_db_session())
         
-        # deploying 상태인 모든 테넌시 조회
-        deploying_tenants = db.query(Tenant).filter(Tenant.status == "deploying").all()
+        # deploying 상태인 모든 테넌시 ID만 조회
+        deploying_tenant_ids = db.scalars(
+            select(Tenant.tenant_id).where(Tenant.status == "deploying")
+        ).all()
         
-        if deploying_tenants:
-            logger.info(f"발견된 deploying 상태 테넌시: {len(deploying_tenants)}개")
+        if deploying_tenant_ids:
+            logger.info(f"발견된 deploying 상태 테넌시: {len(deploying_tenant_ids)}개")
             
-            for tenant in deploying_tenants:
-                logger.info(f"자동 완료 처리 시작: {tenant.id}")
+            for deploying_tenant_id in deploying_tenant_ids:
+                logger.info(f"자동 완료 처리 시작: {deploying_tenant_id}")
                 # 즉시 자동 완료 처리 (10-60초 랜덤 지연)
                 import random
                 short_delay = random.randint(10, 60)
-                asyncio.create_task(auto_complete_deployment(tenant.id, short_delay))
+                asyncio.create_task(auto_complete_deployment(deploying_tenant_id, short_delay))
         else:
             logger.info("deploying 상태인 테넌시가 없습니다")
         
@@ -465,12 +471,12 @@ async def check_and_fix_stuck_deployments():
 
 @router.get("/", response_model=TenantListResponse)
 async def list_tenants(
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(async_read_db_session_for(*TENANT_WRITE_TABLES)),
     x_demo_mode: Optional[str] = Header(None)
 ):
     """
     테넌시 목록 조회
-    - 데이터베이스에서 테넌시 정보 조회
+    - 데이터베이스에서 테넌시 정보 조회 (tenants/services 최근 쓰기가 복제본에 반영되기 전이면 primary)
     - 데모/운영 구분
     - 서비스 개수 포함
     """
@@ -501,13 +507,13 @@ async def list_tenants(
 
 
 @router.get("/{tenant_id}", response_model=TenantSummary)
-async def get_tenant(tenant_id: str, db: Session = Depends(get_db)):
+async def get_tenant(tenant_id: str, db: AsyncSession = Depends(get_tenant_read_session)):
     """
     특정 테넌시 정보 조회
     - 데이터베이스에서 테넌시 상세 정보 조회
     """
     try:
-        tenant = db.query(Tenant).filter(Tenant.tenant_id == tenant_id).first()
+        tenant = await db.scalar(select(Tenant).where(Tenant.tenant_id == tenant_id))
         
         if not tenant:
             raise HTTPException(
@@ -516,7 +522,9 @@ async def get_tenant(tenant_id: str, db: Session = Depends(get_db)):
             )
         
         # 서비스 개수 계산
-        services_count = db.query(Service).filter(Service.tenant_id == tenant.tenant_id).count()
+        services_count = await db.scalar(
+            select(func.count(Service.id)).where(Service.tenant_id == tenant.tenant_id)
+        )
         
         return TenantSummary(
             tenant_id=tenant.tenant_id,
@@ -1001,10 +1009,8 @@ async def create_tenant(
                 manifest_generator = ManifestGenerator()
                 manifest_content = manifest_generator.generate_tenant_manifests(tenant_specs)
                 
-                # [advice from AI] 데이터베이스에 매니페스트 저장 - JSON으로 변환
-                import json
-                tenant.manifest_content = json.dumps(manifest_content)
-                tenant.manifest_generated_at = datetime.utcnow()
+                # [advice from AI] 매니페스트는 tenant_manifests 테이블에 버전별 압축 저장
+                save_manifest_version(db, request.tenant_id, manifest_content, created_by=tenant.created_by)
                 tenant.status = "deploying"
                 db.commit()
                 
@@ -1071,13 +1077,13 @@ async def create_tenant(
 
 
 @router.get("/{tenant_id}", response_model=TenantSummary)
-async def get_tenant(tenant_id: str, db: Session = Depends(get_db)):
+async def get_tenant(tenant_id: str, db: AsyncSession = Depends(get_tenant_read_session)):
     """
     특정 테넌시 정보 조회
     - 데이터베이스에서 테넌시 상세 정보 조회
     """
     try:
-        tenant = db.query(Tenant).filter(Tenant.tenant_id == tenant_id).first()
+        tenant = await db.scalar(select(Tenant).where(Tenant.tenant_id == tenant_id))
         
         if not tenant:
             raise HTTPException(
@@ -1086,7 +1092,9 @@ async def get_tenant(tenant_id: str, db: Session = Depends(get_db)):
             )
         
         # 서비스 개수 계산
-        services_count = db.query(Service).filter(Service.tenant_id == tenant.tenant_id).count()
+        services_count = await db.scalar(
+            select(func.count(Service.id)).where(Service.tenant_id == tenant.tenant_id)
+        )
         
         return TenantSummary(
             tenant_id=tenant.tenant_id,
@@ -1453,6 +1461,35 @@ async def download_deployment_package(
         )
 
 
+@router.get("/{tenant_id}/manifest-versions")
+async def get_manifest_versions(tenant_id: str, db: AsyncSession = Depends(get_tenant_read_session)):
+    """
+    [advice from AI] 저장된 매니페스트 버전 목록 조회
+    - 본문 없이 버전/크기/체크섬 등 요약 정보만 반환
+    """
+    versions = await db.run_sync(list_manifest_versions, tenant_id)
+    return {"tenant_id": tenant_id, "versions": versions, "total": len(versions)}
+
+
+@router.get("/{tenant_id}/manifest-versions/{version}")
+async def get_manifest_version(tenant_id: str, version: str,
+                               db: AsyncSession = Depends(get_tenant_read_session)):
+    """
+    [advice from AI] 저장된 매니페스트 본문 조회
+    - version: 버전 번호 또는 latest
+    """
+    if version != "latest" and not version.isdigit():
+        raise HTTPException(status_code=400, detail="version은 숫자 또는 latest여야 합니다")
+
+    manifests = await db.run_sync(load_manifest, tenant_id, None if version == "latest" else int(version))
+    if manifests is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"테넌시 '{tenant_id}'의 매니페스트 버전 '{version}'을 찾을 수 없습니다"
+        )
+    return {"tenant_id": tenant_id, "version": version, "manifests": manifests}
+
+
 @router.get("/{tenant_id}/manifest-preview")
 async def get_manifest_preview(
     tenant_id: str,
@@ -1494,9 +1531,9 @@ async def get_manifest_preview(
                 service_config = config_manager.get_service_config(service_name)
                 
                 # 이미지 정보 추출
-                import yaml
+                from app.core import yaml_io
                 try:
-                    manifest_yaml = yaml.safe_load(content)
+                    manifest_yaml = yaml_io.load(content)
                     containers = manifest_yaml.get('spec', {}).get('template', {}).get('spec', {}).get('containers', [])
                     
                     for container in containers:
@@ -1521,7 +1558,7 @@ async def get_manifest_preview(
                         }
                         image_matching_info.append(image_info)
                         
-                except yaml.YAMLError as e:
+                except yaml_io.YAMLError as e:
                     logger.warning(f"매니페스트 YAML 파싱 실패: {filename}", error=str(e))
         
         # 매니페스트 수정 가능 여부 확인
@@ -1600,8 +1637,8 @@ async def update_manifest(
             
             try:
                 # YAML 문법 검증
-                import yaml
-                yaml.safe_load(content)
+                from app.core import yaml_io
+                yaml_io.load(content)
                 
                 # 파일 백업 생성
                 backup_path = f"{file_path}.backup.{int(time.time())}"
@@ -1623,7 +1660,7 @@ async def update_manifest(
                 
                 logger.info(f"매니페스트 파일 수정 완료: {filename}")
                 
-            except yaml.YAMLError as e:
+            except yaml_io.YAMLError as e:
                 validation_errors.append(f"YAML 문법 오류 ({filename}): {str(e)}")
             except Exception as e:
                 validation_errors.append(f"파일 수정 실패 ({filename}): {str(e)}")
@@ -1652,6 +1689,68 @@ async def update_manifest(
         )
 
 
+@router.post("/{tenant_id}/apply-manifests")
+async def apply_tenant_manifests(
+    tenant_id: str,
+    request: ManifestGenerationRequest,
+    dry_run: bool = True,
+    tenant_mgr: TenantManager = Depends(get_tenant_manager)
+):
+    """
+    [advice from AI] 매니페스트 diff 적용
+    - ManifestGenerator 결과와 클러스터 실제 상태 비교
+    - 변경된 리소스만 server-side apply (dry_run=true 시 변경 계획만 반환)
+    """
+    k8s_orch = get_k8s_orchestrator()
+    if k8s_orch is None:
+        raise HTTPException(status_code=503, detail="Kubernetes 클러스터에 연결되어 있지 않습니다")
+    
+    try:
+        logger.info("매니페스트 diff 적용 요청", tenant_id=tenant_id, dry_run=dry_run)
+        
+        service_requirements = ServiceRequirements(
+            callbot=request.callbot,
+            chatbot=request.chatbot,
+            advisor=request.advisor,
+            stt=request.stt,
+            tts=request.tts,
+            ta=request.ta,
+            qa=request.qa
+        )
+        tenant_specs = tenant_mgr.generate_tenant_specs(
+            tenant_id=tenant_id,
+            service_requirements=service_requirements.model_dump(),
+            gpu_type=request.gpu_type
+        )
+        
+        manifest_generator = ManifestGenerator()
+        if request.kubernetes_advanced_config:
+            manifests = manifest_generator.generate_tenant_manifests_with_advanced_config(
+                tenant_specs,
+                request.kubernetes_advanced_config
+            )
+        else:
+            manifests = manifest_generator.generate_tenant_manifests(tenant_specs)
+        
+        resources = resources_from_manifests(manifests, default_namespace=f"{tenant_id}-ecp-ai")
+        report = await k8s_orch.apply_resources(resources, dry_run=dry_run)
+        
+        return {
+            "success": report["summary"]["failed"] == 0,
+            "tenant_id": tenant_id,
+            **report
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("매니페스트 diff 적용 실패", tenant_id=tenant_id, error=str(e))
+        raise HTTPException(
+            status_code=500,
+            detail=f"매니페스트 적용 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
 @router.post("/{tenant_id}/validate-deployment")
 async def validate_deployment(
     tenant_id: str,
@@ -1963,6 +2062,7 @@ async def get_preset_template(
 # ==========================================
 
 @router.get("/monitoring/system-metrics")
+@cached_endpoint(invalidate_on=TENANT_WRITE_TABLES)
 async def get_system_metrics() -> Dict[str, Any]:
     """
     시스템 전체 메트릭 조회 (데모 데이터)
@@ -2011,6 +2111,7 @@ async def get_system_metrics() -> Dict[str, Any]:
 
 
 @router.get("/monitoring/tenant-comparison")
+@cached_endpoint(invalidate_on=TENANT_WRITE_TABLES)
 async def get_tenant_comparison() -> Dict[str, Any]:
     """
     테넌시별 성능 비교 데이터 (데모 데이터)
@@ -2061,6 +2162,7 @@ async def get_tenant_comparison() -> Dict[str, Any]:
 
 
 @router.get("/monitoring/sla-trends")
+@cached_endpoint(invalidate_on=TENANT_WRITE_TABLES)
 async def get_sla_trends() -> Dict[str, Any]:
     """
     SLA 메트릭 트렌드 데이터 (데모 데이터)
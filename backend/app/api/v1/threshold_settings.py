@@ -15,6 +15,7 @@ from sqlalchemy import desc
 
 from app.models.database import ThresholdSettings, SessionLocal
 from app.core.database_manager import get_db_session
+from app.core.threshold_engine import DEFAULT_THRESHOLDS
 
 router = APIRouter()
 
@@ -229,20 +230,12 @@ async def get_default_threshold_settings(db: Session = Depends(get_db)):
         
         if not default_setting:
             # 기본 설정이 없으면 생성
-            default_thresholds = {
-                "cpu": {"warning": 80, "critical": 90},
-                "memory": {"warning": 85, "critical": 95},
-                "gpu": {"warning": 80, "critical": 90},
-                "response_time": {"warning": 500, "critical": 1000},
-                "error_rate": {"warning": 5.0, "critical": 10.0}
-            }
-            
             default_setting = ThresholdSettings(
                 setting_id="default-monitoring-thresholds",
                 name="기본 모니터링 임계값",
                 description="시스템 기본 모니터링 임계값 설정",
                 category="monitoring",
-                thresholds=default_thresholds,
+                thresholds=DEFAULT_THRESHOLDS,
                 notifications_enabled=True,
                 email_enabled=False,
                 sms_enabled=False,
@@ -0,0 +1,178 @@
+# [advice from AI] 알림 폭주 대응 - 지문 기반 중복 제거 및 집계
+"""
+알림 집계기
+- 알림 지문(fingerprint) = 테넌시 + 서비스 + 유형(카테고리/제목) + 심각도
+- 집계 창(window) 안의 반복 알림은 기존 열린 알림 하나로 합침 (발생 횟수, 최초/최근 발생 시각)
+- 새 지문은 토큰 버킷으로 발생 속도 제한 (critical은 제한하지 않음)
+- 합쳐진 알림의 횟수/최근 시각은 주기적으로 모아서 DB 갱신 (폭주 시에도 DB 쓰기량 상한)
+- 처리 결과별 카운터와 중복 제거 비율을 Prometheus 메트릭으로 노출
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+from prometheus_client import Counter, Gauge
+
+# [advice from AI] 집계 창(초) / 새 지문 허용 속도(분당) / 순간 허용량 / 열린 지문 최대 개수
+ALERT_AGGREGATION_WINDOW = float(os.getenv("ALERT_AGGREGATION_WINDOW", "300"))
+ALERT_NEW_FINGERPRINT_RATE = float(os.getenv("ALERT_NEW_FINGERPRINT_RATE", "120"))
+ALERT_NEW_FINGERPRINT_BURST = int(os.getenv("ALERT_NEW_FINGERPRINT_BURST", "30"))
+ALERT_AGGREGATION_MAX_OPEN = int(os.getenv("ALERT_AGGREGATION_MAX_OPEN", "10000"))
+
+NEW = "new"
+FOLDED = "folded"
+SUPPRESSED = "suppressed"
+
+ALERTS_INGESTED = Counter(
+    "ecp_alerts_ingested_total",
+    "Alerts received by the aggregation stage",
+    ["source", "outcome"]
+)
+
+
+def alert_fingerprint(alert: Dict[str, Any]) -> str:
+    """알림 지문 (테넌시, 서비스, 유형, 심각도)"""
+    parts = (
+        alert.get("tenant_id") or "",
+        alert.get("service_name") or "",
+        alert.get("category") or "",
+        alert.get("title") or "",
+        alert.get("severity") or "",
+    )
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class OpenAlert:
+    """집계 창 안에서 열려 있는 알림"""
+    alert: Dict[str, Any]
+    opened_at: float
+    seen_at: float
+    dirty: bool = False
+
+
+@dataclass
+class AggregationResult:
+    outcome: str
+    alert: Dict[str, Any]
+    fingerprint: str = field(default="")
+
+
+class AlertAggregator:
+    """지문 기반 알림 중복 제거/집계기 (스레드 안전)"""
+
+    def __init__(self,
+                 window: float = ALERT_AGGREGATION_WINDOW,
+                 new_per_minute: float = ALERT_NEW_FINGERPRINT_RATE,
+                 burst: int = ALERT_NEW_FINGERPRINT_BURST,
+                 max_open: int = ALERT_AGGREGATION_MAX_OPEN,
+                 clock: Callable[[], float] = time.monotonic):
+        self.window = window
+        self.refill_per_second = new_per_minute / 60.0
+        self.burst = burst
+        self.max_open = max_open
+        self._clock = clock
+        self._tokens = float(burst)
+        self._refilled_at = clock()
+        self._open: "OrderedDict[str, OpenAlert]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._evicted_updates: List[Dict[str, Any]] = []
+        self.counts = {NEW: 0, FOLDED: 0, SUPPRESSED: 0}
+
+    @staticmethod
+    def _update_row(entry: OpenAlert) -> Dict[str, Any]:
+        entry.dirty = False
+        return {
+            "b_alert_id": entry.alert["alert_id"],
+            "b_count": entry.alert["occurrence_count"],
+            "b_last_seen": entry.alert["last_seen_at"],
+        }
+
+    def _take_token(self, now: float) -> bool:
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.refill_per_second)
+        self._refilled_at = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def _expire(self, now: float):
+        # 최근 발생 순서로 정렬되어 있으므로 앞에서부터 만료 (미반영 집계는 다음 drain에서 기록)
+        while self._open:
+            entry = next(iter(self._open.values()))
+            if now - entry.seen_at <= self.window and len(self._open) <= self.max_open:
+                break
+            self._open.popitem(last=False)
+            if entry.dirty:
+                self._evicted_updates.append(self._update_row(entry))
+
+    def ingest(self, alert: Dict[str, Any], source: str = "api") -> AggregationResult:
+        """
+        알림 집계
+        - folded: 열린 알림에 합침 (result.alert는 기존 알림, 횟수/최근 시각 갱신됨)
+        - new: 새 알림으로 저장 필요 (지문/횟수 필드 추가됨)
+        - suppressed: 새 지문 발생 속도 초과로 버림
+        """
+        fingerprint = alert_fingerprint(alert)
+        seen_at = alert.get("timestamp") or datetime.utcnow()
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            entry = self._open.get(fingerprint)
+            if entry is not None:
+                entry.alert["occurrence_count"] = entry.alert.get("occurrence_count", 1) + 1
+                entry.alert["last_seen_at"] = seen_at
+                entry.seen_at = now
+                entry.dirty = True
+                self._open.move_to_end(fingerprint)
+                outcome, target = FOLDED, entry.alert
+            elif alert.get("severity") == "critical" or self._take_token(now):
+                alert.update(fingerprint=fingerprint, occurrence_count=1, last_seen_at=seen_at)
+                self._open[fingerprint] = OpenAlert(alert=alert, opened_at=now, seen_at=now)
+                outcome, target = NEW, alert
+            else:
+                outcome, target = SUPPRESSED, alert
+            self.counts[outcome] += 1
+        ALERTS_INGESTED.labels(source=source, outcome=outcome).inc()
+        return AggregationResult(outcome=outcome, alert=target, fingerprint=fingerprint)
+
+    def forget(self, alert_id: str):
+        """알림 삭제/해결 시 열린 지문에서 제거 (다음 발생은 새 알림)"""
+        with self._lock:
+            for fingerprint, entry in list(self._open.items()):
+                if entry.alert.get("alert_id") == alert_id:
+                    del self._open[fingerprint]
+                    if entry.dirty:
+                        self._evicted_updates.append(self._update_row(entry))
+
+    def drain_updates(self) -> List[Dict[str, Any]]:
+        """DB에 반영할 집계 변경분 (alert_id, 횟수, 최근 발생 시각)"""
+        with self._lock:
+            updates, self._evicted_updates = self._evicted_updates, []
+            updates.extend(self._update_row(entry) for entry in self._open.values() if entry.dirty)
+            return updates
+
+    def dedup_ratio(self) -> float:
+        """합쳐지거나 버려진 알림 비율"""
+        total = sum(self.counts.values())
+        return (self.counts[FOLDED] + self.counts[SUPPRESSED]) / total if total else 0.0
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            open_count = len(self._open)
+        return {"open_fingerprints": open_count, "window_seconds": self.window,
+                "dedup_ratio": round(self.dedup_ratio(), 4), **self.counts}
+
+
+alert_aggregator = AlertAggregator()
+
+ALERT_DEDUP_RATIO = Gauge("ecp_alert_dedup_ratio", "Share of alerts folded or suppressed by aggregation")
+ALERT_DEDUP_RATIO.set_function(alert_aggregator.dedup_ratio)
+ALERT_OPEN_FINGERPRINTS = Gauge("ecp_alert_open_fingerprints", "Alert fingerprints inside the aggregation window")
+ALERT_OPEN_FINGERPRINTS.set_function(lambda: len(alert_aggregator._open))
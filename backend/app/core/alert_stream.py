@@ -0,0 +1,117 @@
+# [advice from AI] 알림 조회 스트림 - keyset 커서 페이지네이션 + 메모리/DB 병합
+"""
+알림 조회 스트림
+- 정렬 키는 (timestamp, alert_id) 내림차순 (메모리 알림과 DB 알림이 같은 키를 공유)
+- 커서는 마지막 알림의 정렬 키를 인코딩 (OFFSET 없이 인덱스 범위 조회)
+- 메모리 최근 버퍼와 DB 조회 결과를 k-way 병합, alert_id 기준 중복 제거
+- 필터별 전체 개수는 TTL 캐시 (근사값)
+"""
+
+import base64
+import heapq
+import json
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from sqlalchemy import Select, select, tuple_
+
+from app.models.database import Alert
+
+# [advice from AI] 필터별 전체 개수 캐시 유지 시간(초)
+ALERT_COUNT_CACHE_TTL = float(os.getenv("ALERT_COUNT_CACHE_TTL", "30"))
+
+AlertKey = Tuple[datetime, str]
+
+
+def _naive_utc(value: Any) -> datetime:
+    """비교용 timestamp 정규화 (naive UTC, 파싱 불가 시 datetime.min)"""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return datetime.min
+    if not isinstance(value, datetime):
+        return datetime.min
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def alert_sort_key(alert: Dict[str, Any]) -> AlertKey:
+    """알림 정렬 키 (timestamp, alert_id)"""
+    return _naive_utc(alert.get("timestamp")), alert.get("alert_id") or ""
+
+
+def encode_cursor(key: AlertKey) -> str:
+    """정렬 키 → 불투명 커서 문자열"""
+    raw = json.dumps([key[0].isoformat(), key[1]]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> AlertKey:
+    """커서 문자열 → 정렬 키 (형식 오류 시 ValueError)"""
+    try:
+        timestamp, alert_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(timestamp), str(alert_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"잘못된 커서: {cursor}") from e
+
+
+def keyset_query(filters: List[Any], after: Optional[AlertKey], limit: int) -> Select:
+    """커서 이후 알림 조회 쿼리 ((timestamp, alert_id) 인덱스 범위 조회)"""
+    stmt = select(Alert).where(*filters)
+    if after is not None:
+        after_timestamp = after[0].replace(tzinfo=timezone.utc)
+        stmt = stmt.where(tuple_(Alert.timestamp, Alert.alert_id) < (after_timestamp, after[1]))
+    return stmt.order_by(Alert.timestamp.desc(), Alert.alert_id.desc()).limit(limit)
+
+
+def recent_page(recent: Iterable[Dict[str, Any]],
+                predicate: Callable[[Dict[str, Any]], bool],
+                after: Optional[AlertKey],
+                limit: int) -> List[Dict[str, Any]]:
+    """메모리 최근 알림 중 필터/커서 조건을 만족하는 상위 limit개 (정렬 키 내림차순)"""
+    candidates = (
+        alert for alert in recent
+        if predicate(alert) and (after is None or alert_sort_key(alert) < after)
+    )
+    return heapq.nlargest(limit, candidates, key=alert_sort_key)
+
+
+def merge_alert_pages(recent: List[Dict[str, Any]],
+                      stored: List[Dict[str, Any]],
+                      limit: int) -> Tuple[List[Dict[str, Any]], bool]:
+    """정렬된 메모리/DB 알림 병합 (alert_id 중복 제거), (페이지, 다음 페이지 존재 여부) 반환"""
+    page: List[Dict[str, Any]] = []
+    seen = set()
+    for alert in heapq.merge(recent, stored, key=alert_sort_key, reverse=True):
+        alert_id = alert.get("alert_id")
+        if alert_id in seen:
+            continue
+        seen.add(alert_id)
+        if len(page) == limit:
+            return page, True
+        page.append(alert)
+    return page, False
+
+
+class AlertCountCache:
+    """필터 조합별 알림 개수 TTL 캐시"""
+
+    def __init__(self, ttl: float = ALERT_COUNT_CACHE_TTL):
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, int]] = {}
+
+    async def get(self, key: Hashable, loader: Callable[[], Awaitable[int]]) -> int:
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < self.ttl:
+            return entry[1]
+        count = await loader()
+        self._entries[key] = (now, count)
+        return count
+
+    def invalidate(self) -> None:
+        self._entries.clear()
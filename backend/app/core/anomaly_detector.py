@@ -0,0 +1,231 @@
+# [advice from AI] 테넌시/서비스 메트릭 실시간 이상 탐지 (시간대별 EWMA 기준선 + z-score)
+"""
+이상 탐지기
+- 시계열(테넌시, 서비스) x 메트릭마다 시간대(0~23시)별 EWMA 평균/분산 기준선 유지
+- 시계열당 메모리 고정 (24개 시간대 + 전체 기준선), 점 하나당 O(1) 갱신
+- 시간대 기준선이 충분히 학습되기 전에는 전체(비계절) 기준선으로 판단
+- 기준선 대비 상승 z-score가 기준을 넘으면 warning/critical, 해제 기준 아래로 내려오면 해제
+- 틱 단위로 전체 시계열을 numpy로 한 번에 갱신, 상태 전이만 반환 (임계값 엔진과 같은 형식)
+"""
+
+import math
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from prometheus_client import Gauge, Histogram
+
+from app.core.threshold_engine import LEVELS, METRIC_LABELS
+
+# [advice from AI] 탐지 대상 메트릭 / EWMA 가중치 / z-score 기준 / 학습 최소 표본 수
+ANOMALY_METRICS = ("cpu", "error_rate", "response_time")
+ANOMALY_ALPHA = float(os.getenv("ANOMALY_ALPHA", "0.1"))
+ANOMALY_Z_WARNING = float(os.getenv("ANOMALY_Z_WARNING", "3"))
+ANOMALY_Z_CRITICAL = float(os.getenv("ANOMALY_Z_CRITICAL", "5"))
+ANOMALY_Z_CLEAR = float(os.getenv("ANOMALY_Z_CLEAR", "2"))
+ANOMALY_MIN_SAMPLES = int(os.getenv("ANOMALY_MIN_SAMPLES", "20"))
+# 분산이 거의 0인 시계열의 과민 반응 방지 (평균 대비 최소 표준편차 비율)
+ANOMALY_MIN_STD_RATIO = 0.05
+# 메트릭별 최소 표준편차 (단위: %, ms) - 0으로 평탄한 기준선에서도 급등 판정 가능
+ANOMALY_MIN_STD = {"cpu": 1.0, "memory": 1.0, "gpu": 1.0, "error_rate": 0.1, "response_time": 5.0}
+ANOMALY_DEFAULT_MIN_STD = 0.01
+HOURS = 24
+
+ANOMALY_EVALUATION_SECONDS = Histogram(
+    "ecp_anomaly_evaluation_seconds",
+    "Time spent updating anomaly baselines for one metrics tick",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+)
+ANOMALY_SERIES = Gauge("ecp_anomaly_series", "Tenant/service series tracked by the anomaly detector")
+
+
+@dataclass
+class AnomalyTransition:
+    """이상 상태 전이 (임계값 규칙 전이와 같은 형식으로 알림 파이프라인에 전달)"""
+    tenant_id: Optional[str]
+    service_name: Optional[str]
+    metric: str
+    previous: str
+    current: str
+    value: float
+    expected: float
+    z_score: float
+    at: float
+    kind: str = "anomaly"
+
+    @property
+    def key(self) -> Tuple[Optional[str], Optional[str], str, str]:
+        return self.tenant_id, self.service_name, self.metric, self.kind
+
+    @property
+    def firing(self) -> bool:
+        return self.current != "ok"
+
+    @property
+    def threshold(self) -> float:
+        return self.expected
+
+    @property
+    def category(self) -> str:
+        return METRIC_LABELS.get(self.metric, (self.metric, "", "performance"))[2]
+
+    @property
+    def title(self) -> str:
+        return f"{METRIC_LABELS.get(self.metric, (self.metric,))[0]} 이상 징후"
+
+    @property
+    def message(self) -> str:
+        label, unit, _ = METRIC_LABELS.get(self.metric, (self.metric, "", ""))
+        target = self.service_name or self.tenant_id or "시스템"
+        return (f"{target} {label}이 {self.value:.1f}{unit}로 평소 수준({self.expected:.1f}{unit})보다 "
+                f"크게 높습니다 (z={self.z_score:.1f})")
+
+
+class AnomalyDetector:
+    """시간대별 EWMA 기준선 기반 이상 탐지기"""
+
+    def __init__(self,
+                 metrics: Tuple[str, ...] = ANOMALY_METRICS,
+                 alpha: float = ANOMALY_ALPHA,
+                 z_warning: float = ANOMALY_Z_WARNING,
+                 z_critical: float = ANOMALY_Z_CRITICAL,
+                 z_clear: float = ANOMALY_Z_CLEAR,
+                 min_samples: int = ANOMALY_MIN_SAMPLES):
+        self.metrics = tuple(metrics)
+        self.alpha = alpha
+        self.z_warning = z_warning
+        self.z_critical = z_critical
+        self.z_clear = z_clear
+        self.min_samples = min_samples
+        self._min_std = np.array([ANOMALY_MIN_STD.get(metric, ANOMALY_DEFAULT_MIN_STD) for metric in self.metrics])
+        self._rows: Dict[Tuple[Optional[str], Optional[str]], int] = {}
+        self._series: List[Tuple[Optional[str], Optional[str]]] = []
+        self.last_tick: Dict[str, Any] = {"series": 0, "transitions": 0, "duration_ms": 0.0}
+        self._allocate(16)
+
+    def _allocate(self, capacity: int):
+        metric_count = len(self.metrics)
+        # 시간대별 기준선 [행, 시간대, 메트릭] / 전체 기준선 [행, 메트릭]
+        self._hour_mean = np.zeros((capacity, HOURS, metric_count))
+        self._hour_var = np.zeros((capacity, HOURS, metric_count))
+        self._hour_count = np.zeros((capacity, HOURS, metric_count), dtype=np.int32)
+        self._mean = np.zeros((capacity, metric_count))
+        self._var = np.zeros((capacity, metric_count))
+        self._count = np.zeros((capacity, metric_count), dtype=np.int32)
+        self._z = np.zeros((capacity, metric_count))
+        self._state = np.zeros((capacity, metric_count), dtype=np.int8)
+
+    def _grow(self, needed: int):
+        capacity = len(self._state)
+        if needed <= capacity:
+            return
+        pad = max(needed, capacity * 2) - capacity
+        for name in ("_hour_mean", "_hour_var", "_hour_count", "_mean", "_var", "_count", "_z", "_state"):
+            array = getattr(self, name)
+            setattr(self, name, np.pad(array, ((0, pad),) + ((0, 0),) * (array.ndim - 1)))
+
+    def _row_indexes(self, samples: List[Dict[str, Any]]) -> np.ndarray:
+        rows = []
+        for sample in samples:
+            key = (sample.get("tenant_id"), sample.get("service_name"))
+            row = self._rows.get(key)
+            if row is None:
+                row = self._rows[key] = len(self._series)
+                self._series.append(key)
+            rows.append(row)
+        self._grow(len(self._series))
+        return np.array(rows, dtype=np.intp)
+
+    def _ewma(self, mean: np.ndarray, var: np.ndarray, count: np.ndarray, values: np.ndarray, valid: np.ndarray):
+        """EWMA 평균/분산 갱신 (첫 표본은 평균으로 초기화)"""
+        diff = values - mean
+        first = valid & (count == 0)
+        increment = self.alpha * diff
+        new_mean = np.where(first, values, mean + increment)
+        new_var = np.where(first, 0.0, (1 - self.alpha) * (var + diff * increment))
+        return (np.where(valid, new_mean, mean), np.where(valid, new_var, var),
+                np.where(valid, count + 1, count))
+
+    def _z_scores(self, values, mean, var):
+        std = np.maximum(np.maximum(np.sqrt(var), np.abs(mean) * ANOMALY_MIN_STD_RATIO), self._min_std)
+        return (values - mean) / std
+
+    def update(self, samples: Iterable[Dict[str, Any]], now: Optional[float] = None) -> List[AnomalyTransition]:
+        """메트릭 틱 하나 반영 (판정 후 기준선 갱신), 이상 상태 전이 반환"""
+        started = time.perf_counter()
+        now = time.time() if now is None else now
+        samples = list(samples)
+        if not samples:
+            return []
+
+        hour = time.localtime(now).tm_hour
+        rows = self._row_indexes(samples)
+        values = np.array([[sample.get(metric) for metric in self.metrics] for sample in samples], dtype=float)
+        valid = ~np.isnan(values)
+
+        hour_mean = self._hour_mean[rows, hour]
+        hour_var = self._hour_var[rows, hour]
+        hour_count = self._hour_count[rows, hour]
+        mean, var, count = self._mean[rows], self._var[rows], self._count[rows]
+
+        # 시간대 기준선이 학습되었으면 시간대 기준, 아니면 전체 기준
+        seasonal = hour_count >= self.min_samples
+        z = np.where(seasonal, self._z_scores(values, hour_mean, hour_var), self._z_scores(values, mean, var))
+        expected = np.where(seasonal, hour_mean, mean)
+        trained = valid & (seasonal | (count >= self.min_samples))
+        z = np.where(trained, z, 0.0)
+
+        state = self._state[rows]
+        level = np.where(z >= self.z_critical, 2, np.where(z >= self.z_warning, 1, 0))
+        # 해제 기준(z_clear) 이상이면 현재 단계 유지, 값이 없는 메트릭은 상태 유지
+        held = np.where(z >= self.z_clear, np.maximum(level, state), level)
+        new_state = np.where(valid, held, state).astype(np.int8)
+
+        self._hour_mean[rows, hour], self._hour_var[rows, hour], self._hour_count[rows, hour] = self._ewma(
+            hour_mean, hour_var, hour_count, values, valid)
+        self._mean[rows], self._var[rows], self._count[rows] = self._ewma(mean, var, count, values, valid)
+        self._z[rows] = np.where(valid, z, self._z[rows])
+        self._state[rows] = new_state
+
+        transitions = []
+        for i, j in zip(*np.nonzero(new_state != state)):
+            tenant_id, service_name = self._series[rows[i]]
+            transitions.append(AnomalyTransition(
+                tenant_id=tenant_id, service_name=service_name, metric=self.metrics[j],
+                previous=LEVELS[state[i, j]], current=LEVELS[new_state[i, j]],
+                value=float(values[i, j]), expected=float(expected[i, j]), z_score=float(z[i, j]), at=now
+            ))
+
+        duration = time.perf_counter() - started
+        ANOMALY_EVALUATION_SECONDS.observe(duration)
+        ANOMALY_SERIES.set(len(self._series))
+        self.last_tick = {"series": len(samples), "transitions": len(transitions),
+                          "duration_ms": round(duration * 1000, 3)}
+        return transitions
+
+    def series_state(self, tenant_id: Optional[str], service_name: Optional[str],
+                     hour: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """시계열 하나의 기준선/상태 (디버깅용)"""
+        row = self._rows.get((tenant_id, service_name))
+        if row is None:
+            return None
+        hour = time.localtime().tm_hour if hour is None else hour
+        metrics = {}
+        for j, metric in enumerate(self.metrics):
+            metrics[metric] = {
+                "level": LEVELS[self._state[row, j]],
+                "z_score": round(float(self._z[row, j]), 3),
+                "baseline": {"mean": float(self._mean[row, j]), "std": math.sqrt(self._var[row, j]),
+                             "samples": int(self._count[row, j])},
+                "hourly_baseline": {"hour": hour, "mean": float(self._hour_mean[row, hour, j]),
+                                    "std": math.sqrt(self._hour_var[row, hour, j]),
+                                    "samples": int(self._hour_count[row, hour, j])},
+            }
+        return {"tenant_id": tenant_id, "service_name": service_name, "metrics": metrics}
+
+    def status(self) -> Dict[str, Any]:
+        series = len(self._series)
+        return {"series": series, "metrics": list(self.metrics),
+                "anomalous": int(np.count_nonzero(self._state[:series])), "last_tick": self.last_tick}
@@ -1,27 +1,35 @@
 # [advice from AI] ECP-AI 배포 상태 모니터링 및 검증 시스템
 """
 배포 상태 모니터링 및 검증 시스템
-- Kubernetes 배포 상태 실시간 모니터링
+- Kubernetes 배포 상태 실시간 모니터링 (Deployment watch 이벤트 기반, 변경된 배포만 평가)
 - 이미지 버전과 매니페스트 일치성 검증
 - 배포 실패 시 자동 롤백
 - 배포 성공률 및 성능 메트릭 수집
+- 동시 평가/매니페스트 조회 상한 및 메트릭 캐시 크기 제한
 """
 
 import asyncio
+import os
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 import structlog
-import yaml
 import json
 
 from .image_version_tracker import ImageVersionTracker, ImageVersion, DeploymentRecord, DeploymentStatus
 from .k8s_orchestrator import K8sOrchestrator
+from . import yaml_io
 
 logger = structlog.get_logger(__name__)
 
+# [advice from AI] 메트릭 캐시 최대 항목 수, 동시 평가 워커 수, 매니페스트 조회 동시 실행 상한
+DEPLOYMENT_CACHE_MAX = int(os.getenv("DEPLOYMENT_MONITOR_CACHE_MAX", "5000"))
+DEPLOYMENT_EVAL_WORKERS = int(os.getenv("DEPLOYMENT_MONITOR_WORKERS", "8"))
+MANIFEST_LOOKUP_CONCURRENCY = int(os.getenv("DEPLOYMENT_MONITOR_LOOKUP_CONCURRENCY", "4"))
+
 
 class DeploymentHealth(str, Enum):
     """배포 상태"""
@@ -53,28 +61,49 @@ class DeploymentMonitor:
     """배포 상태 모니터링 시스템"""
     
     def __init__(self, k8s_orchestrator: K8sOrchestrator, 
-                 image_tracker: ImageVersionTracker):
+                 image_tracker: ImageVersionTracker,
+                 max_cache_size: int = DEPLOYMENT_CACHE_MAX,
+                 workers: int = DEPLOYMENT_EVAL_WORKERS,
+                 lookup_concurrency: int = MANIFEST_LOOKUP_CONCURRENCY):
         self.k8s_orchestrator = k8s_orchestrator
         self.image_tracker = image_tracker
-        self.monitoring_interval = 30  # 30초마다 체크
+        self.monitoring_interval = 30  # 폴링 모드 체크 주기 / 이벤트 모드 캐시 정리 주기
         self.is_monitoring = False
-        self.deployment_cache: Dict[str, DeploymentMetrics] = {}
+        self.max_cache_size = max_cache_size
+        self.workers = workers
+        self.deployment_cache: "OrderedDict[str, DeploymentMetrics]" = OrderedDict()
+        
+        # [advice from AI] 이벤트 큐 - 같은 배포의 연속 이벤트는 최신 상태 하나로 병합
+        self._pending: Dict[str, Tuple[Any, float]] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._fingerprints: Dict[str, Tuple] = {}
+        self._lookup_semaphore = asyncio.Semaphore(lookup_concurrency)
+        self.stats = {"events": 0, "evaluated": 0, "unchanged": 0, "evicted": 0}
+        self.last_detection_latency_ms: Optional[float] = None
         
         logger.info("DeploymentMonitor 초기화 완료")
     
     async def start_monitoring(self):
-        """모니터링 시작"""
+        """모니터링 시작 (watch 캐시 사용 시 이벤트 기반, 아니면 주기 폴링)"""
         if self.is_monitoring:
             logger.warning("모니터링이 이미 실행 중입니다")
             return
         
         self.is_monitoring = True
-        logger.info("배포 모니터링 시작")
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        event_driven = getattr(self.k8s_orchestrator, "use_watch_cache", False)
+        logger.info("배포 모니터링 시작", mode="watch" if event_driven else "polling")
         
         try:
-            while self.is_monitoring:
-                await self._monitor_deployments()
-                await asyncio.sleep(self.monitoring_interval)
+            if event_driven:
+                await self._run_event_loop()
+            else:
+                while self.is_monitoring:
+                    await self._monitor_deployments()
+                    await self._wait_stop(self.monitoring_interval)
         except Exception as e:
             logger.error("모니터링 중 오류 발생", error=str(e))
             self.is_monitoring = False
@@ -84,19 +113,129 @@ class DeploymentMonitor:
     def stop_monitoring(self):
         """모니터링 중지"""
         self.is_monitoring = False
+        if self._loop and self._stop_event and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._stop_event.set)
         logger.info("배포 모니터링 중지 요청됨")
     
+    async def _wait_stop(self, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+    
+    async def _run_event_loop(self):
+        """Deployment watch 이벤트 구독 후 변경된 배포만 평가"""
+        self._queue = asyncio.Queue()
+        cache = self.k8s_orchestrator.start_watch_cache()
+        cache.deployments.add_listener(self._on_deployment_event)
+        workers = [asyncio.create_task(self._evaluation_worker()) for _ in range(self.workers)]
+        
+        try:
+            # 초기 상태 평가 (리스너 등록 전 이미 캐시에 있던 배포)
+            if await cache.wait_for_sync():
+                for deployment in cache.deployments.values():
+                    self._enqueue("ADDED", deployment, time.perf_counter())
+            
+            while self.is_monitoring:
+                await self._wait_stop(self.monitoring_interval)
+                self._cleanup_old_metrics()
+        finally:
+            cache.deployments.remove_listener(self._on_deployment_event)
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+    
+    def _on_deployment_event(self, event_type: str, deployment: Any) -> None:
+        """watch 스레드 콜백 - 이벤트 루프로 전달"""
+        loop = self._loop
+        if loop and not loop.is_closed():
+            loop.call_soon_threadsafe(self._enqueue, event_type, deployment, time.perf_counter())
+    
+    def _enqueue(self, event_type: str, deployment: Any, received_at: float) -> None:
+        cache_key = f"{deployment.metadata.namespace}:{deployment.metadata.name}"
+        self.stats["events"] += 1
+        
+        if event_type == "DELETED":
+            self._pending.pop(cache_key, None)
+            self._forget(cache_key)
+            return
+        
+        if cache_key in self._pending:
+            # 아직 평가 전이면 최신 객체로 교체 (최초 수신 시각 유지)
+            self._pending[cache_key] = (deployment, self._pending[cache_key][1])
+        else:
+            self._pending[cache_key] = (deployment, received_at)
+            self._queue.put_nowait(cache_key)
+    
+    async def _evaluation_worker(self):
+        while True:
+            cache_key = await self._queue.get()
+            try:
+                item = self._pending.pop(cache_key, None)
+                if item is None:
+                    continue
+                deployment, received_at = item
+                deployment_info = self.k8s_orchestrator.deployment_info(deployment)
+                
+                fingerprint = self._fingerprint(deployment_info)
+                if self._fingerprints.get(cache_key) == fingerprint and cache_key in self.deployment_cache:
+                    # 헬스 관련 변경 없음 - 갱신 시각만 반영
+                    self.deployment_cache[cache_key].last_update_time = datetime.now()
+                    self.deployment_cache.move_to_end(cache_key)
+                    self.stats["unchanged"] += 1
+                    continue
+                
+                await self._check_deployment_health(
+                    deployment_info["name"], deployment_info["namespace"], deployment_info
+                )
+                self._fingerprints[cache_key] = fingerprint
+                self.last_detection_latency_ms = (time.perf_counter() - received_at) * 1000
+            except Exception as e:
+                logger.error("배포 이벤트 처리 실패", cache_key=cache_key, error=str(e))
+            finally:
+                self._queue.task_done()
+    
+    async def wait_idle(self):
+        """대기 중인 이벤트 평가 완료까지 대기"""
+        if self._queue is not None:
+            await self._queue.join()
+    
+    @staticmethod
+    def _fingerprint(deployment_info: Dict[str, Any]) -> Tuple:
+        """헬스 평가에 영향을 주는 필드 (status 외 변경은 재평가 생략)"""
+        containers = deployment_info.get("spec", {}).get("template", {}).get("spec", {}).get("containers", [])
+        return (
+            deployment_info.get("generation"),
+            deployment_info.get("observed_generation"),
+            tuple(c.get("image") for c in containers),
+            deployment_info.get("replicas_desired"),
+            deployment_info.get("replicas_available"),
+            deployment_info.get("replicas_ready"),
+            deployment_info.get("replicas_updated"),
+            deployment_info.get("replicas_unavailable"),
+            deployment_info.get("progress_deadline_exceeded")
+        )
+    
     async def _monitor_deployments(self):
-        """배포 상태 모니터링"""
+        """배포 상태 전체 점검 (폴링 모드, 동시 평가)"""
         try:
-            # 모든 네임스페이스의 배포 상태 확인
+            # 모든 관리 네임스페이스의 배포 목록 수집
             namespaces = await self.k8s_orchestrator.list_namespaces()
+            deployment_lists = await asyncio.gather(
+                *(self.k8s_orchestrator.list_deployments(namespace) for namespace in namespaces)
+            )
             
-            for namespace in namespaces:
-                deployments = await self.k8s_orchestrator.list_deployments(namespace)
-                
-                for deployment in deployments:
-                    await self._check_deployment_health(deployment, namespace)
+            semaphore = asyncio.Semaphore(self.workers)
+            
+            async def check(deployment_name: str, namespace: str):
+                async with semaphore:
+                    await self._check_deployment_health(deployment_name, namespace)
+            
+            await asyncio.gather(*(
+                check(deployment, namespace)
+                for namespace, deployments in zip(namespaces, deployment_lists)
+                for deployment in deployments
+            ))
             
             # 캐시된 메트릭 정리 (오래된 데이터 제거)
             self._cleanup_old_metrics()
@@ -104,13 +243,15 @@ class DeploymentMonitor:
         except Exception as e:
             logger.error("배포 모니터링 중 오류", error=str(e))
     
-    async def _check_deployment_health(self, deployment_name: str, namespace: str):
-        """개별 배포 상태 확인"""
+    async def _check_deployment_health(self, deployment_name: str, namespace: str,
+                                       deployment_info: Optional[Dict[str, Any]] = None):
+        """개별 배포 상태 확인 (이벤트로 받은 상태가 있으면 API 조회 생략)"""
         try:
             # Kubernetes API에서 배포 상태 조회
-            deployment_info = await self.k8s_orchestrator.get_deployment_info(
-                deployment_name, namespace
-            )
+            if deployment_info is None:
+                deployment_info = await self.k8s_orchestrator.get_deployment_info(
+                    deployment_name, namespace
+                )
             
             if not deployment_info:
                 return
@@ -145,7 +286,8 @@ class DeploymentMonitor:
             
             # 메트릭 캐시에 저장
             cache_key = f"{namespace}:{deployment_name}"
-            self.deployment_cache[cache_key] = metrics
+            self._store_metrics(cache_key, metrics)
+            self.stats["evaluated"] += 1
             
             # 버전 불일치 시 경고 로그
             if version_mismatch:
@@ -165,6 +307,20 @@ class DeploymentMonitor:
                         namespace=namespace,
                         error=str(e))
     
+    def _store_metrics(self, cache_key: str, metrics: DeploymentMetrics):
+        """메트릭 캐시 저장 (최대 크기 초과 시 가장 오래 갱신되지 않은 항목 제거)"""
+        self.deployment_cache[cache_key] = metrics
+        self.deployment_cache.move_to_end(cache_key)
+        while len(self.deployment_cache) > self.max_cache_size:
+            evicted_key, _ = self.deployment_cache.popitem(last=False)
+            self._fingerprints.pop(evicted_key, None)
+            self.stats["evicted"] += 1
+    
+    def _forget(self, cache_key: str):
+        """삭제된 배포의 캐시 제거"""
+        self.deployment_cache.pop(cache_key, None)
+        self._fingerprints.pop(cache_key, None)
+    
     def _extract_image_version(self, deployment_info: Dict[str, Any]) -> Optional[str]:
         """배포 정보에서 이미지 버전 추출"""
         try:
@@ -179,14 +335,18 @@ class DeploymentMonitor:
             return None
     
     async def _get_manifest_image_version(self, deployment_name: str, namespace: str) -> Optional[str]:
-        """매니페스트 파일에서 이미지 버전 확인"""
+        """매니페스트 파일에서 이미지 버전 확인 (동시 조회 수 제한, 파일 읽기는 스레드에서 실행)"""
+        async with self._lookup_semaphore:
+            return await asyncio.to_thread(self._read_manifest_image_version, deployment_name, namespace)
+    
+    def _read_manifest_image_version(self, deployment_name: str, namespace: str) -> Optional[str]:
         try:
             # 매니페스트 파일 경로 구성
             manifest_path = f"k8s-manifests/{deployment_name}-deployment.yaml"
             
             # 매니페스트 파일 읽기
             with open(manifest_path, 'r') as f:
-                manifest_content = yaml.safe_load(f)
+                manifest_content = yaml_io.load(f)
             
             # 이미지 정보 추출
             containers = manifest_content.get('spec', {}).get('template', {}).get('spec', {}).get('containers', [])
@@ -214,6 +374,10 @@ class DeploymentMonitor:
             if replicas_desired == 0:
                 return DeploymentHealth.UNKNOWN
             
+            # 롤아웃 진행 기한 초과 (실패한 롤아웃)
+            if deployment_info.get('progress_deadline_exceeded'):
+                return DeploymentHealth.CRITICAL
+            
             # 모든 레플리카가 준비된 경우
             if replicas_ready == replicas_desired:
                 return DeploymentHealth.HEALTHY
@@ -317,7 +481,7 @@ class DeploymentMonitor:
                 keys_to_remove.append(key)
         
         for key in keys_to_remove:
-            del self.deployment_cache[key]
+            self._forget(key)
         
         if keys_to_remove:
             logger.info("오래된 메트릭 정리 완료", removed_count=len(keys_to_remove))
@@ -5,19 +5,68 @@
 - 배포 히스토리 관리
 - 롤백 기능 제공
 - 이미지 보안 스캔 결과 추적
+- WAL 모드 커넥션 풀 + 일괄 등록/기록 API (CI/CD 대량 등록 시 잠금 경합 최소화)
+- (테넌시, 서비스)별 최근 정상 이미지 포인터(last_known_good) 유지 - 롤백 후보 즉시 조회
 """
 
 import os
 import json
 import sqlite3
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import structlog
 
+from .sqlite_pool import SQLitePool, SQLITE_POOL_SIZE
+
 logger = structlog.get_logger(__name__)
 
+# [advice from AI] 정리 작업 1회 삭제 건수 (쓰기 잠금을 짧게 유지)
+CLEANUP_BATCH_SIZE = int(os.getenv("IMAGE_TRACKER_CLEANUP_BATCH_SIZE", "500"))
+
+# [advice from AI] (테넌시, 서비스)별 보관할 최근 정상 이미지 수
+LAST_KNOWN_GOOD_DEPTH = int(os.getenv("IMAGE_TRACKER_LAST_KNOWN_GOOD_DEPTH", "5"))
+
+# [advice from AI] 고정 SQL 문 - 커넥션별 statement 캐시에서 재사용
+INSERT_IMAGE_VERSION_SQL = """
+    INSERT OR REPLACE INTO image_versions
+    (id, service_name, image_name, image_tag, full_image_name,
+     git_commit, git_branch, build_timestamp, status,
+     security_scan_result, vulnerabilities_count, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+INSERT_DEPLOYMENT_RECORD_SQL = """
+    INSERT INTO deployment_records
+    (id, tenant_id, service_name, image_version_id, deployment_timestamp,
+     status, namespace, replicas, rollback_reason, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+UPSERT_LAST_KNOWN_GOOD_SQL = """
+    INSERT INTO last_known_good
+    (tenant_id, service_name, image_version_id, deployment_id, deployment_timestamp, namespace)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (tenant_id, service_name, image_version_id) DO UPDATE SET
+        deployment_id = excluded.deployment_id,
+        deployment_timestamp = excluded.deployment_timestamp,
+        namespace = excluded.namespace
+    WHERE excluded.deployment_timestamp > last_known_good.deployment_timestamp
+"""
+TRIM_LAST_KNOWN_GOOD_SQL = """
+    DELETE FROM last_known_good
+    WHERE tenant_id = ? AND service_name = ? AND image_version_id NOT IN (
+        SELECT image_version_id FROM last_known_good
+        WHERE tenant_id = ? AND service_name = ?
+        ORDER BY deployment_timestamp DESC
+        LIMIT ?
+    )
+"""
+IMAGE_VERSION_COLUMNS = """
+    iv.id, iv.service_name, iv.image_name, iv.image_tag, iv.full_image_name, iv.git_commit,
+    iv.git_branch, iv.build_timestamp, iv.status, iv.security_scan_result,
+    iv.vulnerabilities_count, iv.metadata
+"""
+
 
 class ImageStatus(str, Enum):
     """이미지 상태"""
@@ -72,16 +121,17 @@ class DeploymentRecord:
 class ImageVersionTracker:
     """이미지 버전 추적기"""
     
-    def __init__(self, db_path: str = "/app/data/image_versions.db"):
+    def __init__(self, db_path: str = "/app/data/image_versions.db", pool_size: int = SQLITE_POOL_SIZE,
+                 last_known_good_depth: int = LAST_KNOWN_GOOD_DEPTH):
         self.db_path = db_path
+        self.last_known_good_depth = max(1, last_known_good_depth)
+        self.pool = SQLitePool(db_path, size=pool_size)
         self._init_database()
         logger.info("ImageVersionTracker 초기화 완료", db_path=db_path)
     
     def _init_database(self):
         """데이터베이스 초기화"""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        
-        with sqlite3.connect(self.db_path) as conn:
+        with self.pool.transaction() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS image_versions (
                     id TEXT PRIMARY KEY,
@@ -123,127 +173,271 @@ class ImageVersionTracker:
             conn.execute("CREATE INDEX IF NOT EXISTS idx_deployment_records_tenant ON deployment_records (tenant_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_deployment_records_service ON deployment_records (service_name)")
             
-            conn.commit()
+            # [advice from AI] 복합 인덱스 - 히스토리/롤백 후보 조회, 서비스별 최신 버전, 정리 작업
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_deployment_records_tenant_service_ts
+                ON deployment_records (tenant_id, service_name, deployment_timestamp)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_image_versions_service_ts
+                ON image_versions (service_name, build_timestamp)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_image_versions_status_ts
+                ON image_versions (status, build_timestamp)
+            """)
+            
+            # [advice from AI] 최근 정상 배포 이미지 포인터 - 성공 배포 기록 시 같은 트랜잭션에서 갱신
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS last_known_good (
+                    tenant_id TEXT NOT NULL,
+                    service_name TEXT NOT NULL,
+                    image_version_id TEXT NOT NULL,
+                    deployment_id TEXT NOT NULL,
+                    deployment_timestamp TEXT NOT NULL,
+                    namespace TEXT,
+                    PRIMARY KEY (tenant_id, service_name, image_version_id)
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_last_known_good_tenant_service_ts
+                ON last_known_good (tenant_id, service_name, deployment_timestamp)
+            """)
+            
+            # 기존 DB 업그레이드 시 배포 기록에서 포인터 재구성
+            needs_backfill = (
+                conn.execute("SELECT 1 FROM last_known_good LIMIT 1").fetchone() is None
+                and conn.execute("SELECT 1 FROM deployment_records WHERE status = 'success' LIMIT 1").fetchone()
+            )
+            if needs_backfill:
+                self._rebuild_last_known_good(conn)
+    
+    def _rebuild_last_known_good(self, conn: sqlite3.Connection) -> int:
+        """성공 배포 기록 전체에서 last_known_good 재구성 (트랜잭션 내 호출)"""
+        conn.execute("DELETE FROM last_known_good")
+        cursor = conn.execute("""
+            INSERT INTO last_known_good
+            (tenant_id, service_name, image_version_id, deployment_id, deployment_timestamp, namespace)
+            SELECT tenant_id, service_name, image_version_id, id, deployment_timestamp, namespace
+            FROM (
+                SELECT tenant_id, service_name, image_version_id, id, deployment_timestamp, namespace,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY tenant_id, service_name ORDER BY deployment_timestamp DESC
+                       ) AS position
+                FROM (
+                    SELECT tenant_id, service_name, image_version_id, id,
+                           MAX(deployment_timestamp) AS deployment_timestamp, namespace
+                    FROM deployment_records
+                    WHERE status = 'success'
+                    GROUP BY tenant_id, service_name, image_version_id
+                )
+            )
+            WHERE position <= ?
+        """, (self.last_known_good_depth,))
+        logger.info("last_known_good 재구성 완료", pointers=cursor.rowcount)
+        return cursor.rowcount
+    
+    def rebuild_last_known_good(self) -> int:
+        """last_known_good 포인터 재구성 (포인터 수 반환)"""
+        try:
+            with self.pool.transaction() as conn:
+                return self._rebuild_last_known_good(conn)
+        except Exception as e:
+            logger.error("last_known_good 재구성 실패", error=str(e))
+            return 0
     
+    def close(self):
+        """커넥션 풀 종료"""
+        self.pool.close()
+    
+    # ------------------------------------------------------------------
+    # 행 변환
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _image_version_params(image_version: ImageVersion) -> Tuple:
+        return (
+            image_version.id,
+            image_version.service_name,
+            image_version.image_name,
+            image_version.image_tag,
+            image_version.full_image_name,
+            image_version.git_commit,
+            image_version.git_branch,
+            image_version.build_timestamp.isoformat(),
+            image_version.status.value,
+            image_version.security_scan_result,
+            image_version.vulnerabilities_count,
+            json.dumps(image_version.metadata) if image_version.metadata else None
+        )
+    
+    @staticmethod
+    def _deployment_record_params(deployment_record: DeploymentRecord) -> Tuple:
+        return (
+            deployment_record.id,
+            deployment_record.tenant_id,
+            deployment_record.service_name,
+            deployment_record.image_version_id,
+            deployment_record.deployment_timestamp.isoformat(),
+            deployment_record.status.value,
+            deployment_record.namespace,
+            deployment_record.replicas,
+            deployment_record.rollback_reason,
+            json.dumps(deployment_record.metadata) if deployment_record.metadata else None
+        )
+    
+    @staticmethod
+    def _to_image_version(row: sqlite3.Row) -> ImageVersion:
+        return ImageVersion(
+            id=row["id"],
+            service_name=row["service_name"],
+            image_name=row["image_name"],
+            image_tag=row["image_tag"],
+            full_image_name=row["full_image_name"],
+            git_commit=row["git_commit"],
+            git_branch=row["git_branch"],
+            build_timestamp=datetime.fromisoformat(row["build_timestamp"]),
+            status=ImageStatus(row["status"]),
+            security_scan_result=row["security_scan_result"],
+            vulnerabilities_count=row["vulnerabilities_count"],
+            metadata=json.loads(row["metadata"]) if row["metadata"] else None
+        )
+    
+    @staticmethod
+    def _to_deployment_record(row: sqlite3.Row) -> DeploymentRecord:
+        return DeploymentRecord(
+            id=row["id"],
+            tenant_id=row["tenant_id"],
+            service_name=row["service_name"],
+            image_version_id=row["image_version_id"],
+            deployment_timestamp=datetime.fromisoformat(row["deployment_timestamp"]),
+            status=DeploymentStatus(row["status"]),
+            namespace=row["namespace"],
+            replicas=row["replicas"],
+            rollback_reason=row["rollback_reason"],
+            metadata=json.loads(row["metadata"]) if row["metadata"] else None
+        )
+    
+    # ------------------------------------------------------------------
+    # 등록 / 기록
+    # ------------------------------------------------------------------
     def register_image_version(self, image_version: ImageVersion) -> bool:
         """새 이미지 버전 등록"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO image_versions 
-                    (id, service_name, image_name, image_tag, full_image_name, 
-                     git_commit, git_branch, build_timestamp, status, 
-                     security_scan_result, vulnerabilities_count, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    image_version.id,
-                    image_version.service_name,
-                    image_version.image_name,
-                    image_version.image_tag,
-                    image_version.full_image_name,
-                    image_version.git_commit,
-                    image_version.git_branch,
-                    image_version.build_timestamp.isoformat(),
-                    image_version.status.value,
-                    image_version.security_scan_result,
-                    image_version.vulnerabilities_count,
-                    json.dumps(image_version.metadata) if image_version.metadata else None
-                ))
-                conn.commit()
-                
-                logger.info("이미지 버전 등록 완료", 
-                           service_name=image_version.service_name,
-                           image_tag=image_version.image_tag)
-                return True
+            with self.pool.transaction() as conn:
+                conn.execute(INSERT_IMAGE_VERSION_SQL, self._image_version_params(image_version))
+            
+            logger.info("이미지 버전 등록 완료", 
+                       service_name=image_version.service_name,
+                       image_tag=image_version.image_tag)
+            return True
                 
         except Exception as e:
             logger.error("이미지 버전 등록 실패", error=str(e))
             return False
     
+    def register_image_versions(self, image_versions: Iterable[ImageVersion]) -> int:
+        """이미지 버전 일괄 등록 (단일 트랜잭션), 저장된 버전 수 반환 (같은 ID는 마지막 항목만 남으므로 1건)"""
+        params = [self._image_version_params(v) for v in image_versions]
+        if not params:
+            return 0
+        try:
+            with self.pool.transaction() as conn:
+                conn.executemany(INSERT_IMAGE_VERSION_SQL, params)
+            
+            registered = len({row[0] for row in params})
+            logger.info("이미지 버전 일괄 등록 완료", count=registered, duplicates=len(params) - registered)
+            return registered
+            
+        except Exception as e:
+            logger.error("이미지 버전 일괄 등록 실패", count=len(params), error=str(e))
+            return 0
+    
     def update_image_status(self, image_version_id: str, status: ImageStatus, 
                            security_scan_result: Optional[str] = None,
                            vulnerabilities_count: int = 0) -> bool:
         """이미지 상태 업데이트"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.pool.transaction() as conn:
                 conn.execute("""
                     UPDATE image_versions 
                     SET status = ?, security_scan_result = ?, vulnerabilities_count = ?
                     WHERE id = ?
                 """, (status.value, security_scan_result, vulnerabilities_count, image_version_id))
-                conn.commit()
-                
-                logger.info("이미지 상태 업데이트 완료", 
-                           image_version_id=image_version_id,
-                           status=status.value)
-                return True
+            
+            logger.info("이미지 상태 업데이트 완료", 
+                       image_version_id=image_version_id,
+                       status=status.value)
+            return True
                 
         except Exception as e:
             logger.error("이미지 상태 업데이트 실패", error=str(e))
             return False
     
+    def _insert_deployments(self, conn: sqlite3.Connection, deployment_records: List[DeploymentRecord]) -> None:
+        """배포 기록 저장 + 성공 배포의 last_known_good 갱신 (트랜잭션 내 호출)"""
+        conn.executemany(INSERT_DEPLOYMENT_RECORD_SQL,
+                         [self._deployment_record_params(r) for r in deployment_records])
+        
+        succeeded = [r for r in deployment_records if r.status == DeploymentStatus.SUCCESS]
+        if not succeeded:
+            return
+        conn.executemany(UPSERT_LAST_KNOWN_GOOD_SQL, [
+            (r.tenant_id, r.service_name, r.image_version_id, r.id,
+             r.deployment_timestamp.isoformat(), r.namespace)
+            for r in succeeded
+        ])
+        targets = {(r.tenant_id, r.service_name) for r in succeeded}
+        conn.executemany(TRIM_LAST_KNOWN_GOOD_SQL, [
+            (tenant_id, service_name, tenant_id, service_name, self.last_known_good_depth)
+            for tenant_id, service_name in targets
+        ])
+    
     def record_deployment(self, deployment_record: DeploymentRecord) -> bool:
         """배포 기록 저장"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT INTO deployment_records 
-                    (id, tenant_id, service_name, image_version_id, deployment_timestamp,
-                     status, namespace, replicas, rollback_reason, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    deployment_record.id,
-                    deployment_record.tenant_id,
-                    deployment_record.service_name,
-                    deployment_record.image_version_id,
-                    deployment_record.deployment_timestamp.isoformat(),
-                    deployment_record.status.value,
-                    deployment_record.namespace,
-                    deployment_record.replicas,
-                    deployment_record.rollback_reason,
-                    json.dumps(deployment_record.metadata) if deployment_record.metadata else None
-                ))
-                conn.commit()
-                
-                logger.info("배포 기록 저장 완료", 
-                           tenant_id=deployment_record.tenant_id,
-                           service_name=deployment_record.service_name)
-                return True
+            with self.pool.transaction() as conn:
+                self._insert_deployments(conn, [deployment_record])
+            
+            logger.info("배포 기록 저장 완료", 
+                       tenant_id=deployment_record.tenant_id,
+                       service_name=deployment_record.service_name)
+            return True
                 
         except Exception as e:
             logger.error("배포 기록 저장 실패", error=str(e))
             return False
     
+    def record_deployments(self, deployment_records: Iterable[DeploymentRecord]) -> int:
+        """배포 기록 일괄 저장 (단일 트랜잭션), 저장 건수 반환"""
+        records = list(deployment_records)
+        if not records:
+            return 0
+        try:
+            with self.pool.transaction() as conn:
+                self._insert_deployments(conn, records)
+            
+            logger.info("배포 기록 일괄 저장 완료", count=len(records))
+            return len(records)
+            
+        except Exception as e:
+            logger.error("배포 기록 일괄 저장 실패", count=len(records), error=str(e))
+            return 0
+    
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
     def get_image_versions(self, service_name: str, limit: int = 10) -> List[ImageVersion]:
         """서비스별 이미지 버전 목록 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    SELECT * FROM image_versions 
-                    WHERE service_name = ? 
-                    ORDER BY build_timestamp DESC 
+            with self.pool.connection() as conn:
+                rows = conn.execute(f"""
+                    SELECT {IMAGE_VERSION_COLUMNS} FROM image_versions iv
+                    WHERE iv.service_name = ? 
+                    ORDER BY iv.build_timestamp DESC 
                     LIMIT ?
-                """, (service_name, limit))
-                
-                versions = []
-                for row in cursor.fetchall():
-                    version = ImageVersion(
-                        id=row[0],
-                        service_name=row[1],
-                        image_name=row[2],
-                        image_tag=row[3],
-                        full_image_name=row[4],
-                        git_commit=row[5],
-                        git_branch=row[6],
-                        build_timestamp=datetime.fromisoformat(row[7]),
-                        status=ImageStatus(row[8]),
-                        security_scan_result=row[9],
-                        vulnerabilities_count=row[10],
-                        metadata=json.loads(row[11]) if row[11] else None
-                    )
-                    versions.append(version)
-                
-                return versions
+                """, (service_name, limit)).fetchall()
+            
+            return [self._to_image_version(row) for row in rows]
                 
         except Exception as e:
             logger.error("이미지 버전 조회 실패", error=str(e))
@@ -253,94 +447,120 @@ class ImageVersionTracker:
                               limit: int = 20) -> List[DeploymentRecord]:
         """배포 히스토리 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    SELECT * FROM deployment_records 
+            with self.pool.connection() as conn:
+                rows = conn.execute("""
+                    SELECT id, tenant_id, service_name, image_version_id, deployment_timestamp,
+                           status, namespace, replicas, rollback_reason, metadata
+                    FROM deployment_records 
                     WHERE tenant_id = ? AND service_name = ?
                     ORDER BY deployment_timestamp DESC 
                     LIMIT ?
-                """, (tenant_id, service_name, limit))
-                
-                records = []
-                for row in cursor.fetchall():
-                    record = DeploymentRecord(
-                        id=row[0],
-                        tenant_id=row[1],
-                        service_name=row[2],
-                        image_version_id=row[3],
-                        deployment_timestamp=datetime.fromisoformat(row[4]),
-                        status=DeploymentStatus(row[5]),
-                        namespace=row[6],
-                        replicas=row[7],
-                        rollback_reason=row[8],
-                        metadata=json.loads(row[9]) if row[9] else None
-                    )
-                    records.append(record)
-                
-                return records
+                """, (tenant_id, service_name, limit)).fetchall()
+            
+            return [self._to_deployment_record(row) for row in rows]
                 
         except Exception as e:
             logger.error("배포 히스토리 조회 실패", error=str(e))
             return []
     
     def find_rollback_candidate(self, tenant_id: str, service_name: str) -> Optional[ImageVersion]:
-        """롤백 후보 이미지 찾기"""
+        """롤백 후보 이미지 찾기 (최근 성공 배포 이미지)"""
+        candidates = self.get_last_known_good(tenant_id, service_name, limit=1)
+        return candidates[0] if candidates else None
+    
+    def get_last_known_good(self, tenant_id: str, service_name: str,
+                            limit: Optional[int] = None) -> List[ImageVersion]:
+        """최근 정상 배포 이미지 목록 (최신순, 최대 last_known_good_depth개)"""
         try:
-            # 최근 성공한 배포 기록 찾기
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    SELECT dr.image_version_id, iv.* 
-                    FROM deployment_records dr
-                    JOIN image_versions iv ON dr.image_version_id = iv.id
-                    WHERE dr.tenant_id = ? AND dr.service_name = ? 
-                    AND dr.status = 'success'
-                    ORDER BY dr.deployment_timestamp DESC
-                    LIMIT 1
-                """, (tenant_id, service_name))
+            with self.pool.connection() as conn:
+                rows = conn.execute(f"""
+                    SELECT {IMAGE_VERSION_COLUMNS}
+                    FROM last_known_good lkg
+                    JOIN image_versions iv ON lkg.image_version_id = iv.id
+                    WHERE lkg.tenant_id = ? AND lkg.service_name = ?
+                    ORDER BY lkg.deployment_timestamp DESC
+                    LIMIT ?
+                """, (tenant_id, service_name, limit or self.last_known_good_depth)).fetchall()
+            
+            return [self._to_image_version(row) for row in rows]
                 
-                row = cursor.fetchone()
-                if row:
-                    return ImageVersion(
-                        id=row[1],
-                        service_name=row[2],
-                        image_name=row[3],
-                        image_tag=row[4],
-                        full_image_name=row[5],
-                        git_commit=row[6],
-                        git_branch=row[7],
-                        build_timestamp=datetime.fromisoformat(row[8]),
-                        status=ImageStatus(row[9]),
-                        security_scan_result=row[10],
-                        vulnerabilities_count=row[11],
-                        metadata=json.loads(row[12]) if row[12] else None
+        except Exception as e:
+            logger.error("롤백 후보 이미지 찾기 실패", error=str(e))
+            return []
+    
+    def get_rollback_report(self, tenant_id: Optional[str] = None) -> List[Dict]:
+        """전체(또는 테넌시) 서비스별 롤백 시 대상 이미지 리포트"""
+        try:
+            with self.pool.connection() as conn:
+                rows = conn.execute("""
+                    SELECT lkg.tenant_id, lkg.service_name, lkg.namespace,
+                           lkg.image_version_id AS target_image_version_id,
+                           lkg.deployment_timestamp AS target_deployed_at,
+                           iv.full_image_name AS target_image,
+                           (SELECT COUNT(*) FROM last_known_good g
+                            WHERE g.tenant_id = lkg.tenant_id AND g.service_name = lkg.service_name) AS good_versions,
+                           cur.id AS current_deployment_id,
+                           cur.image_version_id AS current_image_version_id,
+                           cur.status AS current_status,
+                           cur.deployment_timestamp AS current_deployed_at
+                    FROM last_known_good lkg
+                    JOIN image_versions iv ON lkg.image_version_id = iv.id
+                    LEFT JOIN deployment_records cur ON cur.id = (
+                        SELECT dr.id FROM deployment_records dr
+                        WHERE dr.tenant_id = lkg.tenant_id AND dr.service_name = lkg.service_name
+                        ORDER BY dr.deployment_timestamp DESC
+                        LIMIT 1
                     )
-                
-                return None
+                    WHERE (? IS NULL OR lkg.tenant_id = ?)
+                    AND lkg.deployment_timestamp = (
+                        SELECT MAX(g.deployment_timestamp) FROM last_known_good g
+                        WHERE g.tenant_id = lkg.tenant_id AND g.service_name = lkg.service_name
+                    )
+                    ORDER BY lkg.tenant_id, lkg.service_name
+                """, (tenant_id, tenant_id)).fetchall()
+            
+            report = []
+            for row in rows:
+                entry = dict(row)
+                # 현재 배포가 이미 정상 이미지이면 롤백해도 변화 없음
+                entry["would_change"] = entry["current_image_version_id"] != entry["target_image_version_id"]
+                report.append(entry)
+            return report
                 
         except Exception as e:
-            logger.error("롤백 후보 이미지 찾기 실패", error=str(e))
-            return None
+            logger.error("롤백 리포트 조회 실패", error=str(e))
+            return []
     
-    def cleanup_old_versions(self, days_to_keep: int = 30) -> int:
-        """오래된 이미지 버전 정리"""
+    # ------------------------------------------------------------------
+    # 정리
+    # ------------------------------------------------------------------
+    def cleanup_old_versions(self, days_to_keep: int = 30, batch_size: int = CLEANUP_BATCH_SIZE) -> int:
+        """오래된 이미지 버전 정리 (롤백 대상 이미지 제외, batch_size 단위 짧은 트랜잭션으로 나누어 삭제)"""
         try:
             cutoff_date = datetime.now() - timedelta(days=days_to_keep)
+            deleted_count = 0
             
-            with sqlite3.connect(self.db_path) as conn:
-                # 오래된 이미지 버전 삭제
-                cursor = conn.execute("""
-                    DELETE FROM image_versions 
-                    WHERE build_timestamp < ? AND status != 'deployed'
-                """, (cutoff_date.isoformat(),))
-                
-                deleted_count = cursor.rowcount
-                conn.commit()
-                
-                logger.info("오래된 이미지 버전 정리 완료", 
-                           deleted_count=deleted_count,
-                           cutoff_date=cutoff_date.isoformat())
-                
-                return deleted_count
+            while True:
+                with self.pool.transaction() as conn:
+                    cursor = conn.execute("""
+                        DELETE FROM image_versions
+                        WHERE rowid IN (
+                            SELECT rowid FROM image_versions
+                            WHERE build_timestamp < ? AND status != 'deployed'
+                            AND id NOT IN (SELECT image_version_id FROM last_known_good)
+                            LIMIT ?
+                        )
+                    """, (cutoff_date.isoformat(), batch_size))
+                    batch_deleted = cursor.rowcount
+                deleted_count += batch_deleted
+                if batch_deleted < batch_size:
+                    break
+            
+            logger.info("오래된 이미지 버전 정리 완료", 
+                       deleted_count=deleted_count,
+                       cutoff_date=cutoff_date.isoformat())
+            
+            return deleted_count
                 
         except Exception as e:
             logger.error("이미지 버전 정리 실패", error=str(e))
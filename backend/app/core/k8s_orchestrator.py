@@ -5,18 +5,50 @@ ECP-AI Kubernetes 자동 오케스트레이션 시스템
 - GPU 워크로드 특별 처리 (NodeSelector, nvidia.com/gpu)
 - 오토스케일링 (HPA/VPA) 및 모니터링 설정
 - 네트워크 보안 정책 적용
-- kubernetes-python 클라이언트 기반 비동기 처리
+- kubernetes-python 클라이언트 기반 비동기 처리 (전용 스레드 풀 오프로드 + 호출별 타임아웃)
+- 의존성 DAG 기반 병렬 테넌시 프로비저닝 (provision_tenant)
+- watch 캐시 기반 테넌시 상태 조회 (API 서버 부하를 조회 빈도와 분리)
+- diff 기반 server-side apply (변경된 리소스만 패치, dry-run 지원)
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional
+import os
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Any, List, Optional, Callable
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
+import urllib3
 import yaml
 import structlog
 
+from .k8s_watch_cache import MANAGED_BY_SELECTOR, K8sWatchCache
+from .manifest_diff import diff_object, object_key, resource_path, split_namespaces
+from .provisioning_planner import DEFAULT_MAX_PARALLEL, ProvisioningPlanner, build_tenant_plan
+
 logger = structlog.get_logger(__name__)
 
+# [advice from AI] K8s API 호출 스레드 풀 크기 및 기본 타임아웃 (초)
+K8S_API_MAX_WORKERS = int(os.getenv("K8S_API_MAX_WORKERS", "8"))
+K8S_API_TIMEOUT = float(os.getenv("K8S_API_TIMEOUT", "30"))
+K8S_WATCH_CACHE_ENABLED = os.getenv("K8S_WATCH_CACHE_ENABLED", "true").lower() == "true"
+
+# [advice from AI] 리소스 종류별 API 매핑 (API 속성, create_/delete_ 뒤 접미사, 네임스페이스 범위 여부)
+OBJECT_APIS = {
+    "Namespace": ("v1", "namespace", False),
+    "ResourceQuota": ("v1", "namespaced_resource_quota", True),
+    "NetworkPolicy": ("networking_v1", "namespaced_network_policy", True),
+    "Deployment": ("apps_v1", "namespaced_deployment", True),
+    "Service": ("v1", "namespaced_service", True),
+    "HorizontalPodAutoscaler": ("autoscaling_v2", "namespaced_horizontal_pod_autoscaler", True),
+}
+SERVICE_MONITOR_CRD = {"group": "monitoring.coreos.com", "version": "v1", "plural": "servicemonitors"}
+
+# [advice from AI] server-side apply 필드 매니저 이름 및 apply 동시 실행 상한
+APPLY_FIELD_MANAGER = "ecp-orchestrator"
+APPLY_MAX_PARALLEL = int(os.getenv("K8S_APPLY_MAX_PARALLEL", "8"))
+
 
 class K8sOrchestrator:
     """
@@ -24,50 +56,168 @@ class K8sOrchestrator:
     테넌시별 완전한 K8s 리소스 생성 및 관리
     """
     
-    def __init__(self):
-        """Kubernetes 클라이언트 초기화"""
-        try:
-            # 클러스터 내부에서 실행 시
-            config.load_incluster_config()
-            logger.info("Kubernetes 클러스터 내부 설정 로드")
-        except config.ConfigException:
+    def __init__(self,
+                 configuration: Optional[client.Configuration] = None,
+                 max_workers: int = K8S_API_MAX_WORKERS,
+                 request_timeout: float = K8S_API_TIMEOUT,
+                 use_watch_cache: bool = K8S_WATCH_CACHE_ENABLED):
+        """Kubernetes 클라이언트 초기화
+        
+        Args:
+            configuration: 명시적 클라이언트 설정 (지정 시 kubeconfig 로드 생략, 테스트용 로컬 API 서버 등)
+            max_workers: K8s API 호출 전용 스레드 수 (동시 호출 상한)
+            request_timeout: 호출별 기본 타임아웃 (초)
+            use_watch_cache: 상태 조회를 watch 캐시에서 처리 (첫 조회 시 시작)
+        """
+        if configuration is None:
             try:
-                # 로컬 개발 환경에서 실행 시
-                config.load_kube_config()
-                logger.info("로컬 Kubernetes 설정 로드")
-            except config.ConfigException as e:
-                logger.error("Kubernetes 설정 로드 실패", error=str(e))
-                raise
-        
-        # Kubernetes API 클라이언트들 초기화
-        self.v1 = client.CoreV1Api()
-        self.apps_v1 = client.AppsV1Api()
-        self.autoscaling_v2 = client.AutoscalingV2Api()
-        self.networking_v1 = client.NetworkingV1Api()
-        self.monitoring_v1 = client.CustomObjectsApi()  # Prometheus ServiceMonitor용
-        
-        logger.info("K8sOrchestrator 초기화 완료")
+                # 클러스터 내부에서 실행 시
+                config.load_incluster_config()
+                logger.info("Kubernetes 클러스터 내부 설정 로드")
+            except config.ConfigException:
+                try:
+                    # 로컬 개발 환경에서 실행 시
+                    config.load_kube_config()
+                    logger.info("로컬 Kubernetes 설정 로드")
+                except config.ConfigException as e:
+                    logger.error("Kubernetes 설정 로드 실패", error=str(e))
+                    raise
+        
+        # [advice from AI] 동기 클라이언트 호출은 전용 스레드 풀에서 실행 (이벤트 루프 블로킹 방지)
+        self.request_timeout = request_timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="k8s-api")
+        
+        # Kubernetes API 클라이언트들 초기화 (HTTP 커넥션 풀을 스레드 수에 맞춤)
+        configuration = configuration or client.Configuration.get_default_copy()
+        configuration.connection_pool_maxsize = max(max_workers, configuration.connection_pool_maxsize or 0)
+        self.api_client = client.ApiClient(configuration)
+        self.version_api = client.VersionApi(self.api_client)
+        self.v1 = client.CoreV1Api(self.api_client)
+        self.apps_v1 = client.AppsV1Api(self.api_client)
+        self.autoscaling_v2 = client.AutoscalingV2Api(self.api_client)
+        self.networking_v1 = client.NetworkingV1Api(self.api_client)
+        self.monitoring_v1 = client.CustomObjectsApi(self.api_client)  # Prometheus ServiceMonitor용
+        
+        # [advice from AI] 관리 리소스 watch 캐시 (첫 상태 조회 시 지연 시작)
+        self.use_watch_cache = use_watch_cache
+        self.watch_cache: Optional[K8sWatchCache] = None
+        
+        logger.info("K8sOrchestrator 초기화 완료", max_workers=max_workers, request_timeout=request_timeout)
+    
+    async def _call(self, func: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """K8s API 동기 호출을 스레드 풀에서 실행 (호출별 타임아웃 적용)
+        
+        타임아웃은 HTTP 요청(_request_timeout)과 대기(wait_for) 양쪽에 적용되며,
+        초과 시 기존 에러 처리와 호환되도록 ApiException(504)으로 변환
+        """
+        timeout = timeout or self.request_timeout
+        loop = asyncio.get_running_loop()
+        call = partial(func, *args, _request_timeout=timeout, **kwargs)
+        
+        try:
+            # 스레드 풀 대기 시간까지 고려하여 HTTP 타임아웃보다 약간 여유를 둠
+            return await asyncio.wait_for(loop.run_in_executor(self._executor, call), timeout=timeout + 1.0)
+        except asyncio.TimeoutError:
+            raise self._timeout_exception(func, timeout)
+        except urllib3.exceptions.MaxRetryError as e:
+            if isinstance(e.reason, urllib3.exceptions.TimeoutError):
+                raise self._timeout_exception(func, timeout)
+            raise
+        except urllib3.exceptions.TimeoutError:
+            raise self._timeout_exception(func, timeout)
+    
+    @staticmethod
+    def _timeout_exception(func: Callable, timeout: float) -> ApiException:
+        name = getattr(func, "__name__", "k8s_api_call")
+        logger.warning("K8s API 호출 타임아웃", call=name, timeout=timeout)
+        return ApiException(status=504, reason=f"{name} timed out after {timeout}s")
+    
+    def start_watch_cache(self) -> K8sWatchCache:
+        """watch 캐시 시작 (이미 시작된 경우 기존 캐시 반환)"""
+        if self.watch_cache is None:
+            self.watch_cache = K8sWatchCache(self.v1, self.apps_v1, request_timeout=self.request_timeout)
+            self.watch_cache.start()
+        return self.watch_cache
+    
+    async def close(self) -> None:
+        """watch 캐시, 스레드 풀 및 API 클라이언트 정리"""
+        if self.watch_cache:
+            self.watch_cache.stop()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        await asyncio.get_running_loop().run_in_executor(None, self.api_client.close)
+    
+    @staticmethod
+    def _object_meta(body: Any) -> tuple:
+        """매니페스트(모델 객체 또는 dict)에서 (name, namespace) 추출"""
+        if isinstance(body, dict):
+            metadata = body.get("metadata") or {}
+            return metadata.get("name"), metadata.get("namespace")
+        return body.metadata.name, body.metadata.namespace
+    
+    async def create_object(self, kind: str, body: Any, namespace: Optional[str] = None) -> str:
+        """리소스 종류에 맞는 create API 호출
+        
+        Returns:
+            "created" (새로 생성) 또는 "exists" (409 - 이미 존재), 그 외 오류는 ApiException 전파
+        """
+        name, body_namespace = self._object_meta(body)
+        namespace = namespace or body_namespace
+        
+        try:
+            if kind == "ServiceMonitor":
+                await self._call(
+                    self.monitoring_v1.create_namespaced_custom_object,
+                    namespace=namespace, body=body, **SERVICE_MONITOR_CRD
+                )
+            else:
+                api_name, suffix, namespaced = OBJECT_APIS[kind]
+                func = getattr(getattr(self, api_name), f"create_{suffix}")
+                if namespaced:
+                    await self._call(func, namespace=namespace, body=body)
+                else:
+                    await self._call(func, body=body)
+            return "created"
+        except ApiException as e:
+            if e.status == 409:  # 이미 존재
+                return "exists"
+            raise
+    
+    async def delete_object(self, kind: str, name: str, namespace: Optional[str] = None) -> bool:
+        """리소스 종류에 맞는 delete API 호출 (404는 이미 삭제된 것으로 처리)"""
+        try:
+            if kind == "ServiceMonitor":
+                await self._call(
+                    self.monitoring_v1.delete_namespaced_custom_object,
+                    namespace=namespace, name=name, **SERVICE_MONITOR_CRD
+                )
+            else:
+                api_name, suffix, namespaced = OBJECT_APIS[kind]
+                func = getattr(getattr(self, api_name), f"delete_{suffix}")
+                if namespaced:
+                    await self._call(func, name=name, namespace=namespace)
+                else:
+                    await self._call(func, name=name)
+            return True
+        except ApiException as e:
+            if e.status == 404:
+                return True
+            raise
     
     async def health_check(self) -> bool:
         """Kubernetes 클러스터 연결 상태 확인"""
         try:
             # 클러스터 버전 조회로 연결 확인
-            version = self.v1.get_code(async_req=False)
+            version = await self._call(self.version_api.get_code)
             logger.info("Kubernetes 클러스터 연결 확인", version=version.git_version)
             return True
         except Exception as e:
             logger.error("Kubernetes 클러스터 연결 실패", error=str(e))
             return False
     
-    async def create_namespace(self, tenant_id: str, preset: str) -> bool:
-        """
-        테넌시별 네임스페이스 생성
-        라벨링 및 리소스 쿼터 설정
-        """
+    def _build_namespace(self, tenant_id: str, preset: str) -> client.V1Namespace:
+        """테넌시 네임스페이스 매니페스트"""
         namespace_name = f"{tenant_id}-ecp-ai"
-        
-        # 네임스페이스 매니페스트
-        namespace = client.V1Namespace(
+        return client.V1Namespace(
             metadata=client.V1ObjectMeta(
                 name=namespace_name,
                 labels={
@@ -84,10 +234,22 @@ class K8sOrchestrator:
                 }
             )
         )
+    
+    async def create_namespace(self, tenant_id: str, preset: str) -> bool:
+        """
+        테넌시별 네임스페이스 생성
+        라벨링 및 리소스 쿼터 설정
+        """
+        namespace_name = f"{tenant_id}-ecp-ai"
+        
+        # 네임스페이스 매니페스트
+        namespace = self._build_namespace(tenant_id, preset)
         
         try:
             # 네임스페이스 생성
-            self.v1.create_namespace(body=namespace, async_req=False)
+            if await self.create_object("Namespace", namespace) == "exists":
+                logger.info("네임스페이스 이미 존재", namespace=namespace_name)
+                return True
             logger.info("네임스페이스 생성 성공", namespace=namespace_name, preset=preset)
             
             # 리소스 쿼터 설정 (프리셋별 제한)
@@ -99,18 +261,14 @@ class K8sOrchestrator:
             return True
             
         except ApiException as e:
-            if e.status == 409:  # 이미 존재하는 경우
-                logger.info("네임스페이스 이미 존재", namespace=namespace_name)
-                return True
-            else:
-                logger.error("네임스페이스 생성 실패", namespace=namespace_name, error=str(e))
-                return False
+            logger.error("네임스페이스 생성 실패", namespace=namespace_name, error=str(e))
+            return False
         except Exception as e:
             logger.error("네임스페이스 생성 중 오류", namespace=namespace_name, error=str(e))
             return False
     
-    async def _create_resource_quota(self, namespace: str, preset: str) -> None:
-        """프리셋별 리소스 쿼터 생성"""
+    def _build_resource_quota(self, namespace: str, preset: str) -> client.V1ResourceQuota:
+        """프리셋별 리소스 쿼터 매니페스트"""
         # 프리셋별 리소스 제한
         quota_specs = {
             "micro": {
@@ -153,7 +311,7 @@ class K8sOrchestrator:
         
         quota_spec = quota_specs.get(preset, quota_specs["small"])
         
-        resource_quota = client.V1ResourceQuota(
+        return client.V1ResourceQuota(
             metadata=client.V1ObjectMeta(
                 name="ecp-ai-quota",
                 namespace=namespace
@@ -162,21 +320,25 @@ class K8sOrchestrator:
                 hard=quota_spec
             )
         )
+    
+    async def _create_resource_quota(self, namespace: str, preset: str) -> None:
+        """프리셋별 리소스 쿼터 생성"""
+        resource_quota = self._build_resource_quota(namespace, preset)
         
         try:
-            self.v1.create_namespaced_resource_quota(
+            await self._call(
+                self.v1.create_namespaced_resource_quota,
                 namespace=namespace,
-                body=resource_quota,
-                async_req=False
+                body=resource_quota
             )
             logger.info("리소스 쿼터 생성", namespace=namespace, preset=preset)
         except ApiException as e:
             if e.status != 409:  # 이미 존재하지 않는 경우만 로그
                 logger.warning("리소스 쿼터 생성 실패", namespace=namespace, error=str(e))
     
-    async def _create_network_policy(self, namespace: str, tenant_id: str) -> None:
-        """네트워크 보안 정책 생성"""
-        network_policy = client.V1NetworkPolicy(
+    def _build_network_policy(self, namespace: str, tenant_id: str) -> client.V1NetworkPolicy:
+        """네트워크 보안 정책 매니페스트"""
+        return client.V1NetworkPolicy(
             metadata=client.V1ObjectMeta(
                 name="ecp-ai-network-policy",
                 namespace=namespace
@@ -242,12 +404,16 @@ class K8sOrchestrator:
                 ]
             )
         )
+    
+    async def _create_network_policy(self, namespace: str, tenant_id: str) -> None:
+        """네트워크 보안 정책 생성"""
+        network_policy = self._build_network_policy(namespace, tenant_id)
         
         try:
-            self.networking_v1.create_namespaced_network_policy(
+            await self._call(
+                self.networking_v1.create_namespaced_network_policy,
                 namespace=namespace,
-                body=network_policy,
-                async_req=False
+                body=network_policy
             )
             logger.info("네트워크 정책 생성", namespace=namespace)
         except ApiException as e:
@@ -306,12 +472,12 @@ class K8sOrchestrator:
             )
             return False
     
-    async def _create_deployment(self, 
-                               namespace: str,
-                               tenant_id: str,
-                               service_name: str,
-                               service_config: Dict[str, Any]) -> bool:
-        """Deployment 매니페스트 생성 및 배포"""
+    def _build_deployment(self,
+                          namespace: str,
+                          tenant_id: str,
+                          service_name: str,
+                          service_config: Dict[str, Any]) -> client.V1Deployment:
+        """Deployment 매니페스트 생성 (GPU 워크로드 처리 포함)"""
         
         container_spec = service_config["container_specs"]
         resource_req = service_config["resource_requirements"]
@@ -425,13 +591,14 @@ class K8sOrchestrator:
         )
         
         # Deployment 생성
-        deployment = client.V1Deployment(
+        return client.V1Deployment(
             metadata=client.V1ObjectMeta(
                 name=service_name,
                 namespace=namespace,
                 labels={
                     "app": service_name,
                     "tenant": tenant_id,
+                    "app.kubernetes.io/managed-by": "ecp-orchestrator",
                     "ecp.ai/tenant-id": tenant_id,
                     "ecp.ai/service": service_name
                 }
@@ -454,12 +621,20 @@ class K8sOrchestrator:
                 )
             )
         )
+    
+    async def _create_deployment(self, 
+                               namespace: str,
+                               tenant_id: str,
+                               service_name: str,
+                               service_config: Dict[str, Any]) -> bool:
+        """Deployment 매니페스트 생성 및 배포"""
+        deployment = self._build_deployment(namespace, tenant_id, service_name, service_config)
         
         try:
-            self.apps_v1.create_namespaced_deployment(
+            await self._call(
+                self.apps_v1.create_namespaced_deployment,
                 namespace=namespace,
-                body=deployment,
-                async_req=False
+                body=deployment
             )
             logger.info("Deployment 생성", namespace=namespace, service_name=service_name)
             return True
@@ -471,12 +646,12 @@ class K8sOrchestrator:
                 logger.error("Deployment 생성 실패", namespace=namespace, service_name=service_name, error=str(e))
                 return False
     
-    async def _create_service(self, 
-                            namespace: str,
-                            tenant_id: str,
-                            service_name: str,
-                            service_config: Dict[str, Any]) -> bool:
-        """Service 매니페스트 생성 및 배포"""
+    def _build_service(self,
+                       namespace: str,
+                       tenant_id: str,
+                       service_name: str,
+                       service_config: Dict[str, Any]) -> client.V1Service:
+        """Service 매니페스트 생성"""
         
         container_spec = service_config["container_specs"]
         
@@ -491,7 +666,7 @@ class K8sOrchestrator:
             ))
         
         # Service 생성
-        service = client.V1Service(
+        return client.V1Service(
             metadata=client.V1ObjectMeta(
                 name=f"{service_name}-service",
                 namespace=namespace,
@@ -512,12 +687,20 @@ class K8sOrchestrator:
                 type="ClusterIP"
             )
         )
+    
+    async def _create_service(self, 
+                            namespace: str,
+                            tenant_id: str,
+                            service_name: str,
+                            service_config: Dict[str, Any]) -> bool:
+        """Service 매니페스트 생성 및 배포"""
+        service = self._build_service(namespace, tenant_id, service_name, service_config)
         
         try:
-            self.v1.create_namespaced_service(
+            await self._call(
+                self.v1.create_namespaced_service,
                 namespace=namespace,
-                body=service,
-                async_req=False
+                body=service
             )
             logger.info("Service 생성", namespace=namespace, service_name=service_name)
             return True
@@ -529,18 +712,14 @@ class K8sOrchestrator:
                 logger.error("Service 생성 실패", namespace=namespace, service_name=service_name, error=str(e))
                 return False
     
-    async def setup_autoscaling(self, 
-                              namespace: str,
-                              service_name: str,
-                              service_config: Dict[str, Any]) -> bool:
-        """
-        HPA (Horizontal Pod Autoscaler) 설정
-        CPU/메모리 기반 오토스케일링
-        """
+    def _build_hpa(self,
+                   namespace: str,
+                   service_name: str,
+                   service_config: Dict[str, Any]) -> client.V2HorizontalPodAutoscaler:
+        """HPA 매니페스트 (CPU/메모리 기반)"""
         scaling_config = service_config.get("scaling", {})
         
-        # HPA 매니페스트
-        hpa = client.V2HorizontalPodAutoscaler(
+        return client.V2HorizontalPodAutoscaler(
             metadata=client.V1ObjectMeta(
                 name=f"{service_name}-hpa",
                 namespace=namespace
@@ -601,12 +780,23 @@ class K8sOrchestrator:
                 )
             )
         )
+    
+    async def setup_autoscaling(self, 
+                              namespace: str,
+                              service_name: str,
+                              service_config: Dict[str, Any]) -> bool:
+        """
+        HPA (Horizontal Pod Autoscaler) 설정
+        CPU/메모리 기반 오토스케일링
+        """
+        # HPA 매니페스트
+        hpa = self._build_hpa(namespace, service_name, service_config)
         
         try:
-            self.autoscaling_v2.create_namespaced_horizontal_pod_autoscaler(
+            await self._call(
+                self.autoscaling_v2.create_namespaced_horizontal_pod_autoscaler,
                 namespace=namespace,
-                body=hpa,
-                async_req=False
+                body=hpa
             )
             logger.info("HPA 생성", namespace=namespace, service_name=service_name)
             return True
@@ -618,15 +808,9 @@ class K8sOrchestrator:
                 logger.error("HPA 생성 실패", namespace=namespace, service_name=service_name, error=str(e))
                 return False
     
-    async def configure_monitoring(self, 
-                                 namespace: str,
-                                 tenant_id: str,
-                                 service_name: str) -> bool:
-        """
-        Prometheus ServiceMonitor 설정
-        메트릭 수집 활성화
-        """
-        service_monitor = {
+    def _build_service_monitor(self, namespace: str, tenant_id: str, service_name: str) -> Dict[str, Any]:
+        """Prometheus ServiceMonitor 매니페스트"""
+        return {
             "apiVersion": "monitoring.coreos.com/v1",
             "kind": "ServiceMonitor",
             "metadata": {
@@ -655,15 +839,25 @@ class K8sOrchestrator:
                 ]
             }
         }
+    
+    async def configure_monitoring(self, 
+                                 namespace: str,
+                                 tenant_id: str,
+                                 service_name: str) -> bool:
+        """
+        Prometheus ServiceMonitor 설정
+        메트릭 수집 활성화
+        """
+        service_monitor = self._build_service_monitor(namespace, tenant_id, service_name)
         
         try:
-            self.monitoring_v1.create_namespaced_custom_object(
+            await self._call(
+                self.monitoring_v1.create_namespaced_custom_object,
                 group="monitoring.coreos.com",
                 version="v1",
                 namespace=namespace,
                 plural="servicemonitors",
-                body=service_monitor,
-                async_req=False
+                body=service_monitor
             )
             logger.info("ServiceMonitor 생성", namespace=namespace, service_name=service_name)
             return True
@@ -680,14 +874,27 @@ class K8sOrchestrator:
                          namespace=namespace, service_name=service_name, error=str(e))
             return False
     
+    async def provision_tenant(self,
+                               tenant_id: str,
+                               preset: str,
+                               services: Dict[str, Dict[str, Any]],
+                               max_parallel: Optional[int] = None) -> Dict[str, Any]:
+        """
+        테넌시 전체 리소스를 의존성 DAG 순서로 병렬 생성
+        실패 시 이번 실행에서 생성한 리소스 롤백, 리소스별 지연 시간 및 크리티컬 패스 리포트 반환
+        """
+        plan = build_tenant_plan(self, tenant_id, preset, services)
+        planner = ProvisioningPlanner(self, max_parallel=max_parallel or DEFAULT_MAX_PARALLEL)
+        return await planner.execute(plan)
+    
     async def delete_tenant(self, tenant_id: str) -> bool:
         """테넌시 전체 삭제 (네임스페이스 삭제로 모든 리소스 정리)"""
         namespace_name = f"{tenant_id}-ecp-ai"
         
         try:
-            self.v1.delete_namespace(
-                name=namespace_name,
-                async_req=False
+            await self._call(
+                self.v1.delete_namespace,
+                name=namespace_name
             )
             logger.info("테넌시 삭제 시작", tenant_id=tenant_id, namespace=namespace_name)
             return True
@@ -700,38 +907,32 @@ class K8sOrchestrator:
                 return False
     
     async def get_tenant_status(self, tenant_id: str) -> Optional[Dict[str, Any]]:
-        """테넌시 상태 조회"""
+        """
+        테넌시 상태 조회 (watch 캐시 동기화 후에는 메모리에서 처리)
+        - 동기화된 캐시에 네임스페이스가 없으면 없는 테넌시로 처리 (API 서버 조회 없음)
+        - 캐시 동기화 전에만 API 서버 직접 조회
+        """
         namespace_name = f"{tenant_id}-ecp-ai"
         
+        if self.use_watch_cache:
+            cache = self.start_watch_cache()
+            if cache.has_synced():
+                if cache.get_namespace(namespace_name) is None:
+                    logger.info("테넌시 없음", tenant_id=tenant_id)
+                    return None
+                return self._tenant_status(tenant_id, namespace_name, cache.list_deployments(namespace_name))
+        
         try:
             # 네임스페이스 존재 확인
-            self.v1.read_namespace(name=namespace_name, async_req=False)
+            await self._call(self.v1.read_namespace, name=namespace_name)
             
             # 배포된 서비스 목록 조회
-            deployments = self.apps_v1.list_namespaced_deployment(
-                namespace=namespace_name,
-                async_req=False
+            deployments = await self._call(
+                self.apps_v1.list_namespaced_deployment,
+                namespace=namespace_name
             )
             
-            services = []
-            for deployment in deployments.items:
-                service_info = {
-                    "name": deployment.metadata.name,
-                    "replicas": {
-                        "desired": deployment.spec.replicas,
-                        "available": deployment.status.available_replicas or 0,
-                        "ready": deployment.status.ready_replicas or 0
-                    },
-                    "status": "Running" if deployment.status.available_replicas == deployment.spec.replicas else "Pending"
-                }
-                services.append(service_info)
-            
-            return {
-                "tenant_id": tenant_id,
-                "namespace": namespace_name,
-                "status": "Running",
-                "services": services
-            }
+            return self._tenant_status(tenant_id, namespace_name, deployments.items)
             
         except ApiException as e:
             if e.status == 404:
@@ -740,3 +941,231 @@ class K8sOrchestrator:
             else:
                 logger.error("테넌시 상태 조회 실패", tenant_id=tenant_id, error=str(e))
                 return None
+    
+    @staticmethod
+    def _tenant_status(tenant_id: str, namespace_name: str, deployments: List[Any]) -> Dict[str, Any]:
+        """Deployment 목록으로 테넌시 상태 구성"""
+        services = []
+        for deployment in sorted(deployments, key=lambda d: d.metadata.name):
+            service_info = {
+                "name": deployment.metadata.name,
+                "replicas": {
+                    "desired": deployment.spec.replicas,
+                    "available": deployment.status.available_replicas or 0,
+                    "ready": deployment.status.ready_replicas or 0
+                },
+                "status": "Running" if deployment.status.available_replicas == deployment.spec.replicas else "Pending"
+            }
+            services.append(service_info)
+        
+        return {
+            "tenant_id": tenant_id,
+            "namespace": namespace_name,
+            "status": "Running",
+            "services": services
+        }
+    
+    async def list_namespaces(self) -> List[str]:
+        """ECP 관리 네임스페이스 이름 목록 (watch 캐시 동기화 시 메모리에서 조회)"""
+        if self.watch_cache and self.watch_cache.has_synced():
+            return sorted(ns.metadata.name for ns in self.watch_cache.namespaces.values())
+        
+        result = await self._call(self.v1.list_namespace, label_selector=MANAGED_BY_SELECTOR)
+        return [ns.metadata.name for ns in result.items]
+    
+    async def list_deployments(self, namespace: str) -> List[str]:
+        """네임스페이스 내 Deployment 이름 목록"""
+        if self.watch_cache and self.watch_cache.has_synced():
+            return sorted(d.metadata.name for d in self.watch_cache.list_deployments(namespace))
+        
+        result = await self._call(self.apps_v1.list_namespaced_deployment, namespace=namespace)
+        return [d.metadata.name for d in result.items]
+    
+    async def get_deployment_info(self, deployment_name: str, namespace: str) -> Optional[Dict[str, Any]]:
+        """Deployment 상태 정보 (레플리카 수, 롤아웃 상태, 스펙)"""
+        deployment = None
+        if self.watch_cache and self.watch_cache.has_synced():
+            deployment = self.watch_cache.deployments.get(f"{namespace}/{deployment_name}")
+        
+        if deployment is None:
+            try:
+                deployment = await self._call(
+                    self.apps_v1.read_namespaced_deployment,
+                    name=deployment_name,
+                    namespace=namespace
+                )
+            except ApiException as e:
+                if e.status != 404:
+                    logger.error("Deployment 조회 실패", namespace=namespace, deployment_name=deployment_name, error=str(e))
+                return None
+        
+        return self.deployment_info(deployment)
+    
+    def deployment_info(self, deployment: client.V1Deployment) -> Dict[str, Any]:
+        """V1Deployment를 모니터링용 딕셔너리로 변환"""
+        status = deployment.status or client.V1DeploymentStatus()
+        conditions = status.conditions or []
+        created = deployment.metadata.creation_timestamp
+        desired = deployment.spec.replicas if deployment.spec.replicas is not None else 1
+        
+        return {
+            "name": deployment.metadata.name,
+            "namespace": deployment.metadata.namespace,
+            "resource_version": deployment.metadata.resource_version,
+            "generation": deployment.metadata.generation,
+            "observed_generation": status.observed_generation,
+            "replicas_desired": desired,
+            "replicas_available": status.available_replicas or 0,
+            "replicas_ready": status.ready_replicas or 0,
+            "replicas_updated": status.updated_replicas or 0,
+            "replicas_unavailable": status.unavailable_replicas or 0,
+            "progress_deadline_exceeded": any(
+                c.type == "Progressing" and c.reason == "ProgressDeadlineExceeded" for c in conditions
+            ),
+            "age": datetime.now(timezone.utc) - created if created else timedelta(),
+            "spec": self.api_client.sanitize_for_serialization(deployment.spec)
+        }
+    
+    async def rollback_deployment(self, deployment_name: str, namespace: str, image: str) -> bool:
+        """Deployment 메인 컨테이너 이미지를 지정 이미지로 되돌림"""
+        try:
+            deployment = await self._call(
+                self.apps_v1.read_namespaced_deployment,
+                name=deployment_name,
+                namespace=namespace
+            )
+            containers = deployment.spec.template.spec.containers
+            previous_image = containers[0].image
+            containers[0].image = image
+            
+            annotations = deployment.spec.template.metadata.annotations or {}
+            annotations["ecp.ai/rollback-from"] = previous_image
+            deployment.spec.template.metadata.annotations = annotations
+            
+            await self._call(
+                self.apps_v1.replace_namespaced_deployment,
+                name=deployment_name,
+                namespace=namespace,
+                body=deployment
+            )
+            logger.info("Deployment 롤백", namespace=namespace, deployment_name=deployment_name,
+                        from_image=previous_image, to_image=image)
+            return True
+        except ApiException as e:
+            logger.error("Deployment 롤백 실패", namespace=namespace, deployment_name=deployment_name, error=str(e))
+            return False
+    
+    async def _read_live_object(self, obj: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """리소스 실제 상태 조회 (watch 캐시 우선, 없으면 API 조회, 미존재 시 None)"""
+        metadata = obj.get("metadata") or {}
+        if self.watch_cache and self.watch_cache.has_synced():
+            cached = None
+            if obj.get("kind") == "Namespace":
+                cached = self.watch_cache.get_namespace(metadata.get("name"))
+            elif obj.get("kind") == "Deployment":
+                cached = self.watch_cache.deployments.get(f"{metadata.get('namespace')}/{metadata.get('name')}")
+            if cached is not None:
+                return self.api_client.sanitize_for_serialization(cached)
+        
+        try:
+            return await self._call(
+                self.api_client.call_api, resource_path(obj), "GET",
+                header_params={"Accept": "application/json"},
+                response_type="object", auth_settings=["BearerToken"],
+                _return_http_data_only=True
+            )
+        except ApiException as e:
+            if e.status == 404:
+                return None
+            raise
+    
+    async def _server_side_apply(self, obj: Dict[str, Any], dry_run: bool = False) -> Dict[str, Any]:
+        """server-side apply PATCH (없으면 생성, dry_run 시 서버 검증만 수행)"""
+        query_params = [("fieldManager", APPLY_FIELD_MANAGER), ("force", "true")]
+        if dry_run:
+            query_params.append(("dryRun", "All"))
+        return await self._call(
+            self.api_client.call_api, resource_path(obj), "PATCH",
+            query_params=query_params,
+            header_params={"Content-Type": "application/apply-patch+yaml", "Accept": "application/json"},
+            body=obj, response_type="object", auth_settings=["BearerToken"],
+            _return_http_data_only=True
+        )
+    
+    async def _apply_one(self, obj: Dict[str, Any], dry_run: bool) -> Dict[str, Any]:
+        result = {"resource": object_key(obj), "action": "unchanged", "changed_fields": [], "status": "unchanged"}
+        try:
+            live = await self._read_live_object(obj)
+            if live is None:
+                result["action"] = "create"
+            else:
+                result["changed_fields"] = diff_object(obj, live)
+                if result["changed_fields"]:
+                    result["action"] = "update"
+            
+            if result["action"] != "unchanged":
+                # 변경된 리소스만 전송 (SSA 특성상 소유 필드 유지를 위해 해당 리소스의 desired 전체를 전송)
+                await self._server_side_apply(obj, dry_run=dry_run)
+                result["status"] = "planned" if dry_run else "applied"
+        except (ApiException, ValueError) as e:
+            result["status"] = "failed"
+            result["error"] = f"{e.status}: {e.reason}" if isinstance(e, ApiException) else str(e)
+            logger.error("리소스 apply 실패", resource=result["resource"], error=result["error"])
+        return result
+    
+    async def apply_resources(self,
+                              resources: List[Dict[str, Any]],
+                              dry_run: bool = False,
+                              max_parallel: int = APPLY_MAX_PARALLEL) -> Dict[str, Any]:
+        """
+        원하는 상태와 실제 상태를 비교하여 변경된 리소스만 server-side apply
+        dry_run 시 서버 dryRun=All로 검증만 하고 변경 계획 반환
+        """
+        semaphore = asyncio.Semaphore(max_parallel)
+        
+        async def apply(obj: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._apply_one(obj, dry_run)
+        
+        namespaces, others = split_namespaces(resources)
+        results = [await apply(obj) for obj in namespaces]
+        results += await asyncio.gather(*(apply(obj) for obj in others))
+        
+        summary = {"create": 0, "update": 0, "unchanged": 0, "failed": 0}
+        for result in results:
+            summary["failed" if result["status"] == "failed" else result["action"]] += 1
+        
+        logger.info("매니페스트 apply 완료", dry_run=dry_run, **summary)
+        return {
+            "dry_run": dry_run,
+            "changed": summary["create"] + summary["update"] > 0,
+            "summary": summary,
+            "objects": results
+        }
+    
+    async def apply_fleet(self,
+                          tenant_resources: Dict[str, List[Dict[str, Any]]],
+                          dry_run: bool = False,
+                          max_parallel_tenants: int = 4) -> Dict[str, Any]:
+        """여러 테넌시에 설정 일괄 적용 (변경이 있는 테넌시/리소스만 반영)"""
+        semaphore = asyncio.Semaphore(max_parallel_tenants)
+        
+        async def apply_tenant(tenant_id: str, resources: List[Dict[str, Any]]):
+            async with semaphore:
+                return tenant_id, await self.apply_resources(resources, dry_run=dry_run)
+        
+        reports = dict(await asyncio.gather(*(
+            apply_tenant(tenant_id, resources) for tenant_id, resources in tenant_resources.items()
+        )))
+        
+        summary = {"create": 0, "update": 0, "unchanged": 0, "failed": 0}
+        for report in reports.values():
+            for key, count in report["summary"].items():
+                summary[key] += count
+        
+        return {
+            "dry_run": dry_run,
+            "tenants": reports,
+            "changed_tenants": sorted(t for t, r in reports.items() if r["changed"]),
+            "summary": summary
+        }
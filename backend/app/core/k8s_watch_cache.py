@@ -0,0 +1,247 @@
+# [advice from AI] ECP-AI K8s watch 캐시 - informer 방식 로컬 상태 캐시
+"""
+ECP 오케스트레이터 관리 리소스 watch 캐시
+- app.kubernetes.io/managed-by=ecp-orchestrator (이전 라벨 ecp-ai-orchestrator 포함) Namespace / Deployment를
+  list + watch로 메모리에 유지
+- watch 만료(410 Gone) 또는 오류 시 재목록(resync) 후 watch 재개
+- 상태 조회는 메모리에서 처리하여 대시보드 연결 수와 무관하게 API 서버 부하 일정 유지
+- watch 스트림은 전용 데몬 스레드에서 동작 (API 호출 스레드 풀과 분리)
+- 변경 이벤트 리스너 등록 지원 (재목록 시 누락된 변경/삭제도 이벤트로 전달)
+"""
+
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# [advice from AI] 관리 라벨 값 (ecp-ai-orchestrator는 이전 매니페스트 생성기가 붙이던 값, 기존 테넌시 호환)
+MANAGED_BY = "ecp-orchestrator"
+LEGACY_MANAGED_BY = "ecp-ai-orchestrator"
+MANAGED_BY_SELECTOR = f"app.kubernetes.io/managed-by in ({MANAGED_BY},{LEGACY_MANAGED_BY})"
+
+# [advice from AI] watch 요청 서버 측 타임아웃(초) 및 오류 후 재시도 대기(초)
+K8S_WATCH_TIMEOUT = int(os.getenv("K8S_WATCH_TIMEOUT", "300"))
+K8S_WATCH_RETRY_BACKOFF = float(os.getenv("K8S_WATCH_RETRY_BACKOFF", "2"))
+
+
+class Informer:
+    """단일 리소스 종류에 대한 list + watch 캐시"""
+
+    def __init__(self,
+                 name: str,
+                 list_func: Callable,
+                 label_selector: str = MANAGED_BY_SELECTOR,
+                 watch_timeout: int = K8S_WATCH_TIMEOUT,
+                 request_timeout: float = 30.0,
+                 retry_backoff: float = K8S_WATCH_RETRY_BACKOFF):
+        self.name = name
+        self.list_func = list_func
+        self.label_selector = label_selector
+        self.watch_timeout = watch_timeout
+        self.request_timeout = request_timeout
+        self.retry_backoff = retry_backoff
+
+        self.items: Dict[str, Any] = {}
+        self.by_namespace: Dict[str, Dict[str, Any]] = {}
+        self.resource_version: Optional[str] = None
+        self.lock = threading.RLock()
+        self.synced = threading.Event()
+        self.stats = {"lists": 0, "watches": 0, "events": 0, "expired": 0, "errors": 0}
+        self.last_sync_at: Optional[float] = None
+        self.listeners: List[Callable[[str, Any], None]] = []
+
+        self._stop = threading.Event()
+        self._watch: Optional[watch.Watch] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _key(obj: Any) -> str:
+        metadata = obj.metadata
+        return f"{metadata.namespace}/{metadata.name}" if metadata.namespace else metadata.name
+
+    def add_listener(self, listener: Callable[[str, Any], None]) -> None:
+        """변경 이벤트 리스너 등록 (watch 스레드에서 (이벤트 타입, 객체)로 호출)"""
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, Any], None]) -> None:
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def _notify(self, event_type: str, obj: Any) -> None:
+        for listener in list(self.listeners):
+            try:
+                listener(event_type, obj)
+            except Exception as e:
+                logger.warning("watch 리스너 오류", informer=self.name, error=str(e))
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f"k8s-watch-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._watch:
+            self._watch.stop()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                if self.resource_version is None:
+                    self._relist()
+                self._watch_once()
+            except ApiException as e:
+                self.resource_version = None
+                if e.status == 410:
+                    # watch 만료 - 즉시 재목록
+                    self.stats["expired"] += 1
+                    logger.info("watch 만료 - 재동기화", informer=self.name)
+                else:
+                    self.stats["errors"] += 1
+                    logger.warning("watch 오류 - 재시도 대기", informer=self.name, status=e.status, error=str(e))
+                    self._stop.wait(self.retry_backoff)
+            except Exception as e:
+                self.resource_version = None
+                self.stats["errors"] += 1
+                logger.warning("watch 오류 - 재시도 대기", informer=self.name, error=str(e))
+                self._stop.wait(self.retry_backoff)
+
+    def _relist(self) -> None:
+        """전체 목록 조회로 캐시 교체"""
+        result = self.list_func(label_selector=self.label_selector, _request_timeout=self.request_timeout)
+        items = {self._key(obj): obj for obj in result.items}
+        by_namespace: Dict[str, Dict[str, Any]] = {}
+        for obj in result.items:
+            if obj.metadata.namespace:
+                by_namespace.setdefault(obj.metadata.namespace, {})[obj.metadata.name] = obj
+
+        with self.lock:
+            previous = self.items
+            self.items = items
+            self.by_namespace = by_namespace
+            self.resource_version = result.metadata.resource_version
+            self.last_sync_at = time.time()
+        self.stats["lists"] += 1
+        self.synced.set()
+        logger.debug("watch 캐시 재동기화", informer=self.name, items=len(items))
+
+        # watch 공백 동안의 변경/삭제를 리스너에 전달
+        if self.listeners:
+            for key, obj in previous.items():
+                if key not in items:
+                    self._notify("DELETED", obj)
+            for key, obj in items.items():
+                old = previous.get(key)
+                if old is None:
+                    self._notify("ADDED", obj)
+                elif old.metadata.resource_version != obj.metadata.resource_version:
+                    self._notify("MODIFIED", obj)
+
+    def _watch_once(self) -> None:
+        """resource_version 이후 변경 이벤트 반영 (서버 타임아웃 시 정상 종료)"""
+        self._watch = watch.Watch()
+        self.stats["watches"] += 1
+        for event in self._watch.stream(
+            self.list_func,
+            label_selector=self.label_selector,
+            resource_version=self.resource_version,
+            timeout_seconds=self.watch_timeout,
+            _request_timeout=self.watch_timeout + self.request_timeout
+        ):
+            self._apply(event["type"], event["object"])
+            if self._stop.is_set():
+                self._watch.stop()
+                break
+
+    def _apply(self, event_type: str, obj: Any) -> None:
+        key = self._key(obj)
+        namespace = obj.metadata.namespace
+        with self.lock:
+            if event_type == "DELETED":
+                self.items.pop(key, None)
+                if namespace:
+                    self.by_namespace.get(namespace, {}).pop(obj.metadata.name, None)
+            elif event_type in ("ADDED", "MODIFIED"):
+                self.items[key] = obj
+                if namespace:
+                    self.by_namespace.setdefault(namespace, {})[obj.metadata.name] = obj
+            self.resource_version = obj.metadata.resource_version
+        self.stats["events"] += 1
+        self._notify(event_type, obj)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self.lock:
+            return self.items.get(key)
+
+    def values(self) -> List[Any]:
+        with self.lock:
+            return list(self.items.values())
+
+    def list_namespace(self, namespace: str) -> List[Any]:
+        with self.lock:
+            return list(self.by_namespace.get(namespace, {}).values())
+
+    def status(self) -> Dict[str, Any]:
+        with self.lock:
+            count = len(self.items)
+        return {
+            "synced": self.synced.is_set(),
+            "items": count,
+            "resource_version": self.resource_version,
+            "last_sync_at": self.last_sync_at,
+            **self.stats
+        }
+
+
+class K8sWatchCache:
+    """관리 대상 Namespace / Deployment 공유 watch 캐시"""
+
+    def __init__(self,
+                 v1,
+                 apps_v1,
+                 label_selector: str = MANAGED_BY_SELECTOR,
+                 watch_timeout: int = K8S_WATCH_TIMEOUT,
+                 request_timeout: float = 30.0):
+        self.namespaces = Informer("namespaces", v1.list_namespace, label_selector,
+                                   watch_timeout, request_timeout)
+        self.deployments = Informer("deployments", apps_v1.list_deployment_for_all_namespaces, label_selector,
+                                    watch_timeout, request_timeout)
+
+    def start(self) -> None:
+        self.namespaces.start()
+        self.deployments.start()
+        logger.info("K8s watch 캐시 시작", label_selector=self.namespaces.label_selector)
+
+    def stop(self) -> None:
+        self.namespaces.stop()
+        self.deployments.stop()
+
+    def has_synced(self) -> bool:
+        return self.namespaces.synced.is_set() and self.deployments.synced.is_set()
+
+    async def wait_for_sync(self, timeout: float = 10.0) -> bool:
+        """초기 목록 동기화 대기"""
+        deadline = time.monotonic() + timeout
+        while not self.has_synced():
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.05)
+        return True
+
+    def get_namespace(self, name: str) -> Optional[Any]:
+        return self.namespaces.get(name)
+
+    def list_deployments(self, namespace: str) -> List[Any]:
+        return self.deployments.list_namespace(namespace)
+
+    def status(self) -> Dict[str, Any]:
+        return {"namespaces": self.namespaces.status(), "deployments": self.deployments.status()}
@@ -0,0 +1,138 @@
+# [advice from AI] 매니페스트 diff - 원하는 상태와 실제 상태 비교
+"""
+매니페스트 diff 유틸리티
+- 매니페스트(dict)의 API 경로 / 식별 키 계산
+- 원하는 상태(desired)가 실제 상태(live)에 포함되는지 필드 단위 비교
+  (desired에 없는 필드는 서버 기본값으로 간주하여 무시, 리소스 수량은 단위 정규화 후 비교)
+- ManifestGenerator 출력(파일명 → YAML)을 리소스 목록으로 변환
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from kubernetes.utils.quantity import parse_quantity
+
+from . import yaml_io
+
+# [advice from AI] 종류별 복수형 이름 (API 경로 구성용)
+RESOURCE_PLURALS = {
+    "Namespace": "namespaces",
+    "ConfigMap": "configmaps",
+    "Secret": "secrets",
+    "Service": "services",
+    "PersistentVolumeClaim": "persistentvolumeclaims",
+    "ResourceQuota": "resourcequotas",
+    "Deployment": "deployments",
+    "StatefulSet": "statefulsets",
+    "HorizontalPodAutoscaler": "horizontalpodautoscalers",
+    "VerticalPodAutoscaler": "verticalpodautoscalers",
+    "NetworkPolicy": "networkpolicies",
+    "Ingress": "ingresses",
+    "ServiceMonitor": "servicemonitors",
+}
+CLUSTER_SCOPED_KINDS = {"Namespace"}
+IGNORED_FIELDS = {"apiVersion", "kind", "metadata", "status"}
+
+
+def object_key(obj: Dict[str, Any]) -> str:
+    """리소스 식별 키 (Kind/namespace/name, 클러스터 범위는 Kind/name)"""
+    metadata = obj.get("metadata") or {}
+    if obj.get("kind") in CLUSTER_SCOPED_KINDS or not metadata.get("namespace"):
+        return f"{obj.get('kind')}/{metadata.get('name')}"
+    return f"{obj.get('kind')}/{metadata.get('namespace')}/{metadata.get('name')}"
+
+
+def resource_path(obj: Dict[str, Any]) -> str:
+    """리소스 단일 객체 API 경로"""
+    kind = obj.get("kind")
+    if kind not in RESOURCE_PLURALS:
+        raise ValueError(f"지원하지 않는 리소스 종류: {kind}")
+
+    api_version = obj.get("apiVersion", "v1")
+    prefix = "/api/v1" if api_version == "v1" else f"/apis/{api_version}"
+    metadata = obj.get("metadata") or {}
+    name = metadata.get("name")
+    if not name:
+        raise ValueError(f"{kind} 리소스에 metadata.name이 없습니다")
+
+    if kind in CLUSTER_SCOPED_KINDS:
+        return f"{prefix}/{RESOURCE_PLURALS[kind]}/{name}"
+    namespace = metadata.get("namespace")
+    if not namespace:
+        raise ValueError(f"{kind}/{name} 리소스에 metadata.namespace가 없습니다")
+    return f"{prefix}/namespaces/{namespace}/{RESOURCE_PLURALS[kind]}/{name}"
+
+
+def _scalar_equal(desired: Any, live: Any) -> bool:
+    if desired == live:
+        return True
+    if isinstance(desired, bool) or isinstance(live, bool):
+        return False
+    if isinstance(desired, (int, float, str)) and isinstance(live, (int, float, str)):
+        # IntOrString 포트("8080" vs 8080), 리소스 수량("500m" vs "0.5", "1Gi" vs "1024Mi")
+        if str(desired) == str(live):
+            return True
+        try:
+            return parse_quantity(desired) == parse_quantity(live)
+        except (ValueError, TypeError):
+            return False
+    return False
+
+
+def _diff(desired: Any, live: Any, path: str, changes: List[str]) -> None:
+    if desired is None:
+        return
+    if isinstance(desired, dict):
+        if live is None and not desired:
+            return
+        if not isinstance(live, dict):
+            changes.append(path)
+            return
+        for key, value in desired.items():
+            _diff(value, live.get(key), f"{path}.{key}", changes)
+    elif isinstance(desired, list):
+        if live is None and not desired:
+            return
+        if not isinstance(live, list) or len(live) != len(desired):
+            changes.append(path)
+            return
+        for index, (d, l) in enumerate(zip(desired, live)):
+            _diff(d, l, f"{path}[{index}]", changes)
+    elif not _scalar_equal(desired, live):
+        changes.append(path)
+
+
+def diff_object(desired: Dict[str, Any], live: Dict[str, Any]) -> List[str]:
+    """desired와 다른 live 필드 경로 목록 (빈 목록이면 변경 없음)"""
+    changes: List[str] = []
+    desired_meta = desired.get("metadata") or {}
+    live_meta = live.get("metadata") or {}
+    for field in ("labels", "annotations"):
+        _diff(desired_meta.get(field), live_meta.get(field), f"metadata.{field}", changes)
+    for key, value in desired.items():
+        if key not in IGNORED_FIELDS:
+            _diff(value, live.get(key), key, changes)
+    return changes
+
+
+def resources_from_manifests(manifests: Dict[str, str],
+                             default_namespace: Optional[str] = None) -> List[Dict[str, Any]]:
+    """ManifestGenerator 출력(파일명 → YAML)에서 Kubernetes 리소스만 추출 (스크립트/문서 제외)"""
+    resources: List[Dict[str, Any]] = []
+    for filename, content in manifests.items():
+        if not filename.endswith((".yaml", ".yml")):
+            continue
+        for doc in yaml_io.load_all(content):
+            if not doc.get("kind") or not doc.get("apiVersion"):
+                continue
+            metadata = doc.setdefault("metadata", {})
+            if default_namespace and doc["kind"] not in CLUSTER_SCOPED_KINDS:
+                metadata.setdefault("namespace", default_namespace)
+            resources.append(doc)
+    return resources
+
+
+def split_namespaces(resources: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Namespace 리소스와 나머지 분리 (Namespace 먼저 적용)"""
+    namespaces = [r for r in resources if r.get("kind") == "Namespace"]
+    others = [r for r in resources if r.get("kind") != "Namespace"]
+    return namespaces, others
@@ -7,7 +7,6 @@ Kubernetes 매니페스트 파일 자동 생성
 """
 
 import os
-import yaml
 import zipfile
 from io import BytesIO
 from typing import Dict, Any, List
@@ -16,6 +15,7 @@ from jinja2 import Template, Environment, FileSystemLoader
 import structlog
 
 from .tenant_manager import TenantSpecs
+from . import yaml_io
 
 logger = structlog.get_logger(__name__)
 
@@ -281,6 +281,7 @@ metadata:
   labels:
     app: {{ service_name }}
     tenant: {{ tenant_id }}
+    app.kubernetes.io/managed-by: ecp-orchestrator
     component: vpa
 spec:
   targetRef:
@@ -603,6 +604,7 @@ metadata:
   labels:
     app: {service_name}
     tenant: {tenant_specs.tenant_id}
+    app.kubernetes.io/managed-by: ecp-orchestrator
 spec:
   replicas: 1
   selector:
@@ -737,6 +739,7 @@ metadata:
   labels:
     app: {gpu_service}
     tenant: {tenant_specs.tenant_id}
+    app.kubernetes.io/managed-by: ecp-orchestrator
     tier: gpu
 spec:
   replicas: 1
@@ -816,6 +819,7 @@ metadata:
   labels:
     app: {cpu_service}
     tenant: {tenant_specs.tenant_id}
+    app.kubernetes.io/managed-by: ecp-orchestrator
     tier: cpu
 spec:
   replicas: {resource_config["replicas"]}
@@ -932,6 +936,7 @@ metadata:
   labels:
     app: {infra_service}
     tenant: {tenant_specs.tenant_id}
+    app.kubernetes.io/managed-by: ecp-orchestrator
     tier: infrastructure
 spec:
   replicas: {config["replicas"]}
@@ -987,6 +992,7 @@ metadata:
   labels:
     app: {gpu_service}
     tenant: {tenant_specs.tenant_id}
+    app.kubernetes.io/managed-by: ecp-orchestrator
 spec:
   scaleTargetRef:
     apiVersion: apps/v1
@@ -1083,6 +1089,7 @@ metadata:
   labels:
     app: {service_name}
     tenant: {tenant_specs.tenant_id}
+    app.kubernetes.io/managed-by: ecp-orchestrator
     monitoring: enabled
 spec:
   selector:
@@ -1214,7 +1221,7 @@ data:
             }
         }
         
-        return yaml.dump(monitoring_yaml, default_flow_style=False, allow_unicode=True)
+        return yaml_io.dump(monitoring_yaml)
     
     def _generate_deploy_script(self, tenant_specs: TenantSpecs) -> str:
         """배포 스크립트 생성"""
@@ -1441,6 +1448,7 @@ metadata:
   labels:
     app: {{ service_name }}
     tenant: {{ tenant_id }}
+    app.kubernetes.io/managed-by: ecp-orchestrator
     ecp.ai/tenant-id: {{ tenant_id }}
     ecp.ai/service: {{ service_name }}
 spec:
@@ -1556,6 +1564,7 @@ metadata:
   labels:
     app: {{ service_name }}
     tenant: {{ tenant_id }}
+    app.kubernetes.io/managed-by: ecp-orchestrator
     ecp.ai/tenant-id: {{ tenant_id }}
     ecp.ai/service: {{ service_name }}
     monitoring: enabled
@@ -1583,6 +1592,7 @@ metadata:
   labels:
     app: {{ service_name }}
     tenant: {{ tenant_id }}
+    app.kubernetes.io/managed-by: ecp-orchestrator
 spec:
   scaleTargetRef:
     apiVersion: apps/v1
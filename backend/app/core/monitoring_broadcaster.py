@@ -0,0 +1,114 @@
+# [advice from AI] 모니터링 WebSocket 공유 생산자 - 주기마다 한 번 계산/직렬화 후 구독자에게 분배
+"""
+모니터링 브로드캐스터
+- 구독자가 있을 때만 생산 태스크 실행 (첫 구독 시 시작, 마지막 구독 해제 시 중지)
+- 주기마다 번들을 한 번 계산하고 한 번 직렬화해 모든 구독자 큐에 같은 문자열 전달
+- 구독자 큐는 크기 제한, 느린 구독자는 오래된 메시지를 버리고 최신 메시지 유지 (생산자는 대기하지 않음)
+- 새 구독자에게는 직전 메시지를 바로 전달 (다음 주기까지 기다리지 않음)
+- 계산 실패 시 오류 메시지를 분배하고 오류 대기 시간 후 재시도
+"""
+
+import asyncio
+import json
+import os
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+import structlog
+from prometheus_client import Counter
+
+logger = structlog.get_logger(__name__)
+
+# [advice from AI] 전송 주기(초) / 오류 시 대기(초) / 구독자별 대기 메시지 최대 개수
+MONITORING_STREAM_INTERVAL = float(os.getenv("MONITORING_STREAM_INTERVAL", "5"))
+MONITORING_STREAM_ERROR_INTERVAL = float(os.getenv("MONITORING_STREAM_ERROR_INTERVAL", "10"))
+MONITORING_STREAM_QUEUE_SIZE = int(os.getenv("MONITORING_STREAM_QUEUE_SIZE", "2"))
+
+MONITORING_STREAM_DROPPED = Counter(
+    "ecp_monitoring_stream_dropped_total",
+    "Monitoring stream messages dropped for slow WebSocket subscribers"
+)
+
+
+class MonitoringBroadcaster:
+    """구독자 큐로 분배하는 공유 생산자"""
+
+    def __init__(self, produce: Callable[[], Awaitable[Dict[str, Any]]],
+                 interval: float = MONITORING_STREAM_INTERVAL,
+                 error_interval: float = MONITORING_STREAM_ERROR_INTERVAL,
+                 queue_size: int = MONITORING_STREAM_QUEUE_SIZE):
+        self.produce = produce
+        self.interval = interval
+        self.error_interval = error_interval
+        self.queue_size = queue_size
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._latest: Optional[str] = None
+        self._latest_at: Optional[float] = None
+        self.stats = {"produced": 0, "errors": 0, "delivered": 0, "dropped": 0}
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> asyncio.Queue:
+        """구독 큐 등록 (필요 시 생산 태스크 시작)"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        if self._latest is not None and time.monotonic() - self._latest_at < self.interval:
+            queue.put_nowait(self._latest)
+        self._subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        """구독 해제 (구독자가 없으면 생산 태스크 중지)"""
+        self._subscribers.discard(queue)
+        if not self._subscribers:
+            self.stop()
+
+    def stop(self):
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    def publish(self, message: str):
+        """직렬화된 메시지를 모든 구독자 큐에 전달 (가득 찬 큐는 가장 오래된 메시지 버림)"""
+        self._latest, self._latest_at = message, time.monotonic()
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+                self.stats["dropped"] += 1
+                MONITORING_STREAM_DROPPED.inc()
+            queue.put_nowait(message)
+            self.stats["delivered"] += 1
+
+    async def _run(self):
+        logger.info("모니터링 스트림 생산 시작", subscribers=self.subscriber_count)
+        try:
+            while self._subscribers:
+                delay = self.interval
+                try:
+                    bundle = await self.produce()
+                    message = json.dumps(bundle, ensure_ascii=False)
+                    self.stats["produced"] += 1
+                except Exception as e:
+                    logger.error("모니터링 스트림 데이터 수집 오류", error=str(e))
+                    message = json.dumps({
+                        "timestamp": datetime.now().isoformat(),
+                        "type": "error",
+                        "message": f"데이터 수집 오류: {str(e)}"
+                    }, ensure_ascii=False)
+                    self.stats["errors"] += 1
+                    delay = self.error_interval
+                self.publish(message)
+                await asyncio.sleep(delay)
+        finally:
+            logger.info("모니터링 스트림 생산 중지")
+
+    def status(self) -> Dict[str, Any]:
+        return {"subscribers": self.subscriber_count, "running": self._task is not None and not self._task.done(),
+                "interval_seconds": self.interval, "queue_size": self.queue_size,
+                "last_produced_age_seconds": round(time.monotonic() - self._latest_at, 3)
+                if self._latest_at is not None else None, **self.stats}
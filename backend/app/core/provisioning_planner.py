@@ -0,0 +1,332 @@
+# [advice from AI] 테넌시 프로비저닝 플래너 - 의존성 DAG 기반 병렬 리소스 생성
+"""
+테넌시 리소스 프로비저닝 플래너
+- 테넌시 리소스(Namespace, ResourceQuota, NetworkPolicy, 서비스별 Deployment/Service/HPA/ServiceMonitor)를 의존성 DAG로 구성
+- 의존성이 충족된 리소스부터 동시 실행 상한 내에서 병렬 생성
+- 필수 리소스 실패 시 신규 스케줄 중단 후 이번 실행에서 생성한 리소스만 역순 롤백 (기존 리소스는 유지)
+- 리소스별 대기/생성 지연 시간 및 크리티컬 패스 리포트
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from kubernetes.client.rest import ApiException
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# [advice from AI] 동시에 생성할 리소스 수 기본 상한
+DEFAULT_MAX_PARALLEL = int(os.getenv("K8S_PROVISION_MAX_PARALLEL", "6"))
+
+
+@dataclass
+class ProvisioningStep:
+    """프로비저닝 DAG 노드 (리소스 1개)"""
+    key: str
+    kind: str
+    name: str
+    namespace: Optional[str]
+    body: Any
+    depends_on: List[str] = field(default_factory=list)
+    optional: bool = False  # 실패해도 롤백하지 않는 리소스 (예: Prometheus Operator 미설치 시 ServiceMonitor)
+
+    # 실행 결과
+    status: str = "pending"  # pending, running, created, exists, failed, skipped, rolled_back
+    queued_at: Optional[float] = None
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def latency_ms(self) -> float:
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return (self.finished_at - self.started_at) * 1000
+
+    @property
+    def wait_ms(self) -> float:
+        if self.queued_at is None or self.started_at is None:
+            return 0.0
+        return (self.started_at - self.queued_at) * 1000
+
+
+class ProvisioningPlan:
+    """테넌시 리소스 의존성 DAG"""
+
+    def __init__(self, tenant_id: str, namespace: str):
+        self.tenant_id = tenant_id
+        self.namespace = namespace
+        self.steps: Dict[str, ProvisioningStep] = {}
+
+    def add(self,
+            kind: str,
+            name: str,
+            body: Any,
+            namespace: Optional[str] = None,
+            depends_on: Optional[List[str]] = None,
+            optional: bool = False) -> str:
+        """리소스 추가 후 DAG 키("Kind/name") 반환"""
+        key = f"{kind}/{name}"
+        if key in self.steps:
+            raise ValueError(f"중복된 리소스: {key}")
+        for dependency in depends_on or []:
+            if dependency not in self.steps:
+                raise ValueError(f"{key}의 의존 리소스가 계획에 없습니다: {dependency}")
+        self.steps[key] = ProvisioningStep(
+            key=key, kind=kind, name=name, namespace=namespace, body=body,
+            depends_on=list(depends_on or []), optional=optional
+        )
+        return key
+
+    def dependents(self) -> Dict[str, List[str]]:
+        """키별 후속 리소스 목록"""
+        result: Dict[str, List[str]] = {key: [] for key in self.steps}
+        for step in self.steps.values():
+            for dependency in step.depends_on:
+                result[dependency].append(step.key)
+        return result
+
+    def topological_order(self) -> List[str]:
+        """위상 정렬 (add 시 의존 리소스 존재를 강제하므로 삽입 순서가 곧 유효한 순서)"""
+        return list(self.steps)
+
+
+def build_tenant_plan(orchestrator,
+                      tenant_id: str,
+                      preset: str,
+                      services: Dict[str, Dict[str, Any]]) -> ProvisioningPlan:
+    """K8sOrchestrator 매니페스트 빌더로 테넌시 프로비저닝 DAG 구성
+
+    의존성:
+        Namespace → ResourceQuota, NetworkPolicy
+        ResourceQuota, NetworkPolicy → Deployment (쿼터/보안 정책 적용 전에 Pod가 뜨지 않도록)
+        Namespace → Service → ServiceMonitor
+        Deployment → HorizontalPodAutoscaler (스케일 대상)
+    """
+    namespace = f"{tenant_id}-ecp-ai"
+    plan = ProvisioningPlan(tenant_id, namespace)
+
+    ns_key = plan.add("Namespace", namespace, orchestrator._build_namespace(tenant_id, preset))
+    quota_key = plan.add(
+        "ResourceQuota", "ecp-ai-quota",
+        orchestrator._build_resource_quota(namespace, preset),
+        namespace=namespace, depends_on=[ns_key]
+    )
+    policy_key = plan.add(
+        "NetworkPolicy", "ecp-ai-network-policy",
+        orchestrator._build_network_policy(namespace, tenant_id),
+        namespace=namespace, depends_on=[ns_key]
+    )
+
+    for service_name, service_config in services.items():
+        if not service_config.get("enabled", True):
+            continue
+        deployment_key = plan.add(
+            "Deployment", service_name,
+            orchestrator._build_deployment(namespace, tenant_id, service_name, service_config),
+            namespace=namespace, depends_on=[quota_key, policy_key]
+        )
+        service_key = plan.add(
+            "Service", f"{service_name}-service",
+            orchestrator._build_service(namespace, tenant_id, service_name, service_config),
+            namespace=namespace, depends_on=[ns_key]
+        )
+        if service_config.get("scaling", {}).get("enabled", False):
+            plan.add(
+                "HorizontalPodAutoscaler", f"{service_name}-hpa",
+                orchestrator._build_hpa(namespace, service_name, service_config),
+                namespace=namespace, depends_on=[deployment_key]
+            )
+        plan.add(
+            "ServiceMonitor", f"{service_name}-monitor",
+            orchestrator._build_service_monitor(namespace, tenant_id, service_name),
+            namespace=namespace, depends_on=[service_key], optional=True
+        )
+
+    return plan
+
+
+class ProvisioningPlanner:
+    """프로비저닝 DAG 실행기 (동시 실행 상한, 실패 시 롤백)"""
+
+    def __init__(self, orchestrator, max_parallel: int = DEFAULT_MAX_PARALLEL):
+        if max_parallel < 1:
+            raise ValueError("max_parallel은 1 이상이어야 합니다")
+        self.orchestrator = orchestrator
+        self.max_parallel = max_parallel
+
+    async def execute(self, plan: ProvisioningPlan) -> Dict[str, Any]:
+        """DAG 실행 후 리포트 반환"""
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.max_parallel)
+        dependents = plan.dependents()
+        remaining = {key: len(step.depends_on) for key, step in plan.steps.items()}
+        completed: List[str] = []  # 완료 순서 (롤백 역순 기준)
+        running: Dict[asyncio.Task, str] = {}
+        aborted = False
+
+        def schedule(key: str) -> None:
+            step = plan.steps[key]
+            step.queued_at = time.perf_counter()
+            running[asyncio.create_task(self._run_step(step, semaphore))] = key
+
+        for key, count in remaining.items():
+            if count == 0:
+                schedule(key)
+
+        while running:
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                step = plan.steps[running.pop(task)]
+                if step.status in ("created", "exists"):
+                    completed.append(step.key)
+                elif not step.optional:
+                    aborted = True
+
+                # 실패한 선택 리소스의 후속 리소스는 건너뜀 처리 대상
+                if aborted or step.status == "failed":
+                    continue
+                for dependent in dependents[step.key]:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        schedule(dependent)
+
+        for step in plan.steps.values():
+            if step.status == "pending":
+                step.status = "skipped"
+
+        rollback_errors: List[str] = []
+        if aborted:
+            rollback_errors = await self._rollback(plan, completed)
+
+        total_ms = (time.perf_counter() - started) * 1000
+        report = self._report(plan, started, total_ms, aborted, rollback_errors)
+        logger.info(
+            "테넌시 프로비저닝 완료" if not aborted else "테넌시 프로비저닝 실패 - 롤백 수행",
+            tenant_id=plan.tenant_id,
+            status=report["status"],
+            total_ms=report["total_ms"],
+            critical_path_ms=report["critical_path"]["duration_ms"]
+        )
+        return report
+
+    async def _run_step(self, step: ProvisioningStep, semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
+            step.status = "running"
+            step.started_at = time.perf_counter()
+            try:
+                step.status = await self.orchestrator.create_object(step.kind, step.body, namespace=step.namespace)
+            except ApiException as e:
+                step.status = "failed"
+                step.error = f"{e.status}: {e.reason}"
+            except Exception as e:
+                step.status = "failed"
+                step.error = str(e)
+            finally:
+                step.finished_at = time.perf_counter()
+
+        if step.status == "failed":
+            log = logger.warning if step.optional else logger.error
+            log("리소스 생성 실패", resource=step.key, namespace=step.namespace, error=step.error)
+
+    async def _rollback(self, plan: ProvisioningPlan, completed: List[str]) -> List[str]:
+        """이번 실행에서 새로 생성한 리소스만 완료 역순으로 삭제"""
+        created = [plan.steps[key] for key in reversed(completed) if plan.steps[key].status == "created"]
+        errors: List[str] = []
+
+        # 네임스페이스를 이번에 생성했다면 네임스페이스 삭제로 하위 리소스까지 한 번에 정리
+        namespace_step = next((step for step in created if step.kind == "Namespace"), None)
+        targets = [namespace_step] if namespace_step else created
+
+        for step in targets:
+            try:
+                await self.orchestrator.delete_object(step.kind, step.name, namespace=step.namespace)
+            except Exception as e:
+                errors.append(f"{step.key}: {e}")
+                logger.error("롤백 실패", resource=step.key, error=str(e))
+                continue
+            if step is namespace_step:
+                for other in created:
+                    other.status = "rolled_back"
+            else:
+                step.status = "rolled_back"
+        return errors
+
+    @staticmethod
+    def critical_path(plan: ProvisioningPlan) -> Dict[str, Any]:
+        """실행된 리소스 기준 가장 긴 의존성 경로 (생성 지연 합 기준)"""
+        distance: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+        for key in plan.topological_order():
+            step = plan.steps[key]
+            if step.started_at is None:
+                continue
+            best_dependency = max(
+                (dep for dep in step.depends_on if dep in distance),
+                key=lambda dep: distance[dep], default=None
+            )
+            distance[key] = step.latency_ms + (distance[best_dependency] if best_dependency else 0.0)
+            previous[key] = best_dependency
+
+        if not distance:
+            return {"steps": [], "duration_ms": 0.0}
+
+        key: Optional[str] = max(distance, key=distance.get)
+        duration = distance[key]
+        path: List[str] = []
+        while key:
+            path.append(key)
+            key = previous[key]
+        return {"steps": list(reversed(path)), "duration_ms": round(duration, 2)}
+
+    def _report(self,
+                plan: ProvisioningPlan,
+                started: float,
+                total_ms: float,
+                aborted: bool,
+                rollback_errors: List[str]) -> Dict[str, Any]:
+        def offset(value: Optional[float]) -> Optional[float]:
+            return round((value - started) * 1000, 2) if value is not None else None
+
+        steps = [
+            {
+                "resource": step.key,
+                "kind": step.kind,
+                "name": step.name,
+                "depends_on": step.depends_on,
+                "status": step.status,
+                "optional": step.optional,
+                "wait_ms": round(step.wait_ms, 2),
+                "latency_ms": round(step.latency_ms, 2),
+                "started_ms": offset(step.started_at),
+                "finished_ms": offset(step.finished_at),
+                "error": step.error
+            }
+            for step in plan.steps.values()
+        ]
+
+        if not aborted:
+            status = "success"
+        elif rollback_errors:
+            status = "rollback_failed"
+        else:
+            status = "rolled_back"
+
+        return {
+            "tenant_id": plan.tenant_id,
+            "namespace": plan.namespace,
+            "status": status,
+            "max_parallel": self.max_parallel,
+            "total_ms": round(total_ms, 2),
+            "sequential_ms": round(sum(step.latency_ms for step in plan.steps.values()), 2),
+            "critical_path": self.critical_path(plan),
+            "steps": steps,
+            "failed": [step.key for step in plan.steps.values() if step.status == "failed"],
+            "rolled_back": [step.key for step in plan.steps.values() if step.status == "rolled_back"],
+            "rollback_errors": rollback_errors,
+            "completed_at": datetime.now().isoformat()
+        }
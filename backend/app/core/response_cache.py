@@ -0,0 +1,190 @@
+# [advice from AI] 대시보드 엔드포인트 응답 캐시 - 동시 요청 단일 계산(single-flight)
+"""
+엔드포인트 응답 캐시
+- 같은 인자의 동시 요청은 진행 중인 계산 하나를 함께 기다림 (single-flight)
+- 유지 시간(ttl) 동안은 캐시 응답, 이후 stale_ttl 동안은 이전 응답을 바로 주고 백그라운드에서 한 번만 재계산
+- 지정한 테이블(tenants/services 등) 커밋 시 해당 캐시 무효화 (무효화 전에 시작된 계산 결과는 저장하지 않음)
+- 요청이 취소되어도 공유 계산은 계속 진행, 실패한 결과는 캐시하지 않음
+- 인자를 해시할 수 없는 호출은 캐시 없이 그대로 실행
+- 무효화는 커밋한 스레드(동기 세션은 워커 스레드)에서 호출되므로 캐시 상태 변경은 잠금으로 보호
+"""
+
+import asyncio
+import functools
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+import structlog
+from prometheus_client import Counter
+
+from app.core.write_events import on_committed_writes
+
+logger = structlog.get_logger(__name__)
+
+# [advice from AI] 기본 유지 시간(초) / 이전 응답 허용 시간(초) / 엔드포인트별 최대 캐시 항목 수
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "5"))
+RESPONSE_CACHE_STALE_TTL = float(os.getenv("RESPONSE_CACHE_STALE_TTL", "30"))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "256"))
+
+# 테넌시/서비스 쓰기 시 무효화할 테이블
+TENANT_WRITE_TABLES = ("tenants", "services")
+
+RESPONSE_CACHE_REQUESTS = Counter(
+    "ecp_response_cache_requests_total",
+    "Cached endpoint calls by outcome (hit, stale, miss, coalesced)",
+    ["endpoint", "result"]
+)
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    stored_at: float
+
+
+class ResponseCache:
+    """엔드포인트 하나의 응답 캐시"""
+
+    def __init__(self, name: str, func: Callable[..., Awaitable[Any]], ttl: float = RESPONSE_CACHE_TTL,
+                 stale_ttl: float = RESPONSE_CACHE_STALE_TTL, invalidate_on: Iterable[str] = (),
+                 max_entries: int = RESPONSE_CACHE_MAX_ENTRIES):
+        self.name = name
+        self.func = func
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.invalidate_on = frozenset(invalidate_on)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._generation = 0
+        # 이벤트 루프와 커밋 스레드(invalidate)가 함께 접근 - 잠금 구간에는 await 없음
+        self._lock = threading.Lock()
+        self.stats = {"hit": 0, "stale": 0, "miss": 0, "coalesced": 0, "invalidations": 0, "errors": 0}
+
+    def _count(self, result: str):
+        self.stats[result] += 1
+        RESPONSE_CACHE_REQUESTS.labels(endpoint=self.name, result=result).inc()
+
+    @staticmethod
+    def make_key(args: Tuple, kwargs: Dict[str, Any]) -> Optional[Hashable]:
+        key = (args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    async def get(self, args: Tuple = (), kwargs: Optional[Dict[str, Any]] = None) -> Any:
+        """캐시 응답 또는 공유 계산 결과"""
+        kwargs = kwargs or {}
+        key = self.make_key(args, kwargs)
+        if key is None:
+            return await self.func(*args, **kwargs)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            age = time.monotonic() - entry.stored_at if entry is not None else None
+            if age is not None and age < self.ttl + self.stale_ttl:
+                self._entries.move_to_end(key)
+            else:
+                entry = None
+        if entry is not None:
+            if age < self.ttl:
+                self._count("hit")
+                return entry.value
+            self._count("stale")
+            self._start(key, args, kwargs)
+            return entry.value
+
+        task, started = self._start(key, args, kwargs)
+        self._count("miss" if started else "coalesced")
+        # 요청 하나가 취소되어도 함께 기다리는 요청의 계산은 유지
+        return await asyncio.shield(task)
+
+    def _start(self, key: Hashable, args: Tuple, kwargs: Dict[str, Any]) -> Tuple[asyncio.Task, bool]:
+        """진행 중인 계산 또는 새 계산 (새로 시작했는지 여부 포함)"""
+        with self._lock:
+            task = self._inflight.get(key)
+            if task is not None:
+                return task, False
+            task = asyncio.ensure_future(self._compute(key, args, kwargs, self._generation))
+            self._inflight[key] = task
+        task.add_done_callback(functools.partial(self._finished, key))
+        return task, True
+
+    async def _compute(self, key: Hashable, args: Tuple, kwargs: Dict[str, Any], generation: int) -> Any:
+        value = await self.func(*args, **kwargs)
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = CacheEntry(value, time.monotonic())
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return value
+
+    def _finished(self, key: Hashable, task: asyncio.Task):
+        with self._lock:
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            # 백그라운드 재계산 실패는 기다리는 요청이 없을 수 있으므로 여기서 기록
+            self.stats["errors"] += 1
+            logger.warning("응답 캐시 계산 실패", endpoint=self.name, error=str(error))
+
+    def invalidate(self):
+        """캐시 비우기 (진행 중인 계산 결과도 저장하지 않음) - 커밋한 스레드에서 호출 가능"""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._inflight.clear()
+            self.stats["invalidations"] += 1
+
+    def status(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "inflight": len(self._inflight), "ttl_seconds": self.ttl,
+                "stale_ttl_seconds": self.stale_ttl, "invalidate_on": sorted(self.invalidate_on), **self.stats}
+
+
+_caches: List[ResponseCache] = []
+
+
+def cached_endpoint(ttl: float = RESPONSE_CACHE_TTL, stale_ttl: float = RESPONSE_CACHE_STALE_TTL,
+                    invalidate_on: Iterable[str] = (), max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+                    name: Optional[str] = None):
+    """
+    비동기 엔드포인트 응답 캐시 데코레이터
+    - @router.get(...) 아래에 두면 시그니처가 유지되어 FastAPI 파라미터 해석에 영향 없음
+    - 래핑된 함수의 .cache 로 ResponseCache 접근 (무효화/상태 조회)
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]):
+        cache = ResponseCache(name or f"{func.__module__}.{func.__qualname__}", func, ttl=ttl,
+                              stale_ttl=stale_ttl, invalidate_on=invalidate_on, max_entries=max_entries)
+        _caches.append(cache)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await cache.get(args, kwargs)
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+def response_cache_status() -> Dict[str, Any]:
+    """전체 응답 캐시 상태"""
+    return {cache.name: cache.status() for cache in _caches}
+
+
+@on_committed_writes
+def _invalidate_written_caches(tables: Set[str]):
+    """커밋된 테이블과 관련된 엔드포인트 캐시 무효화"""
+    for cache in _caches:
+        if cache.invalidate_on & tables:
+            cache.invalidate()
@@ -0,0 +1,108 @@
+# [advice from AI] 통계 스냅샷 캐시 - 테넌시/서비스 쓰기 시 해당 구역만 갱신
+"""
+통계 스냅샷
+- 통계 구역(tenants/resources/services)별로 SQL 집계 결과를 캐시
+- Tenant/Service 쓰기(ORM flush, 일괄 update/delete)를 감지해 커밋 후 해당 구역만 무효화 (write_events)
+- 무효화된 구역은 다음 조회 때 그 구역의 집계 쿼리만 다시 실행 (구역별 잠금으로 동시 재계산 방지)
+- 다른 프로세스의 쓰기는 감지할 수 없으므로 최대 유지 시간 이후 재계산
+- 응답에는 스냅샷 계산 시각/경과 시간 포함
+- 무효화는 커밋한 스레드(동기 세션은 워커 스레드)에서 호출되므로 구역 상태 변경은 잠금으로 보호
+"""
+
+import asyncio
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from app.core.write_events import on_committed_writes
+
+# [advice from AI] 스냅샷 최대 유지 시간(초)
+STATS_SNAPSHOT_MAX_AGE = float(os.getenv("STATS_SNAPSHOT_MAX_AGE", "60"))
+
+# 쓰기 대상별 영향받는 통계 구역 (테넌시 상태는 실행 중 서비스 집계에도 영향)
+TENANT_SECTIONS = ("tenants", "resources", "services")
+SERVICE_SECTIONS = ("services",)
+
+_WRITE_SECTIONS = {"tenants": TENANT_SECTIONS, "services": SERVICE_SECTIONS}
+
+
+@dataclass
+class SnapshotEntry:
+    value: Any
+    computed_at: datetime
+    computed_monotonic: float
+
+
+class StatsSnapshot:
+    """구역별 통계 스냅샷 캐시"""
+
+    def __init__(self, max_age: float = STATS_SNAPSHOT_MAX_AGE):
+        self.max_age = max_age
+        self._entries: Dict[str, SnapshotEntry] = {}
+        self._dirty: Set[str] = set()
+        self._locks: Dict[str, asyncio.Lock] = {}
+        # 이벤트 루프와 커밋 스레드(invalidate)가 함께 접근하는 _entries/_dirty 보호 (잠금 구간에는 await 없음)
+        self._state_lock = threading.Lock()
+        self.stats = {"hits": 0, "refreshes": 0, "invalidations": 0}
+
+    def invalidate(self, *sections: str):
+        """구역 무효화 (인자가 없으면 전체) - 커밋한 스레드에서 호출 가능"""
+        with self._state_lock:
+            self._dirty.update(sections or list(self._entries))
+            self.stats["invalidations"] += 1
+
+    def _fresh_entry(self, name: str) -> Optional[SnapshotEntry]:
+        with self._state_lock:
+            entry = self._entries.get(name)
+            if entry is None or name in self._dirty or time.monotonic() - entry.computed_monotonic >= self.max_age:
+                return None
+            return entry
+
+    @staticmethod
+    def meta(entry: SnapshotEntry, cached: bool) -> Dict[str, Any]:
+        return {"computed_at": entry.computed_at.isoformat(), "cached": cached,
+                "age_seconds": round(time.monotonic() - entry.computed_monotonic, 3)}
+
+    async def get(self, name: str, compute: Callable[[], Awaitable[Any]]) -> Tuple[Any, Dict[str, Any]]:
+        """구역 값과 스냅샷 정보 (최신이면 캐시, 아니면 compute 실행)"""
+        entry = self._fresh_entry(name)
+        if entry is None:
+            async with self._locks.setdefault(name, asyncio.Lock()):
+                entry = self._fresh_entry(name)
+                if entry is None:
+                    # 계산 중 들어온 쓰기는 다시 무효화되도록 계산 전에 해제
+                    with self._state_lock:
+                        self._dirty.discard(name)
+                    try:
+                        value = await compute()
+                    except BaseException:
+                        with self._state_lock:
+                            self._dirty.add(name)
+                        raise
+                    entry = SnapshotEntry(value, datetime.now(), time.monotonic())
+                    with self._state_lock:
+                        self._entries[name] = entry
+                    self.stats["refreshes"] += 1
+                    return entry.value, self.meta(entry, cached=False)
+        self.stats["hits"] += 1
+        return entry.value, self.meta(entry, cached=True)
+
+    def status(self) -> Dict[str, Any]:
+        with self._state_lock:
+            entries, dirty = dict(self._entries), sorted(self._dirty)
+        return {"sections": {name: self.meta(entry, cached=True) for name, entry in entries.items()},
+                "dirty": dirty, "max_age_seconds": self.max_age, **self.stats}
+
+
+stats_snapshot = StatsSnapshot()
+
+
+@on_committed_writes
+def _invalidate_written_sections(tables: Set[str]):
+    """Tenant/Service 커밋 시 관련 구역 무효화"""
+    sections = {section for table in tables for section in _WRITE_SECTIONS.get(table, ())}
+    if sections:
+        stats_snapshot.invalidate(*sections)
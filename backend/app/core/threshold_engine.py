@@ -0,0 +1,275 @@
+# [advice from AI] 임계값 규칙 엔진 - 임계값 설정을 벡터 연산 규칙으로 컴파일하여 메트릭 틱마다 평가
+"""
+임계값 규칙 엔진
+- 임계값 설정(ThresholdSettings.thresholds)을 규칙 열(metric x 값/변화율)로 컴파일
+- 테넌시/서비스(행) x 규칙(열) 행렬을 numpy로 한 번에 비교 (행마다 Python 루프 없음)
+- 지속 시간(for_seconds): 조건이 일정 시간 유지되어야 발생/상향
+- 히스테리시스(hysteresis, %): 해제는 임계값보다 일정 비율 낮아져야 함 (경계값 깜빡임 방지)
+- 변화율(rate_warning/rate_critical): 분당 증가량 기준 조건
+- 결과는 상태 전이(ok → warning → critical, 해제)만 반환, 틱별 평가 비용은 메트릭으로 노출
+
+임계값 설정 예시:
+    {"cpu": {"warning": 80, "critical": 90, "for_seconds": 60, "hysteresis": 5, "rate_critical": 30}}
+"""
+
+import math
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from prometheus_client import Gauge, Histogram
+
+# [advice from AI] 기본 지속 시간(초) / 기본 히스테리시스(%)
+THRESHOLD_DEFAULT_FOR_SECONDS = float(os.getenv("THRESHOLD_DEFAULT_FOR_SECONDS", "30"))
+THRESHOLD_DEFAULT_HYSTERESIS = float(os.getenv("THRESHOLD_DEFAULT_HYSTERESIS", "5"))
+
+# [advice from AI] 기본 임계값 (기본 설정이 없을 때 사용, 표준 SLA 프리셋과 동일)
+DEFAULT_THRESHOLDS = {
+    "cpu": {"warning": 80, "critical": 90},
+    "memory": {"warning": 85, "critical": 95},
+    "gpu": {"warning": 80, "critical": 90},
+    "response_time": {"warning": 500, "critical": 1000},
+    "error_rate": {"warning": 5.0, "critical": 10.0}
+}
+
+VALUE = "value"
+RATE = "rate"
+LEVELS = ("ok", "warning", "critical")
+
+# 메트릭 표시 이름 / 단위 / 알림 카테고리
+METRIC_LABELS = {
+    "cpu": ("CPU 사용률", "%", "resource"),
+    "memory": ("메모리 사용률", "%", "resource"),
+    "gpu": ("GPU 사용률", "%", "resource"),
+    "response_time": ("응답시간", "ms", "performance"),
+    "error_rate": ("오류율", "%", "performance"),
+}
+
+THRESHOLD_EVALUATION_SECONDS = Histogram(
+    "ecp_threshold_evaluation_seconds",
+    "Time spent evaluating threshold rules for one metrics tick",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+)
+THRESHOLD_EVALUATED_CELLS = Gauge(
+    "ecp_threshold_evaluated_cells",
+    "Series x rule cells evaluated in the last metrics tick"
+)
+
+
+@dataclass(frozen=True)
+class RuleColumn:
+    """컴파일된 규칙 열 (메트릭 하나의 값 또는 변화율 조건)"""
+    metric: str
+    kind: str
+    warning: float
+    critical: float
+    for_seconds: float
+    hysteresis: float
+
+
+def _limit(config: Dict[str, Any], key: str) -> float:
+    value = config.get(key)
+    return float(value) if value is not None else math.inf
+
+
+def compile_rules(thresholds: Dict[str, Any]) -> List[RuleColumn]:
+    """임계값 설정 → 규칙 열 목록 (메트릭 이름순)"""
+    columns = []
+    for metric, config in sorted((thresholds or {}).items()):
+        if not isinstance(config, dict):
+            continue
+        for_seconds = float(config.get("for_seconds", THRESHOLD_DEFAULT_FOR_SECONDS))
+        hysteresis = float(config.get("hysteresis", THRESHOLD_DEFAULT_HYSTERESIS))
+        if config.get("warning") is not None or config.get("critical") is not None:
+            columns.append(RuleColumn(metric, VALUE, _limit(config, "warning"), _limit(config, "critical"),
+                                      for_seconds, hysteresis))
+        if config.get("rate_warning") is not None or config.get("rate_critical") is not None:
+            columns.append(RuleColumn(metric, RATE, _limit(config, "rate_warning"), _limit(config, "rate_critical"),
+                                      for_seconds, hysteresis))
+    return columns
+
+
+@dataclass
+class ThresholdTransition:
+    """알림 상태 전이 (테넌시/서비스의 규칙 하나)"""
+    tenant_id: Optional[str]
+    service_name: Optional[str]
+    metric: str
+    kind: str
+    previous: str
+    current: str
+    value: float
+    threshold: Optional[float]
+    at: float
+
+    @property
+    def key(self) -> Tuple[Optional[str], Optional[str], str, str]:
+        return self.tenant_id, self.service_name, self.metric, self.kind
+
+    @property
+    def firing(self) -> bool:
+        return self.current != "ok"
+
+    @property
+    def category(self) -> str:
+        return METRIC_LABELS.get(self.metric, (self.metric, "", "resource"))[2]
+
+    @property
+    def title(self) -> str:
+        label = METRIC_LABELS.get(self.metric, (self.metric, "", ""))[0]
+        return f"{label} 급증" if self.kind == RATE else f"{label} 임계값 초과"
+
+    @property
+    def message(self) -> str:
+        label, unit, _ = METRIC_LABELS.get(self.metric, (self.metric, "", ""))
+        target = self.service_name or self.tenant_id or "시스템"
+        if self.kind == RATE:
+            return f"{target} {label}이 분당 {self.value:.1f}{unit} 증가했습니다 (기준 {self.threshold:g}{unit}/분)"
+        return f"{target} {label}이 {self.value:.1f}{unit}입니다 (기준 {self.threshold:g}{unit})"
+
+
+class ThresholdEngine:
+    """
+    임계값 규칙 엔진
+    - 시계열(테넌시, 서비스)은 처음 등장할 때 행으로 등록, 상태는 행렬로 유지
+    - 틱에 값이 없는 시계열은 상태 유지 (평가하지 않음)
+    """
+
+    def __init__(self, thresholds: Optional[Dict[str, Any]] = None):
+        self._rows: Dict[Tuple[Optional[str], Optional[str]], int] = {}
+        self._series: List[Tuple[Optional[str], Optional[str]]] = []
+        self.columns: List[RuleColumn] = []
+        self.metrics: List[str] = []
+        self.last_tick: Dict[str, Any] = {"series": 0, "cells": 0, "transitions": 0, "duration_ms": 0.0}
+        self.set_rules(thresholds or {})
+
+    def set_rules(self, thresholds: Dict[str, Any]) -> bool:
+        """규칙 컴파일 (규칙이 바뀐 경우에만 상태 초기화), 변경 여부 반환"""
+        columns = compile_rules(thresholds)
+        if columns == self.columns and hasattr(self, "_state"):
+            return False
+        self.columns = columns
+        self.metrics = sorted({c.metric for c in columns})
+        metric_index = {metric: j for j, metric in enumerate(self.metrics)}
+        self._column_metric = np.array([metric_index[c.metric] for c in columns], dtype=np.intp)
+        self._is_rate = np.array([c.kind == RATE for c in columns], dtype=bool)
+        self._warning = np.array([c.warning for c in columns], dtype=float)
+        self._critical = np.array([c.critical for c in columns], dtype=float)
+        self._for_seconds = np.array([c.for_seconds for c in columns], dtype=float)
+        clear = 1.0 - np.array([c.hysteresis for c in columns], dtype=float) / 100.0
+        self._warning_clear = self._warning * clear
+        self._critical_clear = self._critical * clear
+        self._allocate(len(self._series))
+        return True
+
+    def _allocate(self, capacity: int):
+        capacity = max(capacity, 16)
+        shape = (capacity, len(self.columns))
+        self._state = np.zeros(shape, dtype=np.int8)
+        self._pending = np.zeros(shape, dtype=np.int8)
+        self._pending_since = np.zeros(shape, dtype=float)
+        self._prev_values = np.full((capacity, len(self.metrics)), np.nan)
+        self._prev_at = np.full(capacity, np.nan)
+
+    def _grow(self, needed: int):
+        """행 용량 부족 시 2배로 확장 (기존 상태 유지)"""
+        capacity = len(self._state)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+        pad = new_capacity - capacity
+        self._state = np.pad(self._state, ((0, pad), (0, 0)))
+        self._pending = np.pad(self._pending, ((0, pad), (0, 0)))
+        self._pending_since = np.pad(self._pending_since, ((0, pad), (0, 0)))
+        self._prev_values = np.pad(self._prev_values, ((0, pad), (0, 0)), constant_values=np.nan)
+        self._prev_at = np.pad(self._prev_at, (0, pad), constant_values=np.nan)
+
+    def _row_indexes(self, samples: List[Dict[str, Any]]) -> np.ndarray:
+        rows = []
+        for sample in samples:
+            key = (sample.get("tenant_id"), sample.get("service_name"))
+            row = self._rows.get(key)
+            if row is None:
+                row = self._rows[key] = len(self._series)
+                self._series.append(key)
+            rows.append(row)
+        self._grow(len(self._series))
+        return np.array(rows, dtype=np.intp)
+
+    def evaluate(self, samples: Iterable[Dict[str, Any]], now: Optional[float] = None) -> List[ThresholdTransition]:
+        """
+        메트릭 틱 하나 평가
+        samples: [{"tenant_id", "service_name", "<metric>": 값, ...}] (같은 틱에 시계열당 하나)
+        """
+        started = time.perf_counter()
+        now = time.time() if now is None else now
+        samples = list(samples)
+        if not samples or not self.columns:
+            return []
+
+        rows = self._row_indexes(samples)
+        values = np.array([[sample.get(metric) for metric in self.metrics] for sample in samples], dtype=float)
+
+        # 변화율 (분당 증가량) - 직전 값이 없으면 NaN
+        previous = self._prev_values[rows]
+        elapsed = (now - self._prev_at[rows])[:, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rates = np.where(elapsed > 0, (values - previous) / elapsed * 60.0, np.nan)
+        self._prev_values[rows] = np.where(np.isnan(values), previous, values)
+        self._prev_at[rows] = now
+
+        observed = np.where(self._is_rate, rates[:, self._column_metric], values[:, self._column_metric])
+        valid = ~np.isnan(observed)
+        state = self._state[rows]
+        pending = self._pending[rows]
+        pending_since = self._pending_since[rows]
+
+        with np.errstate(invalid="ignore"):
+            raw = np.where(observed >= self._critical, 2, np.where(observed >= self._warning, 1, 0))
+            # 히스테리시스: 해제 기준(임계값 x (1 - hysteresis%))을 넘는 동안 현재 단계 유지
+            hold = np.where(observed >= self._critical_clear, 2, np.where(observed >= self._warning_clear, 1, 0))
+        candidate = np.where(valid, np.maximum(raw, np.minimum(state, hold)), state).astype(np.int8)
+
+        changed = candidate != pending
+        pending = np.where(changed, candidate, pending)
+        pending_since = np.where(changed, now, pending_since)
+        # 상향은 지속 시간 충족 후, 하향/해제는 즉시 (깜빡임은 히스테리시스로 방지)
+        ready = (now - pending_since) >= self._for_seconds
+        transition = (pending != state) & ((pending < state) | ready)
+        new_state = np.where(transition, pending, state)
+
+        self._state[rows] = new_state
+        self._pending[rows] = pending
+        self._pending_since[rows] = pending_since
+
+        transitions = []
+        for i, j in zip(*np.nonzero(transition)):
+            column = self.columns[j]
+            level = int(new_state[i, j]) or int(state[i, j])
+            threshold = self._critical[j] if level == 2 else self._warning[j]
+            tenant_id, service_name = self._series[rows[i]]
+            transitions.append(ThresholdTransition(
+                tenant_id=tenant_id, service_name=service_name, metric=column.metric, kind=column.kind,
+                previous=LEVELS[state[i, j]], current=LEVELS[new_state[i, j]],
+                value=float(observed[i, j]), threshold=float(threshold) if math.isfinite(threshold) else None, at=now
+            ))
+
+        duration = time.perf_counter() - started
+        THRESHOLD_EVALUATION_SECONDS.observe(duration)
+        THRESHOLD_EVALUATED_CELLS.set(observed.size)
+        self.last_tick = {"series": len(samples), "cells": int(observed.size), "transitions": len(transitions),
+                          "duration_ms": round(duration * 1000, 3)}
+        return transitions
+
+    def firing(self) -> List[Dict[str, Any]]:
+        """현재 발생 중인 (시계열, 규칙) 목록"""
+        rows, cols = np.nonzero(self._state[:len(self._series)])
+        return [{"tenant_id": self._series[i][0], "service_name": self._series[i][1],
+                 "metric": self.columns[j].metric, "kind": self.columns[j].kind,
+                 "level": LEVELS[self._state[i, j]]} for i, j in zip(rows, cols)]
+
+    def status(self) -> Dict[str, Any]:
+        return {"rules": len(self.columns), "series": len(self._series),
+                "firing": int(np.count_nonzero(self._state[:len(self._series)])), "last_tick": self.last_tick}
@@ -0,0 +1,59 @@
+# [advice from AI] 커밋된 테이블 쓰기 감지 - 캐시 무효화 훅
+"""
+커밋된 쓰기 이벤트
+- ORM flush(add/수정/삭제)와 ORM 일괄 insert/update/delete 대상 테이블을 세션 단위로 수집
+- 커밋 후에만 구독자에게 테이블 이름 집합 전달 (롤백된 쓰기는 버림)
+- 비동기 세션도 내부 동기 Session 이벤트로 함께 감지
+- 같은 프로세스의 ORM 쓰기만 감지 (다른 프로세스/raw SQL 쓰기는 캐시 유지 시간으로 보완)
+"""
+
+from itertools import chain
+from typing import Callable, List, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+WriteCallback = Callable[[Set[str]], None]
+
+_SESSION_KEY = "committed_write_tables"
+_subscribers: List[WriteCallback] = []
+
+
+def on_committed_writes(callback: WriteCallback) -> WriteCallback:
+    """커밋된 쓰기 구독 (callback(테이블 이름 집합)), 데코레이터로도 사용"""
+    _subscribers.append(callback)
+    return callback
+
+
+def _pending_tables(session: Session) -> Set[str]:
+    return session.info.setdefault(_SESSION_KEY, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_writes(session: Session, flush_context):
+    tables = {getattr(type(obj), "__tablename__", None) for obj in chain(session.new, session.dirty, session.deleted)}
+    tables.discard(None)
+    if tables:
+        _pending_tables(session).update(tables)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_writes(orm_execute_state):
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.local_table is not None:
+        _pending_tables(orm_execute_state.session).add(mapper.local_table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed_writes(session: Session):
+    tables = session.info.pop(_SESSION_KEY, None)
+    if tables:
+        for callback in _subscribers:
+            callback(tables)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_writes(session: Session):
+    session.info.pop(_SESSION_KEY, None)
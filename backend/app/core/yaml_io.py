@@ -0,0 +1,77 @@
+# [advice from AI] YAML 파싱/직렬화 공통 레이어 - libyaml(C) 가속 + 순수 Python 폴백
+"""
+YAML 입출력 헬퍼
+- libyaml이 설치되어 있으면 CSafeLoader/CSafeDumper 사용, 없으면 SafeLoader/SafeDumper로 폴백
+- 멀티 도큐먼트 매니페스트를 한 번에 하나씩 스트리밍 파싱 (iter_documents)
+- 매니페스트 직렬화 기본 옵션(block 스타일, 유니코드 허용) 통일
+
+NOTE: k8s-simulator/backend/core/yaml_io.py 와 동일한 API를 유지합니다 (빌드 컨텍스트가 분리되어 있음)
+"""
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Union
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    HAS_LIBYAML = True
+except ImportError:  # pragma: no cover - libyaml 미설치 환경
+    from yaml import SafeLoader, SafeDumper
+    HAS_LIBYAML = False
+
+YAMLError = yaml.YAMLError
+
+# [advice from AI] 기존 yaml.dump 호출과 동일한 출력 형태를 유지하기 위한 기본 옵션
+DEFAULT_DUMP_OPTIONS = {
+    "default_flow_style": False,
+    "allow_unicode": True,
+}
+
+
+def backend_name() -> str:
+    """현재 사용 중인 YAML 백엔드 이름"""
+    return "libyaml" if HAS_LIBYAML else "pure-python"
+
+
+def load(content: Union[str, bytes, TextIO]) -> Any:
+    """단일 YAML 도큐먼트 파싱"""
+    return yaml.load(content, Loader=SafeLoader)
+
+
+def iter_documents(content: Union[str, bytes, TextIO]) -> Iterator[Any]:
+    """멀티 도큐먼트 YAML을 한 건씩 파싱 (전체 리스트를 만들지 않음)"""
+    return yaml.load_all(content, Loader=SafeLoader)
+
+
+def load_all(content: Union[str, bytes, TextIO], dicts_only: bool = True) -> List[Any]:
+    """멀티 도큐먼트 YAML 파싱 (빈 도큐먼트 제외, 기본적으로 dict만 반환)"""
+    return [
+        doc for doc in iter_documents(content)
+        if doc and (isinstance(doc, dict) or not dicts_only)
+    ]
+
+
+def dump(data: Any, stream: Optional[TextIO] = None, **options) -> Optional[str]:
+    """단일 객체를 YAML로 직렬화"""
+    return yaml.dump(data, stream, Dumper=SafeDumper, **{**DEFAULT_DUMP_OPTIONS, **options})
+
+
+def dump_all(documents: Iterable[Any], stream: Optional[TextIO] = None, **options) -> Optional[str]:
+    """여러 객체를 '---' 구분 멀티 도큐먼트 YAML로 직렬화"""
+    return yaml.dump_all(documents, stream, Dumper=SafeDumper, **{**DEFAULT_DUMP_OPTIONS, **options})
+
+
+def join_documents(documents: Iterable[str]) -> str:
+    """이미 직렬화된 YAML 문자열들을 멀티 도큐먼트로 연결"""
+    parts = []
+    for doc in documents:
+        doc = doc.strip()
+        if doc.startswith("---"):
+            doc = doc[3:].lstrip("\n")
+        if doc:
+            parts.append(doc)
+    return "\n---\n".join(parts) + "\n" if parts else ""
+
+
+def describe() -> Dict[str, Any]:
+    """YAML 백엔드 정보 (헬스체크/진단용)"""
+    return {"backend": backend_name(), "libyaml": HAS_LIBYAML, "pyyaml_version": yaml.__version__}
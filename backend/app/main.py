@@ -227,11 +227,52 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error("랜덤 알림 생성 시스템 시작 실패", error=str(e))
     
+    # [advice from AI] 시뮬레이터 알림 증분 동기화 태스크 시작 (알림 조회 API는 업스트림 호출 없음)
+    alert_sync = None
+    if os.getenv("ALERT_SYNC_ENABLED", "true").lower() == "true":
+        try:
+            from app.api.v1.alerts import simulator_alert_sync as alert_sync
+            asyncio.create_task(alert_sync.run())
+            logger.info("시뮬레이터 알림 동기화 시스템 시작")
+        except Exception as e:
+            logger.error("시뮬레이터 알림 동기화 시작 실패", error=str(e))
+    
+    # [advice from AI] 임계값 규칙 엔진 주기 평가 (메트릭 틱마다 전체 테넌시/서비스 평가)
+    threshold_evaluator = None
+    if os.getenv("THRESHOLD_ENGINE_ENABLED", "true").lower() == "true":
+        try:
+            from app.api.v1.alerts import threshold_evaluator
+            asyncio.create_task(threshold_evaluator.run())
+            logger.info("임계값 규칙 평가 시스템 시작")
+        except Exception as e:
+            logger.error("임계값 규칙 평가 시작 실패", error=str(e))
+    
+    # [advice from AI] 알림 집계 변경분 주기적 DB 반영
+    try:
+        from app.api.v1.alerts import start_aggregation_flush_task
+        asyncio.create_task(start_aggregation_flush_task())
+    except Exception as e:
+        logger.error("알림 집계 반영 태스크 시작 실패", error=str(e))
+    
     logger.info("초기화 완료")
     
     yield
     
     # 종료 시 정리
+    if alert_sync:
+        alert_sync.stop()
+    if threshold_evaluator:
+        threshold_evaluator.stop()
+    try:
+        from app.api.v1.advanced_monitoring import monitoring_broadcaster
+        monitoring_broadcaster.stop()
+    except Exception as e:
+        logger.error("모니터링 스트림 중지 실패", error=str(e))
+    try:
+        from app.core.database_manager import db_manager
+        await db_manager.close_async_connections()
+    except Exception as e:
+        logger.error("비동기 DB 연결 종료 실패", error=str(e))
     logger.info("ECP-AI Kubernetes Orchestrator 종료")
 
 
@@ -321,6 +362,13 @@ async def readiness_check():
         raise HTTPException(status_code=503, detail="Service not ready")
 
 
+@app.get("/metrics/db-pool")
+async def db_pool_metrics():
+    """DB 커넥션 풀 상태 및 대기 시간 통계"""
+    from app.core.database_manager import db_manager
+    return db_manager.pool_status()
+
+
 @app.get("/metrics")
 async def metrics():
     """프로메테우스 메트릭 엔드포인트"""
@@ -9,14 +9,20 @@ ECP-AI 데이터베이스 모델 및 스키마
 
 from sqlalchemy import (
     create_engine, Column, Integer, String, Boolean, DateTime, 
-    Float, Text, JSON, ForeignKey, Index, UniqueConstraint, BigInteger
+    Float, Text, JSON, ForeignKey, Index, UniqueConstraint, BigInteger, LargeBinary
 )
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy.orm import relationship, sessionmaker, deferred, validates
 from sqlalchemy.sql import func
 from datetime import datetime
+from typing import Dict
+import hashlib
+import json
 import os
 import logging
+import zlib
+
+from app.models.resource_units import parse_cpu_millicores, parse_memory_mib
 
 # 데이터베이스 연결 설정
 DATABASE_URL = os.getenv(
@@ -55,12 +61,19 @@ class Tenant(Base):
     storage_limit = Column(String(50), nullable=True)
     gpu_type = Column(String(50), nullable=True)  # t4, v100, l40s
     
+    # [advice from AI] 리소스 제한 정수 단위 (문자열 컬럼 쓰기 시 자동 동기화, GPU 수는 gpu_limit)
+    cpu_millicores = Column(Integer, nullable=True)
+    memory_mib = Column(Integer, nullable=True)
+    storage_mib = Column(BigInteger, nullable=True)
+    
     # SLA 정보
     sla_availability = Column(String(20), nullable=True)
     sla_response_time = Column(String(20), nullable=True)
     
     # 매니페스트 및 배포 정보
-    manifest_content = Column(Text, nullable=True)
+    # [advice from AI] 매니페스트 본문은 tenant_manifests 테이블에 버전별 압축 저장
+    # (레거시 컬럼은 명시적으로 요청할 때만 로드 - undefer)
+    manifest_content = deferred(Column(Text, nullable=True))
     manifest_generated_at = Column(DateTime(timezone=True), nullable=True)
     deployment_config = Column(JSON, nullable=True)
     k8s_namespace = Column(String(100), nullable=True)
@@ -82,17 +95,33 @@ class Tenant(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     created_by = Column(String(100), nullable=True)
-    description = Column(Text, nullable=True)
+    description = deferred(Column(Text, nullable=True))
     
     # 관계
     services = relationship("Service", back_populates="tenant", cascade="all, delete-orphan")
+    manifests = relationship("TenantManifest", back_populates="tenant", cascade="all, delete-orphan",
+                             order_by="TenantManifest.version", passive_deletes=True)
     monitoring_data = relationship("MonitoringData", back_populates="tenant", cascade="all, delete-orphan")
     dashboard_configs = relationship("DashboardConfig", back_populates="tenant", cascade="all, delete-orphan")
     
     __table_args__ = (
         Index('idx_tenant_demo_status', 'is_demo', 'status'),
         Index('idx_tenant_preset', 'preset'),
+        # [advice from AI] 상태별 전체 할당량 합계를 인덱스만으로 계산 (covering index)
+        Index('idx_tenant_status_capacity', 'status', 'preset', 'cpu_millicores', 'memory_mib', 'gpu_limit',
+              'storage_mib'),
     )
+    
+    @validates('cpu_limit', 'memory_limit', 'storage_limit')
+    def _sync_resource_units(self, key, value):
+        """리소스 문자열 → 정수 단위 컬럼 동기화"""
+        if key == 'cpu_limit':
+            self.cpu_millicores = parse_cpu_millicores(value)
+        elif key == 'memory_limit':
+            self.memory_mib = parse_memory_mib(value)
+        else:
+            self.storage_mib = parse_memory_mib(value)
+        return value
 
 
 class Service(Base):
@@ -121,6 +150,9 @@ class Service(Base):
     cpu_request = Column(String(50), nullable=True)
     memory_request = Column(String(50), nullable=True)
     gpu_request = Column(Integer, default=0)
+    # [advice from AI] 리소스 요청 정수 단위 (문자열 컬럼 쓰기 시 자동 동기화)
+    cpu_millicores = Column(Integer, nullable=True)
+    memory_mib = Column(Integer, nullable=True)
     
     # 포트 및 환경변수
     ports = Column(JSON, nullable=True)
@@ -138,7 +170,18 @@ class Service(Base):
         Index('idx_service_tenant', 'tenant_id'),
         Index('idx_service_type', 'service_type'),
         UniqueConstraint('tenant_id', 'service_name', name='uq_tenant_service'),
+        # [advice from AI] 서비스별 요청 리소스 합계용 covering index
+        Index('idx_service_capacity', 'service_name', 'tenant_id', 'cpu_millicores', 'memory_mib', 'gpu_request'),
     )
+    
+    @validates('cpu_request', 'memory_request')
+    def _sync_resource_units(self, key, value):
+        """리소스 문자열 → 정수 단위 컬럼 동기화"""
+        if key == 'cpu_request':
+            self.cpu_millicores = parse_cpu_millicores(value)
+        else:
+            self.memory_mib = parse_memory_mib(value)
+        return value
 
 
 class MonitoringData(Base):
@@ -205,6 +248,11 @@ class Alert(Base):
     tags = Column(JSON, nullable=True)  # 추가 태그 정보
     alert_metadata = Column(JSON, nullable=True)  # 추가 메타데이터 (metadata는 SQLAlchemy 예약어)
     
+    # [advice from AI] 집계 정보 (같은 지문의 반복 알림을 하나로 합침)
+    fingerprint = Column(String(64), nullable=True)  # 테넌시/서비스/유형/심각도 해시
+    occurrence_count = Column(Integer, default=1, nullable=False)
+    last_seen_at = Column(DateTime(timezone=True), nullable=True)  # 최초 발생은 timestamp
+    
     # 시간 정보
     timestamp = Column(DateTime(timezone=True), nullable=False)  # 알림 발생 시간
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -214,10 +262,14 @@ class Alert(Base):
     tenant = relationship("Tenant", backref="alerts")
 
     __table_args__ = (
-        Index('idx_alert_timestamp', 'timestamp'),
+        # [advice from AI] keyset 페이지네이션용 (필터 컬럼, timestamp, alert_id) 복합 인덱스
+        Index('idx_alert_timestamp_alert_id', 'timestamp', 'alert_id'),
         Index('idx_alert_severity_status', 'severity', 'status'),
-        Index('idx_alert_tenant', 'tenant_id'),
-        Index('idx_alert_category', 'category'),
+        Index('idx_alert_tenant_timestamp', 'tenant_id', 'timestamp', 'alert_id'),
+        Index('idx_alert_severity_timestamp', 'severity', 'timestamp', 'alert_id'),
+        Index('idx_alert_status_timestamp', 'status', 'timestamp', 'alert_id'),
+        Index('idx_alert_category_timestamp', 'category', 'timestamp', 'alert_id'),
+        Index('idx_alert_fingerprint', 'fingerprint'),
     )
 
 
@@ -367,6 +419,60 @@ class DeploymentStatus(Base):
     )
 
 
+# [advice from AI] 테넌시 매니페스트 버전 테이블 (본문은 압축 저장, 기본 조회에서 제외)
+class TenantManifest(Base):
+    """테넌시 매니페스트 버전 테이블"""
+    __tablename__ = "tenant_manifests"
+
+    ENCODING = "zlib+json"
+
+    id = Column(Integer, primary_key=True, index=True)
+    tenant_id = Column(String(100), ForeignKey("tenants.tenant_id", ondelete="CASCADE"), nullable=False)
+    version = Column(Integer, nullable=False)
+
+    # 매니페스트 본문 (파일명 → YAML, JSON 직렬화 후 zlib 압축)
+    encoding = Column(String(20), default=ENCODING, nullable=False)
+    content = deferred(Column(LargeBinary, nullable=False))
+
+    # 요약 정보 (본문 없이 목록 조회용)
+    file_count = Column(Integer, default=0)
+    size_bytes = Column(Integer, default=0)
+    compressed_bytes = Column(Integer, default=0)
+    checksum = Column(String(64), nullable=False)  # 원본 sha256
+
+    # 메타데이터
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_by = Column(String(100), nullable=True)
+
+    # 관계
+    tenant = relationship("Tenant", back_populates="manifests")
+
+    __table_args__ = (
+        Index('idx_tenant_manifest_tenant_version', 'tenant_id', 'version'),
+        UniqueConstraint('tenant_id', 'version', name='uq_tenant_manifest_version'),
+    )
+
+    @staticmethod
+    def pack(files: Dict[str, str]) -> Dict[str, object]:
+        """매니페스트 파일 묶음 → 압축 본문 및 요약 컬럼 값"""
+        raw = json.dumps(files, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        content = zlib.compress(raw, 6)
+        return {
+            "encoding": TenantManifest.ENCODING,
+            "content": content,
+            "file_count": len(files),
+            "size_bytes": len(raw),
+            "compressed_bytes": len(content),
+            "checksum": hashlib.sha256(raw).hexdigest(),
+        }
+
+    def files(self) -> Dict[str, str]:
+        """압축 본문 → 파일명별 매니페스트"""
+        if self.encoding != self.ENCODING:
+            raise ValueError(f"지원하지 않는 매니페스트 인코딩: {self.encoding}")
+        return json.loads(zlib.decompress(self.content).decode("utf-8"))
+
+
 # [advice from AI] CICD 이미지 관리 테이블 추가
 class CICDImage(Base):
     """CICD 이미지 관리 테이블"""
@@ -6,7 +6,7 @@
 - 가상 테넌시 데이터 생성
 """
 
-from sqlalchemy import text, create_engine
+from sqlalchemy import text, create_engine, inspect
 from sqlalchemy.orm import sessionmaker
 import os
 import logging
@@ -434,6 +434,138 @@ def create_virtual_tenants():
     finally:
         db.close()
 
+def migrate_manifest_storage(bind=None):
+    """[advice from AI] tenants.manifest_content(JSON 텍스트)를 tenant_manifests 테이블로 이전 (버전 1, 압축)"""
+    from app.models.database import TenantManifest
+
+    bind = bind or engine
+    TenantManifest.__table__.create(bind=bind, checkfirst=True)
+    if "manifest_content" not in {c["name"] for c in inspect(bind).get_columns("tenants")}:
+        logging.info("tenants.manifest_content 컬럼 없음 - 이전할 매니페스트 없음")
+        return 0
+    db = sessionmaker(autocommit=False, autoflush=False, bind=bind)()
+    
+    try:
+        rows = db.execute(text(
+            "SELECT tenant_id, manifest_content, created_by FROM tenants WHERE manifest_content IS NOT NULL"
+        )).all()
+        migrated = 0
+        
+        for tenant_id, manifest_content, created_by in rows:
+            try:
+                files = json.loads(manifest_content)
+            except ValueError:
+                logging.warning(f"매니페스트 JSON 파싱 실패, 건너뜀: {tenant_id}")
+                continue
+            
+            exists = db.execute(
+                text("SELECT 1 FROM tenant_manifests WHERE tenant_id = :tenant_id"),
+                {"tenant_id": tenant_id}
+            ).first()
+            if not exists:
+                db.add(TenantManifest(tenant_id=tenant_id, version=1, created_by=created_by,
+                                      **TenantManifest.pack(files)))
+            db.execute(
+                text("UPDATE tenants SET manifest_content = NULL WHERE tenant_id = :tenant_id"),
+                {"tenant_id": tenant_id}
+            )
+            migrated += 1
+        
+        db.commit()
+        logging.info(f"매니페스트 저장소 마이그레이션 완료: {migrated}개 테넌시")
+        return migrated
+        
+    except Exception as e:
+        logging.error(f"매니페스트 저장소 마이그레이션 실패: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+def migrate_alert_indexes(bind=None):
+    """[advice from AI] alerts 테이블 단일 컬럼 인덱스를 keyset 페이지네이션용 복합 인덱스로 교체"""
+    bind = bind or engine
+    with bind.begin() as conn:
+        for name, columns in (
+            ("idx_alert_timestamp_alert_id", "timestamp, alert_id"),
+            ("idx_alert_tenant_timestamp", "tenant_id, timestamp, alert_id"),
+            ("idx_alert_severity_timestamp", "severity, timestamp, alert_id"),
+            ("idx_alert_status_timestamp", "status, timestamp, alert_id"),
+            ("idx_alert_category_timestamp", "category, timestamp, alert_id"),
+        ):
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON alerts({columns})"))
+        for name in ("idx_alert_timestamp", "idx_alert_tenant", "idx_alert_category"):
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    logging.info("알림 인덱스 마이그레이션 완료")
+
+def migrate_alert_aggregation_columns(bind=None):
+    """[advice from AI] alerts 테이블에 집계 컬럼(fingerprint, occurrence_count, last_seen_at) 추가"""
+    bind = bind or engine
+    existing = {c["name"] for c in inspect(bind).get_columns("alerts")}
+    with bind.begin() as conn:
+        for name, ddl in (
+            ("fingerprint", "VARCHAR(64)"),
+            ("occurrence_count", "INTEGER NOT NULL DEFAULT 1"),
+            ("last_seen_at", "TIMESTAMP WITH TIME ZONE"),
+        ):
+            if name not in existing:
+                conn.execute(text(f"ALTER TABLE alerts ADD COLUMN {name} {ddl}"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_alert_fingerprint ON alerts(fingerprint)"))
+    logging.info("알림 집계 컬럼 마이그레이션 완료")
+
+def migrate_resource_units(bind=None, batch_size=500):
+    """[advice from AI] 리소스 정수 단위 컬럼 추가, 기존 문자열 값으로 채우기, 할당량 집계 인덱스 생성"""
+    from app.models.resource_units import parse_cpu_millicores, parse_memory_mib
+
+    bind = bind or engine
+    tables = {
+        "tenants": (
+            [("cpu_millicores", "INTEGER"), ("memory_mib", "INTEGER"), ("storage_mib", "BIGINT")],
+            {"cpu_millicores": ("cpu_limit", parse_cpu_millicores), "memory_mib": ("memory_limit", parse_memory_mib),
+             "storage_mib": ("storage_limit", parse_memory_mib)},
+            "CREATE INDEX IF NOT EXISTS idx_tenant_status_capacity "
+            "ON tenants(status, preset, cpu_millicores, memory_mib, gpu_limit, storage_mib)",
+        ),
+        "services": (
+            [("cpu_millicores", "INTEGER"), ("memory_mib", "INTEGER")],
+            {"cpu_millicores": ("cpu_request", parse_cpu_millicores),
+             "memory_mib": ("memory_request", parse_memory_mib)},
+            "CREATE INDEX IF NOT EXISTS idx_service_capacity "
+            "ON services(service_name, tenant_id, cpu_millicores, memory_mib, gpu_request)",
+        ),
+    }
+    backfilled = 0
+    for table, (columns, sources, index_ddl) in tables.items():
+        existing = {c["name"] for c in inspect(bind).get_columns(table)}
+        with bind.begin() as conn:
+            for name, ddl in columns:
+                if name not in existing:
+                    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}"))
+        
+        # 문자열이 있는데 정수 컬럼이 비어 있는 행만 id 순으로 배치 처리
+        source_columns = ", ".join(source for source, _ in sources.values())
+        pending = " OR ".join(f"({source} IS NOT NULL AND {name} IS NULL)" for name, (source, _) in sources.items())
+        assignments = ", ".join(f"{name} = :{name}" for name in sources)
+        last_id = 0
+        while True:
+            with bind.begin() as conn:
+                rows = conn.execute(text(
+                    f"SELECT id, {source_columns} FROM {table} WHERE id > :last_id AND ({pending}) "
+                    f"ORDER BY id LIMIT :limit"
+                ), {"last_id": last_id, "limit": batch_size}).all()
+                if not rows:
+                    break
+                conn.execute(text(f"UPDATE {table} SET {assignments} WHERE id = :id"), [
+                    {"id": row[0], **{name: parse(row[i + 1]) for i, (name, (_, parse)) in enumerate(sources.items())}}
+                    for row in rows
+                ])
+            last_id = rows[-1][0]
+            backfilled += len(rows)
+        with bind.begin() as conn:
+            conn.execute(text(index_ddl))
+    logging.info(f"리소스 정수 단위 컬럼 마이그레이션 완료: {backfilled}개 행")
+    return backfilled
+
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
     
@@ -444,6 +576,16 @@ if __name__ == "__main__":
         # 2. 가상 테넌시 생성
         create_virtual_tenants()
         
+        # 3. 매니페스트 저장소 분리
+        migrate_manifest_storage()
+        
+        # 4. 알림 조회 인덱스 / 집계 컬럼
+        migrate_alert_indexes()
+        migrate_alert_aggregation_columns()
+        
+        # 5. 리소스 정수 단위 컬럼 / 할당량 집계 인덱스
+        migrate_resource_units()
+        
         logging.info("모든 마이그레이션 작업 완료!")
         
     except Exception as e:
@@ -0,0 +1,66 @@
+# [advice from AI] Kubernetes 리소스 수량 문자열 → 정수 단위 변환
+"""
+리소스 단위 변환
+- CPU: 밀리코어 ("4000m" → 4000, "4" → 4000, "0.5" → 500)
+- 메모리/스토리지: MiB ("8Gi" → 8192, "512Mi" → 512, "1G" → 954, "1.0TB" → 953674)
+- 2진 접미사(Ki/Mi/Gi/Ti/Pi/Ei), 10진 접미사(k/M/G/T/P/E, 뒤의 B 허용), 접미사 없으면 바이트
+- 해석할 수 없는 값은 None
+"""
+
+import re
+from typing import Optional, Union
+
+Quantity = Union[str, int, float, None]
+
+_QUANTITY_PATTERN = re.compile(r"^\s*([0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)\s*([A-Za-z]*)\s*$")
+_BINARY_SUFFIXES = {"Ki": 2 ** 10, "Mi": 2 ** 20, "Gi": 2 ** 30, "Ti": 2 ** 40, "Pi": 2 ** 50, "Ei": 2 ** 60}
+_DECIMAL_SUFFIXES = {"": 1, "k": 10 ** 3, "K": 10 ** 3, "M": 10 ** 6, "G": 10 ** 9, "T": 10 ** 12,
+                     "P": 10 ** 15, "E": 10 ** 18}
+MIB = 2 ** 20
+
+
+def _split(value: str):
+    match = _QUANTITY_PATTERN.match(value)
+    if not match:
+        return None, None
+    return float(match.group(1)), match.group(2)
+
+
+def parse_cpu_millicores(value: Quantity) -> Optional[int]:
+    """CPU 수량 → 밀리코어"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return round(value * 1000)
+    number, suffix = _split(str(value))
+    if number is None:
+        return None
+    if suffix == "m":
+        return round(number)
+    if suffix in _DECIMAL_SUFFIXES:
+        return round(number * _DECIMAL_SUFFIXES[suffix] * 1000)
+    return None
+
+
+def parse_bytes(value: Quantity) -> Optional[int]:
+    """메모리/스토리지 수량 → 바이트"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return round(value)
+    number, suffix = _split(str(value))
+    if number is None:
+        return None
+    if suffix in _BINARY_SUFFIXES:
+        return round(number * _BINARY_SUFFIXES[suffix])
+    if suffix.endswith("B") and suffix[:-1] in _DECIMAL_SUFFIXES:
+        suffix = suffix[:-1]
+    if suffix in _DECIMAL_SUFFIXES:
+        return round(number * _DECIMAL_SUFFIXES[suffix])
+    return None
+
+
+def parse_memory_mib(value: Quantity) -> Optional[int]:
+    """메모리/스토리지 수량 → MiB"""
+    size = parse_bytes(value)
+    return round(size / MIB) if size is not None else None
@@ -0,0 +1,265 @@
+# [advice from AI] K8S Simulator 알림 증분 동기화 (백그라운드 태스크)
+"""
+Simulator Alert Sync
+
+K8S Simulator 알림을 백그라운드에서 주기적으로 가져와 ECP 알림으로 저장합니다.
+알림 조회 API는 업스트림 호출 없이 DB/메모리 데이터만 읽습니다.
+
+주요 기능:
+1. since-id 커서 기반 증분 조회 (마지막 동기화 id 이후만 요청)
+2. alert_id 집합 기반 중복 제거 (최근 동기화분 메모리 + DB 인덱스 조회)
+3. 메모리 테넌시 인덱스로 테넌시 매핑 (요청마다 테넌시 API 호출하지 않음)
+4. DB 일괄 저장 (배치 단위 insert)
+5. 집계기(AlertAggregator) 연동 시 반복 알림은 기존 알림에 합침
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.database import Alert, Tenant
+
+logger = logging.getLogger(__name__)
+
+# [advice from AI] 동기화 주기(초) / 1회 조회 개수 / 테넌시 인덱스 갱신 주기(초)
+ALERT_SYNC_INTERVAL = float(os.getenv("ALERT_SYNC_INTERVAL", "5"))
+ALERT_SYNC_BATCH_SIZE = int(os.getenv("ALERT_SYNC_BATCH_SIZE", "200"))
+ALERT_SYNC_TENANT_INDEX_TTL = float(os.getenv("ALERT_SYNC_TENANT_INDEX_TTL", "30"))
+ALERT_SYNC_SEEN_LIMIT = 10000
+
+SIMULATOR_ALERT_PREFIX = "k8s-sim-"
+ALERT_ROW_FIELDS = (
+    "alert_id", "title", "message", "severity", "category", "tenant_id", "service_name", "resource_type",
+    "metric_value", "threshold_value", "status", "resolved", "resolved_at", "resolved_by", "source", "tags",
+    "alert_metadata", "timestamp", "fingerprint", "occurrence_count", "last_seen_at",
+)
+
+
+def simulator_alert_id(sim_alert: Dict[str, Any]) -> str:
+    """시뮬레이터 알림 → ECP alert_id"""
+    return f"{SIMULATOR_ALERT_PREFIX}{sim_alert.get('id', 'unknown')}"
+
+
+def _parse_timestamp(value: Optional[str]) -> datetime:
+    try:
+        return datetime.fromisoformat((value or "").replace('Z', '+00:00'))
+    except ValueError:
+        return datetime.utcnow()
+
+
+class TenantIndex:
+    """알림 테넌시 매핑용 메모리 인덱스 (tenant_id → 이름)"""
+
+    def __init__(self, ttl: float = ALERT_SYNC_TENANT_INDEX_TTL):
+        self.ttl = ttl
+        self._names: Dict[str, Optional[str]] = {}
+        self._ids: List[str] = []
+        self._loaded_at: Optional[float] = None
+
+    def needs_refresh(self) -> bool:
+        return self._loaded_at is None or time.monotonic() - self._loaded_at >= self.ttl
+
+    def load(self, tenants: Iterable[Tuple[str, Optional[str]]]):
+        self._names = dict(tenants)
+        self._ids = sorted(self._names)
+        self._loaded_at = time.monotonic()
+
+    def resolve(self, sim_alert: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """알림의 테넌시 정보 (알림의 테넌시/네임스페이스 기준, 없거나 등록되지 않은 테넌시면 시스템 알림으로 None)"""
+        tenant_id = sim_alert.get("tenant_id")
+        if not tenant_id and sim_alert.get("namespace"):
+            tenant_id = str(sim_alert["namespace"]).removesuffix("-ecp-ai")
+        if not tenant_id or tenant_id not in self._names:
+            return None
+        return {"tenant_id": tenant_id, "name": self._names[tenant_id] or tenant_id}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+def to_ecp_alert(sim_alert: Dict[str, Any], tenant: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """시뮬레이터 알림 → ECP 알림 딕셔너리 (메모리 버퍼/응답 형식)"""
+    timestamp = _parse_timestamp(sim_alert.get('timestamp'))
+    resolved = bool(sim_alert.get('resolved', False))
+    return {
+        "id": sim_alert.get('id', 0),
+        "alert_id": simulator_alert_id(sim_alert),
+        "title": f"[K8s] {sim_alert.get('type', 'System Alert')}",
+        "message": sim_alert.get('message', '알림 메시지'),
+        "severity": sim_alert.get('severity', 'info'),
+        "category": "system",
+        "source": "k8s-simulator",
+        "timestamp": timestamp,
+        "created_at": timestamp,
+        "updated_at": None,
+        "status": "resolved" if resolved else "active",
+        "resolved": resolved,
+        "resolved_at": None,
+        "resolved_by": None,
+        "tenant_id": tenant["tenant_id"] if tenant else None,
+        "service_name": sim_alert.get('service', 'system'),
+        "resource_type": None,
+        "metric_value": None,
+        "threshold_value": None,
+        "tags": {
+            "source": "k8s-simulator",
+            "original_id": sim_alert.get('id'),
+            "tenant_name": tenant["name"] if tenant else '시스템'
+        },
+        "alert_metadata": {"original_alert": sim_alert, "tenant_info": tenant}
+    }
+
+
+class SimulatorAlertSync:
+    """시뮬레이터 알림 증분 동기화기"""
+
+    def __init__(self,
+                 client=None,
+                 session_factory: Optional[Callable[[], Session]] = None,
+                 interval: float = ALERT_SYNC_INTERVAL,
+                 batch_size: int = ALERT_SYNC_BATCH_SIZE,
+                 tenant_index: Optional[TenantIndex] = None,
+                 on_alerts: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+                 aggregator=None):
+        self._client = client
+        self._session_factory = session_factory
+        self.interval = interval
+        self.batch_size = batch_size
+        self.tenant_index = tenant_index or TenantIndex()
+        self.on_alerts = on_alerts
+        self.aggregator = aggregator
+        self.cursor: Optional[int] = None
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self._running = False
+        self.stats = {"fetched": 0, "inserted": 0, "duplicates": 0, "aggregated": 0, "errors": 0,
+                      "last_synced_at": None}
+
+    @property
+    def client(self):
+        if self._client is None:
+            from app.services.k8s_simulator_client import get_simulator_client
+            self._client = get_simulator_client()
+        return self._client
+
+    def _session(self) -> Session:
+        if self._session_factory is None:
+            from app.core.database_manager import db_manager
+            self._session_factory = db_manager.get_session
+        return self._session_factory()
+
+    def _remember(self, alert_ids: Iterable[str]):
+        for alert_id in alert_ids:
+            self._seen[alert_id] = None
+        while len(self._seen) > ALERT_SYNC_SEEN_LIMIT:
+            self._seen.popitem(last=False)
+
+    def _load_cursor(self) -> int:
+        """DB에 저장된 마지막 시뮬레이터 알림 id (재시작 후 이어서 동기화)"""
+        with self._session() as db:
+            last_alert_id = db.scalar(
+                select(Alert.alert_id)
+                .where(Alert.alert_id.startswith(SIMULATOR_ALERT_PREFIX))
+                .order_by(Alert.id.desc())
+                .limit(1)
+            )
+        suffix = (last_alert_id or "").removeprefix(SIMULATOR_ALERT_PREFIX)
+        return int(suffix) if suffix.isdigit() else 0
+
+    def _load_tenants(self) -> List[Tuple[str, Optional[str]]]:
+        with self._session() as db:
+            return [tuple(row) for row in db.execute(
+                select(Tenant.tenant_id, Tenant.name).where(Tenant.status != "deleted")
+            ).all()]
+
+    def _write_batch(self, alerts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """DB에 없는 알림만 일괄 저장, 저장된 알림 반환"""
+        with self._session() as db:
+            existing = set(db.scalars(
+                select(Alert.alert_id).where(Alert.alert_id.in_([a["alert_id"] for a in alerts]))
+            ))
+            new_alerts = [a for a in alerts if a["alert_id"] not in existing]
+            if not new_alerts:
+                return []
+            rows = [{field: alert[field] for field in ALERT_ROW_FIELDS if field in alert} for alert in new_alerts]
+            try:
+                db.add_all(Alert(**row) for row in rows)
+                db.commit()
+            except IntegrityError:
+                # 인덱스 갱신 사이에 삭제된 테넌시 참조 - 테넌시 없이 저장
+                db.rollback()
+                for alert, row in zip(new_alerts, rows):
+                    alert["tenant_id"] = row["tenant_id"] = None
+                db.add_all(Alert(**row) for row in rows)
+                db.commit()
+            return new_alerts
+
+    async def sync_once(self) -> int:
+        """커서 이후 알림을 모두 가져와 저장, 새로 저장된 알림 수 반환"""
+        if self.cursor is None:
+            self.cursor = await asyncio.to_thread(self._load_cursor)
+        if self.tenant_index.needs_refresh():
+            self.tenant_index.load(await asyncio.to_thread(self._load_tenants))
+
+        inserted = 0
+        while True:
+            sim_alerts = await self.client.get_alerts_since(self.cursor, self.batch_size)
+            self.stats["fetched"] += len(sim_alerts)
+
+            batch, processed = [], []
+            for sim_alert in sim_alerts:
+                alert_id = simulator_alert_id(sim_alert)
+                if alert_id in self._seen:
+                    self.stats["duplicates"] += 1
+                    continue
+                processed.append(alert_id)
+                alert = to_ecp_alert(sim_alert, self.tenant_index.resolve(sim_alert))
+                if self.aggregator and self.aggregator.ingest(alert, source="k8s-simulator").outcome != "new":
+                    self.stats["aggregated"] += 1
+                    continue
+                batch.append(alert)
+
+            self._remember(processed)
+            if batch:
+                saved = await asyncio.to_thread(self._write_batch, batch)
+                self.stats["duplicates"] += len(batch) - len(saved)
+                if saved and self.on_alerts:
+                    self.on_alerts(saved)
+                inserted += len(saved)
+
+            if sim_alerts:
+                self.cursor = max(self.cursor, max(int(a["id"]) for a in sim_alerts))
+            if len(sim_alerts) < self.batch_size:
+                break
+
+        self.stats["inserted"] += inserted
+        self.stats["last_synced_at"] = datetime.utcnow().isoformat()
+        if inserted:
+            logger.info(f"시뮬레이터 알림 동기화: {inserted}개 저장 (cursor={self.cursor})")
+        return inserted
+
+    async def run(self):
+        """주기적 동기화 루프 (stop() 호출 시 종료)"""
+        self._running = True
+        logger.info(f"시뮬레이터 알림 동기화 시작 (주기 {self.interval}초)")
+        while self._running:
+            try:
+                await self.sync_once()
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"시뮬레이터 알림 동기화 실패: {e}")
+            await asyncio.sleep(self.interval)
+
+    def stop(self):
+        self._running = False
+
+    def status(self) -> Dict[str, Any]:
+        return {"cursor": self.cursor, "running": self._running, "tenants_indexed": len(self.tenant_index),
+                **self.stats}
@@ -3,9 +3,11 @@ import httpx
 import asyncio
 import json
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
 from datetime import datetime
 
+from app.core import yaml_io
+
 logger = logging.getLogger(__name__)
 
 class K8sSimulatorClient:
@@ -28,12 +30,53 @@ class K8sSimulatorClient:
             limits=httpx.Limits(max_connections=20, max_keepalive_connections=5)
         )
     
+    @staticmethod
+    def to_manifest_yaml(manifest_content: Union[str, Dict[str, str]]) -> str:
+        """매니페스트 파일 dict(파일명 -> YAML)를 멀티 도큐먼트 YAML 문자열로 변환"""
+        if isinstance(manifest_content, dict):
+            return yaml_io.join_documents(manifest_content.values())
+        return manifest_content
+    
+    async def apply_manifest(
+        self,
+        manifest_content: Union[str, Dict[str, str]],
+        tenant_id: str = "default",
+        namespace: Optional[str] = None,
+        deployment_mode: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """매니페스트 검증/파싱/배포를 한 번의 요청으로 수행 (/k8s/manifest/apply)
+        
+        Args:
+            manifest_content: YAML 매니페스트 내용 (str 또는 파일명 -> YAML dict)
+            tenant_id: 테넌트 ID
+            namespace: 네임스페이스가 지정되지 않은 리소스의 기본 네임스페이스
+            deployment_mode: 배포 모드 (production/demo, 리소스 어노테이션으로 기록)
+            
+        Returns:
+            배포 결과 정보 (content_hash, parse_cached 포함)
+        """
+        response = await self.client.post(
+            f"{self.base_url}/k8s/manifest/apply",
+            json={
+                "manifest": self.to_manifest_yaml(manifest_content),
+                "tenant_id": tenant_id,
+                "namespace": namespace,
+                "deployment_mode": deployment_mode
+            },
+            headers={
+                "Content-Type": "application/json",
+                "User-Agent": "ECP-AI-Orchestrator/1.54"
+            }
+        )
+        response.raise_for_status()
+        return response.json()
+    
     async def deploy_manifest(
         self, 
         manifest_content, 
         tenant_id: str = "default",
         deployment_mode: str = "production",
-        namespace: str = "default-ecp-ai"
+        namespace: Optional[str] = None
     ) -> Dict[str, Any]:
         """매니페스트를 K8S Simulator에 배포
         
@@ -41,6 +84,7 @@ class K8sSimulatorClient:
             manifest_content: YAML 매니페스트 내용 (str 또는 dict)
             tenant_id: 테넌트 ID
             deployment_mode: 배포 모드 (production/demo)
+            namespace: 네임스페이스가 지정되지 않은 리소스의 기본 네임스페이스 (없으면 매니페스트 기준)
             
         Returns:
             배포 결과 정보
@@ -48,28 +92,9 @@ class K8sSimulatorClient:
         try:
             logger.info(f"Deploying manifest for tenant {tenant_id} to K8S Simulator")
             
-            # [advice from AI] manifest_content가 dict인 경우 문자열로 변환
-            if isinstance(manifest_content, dict):
-                # dict의 모든 값들을 연결하여 하나의 YAML 문자열로 만들기
-                manifest_yaml = "\n---\n".join(manifest_content.values())
-            else:
-                manifest_yaml = manifest_content
-            
-            response = await self.client.post(
-                f"{self.base_url}/k8s/manifest/deploy",
-                json={
-                    "manifest": manifest_yaml,
-                    "tenant_id": tenant_id,
-                    "deployment_mode": deployment_mode
-                },
-                headers={
-                    "Content-Type": "application/json",
-                    "User-Agent": "ECP-AI-Orchestrator/1.54"
-                }
-            )
-            response.raise_for_status()
-            
-            result = response.json()
+            # [advice from AI] 검증+파싱+배포 단일 요청 (시뮬레이터 측 파싱 캐시 활용)
+            result = await self.apply_manifest(manifest_content, tenant_id=tenant_id, namespace=namespace,
+                                               deployment_mode=deployment_mode)
             logger.info(f"Deployment successful for tenant {tenant_id}: {result.get('deployed_count', 0)} resources")
             
             # [advice from AI] 배포 결과에 모니터링 URL 추가
@@ -96,12 +121,8 @@ class K8sSimulatorClient:
             파싱 결과 및 리소스 정보
         """
         try:
-            # [advice from AI] manifest_content가 dict인 경우 문자열로 변환
-            if isinstance(manifest_content, dict):
-                manifest_yaml = "\n---\n".join(manifest_content.values())
-            else:
-                manifest_yaml = manifest_content
-                
+            manifest_yaml = self.to_manifest_yaml(manifest_content)
+            
             response = await self.client.post(
                 f"{self.base_url}/k8s/manifest/parse",
                 json={
@@ -191,6 +212,27 @@ class K8sSimulatorClient:
             logger.error(f"SLA status fetch failed: {e}")
             return {"status": "error", "message": str(e)}
     
+    async def get_alerts_since(self, since_id: int, limit: int = 500) -> List[Dict[str, Any]]:
+        """since_id 이후 생성된 시뮬레이터 알림 조회 (id 오름차순)
+        
+        Args:
+            since_id: 마지막으로 동기화한 알림 id
+            limit: 최대 조회 개수
+        
+        Returns:
+            알림 목록 (HTTP 오류는 호출 측에서 처리하도록 그대로 전파)
+        """
+        response = await self.client.get(
+            f"{self.base_url}/sla/alerts/history",
+            params={"since_id": since_id, "limit": limit}
+        )
+        response.raise_for_status()
+        
+        # [advice from AI] since_id를 지원하지 않는 시뮬레이터는 전체 히스토리를 반환하므로 한 번 더 거름
+        alerts = [a for a in response.json().get("alerts", []) if int(a.get("id") or 0) > since_id]
+        alerts.sort(key=lambda a: int(a["id"]))
+        return alerts[:limit]
+    
     async def delete_deployment(self, tenant_id: str) -> Dict[str, Any]:
         """테넌트 배포 삭제
         
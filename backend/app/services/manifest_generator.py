@@ -1,9 +1,10 @@
 # [advice from AI] 매니페스트 생성 서비스
-import yaml
 import logging
 from typing import Dict, Any, List
 from datetime import datetime
 
+from app.core import yaml_io
+
 logger = logging.getLogger(__name__)
 
 class ManifestGenerator:
@@ -60,11 +61,8 @@ class ManifestGenerator:
             if not is_demo:
                 resources.append(self._create_ingress(namespace_name, tenant_data))
             
-            # YAML 문서들을 연결
-            manifest_content = "---\n".join([
-                yaml.dump(resource, default_flow_style=False, allow_unicode=True)
-                for resource in resources
-            ])
+            # YAML 문서들을 연결 (libyaml 가속 멀티 도큐먼트 직렬화)
+            manifest_content = yaml_io.dump_all(resources)
             
             logger.info(f"Generated manifest with {len(resources)} resources for tenant {tenant_id}")
             return manifest_content
@@ -83,7 +81,7 @@ class ManifestGenerator:
                 "labels": {
                     "app.kubernetes.io/name": "ecp-ai-tenant",
                     "app.kubernetes.io/instance": tenant_data.get("name", "unknown"),
-                    "app.kubernetes.io/managed-by": "ecp-ai-orchestrator",
+                    "app.kubernetes.io/managed-by": "ecp-orchestrator",
                     "ecp-ai/tenant-id": str(tenant_data.get("id", "unknown"))
                 },
                 "annotations": {
@@ -105,7 +103,7 @@ tenant.cpu_limit={tenant_data.get('cpu_limit', '1000m')}
 tenant.memory_limit={tenant_data.get('memory_limit', '2Gi')}
 tenant.storage_limit={tenant_data.get('storage_limit', '10Gi')}
             """.strip(),
-            "application.yaml": yaml.dump({
+            "application.yaml": yaml_io.dump({
                 "server": {
                     "port": 8080
                 },
@@ -193,6 +191,7 @@ tenant.storage_limit={tenant_data.get('storage_limit', '10Gi')}
                 "labels": {
                     "app.kubernetes.io/name": "ecp-ai-tenant",
                     "app.kubernetes.io/component": "application",
+                    "app.kubernetes.io/managed-by": "ecp-orchestrator",
                     "app": app_name
                 }
             },
@@ -0,0 +1,95 @@
+# [advice from AI] 테넌시 매니페스트 버전 저장소
+"""
+Tenant Manifest Store
+
+테넌시 매니페스트를 tenants 테이블과 분리된 tenant_manifests 테이블에
+버전별로 압축 저장하고, 명시적으로 요청할 때만 본문을 로드합니다.
+
+주요 기능:
+1. 매니페스트 버전 저장 (내용이 같으면 새 버전을 만들지 않음)
+2. 버전 목록 조회 (요약 컬럼만, 본문 제외)
+3. 특정/최신 버전 본문 로드
+"""
+
+import logging
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, undefer
+
+from app.models.database import Tenant, TenantManifest
+
+logger = logging.getLogger(__name__)
+
+
+def _latest(db: Session, tenant_id: str, with_content: bool = False) -> Optional[TenantManifest]:
+    stmt = (
+        select(TenantManifest)
+        .where(TenantManifest.tenant_id == tenant_id)
+        .order_by(TenantManifest.version.desc())
+        .limit(1)
+    )
+    if with_content:
+        stmt = stmt.options(undefer(TenantManifest.content))
+    return db.scalar(stmt)
+
+
+def save_manifest_version(db: Session,
+                          tenant_id: str,
+                          files: Dict[str, str],
+                          created_by: Optional[str] = None) -> TenantManifest:
+    """매니페스트 새 버전 저장 (최신 버전과 내용이 같으면 기존 버전 반환, 커밋은 호출 측에서)"""
+    packed = TenantManifest.pack(files)
+    latest = _latest(db, tenant_id)
+    if latest is not None and latest.checksum == packed["checksum"]:
+        return latest
+
+    manifest = TenantManifest(
+        tenant_id=tenant_id,
+        version=(latest.version + 1) if latest is not None else 1,
+        created_by=created_by,
+        **packed
+    )
+    db.add(manifest)
+    db.execute(
+        Tenant.__table__.update()
+        .where(Tenant.tenant_id == tenant_id)
+        .values(manifest_generated_at=func.now())
+    )
+    logger.info(f"매니페스트 버전 저장: {tenant_id} v{manifest.version} "
+                f"({manifest.size_bytes} → {manifest.compressed_bytes} bytes)")
+    return manifest
+
+
+def list_manifest_versions(db: Session, tenant_id: str) -> List[Dict[str, object]]:
+    """매니페스트 버전 목록 (본문 제외 요약 정보만)"""
+    manifests = db.scalars(
+        select(TenantManifest)
+        .where(TenantManifest.tenant_id == tenant_id)
+        .order_by(TenantManifest.version.desc())
+    )
+    return [
+        {
+            "version": m.version,
+            "file_count": m.file_count,
+            "size_bytes": m.size_bytes,
+            "compressed_bytes": m.compressed_bytes,
+            "checksum": m.checksum,
+            "created_at": m.created_at.isoformat() if m.created_at else None,
+            "created_by": m.created_by,
+        }
+        for m in manifests
+    ]
+
+
+def load_manifest(db: Session, tenant_id: str, version: Optional[int] = None) -> Optional[Dict[str, str]]:
+    """매니페스트 본문 로드 (version 미지정 시 최신 버전, 없으면 None)"""
+    if version is None:
+        manifest = _latest(db, tenant_id, with_content=True)
+    else:
+        manifest = db.scalar(
+            select(TenantManifest)
+            .options(undefer(TenantManifest.content))
+            .where(TenantManifest.tenant_id == tenant_id, TenantManifest.version == version)
+        )
+    return manifest.files() if manifest is not None else None
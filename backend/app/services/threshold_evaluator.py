@@ -0,0 +1,159 @@
+# [advice from AI] 임계값 규칙 주기 평가 (백그라운드 태스크)
+"""
+Threshold Evaluator
+
+메트릭 틱마다 K8S Simulator 서비스 메트릭을 임계값 규칙 엔진(및 이상 탐지기)으로 평가하고
+알림 상태 전이(발생/상향/해제)를 콜백으로 전달합니다.
+
+주요 기능:
+1. 기본 임계값 설정(ThresholdSettings) 주기적 로드 및 규칙 컴파일
+2. 시뮬레이터 모니터링 1회 조회 → 테넌시/서비스별 메트릭 샘플 변환
+3. 전체 테넌시/서비스 규칙을 한 번에 평가 (ThresholdEngine)
+4. 같은 샘플로 시간대별 기준선 이상 탐지 (AnomalyDetector 연동 시)
+5. 틱별 평가 비용/전이 수 상태 제공
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.threshold_engine import DEFAULT_THRESHOLDS, ThresholdEngine, ThresholdTransition
+from app.models.database import Tenant, ThresholdSettings
+
+logger = logging.getLogger(__name__)
+
+# [advice from AI] 평가 주기(초) / 임계값 설정·테넌시 목록 갱신 주기(초)
+THRESHOLD_EVAL_INTERVAL = float(os.getenv("THRESHOLD_EVAL_INTERVAL", "5"))
+THRESHOLD_RULES_TTL = float(os.getenv("THRESHOLD_RULES_TTL", "30"))
+
+AI_SERVICE_KEYWORDS = ("callbot", "chatbot", "advisor")
+
+
+def _match_tenant(service_name: str, tenant_ids: Sequence[str]) -> Optional[str]:
+    for tenant_id in tenant_ids:
+        if f"{tenant_id}-ecp-ai" in service_name or tenant_id in service_name:
+            return tenant_id
+    return None
+
+
+def samples_from_monitoring(data: Dict[str, Any], tenant_ids: Sequence[str]) -> List[Dict[str, Any]]:
+    """
+    시뮬레이터 모니터링 데이터(ECP 변환 형식) → 규칙 엔진 샘플
+    - 서비스 이름에 테넌시 id/네임스페이스가 포함되면 해당 테넌시, 아니면 시스템(None)
+    - GPU 사용률은 AI 서비스 CPU 사용률의 80%로 추정 (테넌시 모니터링과 동일 기준)
+    """
+    # 긴 id 우선 매칭 (접두어가 겹치는 테넌시 구분)
+    tenant_ids = sorted(tenant_ids, key=len, reverse=True)
+    samples = []
+    for service_name, metrics in (data.get("services") or {}).items():
+        if not isinstance(metrics, dict):
+            continue
+        sample = {
+            "tenant_id": _match_tenant(service_name, tenant_ids),
+            "service_name": service_name,
+            "cpu": metrics.get("cpu_usage"),
+            "memory": metrics.get("memory_percent"),
+            "response_time": metrics.get("response_time"),
+            "error_rate": metrics.get("error_rate"),
+        }
+        if any(keyword in service_name.lower() for keyword in AI_SERVICE_KEYWORDS) and sample["cpu"] is not None:
+            sample["gpu"] = sample["cpu"] * 0.8
+        samples.append(sample)
+    return samples
+
+
+class ThresholdEvaluator:
+    """임계값 규칙 주기 평가기"""
+
+    def __init__(self,
+                 client=None,
+                 session_factory: Optional[Callable[[], Session]] = None,
+                 engine: Optional[ThresholdEngine] = None,
+                 interval: float = THRESHOLD_EVAL_INTERVAL,
+                 rules_ttl: float = THRESHOLD_RULES_TTL,
+                 on_transitions: Optional[Callable[[List[ThresholdTransition]], Awaitable[None]]] = None,
+                 anomaly_detector=None):
+        self._client = client
+        self._session_factory = session_factory
+        self.engine = engine or ThresholdEngine()
+        self.interval = interval
+        self.rules_ttl = rules_ttl
+        self.on_transitions = on_transitions
+        self.anomaly_detector = anomaly_detector
+        self._tenant_ids: List[str] = []
+        self._rules_loaded_at: Optional[float] = None
+        self._running = False
+        self.stats = {"ticks": 0, "transitions": 0, "errors": 0, "last_evaluated_at": None}
+
+    @property
+    def client(self):
+        if self._client is None:
+            from app.services.k8s_simulator_client import get_simulator_client
+            self._client = get_simulator_client()
+        return self._client
+
+    def _session(self) -> Session:
+        if self._session_factory is None:
+            from app.core.database_manager import db_manager
+            self._session_factory = db_manager.get_session
+        return self._session_factory()
+
+    def _load_rules(self) -> Tuple[Dict[str, Any], List[str]]:
+        """기본 임계값 설정과 테넌시 id 목록"""
+        with self._session() as db:
+            thresholds = db.scalar(
+                select(ThresholdSettings.thresholds)
+                .where(ThresholdSettings.is_default == True, ThresholdSettings.is_active == True)
+                .limit(1)
+            )
+            tenant_ids = list(db.scalars(select(Tenant.tenant_id).where(Tenant.status != "deleted")))
+        return thresholds or DEFAULT_THRESHOLDS, tenant_ids
+
+    async def refresh_rules(self):
+        thresholds, self._tenant_ids = await asyncio.to_thread(self._load_rules)
+        if self.engine.set_rules(thresholds):
+            logger.info(f"임계값 규칙 컴파일: {len(self.engine.columns)}개 규칙")
+        self._rules_loaded_at = time.monotonic()
+
+    async def evaluate_once(self) -> List[ThresholdTransition]:
+        """메트릭 틱 1회 평가, 상태 전이 목록 반환"""
+        if self._rules_loaded_at is None or time.monotonic() - self._rules_loaded_at >= self.rules_ttl:
+            await self.refresh_rules()
+
+        data = await self.client.get_monitoring_data()
+        if data.get("status") == "error":
+            raise RuntimeError(data.get("message", "모니터링 데이터 조회 실패"))
+
+        samples = samples_from_monitoring(data, self._tenant_ids)
+        transitions = self.engine.evaluate(samples)
+        if self.anomaly_detector:
+            transitions.extend(self.anomaly_detector.update(samples))
+        self.stats["ticks"] += 1
+        self.stats["transitions"] += len(transitions)
+        self.stats["last_evaluated_at"] = time.time()
+        if transitions and self.on_transitions:
+            await self.on_transitions(transitions)
+        return transitions
+
+    async def run(self):
+        """주기적 평가 루프 (stop() 호출 시 종료)"""
+        self._running = True
+        logger.info(f"임계값 규칙 평가 시작 (주기 {self.interval}초)")
+        while self._running:
+            try:
+                await self.evaluate_once()
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"임계값 규칙 평가 실패: {e}")
+            await asyncio.sleep(self.interval)
+
+    def stop(self):
+        self._running = False
+
+    def status(self) -> Dict[str, Any]:
+        return {"running": self._running, "interval": self.interval, **self.engine.status(), **self.stats}
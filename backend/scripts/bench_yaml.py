@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# [advice from AI] YAML 파싱/직렬화 처리량 벤치마크 (libyaml vs 순수 Python)
+"""
+yaml_io 백엔드 처리량 벤치마크
+- 생성된 테넌트 매니페스트 번들(Namespace + 서비스별 Deployment/Service/HPA)을 사용
+- 순수 Python(SafeLoader/SafeDumper)과 yaml_io 백엔드(libyaml 설치 시 C 구현)의 파싱/직렬화 MB/s 출력
+- 실행 시간 비교는 환경에 따라 달라지므로 테스트가 아닌 수동 실행용 스크립트로 분리
+
+사용법:
+    python scripts/bench_yaml.py [--tenants 5] [--services 20] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+import yaml
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from app.core import yaml_io  # noqa: E402
+
+
+def tenant_bundle(tenant_index: int, service_count: int) -> List[Dict[str, Any]]:
+    """테넌트 매니페스트 번들 생성"""
+    namespace = f"tenant-{tenant_index:04d}-ecp-ai"
+    resources = [{
+        "apiVersion": "v1",
+        "kind": "Namespace",
+        "metadata": {"name": namespace, "labels": {"app.kubernetes.io/managed-by": "ecp-orchestrator"}}
+    }]
+    for i in range(service_count):
+        name = f"service-{i:02d}"
+        resources.append({
+            "apiVersion": "apps/v1",
+            "kind": "Deployment",
+            "metadata": {"name": name, "namespace": namespace, "labels": {"app": name}},
+            "spec": {
+                "replicas": 2,
+                "selector": {"matchLabels": {"app": name}},
+                "template": {
+                    "metadata": {"labels": {"app": name}},
+                    "spec": {
+                        "containers": [{
+                            "name": name,
+                            "image": f"ecp-ai/{name}:v1.2.{i}",
+                            "resources": {
+                                "requests": {"cpu": "500m", "memory": "1Gi"},
+                                "limits": {"cpu": "1000m", "memory": "2Gi"}
+                            },
+                            "env": [{"name": f"ENV_{k}", "value": f"value-{k}"} for k in range(10)]
+                        }]
+                    }
+                }
+            }
+        })
+        resources.append({
+            "apiVersion": "v1",
+            "kind": "Service",
+            "metadata": {"name": f"{name}-service", "namespace": namespace},
+            "spec": {"selector": {"app": name}, "ports": [{"port": 80, "targetPort": 8080}]}
+        })
+        resources.append({
+            "apiVersion": "autoscaling/v2",
+            "kind": "HorizontalPodAutoscaler",
+            "metadata": {"name": f"{name}-hpa", "namespace": namespace},
+            "spec": {"minReplicas": 2, "maxReplicas": 10}
+        })
+    return resources
+
+
+def best_of(func: Callable[[], Any], repeat: int) -> float:
+    """repeat회 실행 중 최단 시간(초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="YAML 파싱/직렬화 처리량 벤치마크")
+    parser.add_argument("--tenants", type=int, default=5, help="테넌트 번들 수")
+    parser.add_argument("--services", type=int, default=20, help="테넌트당 서비스 수")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (최단 시간 사용)")
+    args = parser.parse_args()
+
+    documents = [doc for i in range(args.tenants) for doc in tenant_bundle(i, args.services)]
+    content = yaml_io.dump_all(documents)
+    megabytes = len(content.encode("utf-8")) / (1024 * 1024)
+
+    backends = [("pure-python", yaml.SafeLoader, yaml.SafeDumper)]
+    if yaml_io.HAS_LIBYAML:
+        backends.append((yaml_io.backend_name(), yaml_io.SafeLoader, yaml_io.SafeDumper))
+    else:
+        print("libyaml 미설치 - 순수 Python 백엔드만 측정합니다")
+
+    print(f"documents={len(documents)} size={megabytes:.2f}MB repeat={args.repeat}")
+    print(f"{'backend':<12} {'parse MB/s':>12} {'emit MB/s':>12}")
+    for label, loader, dumper in backends:
+        parse_seconds = best_of(lambda: list(yaml.load_all(content, Loader=loader)), args.repeat)
+        emit_seconds = best_of(
+            lambda: yaml.dump_all(documents, Dumper=dumper, **yaml_io.DEFAULT_DUMP_OPTIONS), args.repeat
+        )
+        print(f"{label:<12} {megabytes / parse_seconds:>12.2f} {megabytes / emit_seconds:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
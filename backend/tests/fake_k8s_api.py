@@ -0,0 +1,383 @@
+# [advice from AI] 테스트용 로컬 가짜 Kubernetes API 서버
+"""
+kubernetes-python 클라이언트가 실제로 HTTP 요청을 보내는 로컬 API 서버
+- 경로 기반 범용 리소스 저장소 (POST/GET/PUT/PATCH/DELETE, labelSelector key=value / key in (a,b))
+- 경로별 응답 지연 / 오류 주입 (타임아웃, 롤백 테스트용)
+- 요청 로그 기록 (호출 횟수 검증용)
+- watch 스트림 (chunked 이벤트 전송, resourceVersion 만료 시 410 재현)
+- server-side apply PATCH (없으면 생성, dryRun=All 시 저장하지 않음)
+"""
+
+import json
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from kubernetes import client
+
+_CLUSTER_LIST = re.compile(r"^/(api/v1|apis/[^/]+/[^/]+)/([a-z]+)$")
+_SELECTOR_TERM = re.compile(r"\s*([^=,\s]+)\s*(?:=\s*([^,]*)|\s+in\s*\(([^)]*)\))\s*(?:,|$)")
+
+
+def _merge(target: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON merge patch 적용"""
+    for key, value in patch.items():
+        if value is None:
+            target.pop(key, None)
+        elif isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        else:
+            target[key] = value
+    return target
+
+
+class FakeK8sApiServer:
+    """스레드에서 동작하는 가짜 Kubernetes API 서버"""
+
+    def __init__(self):
+        self.objects: Dict[str, Dict[str, Any]] = {}
+        self.requests: List[Tuple[str, str]] = []
+        self.delays: Dict[str, float] = {}
+        self.failures: Dict[Tuple[str, str], int] = {}
+        self.resource_version = 0
+        self.events: List[Tuple[int, str, str, Dict[str, Any]]] = []  # (resourceVersion, 타입, 경로, 객체)
+        self.compacted_version = 0
+        self.watch_generation = 0
+        self.lock = threading.RLock()
+        self.changed = threading.Condition(self.lock)
+        self._stopping = False
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # 서버 수명 주기
+    # ------------------------------------------------------------------
+    def start(self) -> "FakeK8sApiServer":
+        handler = self._make_handler()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        with self.changed:
+            self._stopping = True
+            self.changed.notify_all()
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def configuration(self) -> client.Configuration:
+        """이 서버를 가리키는 클라이언트 설정"""
+        configuration = client.Configuration()
+        configuration.host = self.url
+        configuration.retries = 0
+        return configuration
+
+    # ------------------------------------------------------------------
+    # 테스트 헬퍼
+    # ------------------------------------------------------------------
+    def count(self, method: str, path_contains: str = "") -> int:
+        with self.lock:
+            return sum(1 for m, p in self.requests if m == method and path_contains in p)
+
+    def put_object(self, path: str, obj: Dict[str, Any]):
+        with self.lock:
+            self._set_namespace(path, obj)
+            self._stamp(obj)
+            event_type = "MODIFIED" if path in self.objects else "ADDED"
+            self.objects[path] = obj
+            self._record(event_type, path, obj)
+
+    def expire_watches(self):
+        """이벤트 이력 압축 + 진행 중 watch 종료 (재연결 시 410 Gone → 재목록 유도)"""
+        with self.changed:
+            self.resource_version += 1
+            self.compacted_version = self.resource_version
+            self.watch_generation += 1
+            self.changed.notify_all()
+
+    def _record(self, event_type: str, path: str, obj: Dict[str, Any]):
+        self.events.append((self.resource_version, event_type, path, json.loads(json.dumps(obj))))
+        self.changed.notify_all()
+
+    def _stamp(self, obj: Dict[str, Any]):
+        self.resource_version += 1
+        metadata = obj.setdefault("metadata", {})
+        metadata["resourceVersion"] = str(self.resource_version)
+        metadata.setdefault("uid", str(uuid.uuid4()))
+        metadata.setdefault("creationTimestamp", time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()))
+
+    @staticmethod
+    def _set_namespace(path: str, obj: Dict[str, Any]):
+        """네임스페이스 범위 경로면 metadata.namespace 채움 (실제 API 서버와 동일)"""
+        match = re.search(r"/namespaces/([^/]+)/", path)
+        if match:
+            obj.setdefault("metadata", {})["namespace"] = match.group(1)
+
+    def _delay_for(self, method: str, path: str) -> float:
+        return max((d for key, d in self.delays.items() if key in f"{method} {path}"), default=0.0)
+
+    def _failure_for(self, method: str, path: str) -> Optional[int]:
+        for (fail_method, fragment), status in self.failures.items():
+            if fail_method == method and fragment in path:
+                return status
+        return None
+
+    # ------------------------------------------------------------------
+    # 요청 처리
+    # ------------------------------------------------------------------
+    def handle(self, method: str, raw_path: str, body: Optional[Any],
+               content_type: Optional[str] = None) -> Tuple[int, Any]:
+        parsed = urlparse(raw_path)
+        path = parsed.path.rstrip("/")
+        query = parse_qs(parsed.query)
+
+        with self.lock:
+            self.requests.append((method, path))
+        delay = self._delay_for(method, path)
+        if delay:
+            time.sleep(delay)
+
+        status = self._failure_for(method, path)
+        if status:
+            return status, self._status(status, "injected failure")
+
+        if path == "/version":
+            return 200, {"major": "1", "minor": "28", "gitVersion": "v1.28.0-fake", "gitCommit": "fake",
+                         "gitTreeState": "clean", "buildDate": "2024-01-01T00:00:00Z", "goVersion": "go1.21",
+                         "compiler": "gc", "platform": "linux/amd64"}
+
+        with self.lock:
+            if method == "POST":
+                return self._create(path, body)
+            if method == "GET":
+                return self._get(path, query)
+            if method == "PUT":
+                return self._replace(path, body)
+            if method == "PATCH":
+                if content_type == "application/apply-patch+yaml":
+                    return self._apply(path, body, dry_run="All" in query.get("dryRun", []))
+                return self._patch(path, body)
+            if method == "DELETE":
+                return self._delete(path)
+        return 405, self._status(405, "method not allowed")
+
+    def _status(self, code: int, message: str) -> Dict[str, Any]:
+        reason = {404: "NotFound", 409: "AlreadyExists", 422: "Invalid", 500: "InternalError"}.get(code, "Unknown")
+        return {"kind": "Status", "apiVersion": "v1", "status": "Failure", "message": message,
+                "reason": reason, "code": code}
+
+    def _create(self, path: str, body: Dict[str, Any]) -> Tuple[int, Any]:
+        name = (body.get("metadata") or {}).get("name")
+        if not name:
+            return 422, self._status(422, "metadata.name is required")
+        key = f"{path}/{name}"
+        if key in self.objects:
+            return 409, self._status(409, f"{name} already exists")
+
+        obj = json.loads(json.dumps(body))
+        self._set_namespace(key, obj)
+        if path.endswith("/deployments"):
+            replicas = (obj.get("spec") or {}).get("replicas", 1)
+            obj["status"] = {"replicas": replicas, "readyReplicas": replicas,
+                             "availableReplicas": replicas, "updatedReplicas": replicas}
+        if path == "/api/v1/namespaces":
+            obj["status"] = {"phase": "Active"}
+        self._stamp(obj)
+        self.objects[key] = obj
+        self._record("ADDED", key, obj)
+        return 201, obj
+
+    @staticmethod
+    def _in_collection(path: str, key: str) -> bool:
+        """key 객체가 path 목록(네임스페이스 범위 또는 전체 네임스페이스)에 속하는지"""
+        match = _CLUSTER_LIST.match(path)
+        if match and match.group(2) != "namespaces":
+            # 전체 네임스페이스 목록 (/apis/apps/v1/deployments 등)
+            prefix, plural = f"/{match.group(1)}/namespaces/", f"/{match.group(2)}/"
+            rest = key[len(prefix):]
+            return key.startswith(prefix) and plural in rest and rest.count("/") == 2
+        return key.startswith(path + "/") and "/" not in key[len(path) + 1:]
+
+    @staticmethod
+    def _matches_selector(obj: Dict[str, Any], query: Dict[str, List[str]]) -> bool:
+        selector = (query.get("labelSelector") or [""])[0]
+        labels = obj.get("metadata", {}).get("labels") or {}
+        for key, value, values in _SELECTOR_TERM.findall(selector):
+            allowed = [v.strip() for v in values.split(",")] if values else [value.strip()]
+            if labels.get(key) not in allowed:
+                return False
+        return True
+
+    def _list_items(self, path: str, query: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+        return [obj for key, obj in self.objects.items()
+                if self._in_collection(path, key) and self._matches_selector(obj, query)]
+
+    @staticmethod
+    def _is_item_path(path: str) -> bool:
+        """/api/v1/... 또는 /apis/{group}/{version}/... 이후 세그먼트 수가 짝수면 단일 객체 경로"""
+        segments = path.strip("/").split("/")
+        rest = segments[2:] if segments[0] == "api" else segments[3:]
+        return len(rest) % 2 == 0
+
+    def _get(self, path: str, query: Dict[str, List[str]]) -> Tuple[int, Any]:
+        if path in self.objects:
+            return 200, self.objects[path]
+        if self._is_item_path(path):
+            return 404, self._status(404, f"{path} not found")
+        return 200, {"kind": "List", "apiVersion": "v1",
+                     "metadata": {"resourceVersion": str(self.resource_version)},
+                     "items": self._list_items(path, query)}
+
+    def _replace(self, path: str, body: Dict[str, Any]) -> Tuple[int, Any]:
+        if path not in self.objects:
+            return 404, self._status(404, f"{path} not found")
+        obj = json.loads(json.dumps(body))
+        obj.setdefault("status", self.objects[path].get("status"))
+        self._stamp(obj)
+        self.objects[path] = obj
+        self._record("MODIFIED", path, obj)
+        return 200, obj
+
+    def _patch(self, path: str, body: Any) -> Tuple[int, Any]:
+        if path not in self.objects:
+            return 404, self._status(404, f"{path} not found")
+        if isinstance(body, dict):
+            _merge(self.objects[path], json.loads(json.dumps(body)))
+        self._stamp(self.objects[path])
+        self._record("MODIFIED", path, self.objects[path])
+        return 200, self.objects[path]
+
+    def _apply(self, path: str, body: Dict[str, Any], dry_run: bool) -> Tuple[int, Any]:
+        if path not in self.objects:
+            if dry_run:
+                return 201, body
+            return self._create(path.rsplit("/", 1)[0], body)
+        merged = _merge(json.loads(json.dumps(self.objects[path])), json.loads(json.dumps(body)))
+        if dry_run:
+            return 200, merged
+        self.objects[path] = merged
+        self._stamp(merged)
+        self._record("MODIFIED", path, merged)
+        return 200, merged
+
+    def _delete(self, path: str) -> Tuple[int, Any]:
+        if path not in self.objects:
+            return 404, self._status(404, f"{path} not found")
+        obj = self.objects.pop(path)
+        if path.startswith("/api/v1/namespaces/") and path.count("/") == 4:
+            namespace = path.rsplit("/", 1)[1]
+            for key in [k for k in self.objects if f"/namespaces/{namespace}/" in k]:
+                self.resource_version += 1
+                self._record("DELETED", key, self.objects.pop(key))
+        self.resource_version += 1
+        self._record("DELETED", path, obj)
+        return 200, obj
+
+    # ------------------------------------------------------------------
+    # watch 스트림
+    # ------------------------------------------------------------------
+    def watch(self, path: str, query: Dict[str, List[str]], send) -> None:
+        """resourceVersion 이후 이벤트를 send(dict)로 전송 (timeoutSeconds 경과 또는 만료 시 종료)"""
+        timeout = float((query.get("timeoutSeconds") or ["30"])[0])
+        since = int((query.get("resourceVersion") or ["0"])[0] or 0)
+        deadline = time.time() + timeout
+
+        with self.changed:
+            self.requests.append(("WATCH", path))
+            if since and since < self.compacted_version:
+                send({"type": "ERROR", "object": self._status(410, "too old resource version")})
+                return
+            generation = self.watch_generation
+            cursor = next((i for i, event in enumerate(self.events) if event[0] > since), len(self.events)) \
+                if since else len(self.events)
+
+        while True:
+            with self.changed:
+                while cursor >= len(self.events) and not self._stopping \
+                        and generation == self.watch_generation and time.time() < deadline:
+                    self.changed.wait(min(0.2, max(deadline - time.time(), 0.01)))
+                if self._stopping or generation != self.watch_generation:
+                    return
+                batch = self.events[cursor:]
+                cursor = len(self.events)
+
+            for _, event_type, key, obj in batch:
+                if self._in_collection(path, key) and self._matches_selector(obj, query):
+                    send({"type": event_type, "object": obj})
+            if time.time() >= deadline:
+                return
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # watch 스트림은 chunked 전송 필요
+
+            def _stream_watch(self, parsed):
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+
+                def send(event: Dict[str, Any]):
+                    data = (json.dumps(event) + "\n").encode("utf-8")
+                    self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                    self.wfile.flush()
+
+                try:
+                    server.watch(parsed.path.rstrip("/"), parse_qs(parsed.query), send)
+                    self.wfile.write(b"0\r\n\r\n")
+                    self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    self.close_connection = True
+
+            def _dispatch(self, method: str):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                body = json.loads(raw) if raw else None
+                parsed = urlparse(self.path)
+                if method == "GET" and parse_qs(parsed.query).get("watch") in (["true"], ["True"], ["1"]):
+                    self._stream_watch(parsed)
+                    return
+                status, payload = server.handle(method, self.path, body, self.headers.get("Content-Type"))
+                data = json.dumps(payload).encode("utf-8")
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def do_GET(self):
+                self._dispatch("GET")
+
+            def do_POST(self):
+                self._dispatch("POST")
+
+            def do_PUT(self):
+                self._dispatch("PUT")
+
+            def do_PATCH(self):
+                self._dispatch("PATCH")
+
+            def do_DELETE(self):
+                self._dispatch("DELETE")
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,112 @@
+# [advice from AI] ECP-AI 알림 집계기 테스트
+"""
+AlertAggregator 테스트
+- 지문 단위 반복 알림 합치기 (발생 횟수, 최근 발생 시각)
+- 집계 창 만료 후 새 알림
+- 새 지문 발생 속도 제한 (critical 예외)
+- DB 반영 변경분 및 중복 제거 비율
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+import sys
+sys.path.append('/app')
+from app.core.alert_aggregator import AlertAggregator, alert_fingerprint, NEW, FOLDED, SUPPRESSED
+
+BASE_TIME = datetime(2026, 1, 1, 12, 0, 0)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _alert(alert_id: str, tenant_id: str = "acme", severity: str = "warning", title: str = "CPU 사용률 급증",
+           seconds: int = 0) -> dict:
+    return {"alert_id": alert_id, "tenant_id": tenant_id, "service_name": "api-backend", "category": "resource",
+            "title": title, "severity": severity, "timestamp": BASE_TIME + timedelta(seconds=seconds)}
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestAlertAggregator:
+    """알림 집계기 테스트 클래스"""
+
+    def test_repeats_fold_into_open_alert(self, clock):
+        """같은 지문은 하나의 열린 알림으로 합쳐지고 횟수/최근 시각 갱신"""
+        # Given
+        aggregator = AlertAggregator(window=60, clock=clock)
+
+        # When
+        first = aggregator.ingest(_alert("a1"))
+        clock.now = 10
+        repeats = [aggregator.ingest(_alert(f"a{i}", seconds=i)) for i in range(2, 6)]
+        other = aggregator.ingest(_alert("b1", tenant_id="globex"))
+
+        # Then
+        assert first.outcome == NEW
+        assert {r.outcome for r in repeats} == {FOLDED}
+        assert repeats[-1].alert["alert_id"] == "a1"
+        assert first.alert["occurrence_count"] == 5
+        assert first.alert["last_seen_at"] == BASE_TIME + timedelta(seconds=5)
+        assert other.outcome == NEW
+        assert first.fingerprint != other.fingerprint == alert_fingerprint(_alert("x", tenant_id="globex"))
+
+    def test_window_expiry_opens_new_alert(self, clock):
+        """집계 창이 지나면 같은 지문도 새 알림"""
+        # Given
+        aggregator = AlertAggregator(window=60, clock=clock)
+        aggregator.ingest(_alert("a1"))
+
+        # When
+        clock.now = 61
+        result = aggregator.ingest(_alert("a2"))
+
+        # Then
+        assert result.outcome == NEW
+        assert result.alert["alert_id"] == "a2"
+
+    def test_new_fingerprints_are_rate_limited_except_critical(self, clock):
+        """새 지문은 순간 허용량 초과 시 버리고, 시간이 지나면 다시 허용"""
+        # Given
+        aggregator = AlertAggregator(window=60, new_per_minute=60, burst=3, clock=clock)
+
+        # When
+        outcomes = [aggregator.ingest(_alert(f"a{i}", title=f"t{i}")).outcome for i in range(5)]
+        critical = aggregator.ingest(_alert("c1", title="down", severity="critical")).outcome
+        clock.now = 1.0
+        refilled = aggregator.ingest(_alert("a9", title="t9")).outcome
+
+        # Then
+        assert outcomes == [NEW, NEW, NEW, SUPPRESSED, SUPPRESSED]
+        assert critical == NEW
+        assert refilled == NEW
+
+    def test_drain_updates_and_dedup_ratio(self, clock):
+        """합쳐진 알림만 DB 반영 대상, 만료된 알림의 미반영분도 포함"""
+        # Given
+        aggregator = AlertAggregator(window=60, clock=clock)
+        aggregator.ingest(_alert("a1"))
+        aggregator.ingest(_alert("a2"))
+        aggregator.ingest(_alert("b1", tenant_id="globex"))
+
+        # When
+        updates = aggregator.drain_updates()
+        aggregator.ingest(_alert("b2", tenant_id="globex"))
+        clock.now = 120
+        aggregator.ingest(_alert("c1", tenant_id="initech"))  # 만료 처리 유발
+
+        # Then
+        assert updates == [{"b_alert_id": "a1", "b_count": 2, "b_last_seen": BASE_TIME}]
+        assert aggregator.drain_updates() == [{"b_alert_id": "b1", "b_count": 2, "b_last_seen": BASE_TIME}]
+        assert aggregator.drain_updates() == []
+        assert aggregator.dedup_ratio() == pytest.approx(2 / 5)
+        assert aggregator.status()["open_fingerprints"] == 1
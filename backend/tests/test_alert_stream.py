@@ -0,0 +1,161 @@
+# [advice from AI] ECP-AI 알림 조회 스트림 테스트
+"""
+알림 조회 스트림 테스트
+- 커서 인코딩/디코딩
+- keyset 쿼리 (동일 timestamp 경계 포함, 임시 SQLite 파일 대상)
+- 메모리/DB 병합 및 중복 제거
+- 개수 캐시
+- 알림 목록 API 커서 전용 계약 (cursor 없는 page>1 거부)
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import sys
+sys.path.append('/app')
+from app.core.alert_stream import (
+    AlertCountCache, alert_sort_key, decode_cursor, encode_cursor, keyset_query, merge_alert_pages, recent_page
+)
+from app.models.database import Alert, Base
+
+BASE_TIME = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _alert(alert_id: str, minutes: int, severity: str = "warning") -> dict:
+    return {"alert_id": alert_id, "timestamp": BASE_TIME + timedelta(minutes=minutes), "severity": severity}
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'alerts.db'}")
+    Base.metadata.create_all(engine, tables=[Alert.__table__])
+    session = sessionmaker(bind=engine)()
+    # 같은 timestamp를 공유하는 알림 포함 (페이지 경계 검증)
+    for i in range(30):
+        session.add(Alert(alert_id=f"db-{i:02d}", title="t", message="m",
+                          severity="critical" if i % 3 == 0 else "warning", category="system",
+                          timestamp=BASE_TIME + timedelta(minutes=i // 2)))
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+class TestAlertCursor:
+    """커서 및 정렬 키 테스트 클래스"""
+
+    def test_cursor_round_trip(self):
+        """커서 인코딩 후 같은 정렬 키로 복원"""
+        key = (BASE_TIME, "alert_1234")
+        assert decode_cursor(encode_cursor(key)) == key
+
+    def test_invalid_cursor_raises_value_error(self):
+        """형식이 잘못된 커서는 ValueError"""
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+    def test_sort_key_normalizes_timezones(self):
+        """aware/문자열 timestamp도 naive UTC로 비교"""
+        aware = {"alert_id": "a", "timestamp": datetime(2026, 1, 1, 21, 0, tzinfo=timezone(timedelta(hours=9)))}
+        text = {"alert_id": "a", "timestamp": "2026-01-01T12:00:00Z"}
+        assert alert_sort_key(aware) == alert_sort_key(text) == (BASE_TIME, "a")
+
+
+class TestKeysetPagination:
+    """keyset 페이지네이션 테스트 클래스"""
+
+    def test_pages_cover_all_rows_without_gaps(self, db):
+        """커서로 끝까지 조회하면 모든 알림을 중복/누락 없이 정렬 순서대로 반환"""
+        # Given
+        seen, after = [], None
+
+        # When
+        while True:
+            rows = db.scalars(keyset_query([], after, 8)).all()
+            page, has_more = merge_alert_pages([], [{"alert_id": r.alert_id, "timestamp": r.timestamp} for r in rows], 7)
+            seen.extend(a["alert_id"] for a in page)
+            if not has_more:
+                break
+            after = alert_sort_key(page[-1])
+
+        # Then
+        assert len(seen) == 30
+        assert len(set(seen)) == 30
+        assert seen[:3] == ["db-29", "db-28", "db-27"]
+
+    def test_filters_apply_with_cursor(self, db):
+        """필터 조건과 커서를 함께 적용"""
+        # When
+        rows = db.scalars(keyset_query([Alert.severity == "critical"], (BASE_TIME + timedelta(minutes=6), "db-12"), 100)).all()
+
+        # Then
+        assert [r.alert_id for r in rows] == ["db-09", "db-06", "db-03", "db-00"]
+
+
+class TestAlertMerge:
+    """메모리/DB 알림 병합 테스트 클래스"""
+
+    def test_merge_interleaves_and_deduplicates(self):
+        """두 스트림을 정렬 순서로 병합하고 같은 alert_id는 한 번만 포함"""
+        # Given
+        memory = [_alert("m-2", 20), _alert("dup", 15), _alert("m-1", 5)]
+        stored = [_alert("dup", 15), _alert("d-2", 10), _alert("d-1", 1)]
+
+        # When
+        page, has_more = merge_alert_pages(memory, stored, 4)
+
+        # Then
+        assert [a["alert_id"] for a in page] == ["m-2", "dup", "d-2", "m-1"]
+        assert has_more is True
+        assert merge_alert_pages(memory, stored, 5)[1] is False
+
+    def test_recent_page_filters_and_respects_cursor(self):
+        """메모리 알림도 필터/커서 조건 적용 후 상위 N개만"""
+        # Given
+        recent = [_alert(f"m-{i}", i, "critical" if i % 2 else "info") for i in range(10)]
+
+        # When
+        page = recent_page(recent, lambda a: a["severity"] == "critical", (BASE_TIME + timedelta(minutes=7), "m-7"), 2)
+
+        # Then
+        assert [a["alert_id"] for a in page] == ["m-5", "m-3"]
+
+
+class TestAlertListContract:
+    """알림 목록 API 커서 전용 계약 테스트 클래스"""
+
+    def test_page_without_cursor_is_rejected(self):
+        """cursor 없이 page>1 요청은 400 (조용히 첫 페이지를 돌려주지 않음)"""
+        from fastapi import HTTPException
+        from app.api.v1.alerts import get_alerts
+
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(get_alerts(page=2, page_size=50, severity=None, category=None, tenant_id=None,
+                                   status=None, include_recent=True, cursor=None, db=None))
+
+        assert error.value.status_code == 400
+        assert "cursor" in error.value.detail
+
+
+class TestAlertCountCache:
+    """알림 개수 캐시 테스트 클래스"""
+
+    def test_count_is_cached_until_invalidated(self):
+        """TTL 내에는 캐시된 개수 사용, invalidate 후 재조회"""
+        # Given
+        cache = AlertCountCache(ttl=60)
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            return len(calls) * 10
+
+        # When / Then
+        assert asyncio.run(cache.get("all", loader)) == 10
+        assert asyncio.run(cache.get("all", loader)) == 10
+        cache.invalidate()
+        assert asyncio.run(cache.get("all", loader)) == 20
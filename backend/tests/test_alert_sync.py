@@ -0,0 +1,166 @@
+# [advice from AI] ECP-AI 시뮬레이터 알림 증분 동기화 테스트
+"""
+SimulatorAlertSync 테스트 (가짜 시뮬레이터 클라이언트 + 임시 SQLite 파일)
+- since-id 커서 기반 증분 조회 및 배치 단위 저장
+- 중복 알림 제거
+- 메모리 테넌시 인덱스 기반 테넌시 매핑
+- 재시작 시 DB에서 커서 복원
+- 집계기 연동 시 반복 알림 합치기
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+import sys
+sys.path.append('/app')
+from app.models.database import Alert, Base, Tenant
+from app.core.alert_aggregator import AlertAggregator
+from app.services.alert_sync import SimulatorAlertSync, TenantIndex
+
+
+class FakeSimulatorClient:
+    """since_id 조회를 지원하는 가짜 시뮬레이터 클라이언트"""
+
+    def __init__(self):
+        self.alerts = []
+        self.requests = []
+
+    def add(self, count: int, **fields):
+        start = len(self.alerts) + 1
+        for alert_id in range(start, start + count):
+            self.alerts.append({
+                "id": alert_id, "type": "cpu_high", "severity": "warning", "service": "api-backend",
+                "message": "CPU 사용률이 90%를 초과했습니다", "resolved": False,
+                "timestamp": (datetime(2026, 1, 1) + timedelta(seconds=alert_id)).isoformat(), **fields
+            })
+
+    async def get_alerts_since(self, since_id: int, limit: int = 500):
+        self.requests.append(since_id)
+        return [a for a in self.alerts if a["id"] > since_id][:limit]
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'alerts.db'}")
+    Base.metadata.create_all(engine, tables=[Tenant.__table__, Alert.__table__])
+    factory = sessionmaker(bind=engine)
+    with factory() as db:
+        for tenant_id in ("acme", "globex"):
+            db.add(Tenant(tenant_id=tenant_id, name=f"{tenant_id} corp", preset="micro", status="running",
+                          service_requirements={}, resources={}, sla_target={}))
+        db.commit()
+    yield factory
+    engine.dispose()
+
+
+@pytest.fixture
+def client():
+    return FakeSimulatorClient()
+
+
+def _alert_count(session_factory) -> int:
+    with session_factory() as db:
+        return db.scalar(select(func.count(Alert.id)))
+
+
+class TestSimulatorAlertSync:
+    """시뮬레이터 알림 증분 동기화 테스트 클래스"""
+
+    def test_incremental_sync_in_batches(self, client, session_factory):
+        """커서 이후 알림만 배치 단위로 가져와 저장"""
+        # Given
+        received = []
+        sync = SimulatorAlertSync(client=client, session_factory=session_factory, batch_size=10,
+                                  on_alerts=received.extend)
+        client.add(25)
+
+        # When
+        first = asyncio.run(sync.sync_once())
+        client.add(3)
+        second = asyncio.run(sync.sync_once())
+
+        # Then
+        assert first == 25
+        assert second == 3
+        assert sync.cursor == 28
+        assert client.requests == [0, 10, 20, 25]
+        assert _alert_count(session_factory) == 28
+        assert len(received) == 28
+
+    def test_duplicates_are_skipped(self, client, session_factory):
+        """이미 저장된 알림은 다시 저장하지 않음"""
+        # Given
+        client.add(5)
+        sync = SimulatorAlertSync(client=client, session_factory=session_factory)
+        asyncio.run(sync.sync_once())
+
+        # When - 커서가 되돌아가도 DB/메모리 집합으로 중복 제거
+        sync.cursor = 0
+        inserted = asyncio.run(sync.sync_once())
+        restarted = SimulatorAlertSync(client=client, session_factory=session_factory)
+        restarted.cursor = 0
+        inserted_after_restart = asyncio.run(restarted.sync_once())
+
+        # Then
+        assert inserted == 0
+        assert inserted_after_restart == 0
+        assert _alert_count(session_factory) == 5
+
+    def test_cursor_is_restored_from_database(self, client, session_factory):
+        """재시작 시 마지막 저장 알림 id부터 이어서 조회"""
+        # Given
+        client.add(7)
+        asyncio.run(SimulatorAlertSync(client=client, session_factory=session_factory).sync_once())
+        client.requests.clear()
+
+        # When
+        restarted = SimulatorAlertSync(client=client, session_factory=session_factory)
+        inserted = asyncio.run(restarted.sync_once())
+
+        # Then
+        assert inserted == 0
+        assert client.requests == [7]
+
+    def test_tenant_resolution_uses_index(self, client, session_factory):
+        """알림의 테넌시/네임스페이스로 매핑, 테넌시 정보가 없거나 등록되지 않은 테넌시면 tenant_id 없음"""
+        # Given
+        client.add(1, namespace="globex-ecp-ai")
+        client.add(1, tenant_id="acme")
+        client.add(2)
+        client.add(1, namespace="initech-ecp-ai")
+        sync = SimulatorAlertSync(client=client, session_factory=session_factory)
+
+        # When
+        asyncio.run(sync.sync_once())
+
+        # Then
+        with session_factory() as db:
+            tenants = dict(db.execute(select(Alert.alert_id, Alert.tenant_id)).all())
+        assert tenants == {"k8s-sim-1": "globex", "k8s-sim-2": "acme", "k8s-sim-3": None,
+                           "k8s-sim-4": None, "k8s-sim-5": None}
+
+    def test_repeated_alerts_fold_with_aggregator(self, client, session_factory):
+        """집계기 연동 시 같은 지문의 반복 알림은 한 행으로 합쳐짐"""
+        # Given
+        client.add(5, namespace="acme-ecp-ai")
+        aggregator = AlertAggregator(window=60)
+        sync = SimulatorAlertSync(client=client, session_factory=session_factory, aggregator=aggregator)
+
+        # When
+        inserted = asyncio.run(sync.sync_once())
+
+        # Then
+        assert inserted == 1
+        assert sync.stats["aggregated"] == 4
+        assert _alert_count(session_factory) == 1
+        assert [u["b_count"] for u in aggregator.drain_updates()] == [5]
+
+    def test_empty_tenant_index_leaves_alert_unassigned(self):
+        """테넌시가 없으면 시스템 알림으로 처리"""
+        index = TenantIndex()
+        index.load([])
+        assert index.resolve({"id": 3}) is None
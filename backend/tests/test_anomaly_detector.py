@@ -0,0 +1,107 @@
+# [advice from AI] ECP-AI 메트릭 이상 탐지기 테스트
+"""
+AnomalyDetector 테스트
+- 학습 전에는 판정하지 않음
+- 전체 기준선 대비 급등 탐지 및 해제 (0으로 평탄한 기준선 포함)
+- 시간대별 기준선 (평소 높은 시간대는 이상 아님)
+- 시계열별 상태 조회
+"""
+
+import random
+import time
+
+import sys
+sys.path.append('/app')
+from app.core.anomaly_detector import AnomalyDetector
+
+HOUR = 3600.0
+
+
+def _at(hour: int, minute: int = 0) -> float:
+    """로컬 시간 기준 특정 시각의 epoch (시간대 버킷 고정용)"""
+    return time.mktime((2026, 1, 5, hour, minute, 0, 0, 0, -1))
+
+
+def _sample(value: float, service_name: str = "acme-callbot") -> dict:
+    return {"tenant_id": "acme", "service_name": service_name, "response_time": value}
+
+
+def _train(detector: AnomalyDetector, base: float, hour: int, count: int, seed: int = 1):
+    rng = random.Random(seed)
+    for i in range(count):
+        detector.update([_sample(base + rng.uniform(-5, 5))], now=_at(hour) + i)
+
+
+class TestAnomalyDetector:
+    """이상 탐지기 테스트 클래스"""
+
+    def test_no_detection_before_warmup(self):
+        """최소 표본 수 전에는 급등해도 판정하지 않음"""
+        detector = AnomalyDetector(metrics=("response_time",), min_samples=10)
+        _train(detector, 100, hour=10, count=5)
+
+        assert detector.update([_sample(1000)], now=_at(10, 30)) == []
+
+    def test_spike_fires_and_clears(self):
+        """기준선 대비 급등 시 발생, 평소 수준으로 돌아오면 해제"""
+        # Given
+        detector = AnomalyDetector(metrics=("response_time",), min_samples=10)
+        _train(detector, 100, hour=10, count=50)
+
+        # When
+        fired = detector.update([_sample(400)], now=_at(10, 30))
+        cleared = detector.update([_sample(100)], now=_at(10, 31))
+
+        # Then
+        assert [(t.previous, t.current) for t in fired] == [("ok", "critical")]
+        assert fired[0].z_score >= 5
+        assert 95 <= fired[0].expected <= 105
+        assert fired[0].key == ("acme", "acme-callbot", "response_time", "anomaly")
+        assert [(t.previous, t.current) for t in cleared] == [("critical", "ok")]
+
+    def test_spike_from_flat_zero_baseline(self):
+        """0으로 평탄한 기준선(분산 0)에서도 급등 탐지, 작은 흔들림은 무시"""
+        # Given
+        detector = AnomalyDetector(metrics=("error_rate",), min_samples=10)
+        for i in range(30):
+            detector.update([{"tenant_id": "acme", "service_name": "acme-callbot", "error_rate": 0.0}],
+                            now=_at(10) + i)
+
+        # When
+        wobble = detector.update([{"tenant_id": "acme", "service_name": "acme-callbot", "error_rate": 0.1}],
+                                 now=_at(10, 30))
+        spike = detector.update([{"tenant_id": "acme", "service_name": "acme-callbot", "error_rate": 60.0}],
+                                now=_at(10, 31))
+
+        # Then
+        assert wobble == []
+        assert [(t.previous, t.current) for t in spike] == [("ok", "critical")]
+        assert spike[0].z_score >= 5
+
+    def test_seasonal_baseline_accepts_daily_ramp(self):
+        """업무 시간대에 평소 높은 값은 그 시간대 기준선으로 판단"""
+        # Given - 새벽엔 낮고 오전 9시엔 높은 패턴 학습
+        detector = AnomalyDetector(metrics=("response_time",), min_samples=10)
+        _train(detector, 50, hour=3, count=50)
+        _train(detector, 300, hour=9, count=50, seed=2)
+
+        # When
+        morning = detector.update([_sample(305)], now=_at(9, 30))
+        night = detector.update([_sample(305)], now=_at(3, 30))
+
+        # Then
+        assert morning == []
+        assert [t.current for t in night] == ["critical"]
+
+    def test_series_state_for_debugging(self):
+        """시계열별 기준선/상태 조회, 메트릭이 없는 시계열은 기준선 유지"""
+        detector = AnomalyDetector(metrics=("cpu", "response_time"), min_samples=10)
+        _train(detector, 100, hour=10, count=20)
+
+        state = detector.series_state("acme", "acme-callbot", hour=10)
+
+        assert state["metrics"]["response_time"]["hourly_baseline"]["samples"] == 20
+        assert 95 <= state["metrics"]["response_time"]["baseline"]["mean"] <= 105
+        assert state["metrics"]["cpu"]["baseline"]["samples"] == 0
+        assert detector.series_state("acme", "unknown") is None
+        assert detector.status()["series"] == 1
@@ -0,0 +1,180 @@
+# [advice from AI] ECP-AI DeploymentMonitor 테스트
+"""
+DeploymentMonitor 테스트 (로컬 가짜 API 서버 대상)
+- Deployment watch 이벤트 기반 헬스 평가 및 감지 지연
+- 헬스에 영향 없는 변경은 재평가 생략
+- 메트릭 캐시 크기 제한 및 삭제 이벤트 반영
+"""
+
+import asyncio
+import time
+
+import pytest
+
+import sys
+sys.path.append('/app')
+from app.core.deployment_monitor import DeploymentMonitor, DeploymentHealth
+from app.core.image_version_tracker import ImageVersionTracker
+from app.core.k8s_orchestrator import K8sOrchestrator
+from tests.fake_k8s_api import FakeK8sApiServer
+
+DEPLOYMENTS = "/apis/apps/v1/namespaces/acme-ecp-ai/deployments"
+
+
+@pytest.fixture
+def fake_api():
+    """가짜 Kubernetes API 서버"""
+    server = FakeK8sApiServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def orchestrator(fake_api):
+    """watch 캐시를 사용하는 오케스트레이터"""
+    orchestrator = K8sOrchestrator(configuration=fake_api.configuration(), max_workers=4, request_timeout=2.0,
+                                   use_watch_cache=True)
+    yield orchestrator
+    if orchestrator.watch_cache:
+        orchestrator.watch_cache.stop()
+
+
+@pytest.fixture
+def image_tracker(tmp_path):
+    return ImageVersionTracker(db_path=str(tmp_path / "image_versions.db"))
+
+
+def _deployment(name: str, replicas: int = 2, ready: int = 2):
+    return {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {"name": name, "generation": 1,
+                     "labels": {"app": name, "app.kubernetes.io/managed-by": "ecp-orchestrator"}},
+        "spec": {
+            "replicas": replicas,
+            "selector": {"matchLabels": {"app": name}},
+            "template": {"metadata": {"labels": {"app": name}},
+                         "spec": {"containers": [{"name": name, "image": f"ecp-ai/{name}:v1"}]}}
+        },
+        "status": {"observedGeneration": 1, "replicas": replicas, "availableReplicas": ready,
+                   "readyReplicas": ready, "updatedReplicas": replicas}
+    }
+
+
+async def _eventually(predicate, timeout: float = 3.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        await asyncio.sleep(0.02)
+    return False
+
+
+class TestDeploymentMonitor:
+    """이벤트 기반 DeploymentMonitor 테스트 클래스"""
+
+    async def _start(self, monitor: DeploymentMonitor, orchestrator: K8sOrchestrator):
+        task = asyncio.create_task(monitor.start_monitoring())
+        assert await orchestrator.start_watch_cache().wait_for_sync(5.0)
+        await asyncio.sleep(0.1)
+        return task
+
+    async def _stop(self, monitor: DeploymentMonitor, task: asyncio.Task):
+        monitor.stop_monitoring()
+        await asyncio.wait_for(task, timeout=5.0)
+
+    @pytest.mark.asyncio
+    async def test_failed_rollout_detected_from_watch_event(self, orchestrator, image_tracker, fake_api):
+        """레플리카가 하나도 준비되지 않은 배포를 이벤트 수신 즉시 CRITICAL로 감지"""
+        # Given
+        await orchestrator.create_namespace("acme", "micro")
+        monitor = DeploymentMonitor(orchestrator, image_tracker)
+        task = await self._start(monitor, orchestrator)
+
+        # When
+        fake_api.put_object(f"{DEPLOYMENTS}/callbot", _deployment("callbot", replicas=2, ready=0))
+        detected = await _eventually(lambda: "acme-ecp-ai:callbot" in monitor.deployment_cache)
+
+        # Then
+        assert detected
+        metrics = monitor.deployment_cache["acme-ecp-ai:callbot"]
+        assert metrics.health_status == DeploymentHealth.CRITICAL
+        assert metrics.image_version == "v1"
+        assert monitor.last_detection_latency_ms < 1000
+        await self._stop(monitor, task)
+
+    @pytest.mark.asyncio
+    async def test_only_changed_deployments_are_evaluated(self, orchestrator, image_tracker, fake_api):
+        """헬스 관련 필드가 같은 MODIFIED 이벤트는 재평가 생략"""
+        # Given
+        await orchestrator.create_namespace("acme", "micro")
+        for name in ("callbot", "chatbot", "advisor"):
+            fake_api.put_object(f"{DEPLOYMENTS}/{name}", _deployment(name))
+        monitor = DeploymentMonitor(orchestrator, image_tracker)
+        task = await self._start(monitor, orchestrator)
+        assert await _eventually(lambda: monitor.stats["evaluated"] == 3)
+        await monitor.wait_idle()
+        unchanged_before = monitor.stats["unchanged"]
+
+        # When - 라벨만 변경 / 레플리카 준비 상태 변경
+        relabeled = _deployment("callbot")
+        relabeled["metadata"]["labels"]["team"] = "voice"
+        fake_api.put_object(f"{DEPLOYMENTS}/callbot", relabeled)
+        fake_api.put_object(f"{DEPLOYMENTS}/chatbot", _deployment("chatbot", replicas=2, ready=1))
+        await _eventually(lambda: monitor.stats["evaluated"] == 4
+                          and monitor.stats["unchanged"] == unchanged_before + 1)
+        await monitor.wait_idle()
+
+        # Then
+        assert monitor.stats["evaluated"] == 4
+        assert monitor.stats["unchanged"] == unchanged_before + 1
+        assert monitor.deployment_cache["acme-ecp-ai:chatbot"].health_status == DeploymentHealth.WARNING
+        await self._stop(monitor, task)
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded_and_follows_deletes(self, orchestrator, image_tracker, fake_api):
+        """캐시 최대 크기 유지 및 삭제된 배포 제거"""
+        # Given
+        await orchestrator.create_namespace("acme", "micro")
+        monitor = DeploymentMonitor(orchestrator, image_tracker, max_cache_size=3)
+        task = await self._start(monitor, orchestrator)
+
+        # When
+        for i in range(5):
+            fake_api.put_object(f"{DEPLOYMENTS}/svc{i}", _deployment(f"svc{i}"))
+        await _eventually(lambda: monitor.stats["evaluated"] == 5)
+        await monitor.wait_idle()
+
+        # Then
+        assert len(monitor.deployment_cache) == 3
+        assert monitor.stats["evicted"] == 2
+
+        # When
+        await orchestrator.delete_tenant("acme")
+        emptied = await _eventually(lambda: len(monitor.deployment_cache) == 0)
+
+        # Then
+        assert emptied
+        await self._stop(monitor, task)
+
+    @pytest.mark.asyncio
+    async def test_polling_mode_evaluates_concurrently(self, fake_api, image_tracker):
+        """watch 캐시 미사용 시 전체 점검도 동시 평가"""
+        # Given
+        orchestrator = K8sOrchestrator(configuration=fake_api.configuration(), max_workers=8, request_timeout=2.0,
+                                       use_watch_cache=False)
+        await orchestrator.create_namespace("acme", "micro")
+        for i in range(6):
+            fake_api.put_object(f"{DEPLOYMENTS}/svc{i}", _deployment(f"svc{i}"))
+        fake_api.delays["GET /apis/apps/v1/namespaces/acme-ecp-ai/deployments/svc"] = 0.2
+        monitor = DeploymentMonitor(orchestrator, image_tracker, workers=6)
+
+        # When
+        started = time.perf_counter()
+        await monitor._monitor_deployments()
+        elapsed = time.perf_counter() - started
+
+        # Then
+        assert len(monitor.deployment_cache) == 6
+        assert elapsed < 0.8
+        assert monitor.get_health_summary()["healthy"] == 6
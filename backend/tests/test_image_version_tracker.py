@@ -0,0 +1,219 @@
+# [advice from AI] ECP-AI ImageVersionTracker 테스트
+"""
+ImageVersionTracker 테스트 (임시 SQLite 파일 대상)
+- 일괄 등록/기록 API
+- 히스토리 정렬 및 롤백 후보 조회
+- 배치 단위 정리 작업
+- 다중 스레드 동시 쓰기 (잠금 오류 없음)
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+import sys
+sys.path.append('/app')
+from app.core.image_version_tracker import (
+    ImageVersionTracker, ImageVersion, ImageStatus, DeploymentRecord, DeploymentStatus
+)
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = ImageVersionTracker(db_path=str(tmp_path / "image_versions.db"))
+    yield tracker
+    tracker.close()
+
+
+def _image(service_name: str, tag: str, built: datetime, status: ImageStatus = ImageStatus.READY) -> ImageVersion:
+    return ImageVersion(
+        id=f"{service_name}-{tag}",
+        service_name=service_name,
+        image_name=f"ecp-ai/{service_name}",
+        image_tag=tag,
+        full_image_name=f"registry.local/ecp-ai/{service_name}:{tag}",
+        git_commit="abc1234",
+        git_branch="main",
+        build_timestamp=built,
+        status=status,
+        metadata={"pipeline": "ci"}
+    )
+
+
+def _deployment(record_id: str, image_version_id: str, deployed: datetime,
+                status: DeploymentStatus = DeploymentStatus.SUCCESS) -> DeploymentRecord:
+    return DeploymentRecord(
+        id=record_id,
+        tenant_id="acme",
+        service_name="callbot",
+        image_version_id=image_version_id,
+        deployment_timestamp=deployed,
+        status=status,
+        namespace="acme-ecp-ai",
+        replicas=2
+    )
+
+
+class TestImageVersionTracker:
+    """ImageVersionTracker 저장소 테스트 클래스"""
+
+    def test_bulk_register_and_query(self, tracker):
+        """일괄 등록 후 최신 빌드 순 조회"""
+        # Given
+        now = datetime.now()
+        images = [_image("callbot", f"v{i}", now - timedelta(minutes=10 - i)) for i in range(10)]
+
+        # When
+        registered = tracker.register_image_versions(images)
+        versions = tracker.get_image_versions("callbot", limit=3)
+
+        # Then
+        assert registered == 10
+        assert [v.image_tag for v in versions] == ["v9", "v8", "v7"]
+        assert versions[0].metadata == {"pipeline": "ci"}
+        assert tracker.register_image_versions([]) == 0
+
+    def test_batch_counts_distinct_ids(self, tracker):
+        """배치 안의 같은 ID는 한 행으로 저장되므로 한 번만 집계"""
+        now = datetime.now()
+        images = [_image("callbot", "v1", now), _image("callbot", "v1", now), _image("callbot", "v2", now)]
+
+        registered = tracker.register_image_versions(images)
+
+        assert registered == 2
+        assert len(tracker.get_image_versions("callbot", limit=10)) == 2
+
+    def test_history_and_rollback_candidate(self, tracker):
+        """배포 히스토리 정렬 및 최근 성공 이미지 롤백 후보"""
+        # Given
+        now = datetime.now()
+        tracker.register_image_versions([_image("callbot", tag, now) for tag in ("v1", "v2", "v3")])
+        recorded = tracker.record_deployments([
+            _deployment("d1", "callbot-v1", now - timedelta(hours=3)),
+            _deployment("d2", "callbot-v2", now - timedelta(hours=2)),
+            _deployment("d3", "callbot-v3", now - timedelta(hours=1), DeploymentStatus.FAILED),
+        ])
+
+        # When
+        history = tracker.get_deployment_history("acme", "callbot")
+        candidate = tracker.find_rollback_candidate("acme", "callbot")
+
+        # Then
+        assert recorded == 3
+        assert [r.id for r in history] == ["d3", "d2", "d1"]
+        assert history[0].status == DeploymentStatus.FAILED
+        assert candidate.image_tag == "v2"
+        assert tracker.find_rollback_candidate("acme", "chatbot") is None
+
+    def test_cleanup_deletes_in_batches(self, tracker):
+        """보존 기간 지난 비배포 이미지만 배치 단위로 삭제"""
+        # Given
+        old = datetime.now() - timedelta(days=60)
+        images = [_image("callbot", f"old{i}", old) for i in range(25)]
+        images.append(_image("callbot", "deployed", old, ImageStatus.DEPLOYED))
+        images.append(_image("callbot", "fresh", datetime.now()))
+        tracker.register_image_versions(images)
+
+        # When
+        deleted = tracker.cleanup_old_versions(days_to_keep=30, batch_size=10)
+
+        # Then
+        assert deleted == 25
+        remaining = {v.image_tag for v in tracker.get_image_versions("callbot", limit=100)}
+        assert remaining == {"deployed", "fresh"}
+
+    def test_concurrent_writers(self, tracker):
+        """여러 스레드 동시 기록 시 잠금 오류 없이 전부 저장"""
+        # Given
+        now = datetime.now()
+        tracker.register_image_version(_image("callbot", "v1", now))
+        errors = []
+
+        def writer(worker: int):
+            try:
+                for i in range(25):
+                    assert tracker.record_deployment(
+                        _deployment(f"w{worker}-{i}", "callbot-v1", now + timedelta(seconds=i))
+                    )
+            except (AssertionError, sqlite3.Error) as e:
+                errors.append(e)
+
+        # When
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Then
+        assert errors == []
+        assert len(tracker.get_deployment_history("acme", "callbot", limit=1000)) == 200
+
+
+class TestLastKnownGood:
+    """최근 정상 이미지 포인터 테스트 클래스"""
+
+    def test_pointer_follows_successful_deployments(self, tracker):
+        """성공 배포만 포인터 갱신, 늦게 도착한 과거 기록은 최신 포인터를 덮어쓰지 않음"""
+        # Given
+        now = datetime.now()
+        tracker.register_image_versions([_image("callbot", tag, now) for tag in ("v1", "v2", "v3")])
+
+        # When
+        tracker.record_deployment(_deployment("d2", "callbot-v2", now - timedelta(hours=2)))
+        tracker.record_deployment(_deployment("d3", "callbot-v3", now - timedelta(hours=1), DeploymentStatus.FAILED))
+        tracker.record_deployment(_deployment("d1", "callbot-v1", now - timedelta(hours=3)))
+
+        # Then
+        assert tracker.find_rollback_candidate("acme", "callbot").image_tag == "v2"
+        assert [v.image_tag for v in tracker.get_last_known_good("acme", "callbot")] == ["v2", "v1"]
+
+    def test_depth_limit_and_cleanup_protection(self, tmp_path):
+        """포인터는 최근 N개만 유지하고, 롤백 대상 이미지는 정리 작업에서 보호"""
+        # Given
+        tracker = ImageVersionTracker(db_path=str(tmp_path / "lkg.db"), last_known_good_depth=2)
+        old = datetime.now() - timedelta(days=60)
+        tracker.register_image_versions([_image("callbot", f"v{i}", old) for i in range(4)])
+
+        # When
+        tracker.record_deployments([
+            _deployment(f"d{i}", f"callbot-v{i}", old + timedelta(minutes=i)) for i in range(4)
+        ])
+        deleted = tracker.cleanup_old_versions(days_to_keep=30)
+
+        # Then
+        assert [v.image_tag for v in tracker.get_last_known_good("acme", "callbot")] == ["v3", "v2"]
+        assert deleted == 2
+        assert tracker.find_rollback_candidate("acme", "callbot").image_tag == "v3"
+        tracker.close()
+
+    def test_backfill_and_fleet_report(self, tmp_path):
+        """기존 DB는 배포 기록에서 포인터 재구성, 전체 롤백 리포트 제공"""
+        # Given - 포인터 테이블 없이 기록된 기존 DB
+        db_path = str(tmp_path / "legacy.db")
+        tracker = ImageVersionTracker(db_path=db_path)
+        now = datetime.now()
+        tracker.register_image_versions([_image("callbot", tag, now) for tag in ("v1", "v2")])
+        tracker.record_deployments([
+            _deployment("d1", "callbot-v1", now - timedelta(hours=2)),
+            _deployment("d2", "callbot-v2", now - timedelta(hours=1), DeploymentStatus.FAILED),
+        ])
+        with tracker.pool.transaction() as conn:
+            conn.execute("DROP TABLE last_known_good")
+        tracker.close()
+
+        # When
+        reopened = ImageVersionTracker(db_path=db_path)
+        report = reopened.get_rollback_report()
+
+        # Then
+        assert reopened.find_rollback_candidate("acme", "callbot").image_tag == "v1"
+        assert len(report) == 1
+        assert report[0]["target_image_version_id"] == "callbot-v1"
+        assert report[0]["current_image_version_id"] == "callbot-v2"
+        assert report[0]["current_status"] == "failed"
+        assert report[0]["would_change"] is True
+        assert reopened.get_rollback_report("other") == []
+        reopened.close()
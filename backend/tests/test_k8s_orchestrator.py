@@ -0,0 +1,510 @@
+# [advice from AI] ECP-AI K8sOrchestrator 테스트
+"""
+K8sOrchestrator 테스트 (로컬 가짜 API 서버 대상)
+- 네임스페이스/쿼터/네트워크 정책 생성 및 상태 조회
+- 스레드 풀 오프로드로 이벤트 루프가 블로킹되지 않는지 검증
+- 호출별 타임아웃 동작 검증
+- DAG 기반 병렬 프로비저닝 (의존성 순서, 롤백, 크리티컬 패스)
+- watch 캐시 기반 상태 조회 (메모리 조회, 변경 반영, 만료 시 재동기화, 이전 라벨/생성기 매니페스트 포함)
+- diff 기반 server-side apply (변경 리소스만 패치, dry-run, 플릿 적용)
+"""
+
+import asyncio
+import time
+
+import pytest
+
+import sys
+sys.path.append('/app')
+from app.core.k8s_orchestrator import K8sOrchestrator
+from tests.fake_k8s_api import FakeK8sApiServer
+
+
+@pytest.fixture
+def fake_api():
+    """가짜 Kubernetes API 서버"""
+    server = FakeK8sApiServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def orchestrator(fake_api):
+    """가짜 API 서버에 연결된 오케스트레이터"""
+    return K8sOrchestrator(configuration=fake_api.configuration(), max_workers=4, request_timeout=2.0,
+                           use_watch_cache=False)
+
+
+@pytest.fixture
+def cached_orchestrator(fake_api):
+    """watch 캐시를 사용하는 오케스트레이터"""
+    orchestrator = K8sOrchestrator(configuration=fake_api.configuration(), max_workers=4, request_timeout=2.0,
+                                   use_watch_cache=True)
+    yield orchestrator
+    if orchestrator.watch_cache:
+        orchestrator.watch_cache.stop()
+
+
+def _deployment(name: str, replicas: int = 2):
+    return {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {"name": name, "labels": {"app": name}},
+        "spec": {
+            "replicas": replicas,
+            "selector": {"matchLabels": {"app": name}},
+            "template": {"metadata": {"labels": {"app": name}},
+                         "spec": {"containers": [{"name": name, "image": f"{name}:v1"}]}}
+        },
+        "status": {"replicas": replicas, "availableReplicas": replicas, "readyReplicas": replicas}
+    }
+
+
+def _service_config(scaling: bool = True):
+    return {
+        "enabled": True,
+        "count": 1,
+        "type": "main",
+        "container_specs": {
+            "image": "ecp-ai/callbot:v1",
+            "ports": [{"containerPort": 8080}],
+            "resources": {"requests": {"cpu": "500m", "memory": "1Gi"}}
+        },
+        "resource_requirements": {},
+        "scaling": {"enabled": scaling, "min_replicas": 1, "max_replicas": 4}
+    }
+
+
+class TestK8sOrchestrator:
+    """K8sOrchestrator 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_health_check(self, orchestrator):
+        """클러스터 버전 조회로 연결 확인"""
+        assert await orchestrator.health_check() is True
+
+    @pytest.mark.asyncio
+    async def test_create_namespace_creates_quota_and_policy(self, orchestrator, fake_api):
+        """네임스페이스 생성 시 리소스 쿼터와 네트워크 정책 함께 생성"""
+        # When
+        created = await orchestrator.create_namespace("acme", "small")
+        created_again = await orchestrator.create_namespace("acme", "small")
+
+        # Then
+        assert created is True
+        assert created_again is True  # 409는 이미 존재로 처리
+        assert "/api/v1/namespaces/acme-ecp-ai" in fake_api.objects
+        assert "/api/v1/namespaces/acme-ecp-ai/resourcequotas/ecp-ai-quota" in fake_api.objects
+        assert "/apis/networking.k8s.io/v1/namespaces/acme-ecp-ai/networkpolicies/ecp-ai-network-policy" in fake_api.objects
+        labels = fake_api.objects["/api/v1/namespaces/acme-ecp-ai"]["metadata"]["labels"]
+        assert labels["app.kubernetes.io/managed-by"] == "ecp-orchestrator"
+
+    @pytest.mark.asyncio
+    async def test_get_tenant_status_and_delete(self, orchestrator, fake_api):
+        """테넌시 상태 조회 후 삭제하면 None 반환"""
+        # Given
+        await orchestrator.create_namespace("acme", "micro")
+        fake_api.put_object("/apis/apps/v1/namespaces/acme-ecp-ai/deployments/callbot", _deployment("callbot"))
+
+        # When
+        status = await orchestrator.get_tenant_status("acme")
+        deleted = await orchestrator.delete_tenant("acme")
+        status_after = await orchestrator.get_tenant_status("acme")
+
+        # Then
+        assert status["namespace"] == "acme-ecp-ai"
+        assert status["services"][0]["name"] == "callbot"
+        assert status["services"][0]["status"] == "Running"
+        assert deleted is True
+        assert status_after is None
+
+    @pytest.mark.asyncio
+    async def test_slow_api_does_not_block_event_loop(self, orchestrator, fake_api):
+        """느린 API 응답 중에도 이벤트 루프는 계속 동작"""
+        # Given
+        await orchestrator.create_namespace("acme", "micro")
+        fake_api.delays["GET /api/v1/namespaces/acme-ecp-ai"] = 0.5
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.02)
+                ticks += 1
+
+        # When
+        ticker_task = asyncio.create_task(ticker())
+        started = time.perf_counter()
+        results = await asyncio.gather(*(orchestrator.get_tenant_status("acme") for _ in range(4)))
+        elapsed = time.perf_counter() - started
+        ticker_task.cancel()
+
+        # Then
+        assert all(r is not None for r in results)
+        assert elapsed < 1.5  # 4개 호출이 스레드 풀에서 병렬 처리
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_call_timeout(self, fake_api):
+        """호출별 타임아웃 초과 시 504로 처리되어 None 반환"""
+        # Given
+        orchestrator = K8sOrchestrator(configuration=fake_api.configuration(), max_workers=2, request_timeout=0.3,
+                                       use_watch_cache=False)
+        fake_api.delays["GET /api/v1/namespaces/slow-ecp-ai"] = 2.0
+
+        # When
+        started = time.perf_counter()
+        status = await orchestrator.get_tenant_status("slow")
+        elapsed = time.perf_counter() - started
+
+        # Then
+        assert status is None
+        assert elapsed < 1.5
+        await orchestrator.close()
+
+
+class TestProvisioningPlanner:
+    """DAG 기반 테넌시 프로비저닝 테스트 클래스"""
+
+    NS = "/api/v1/namespaces/acme-ecp-ai"
+
+    def _services(self, count: int = 3):
+        return {f"svc{i}": _service_config() for i in range(count)}
+
+    @pytest.mark.asyncio
+    async def test_provision_respects_dependencies(self, orchestrator, fake_api):
+        """네임스페이스 → 쿼터/정책 → Deployment → HPA 순서 보장 및 전체 리소스 생성"""
+        # When
+        report = await orchestrator.provision_tenant("acme", "small", self._services(2), max_parallel=4)
+
+        # Then
+        assert report["status"] == "success"
+        assert f"{self.NS}/resourcequotas/ecp-ai-quota" in fake_api.objects
+        assert "/apis/apps/v1/namespaces/acme-ecp-ai/deployments/svc1" in fake_api.objects
+        assert "/apis/autoscaling/v2/namespaces/acme-ecp-ai/horizontalpodautoscalers/svc0-hpa" in fake_api.objects
+        assert f"{self.NS}/services/svc0-service" in fake_api.objects
+
+        posts = [path for method, path in fake_api.requests if method == "POST"]
+        assert posts[0] == "/api/v1/namespaces"
+        first_deployment = next(i for i, p in enumerate(posts) if p.endswith("/deployments"))
+        assert posts.index(f"{self.NS}/resourcequotas") < first_deployment
+        assert posts.index("/apis/networking.k8s.io/v1/namespaces/acme-ecp-ai/networkpolicies") < first_deployment
+
+        steps = {step["resource"]: step for step in report["steps"]}
+        assert steps["HorizontalPodAutoscaler/svc0-hpa"]["started_ms"] >= steps["Deployment/svc0"]["finished_ms"]
+        assert report["critical_path"]["steps"][0] == "Namespace/acme-ecp-ai"
+
+    @pytest.mark.asyncio
+    async def test_independent_objects_run_in_parallel(self, orchestrator, fake_api):
+        """독립 리소스는 병렬 생성되어 총 소요 시간이 순차 합보다 짧음"""
+        # Given
+        fake_api.delays["POST /apis/apps/v1/namespaces/acme-ecp-ai/deployments"] = 0.3
+
+        # When
+        report = await orchestrator.provision_tenant("acme", "small", self._services(4), max_parallel=4)
+
+        # Then
+        assert report["status"] == "success"
+        assert report["sequential_ms"] >= 1200
+        assert report["total_ms"] < 900
+        assert any(step.startswith("Deployment/") for step in report["critical_path"]["steps"])
+
+    @pytest.mark.asyncio
+    async def test_failure_rolls_back_new_namespace(self, orchestrator, fake_api):
+        """필수 리소스 실패 시 이번에 생성한 네임스페이스 삭제로 전체 롤백"""
+        # Given
+        fake_api.failures[("POST", "/deployments")] = 500
+
+        # When
+        report = await orchestrator.provision_tenant("acme", "small", self._services(2), max_parallel=2)
+
+        # Then
+        assert report["status"] == "rolled_back"
+        assert "Deployment/svc0" in report["failed"]
+        assert "Namespace/acme-ecp-ai" in report["rolled_back"]
+        assert self.NS not in fake_api.objects
+        assert not any("/namespaces/acme-ecp-ai/" in key for key in fake_api.objects)
+
+    @pytest.mark.asyncio
+    async def test_failure_keeps_existing_objects(self, orchestrator, fake_api):
+        """이미 존재하던 네임스페이스/쿼터는 유지하고 새로 만든 리소스만 롤백"""
+        # Given
+        await orchestrator.create_namespace("acme", "small")
+        fake_api.failures[("POST", "/horizontalpodautoscalers")] = 500
+
+        # When
+        report = await orchestrator.provision_tenant("acme", "small", self._services(1), max_parallel=2)
+
+        # Then
+        assert report["status"] == "rolled_back"
+        assert self.NS in fake_api.objects
+        assert f"{self.NS}/resourcequotas/ecp-ai-quota" in fake_api.objects
+        assert "/apis/apps/v1/namespaces/acme-ecp-ai/deployments/svc0" not in fake_api.objects
+        assert "Deployment/svc0" in report["rolled_back"]
+        assert "Namespace/acme-ecp-ai" not in report["rolled_back"]
+
+    @pytest.mark.asyncio
+    async def test_optional_service_monitor_failure_does_not_roll_back(self, orchestrator, fake_api):
+        """ServiceMonitor 실패(Prometheus Operator 미설치)는 롤백하지 않음"""
+        # Given
+        fake_api.failures[("POST", "/servicemonitors")] = 404
+
+        # When
+        report = await orchestrator.provision_tenant("acme", "micro", self._services(1))
+
+        # Then
+        assert report["status"] == "success"
+        assert report["failed"] == ["ServiceMonitor/svc0-monitor"]
+        assert "/apis/apps/v1/namespaces/acme-ecp-ai/deployments/svc0" in fake_api.objects
+
+
+async def _eventually(predicate, timeout: float = 3.0) -> bool:
+    """watch 이벤트 반영 대기"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if await predicate():
+            return True
+        await asyncio.sleep(0.05)
+    return False
+
+
+class TestWatchCache:
+    """watch 캐시 기반 테넌시 상태 조회 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_status_served_from_memory(self, cached_orchestrator, fake_api):
+        """동기화 후 상태 조회는 API 서버를 호출하지 않음"""
+        # Given
+        await cached_orchestrator.provision_tenant("acme", "small", {"callbot": _service_config(scaling=False)})
+        cache = cached_orchestrator.start_watch_cache()
+        assert await cache.wait_for_sync(5.0)
+        reads_before = fake_api.count("GET", "/namespaces/acme-ecp-ai")
+
+        # When
+        statuses = await asyncio.gather(*(cached_orchestrator.get_tenant_status("acme") for _ in range(50)))
+        missing = await cached_orchestrator.get_tenant_status("unknown")
+
+        # Then
+        assert all(s["services"][0]["name"] == "callbot" for s in statuses)
+        assert missing is None
+        assert fake_api.count("GET", "/namespaces/acme-ecp-ai") == reads_before
+
+    @pytest.mark.asyncio
+    async def test_watch_events_update_cache(self, cached_orchestrator, fake_api):
+        """Deployment 추가 및 네임스페이스 삭제가 캐시에 반영"""
+        # Given
+        await cached_orchestrator.create_namespace("acme", "micro")
+        assert await cached_orchestrator.start_watch_cache().wait_for_sync(5.0)
+        deployment = _deployment("advisor")
+        deployment["metadata"]["labels"]["app.kubernetes.io/managed-by"] = "ecp-orchestrator"
+
+        # When
+        fake_api.put_object("/apis/apps/v1/namespaces/acme-ecp-ai/deployments/advisor", deployment)
+
+        async def has_advisor():
+            status = await cached_orchestrator.get_tenant_status("acme")
+            return bool(status and [s["name"] for s in status["services"]] == ["advisor"])
+
+        # Then
+        assert await _eventually(has_advisor)
+
+        # When
+        await cached_orchestrator.delete_tenant("acme")
+
+        async def is_gone():
+            return await cached_orchestrator.get_tenant_status("acme") is None
+
+        # Then
+        assert await _eventually(is_gone)
+
+    @pytest.mark.asyncio
+    async def test_resync_after_watch_expiry(self, cached_orchestrator, fake_api):
+        """watch 만료(410) 시 재목록 후 변경 사항 계속 반영"""
+        # Given
+        await cached_orchestrator.create_namespace("acme", "micro")
+        cache = cached_orchestrator.start_watch_cache()
+        assert await cache.wait_for_sync(5.0)
+
+        async def watching():
+            return fake_api.count("WATCH", "/api/v1/namespaces") >= 1
+
+        assert await _eventually(watching)
+
+        # When
+        fake_api.expire_watches()
+        await cached_orchestrator.create_namespace("late", "micro")
+
+        async def has_late():
+            return await cached_orchestrator.get_tenant_status("late") is not None
+
+        # Then
+        assert await _eventually(has_late)
+        assert cache.namespaces.stats["expired"] >= 1
+        assert cache.namespaces.stats["lists"] >= 2
+
+    @pytest.mark.asyncio
+    async def test_legacy_label_served_from_cache(self, cached_orchestrator, fake_api):
+        """이전 라벨(ecp-ai-orchestrator) 테넌시도 캐시에서 조회, 없는 테넌시는 API 서버 조회 없이 None"""
+        # Given - 이전 매니페스트 생성기로 만든 네임스페이스와 Deployment
+        legacy_labels = {"app.kubernetes.io/managed-by": "ecp-ai-orchestrator"}
+        fake_api.put_object("/api/v1/namespaces/legacy-ecp-ai",
+                            {"metadata": {"name": "legacy-ecp-ai", "labels": dict(legacy_labels)}})
+        deployment = _deployment("callbot")
+        deployment["metadata"]["labels"].update(legacy_labels)
+        fake_api.put_object("/apis/apps/v1/namespaces/legacy-ecp-ai/deployments/callbot", deployment)
+        assert await cached_orchestrator.start_watch_cache().wait_for_sync(5.0)
+        reads_before = fake_api.count("GET", "/namespaces/")
+
+        # When
+        status = await cached_orchestrator.get_tenant_status("legacy")
+        deployments = await cached_orchestrator.list_deployments("legacy-ecp-ai")
+        missing = await cached_orchestrator.get_tenant_status("unknown")
+
+        # Then
+        assert [s["name"] for s in status["services"]] == ["callbot"]
+        assert deployments == ["callbot"]
+        assert missing is None
+        assert fake_api.count("GET", "/namespaces/") == reads_before
+
+    @pytest.mark.asyncio
+    async def test_generated_tenant_served_from_cache(self, cached_orchestrator, fake_api):
+        """ManifestGenerator로 만든 테넌시는 managed-by 라벨로 캐시에 포함되어 메모리에서 조회"""
+        # Given
+        from app.core.manifest_diff import resources_from_manifests
+        from app.core.manifest_generator import ManifestGenerator
+        from app.models.tenant_specs import TenantSpecs
+
+        specs = TenantSpecs(tenant_id="acme", preset="small", gpu_type="t4", total_channels=10, total_users=10,
+                            gpu_count=0, cpu_cores=4, memory_gb=8, storage_gb=100)
+        resources = resources_from_manifests(ManifestGenerator().generate_tenant_manifests(specs),
+                                             default_namespace="acme-ecp-ai")
+        deployment_names = sorted(r["metadata"]["name"] for r in resources if r["kind"] == "Deployment")
+        assert deployment_names
+        assert (await cached_orchestrator.apply_resources(resources))["summary"]["failed"] == 0
+        cache = cached_orchestrator.start_watch_cache()
+        assert await cache.wait_for_sync(5.0)
+
+        async def all_cached():
+            return len(cache.list_deployments("acme-ecp-ai")) == len(deployment_names)
+
+        assert await _eventually(all_cached)
+        reads_before = fake_api.count("GET", "/namespaces/acme-ecp-ai")
+
+        # When
+        status = await cached_orchestrator.get_tenant_status("acme")
+
+        # Then
+        assert [s["name"] for s in status["services"]] == deployment_names
+        assert fake_api.count("GET", "/namespaces/acme-ecp-ai") == reads_before
+
+
+class TestDeploymentQueries:
+    """Deployment 조회/롤백 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_list_and_get_deployment_info(self, orchestrator, fake_api):
+        """관리 네임스페이스/Deployment 목록 및 상태 정보 조회"""
+        # Given
+        await orchestrator.create_namespace("acme", "micro")
+        fake_api.put_object("/api/v1/namespaces/default", {"metadata": {"name": "default"}})
+        fake_api.put_object("/apis/apps/v1/namespaces/acme-ecp-ai/deployments/callbot", _deployment("callbot", 3))
+
+        # When
+        namespaces = await orchestrator.list_namespaces()
+        deployments = await orchestrator.list_deployments("acme-ecp-ai")
+        info = await orchestrator.get_deployment_info("callbot", "acme-ecp-ai")
+        missing = await orchestrator.get_deployment_info("nothing", "acme-ecp-ai")
+
+        # Then
+        assert namespaces == ["acme-ecp-ai"]
+        assert deployments == ["callbot"]
+        assert info["replicas_desired"] == 3
+        assert info["replicas_ready"] == 3
+        assert info["spec"]["template"]["spec"]["containers"][0]["image"] == "callbot:v1"
+        assert missing is None
+
+    @pytest.mark.asyncio
+    async def test_rollback_deployment(self, orchestrator, fake_api):
+        """메인 컨테이너 이미지를 롤백 이미지로 교체"""
+        # Given
+        path = "/apis/apps/v1/namespaces/acme-ecp-ai/deployments/callbot"
+        fake_api.put_object(path, _deployment("callbot"))
+
+        # When
+        rolled_back = await orchestrator.rollback_deployment("callbot", "acme-ecp-ai", "callbot:v0")
+        missing = await orchestrator.rollback_deployment("nothing", "acme-ecp-ai", "callbot:v0")
+
+        # Then
+        assert rolled_back is True
+        assert missing is False
+        template = fake_api.objects[path]["spec"]["template"]
+        assert template["spec"]["containers"][0]["image"] == "callbot:v0"
+        assert template["metadata"]["annotations"]["ecp.ai/rollback-from"] == "callbot:v1"
+
+
+def _tenant_resources(tenant: str, replicas: int = 2):
+    namespace = f"{tenant}-ecp-ai"
+    return [
+        {"apiVersion": "v1", "kind": "Namespace",
+         "metadata": {"name": namespace, "labels": {"app.kubernetes.io/managed-by": "ecp-orchestrator"}}},
+        {**_deployment("callbot", replicas), "metadata": {"name": "callbot", "namespace": namespace,
+                                                          "labels": {"app": "callbot"}}},
+        {"apiVersion": "v1", "kind": "Service",
+         "metadata": {"name": "callbot-service", "namespace": namespace},
+         "spec": {"selector": {"app": "callbot"}, "ports": [{"port": 80, "targetPort": 8080}]}},
+    ]
+
+
+class TestDiffApply:
+    """diff 기반 server-side apply 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_apply_only_changed_objects(self, orchestrator, fake_api):
+        """최초 적용은 생성, 재적용은 PATCH 없음, 변경된 리소스만 패치"""
+        # When
+        first = await orchestrator.apply_resources(_tenant_resources("acme"))
+        patches_after_first = fake_api.count("PATCH")
+        second = await orchestrator.apply_resources(_tenant_resources("acme"))
+        third = await orchestrator.apply_resources(_tenant_resources("acme", replicas=4))
+
+        # Then
+        assert first["summary"] == {"create": 3, "update": 0, "unchanged": 0, "failed": 0}
+        assert second["summary"]["unchanged"] == 3
+        assert second["changed"] is False
+        assert third["summary"]["update"] == 1
+        updated = next(o for o in third["objects"] if o["action"] == "update")
+        assert updated["resource"] == "Deployment/acme-ecp-ai/callbot"
+        assert updated["changed_fields"] == ["spec.replicas"]
+        assert fake_api.count("PATCH") == patches_after_first + 1
+        assert fake_api.objects["/apis/apps/v1/namespaces/acme-ecp-ai/deployments/callbot"]["spec"]["replicas"] == 4
+
+    @pytest.mark.asyncio
+    async def test_dry_run_does_not_persist(self, orchestrator, fake_api):
+        """dry-run은 변경 계획만 반환하고 저장하지 않음"""
+        # Given
+        await orchestrator.apply_resources(_tenant_resources("acme"))
+
+        # When
+        report = await orchestrator.apply_resources(_tenant_resources("acme", replicas=5), dry_run=True)
+
+        # Then
+        assert report["dry_run"] is True
+        assert [o["status"] for o in report["objects"] if o["action"] == "update"] == ["planned"]
+        assert fake_api.objects["/apis/apps/v1/namespaces/acme-ecp-ai/deployments/callbot"]["spec"]["replicas"] == 2
+
+    @pytest.mark.asyncio
+    async def test_fleet_apply_touches_changed_tenants_only(self, orchestrator, fake_api):
+        """플릿 적용 시 변경이 있는 테넌시만 패치"""
+        # Given
+        await orchestrator.apply_fleet({t: _tenant_resources(t) for t in ("acme", "globex", "initech")})
+
+        # When
+        report = await orchestrator.apply_fleet({
+            "acme": _tenant_resources("acme"),
+            "globex": _tenant_resources("globex", replicas=3),
+            "initech": _tenant_resources("initech"),
+        })
+
+        # Then
+        assert report["changed_tenants"] == ["globex"]
+        assert report["summary"] == {"create": 0, "update": 1, "unchanged": 8, "failed": 0}
@@ -0,0 +1,90 @@
+# [advice from AI] 매니페스트 diff 테스트
+"""
+manifest_diff 모듈 테스트
+- 서버 기본값/상태 필드 무시, 수량 단위 정규화 비교
+- API 경로 계산 및 ManifestGenerator 출력 변환
+"""
+
+import pytest
+
+import sys
+sys.path.append('/app')
+from app.core import manifest_diff
+
+
+def _deployment(replicas: int = 2, cpu: str = "500m"):
+    return {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {"name": "callbot", "namespace": "acme-ecp-ai", "labels": {"app": "callbot"}},
+        "spec": {
+            "replicas": replicas,
+            "template": {"spec": {"containers": [{
+                "name": "callbot",
+                "image": "ecp-ai/callbot:v1",
+                "ports": [{"containerPort": 8080}],
+                "resources": {"requests": {"cpu": cpu, "memory": "1Gi"}}
+            }]}}
+        }
+    }
+
+
+class TestManifestDiff:
+    """manifest_diff 기능 테스트 클래스"""
+
+    def test_live_defaults_and_status_are_ignored(self):
+        """서버가 추가한 필드와 status는 변경으로 보지 않음"""
+        # Given
+        desired = _deployment()
+        live = _deployment(cpu="0.5")
+        live["metadata"].update({"resourceVersion": "42", "uid": "abc"})
+        live["spec"]["strategy"] = {"type": "RollingUpdate"}
+        live["spec"]["template"]["spec"]["containers"][0]["resources"]["requests"]["memory"] = "1024Mi"
+        live["spec"]["template"]["spec"]["containers"][0]["ports"][0]["protocol"] = "TCP"
+        live["status"] = {"readyReplicas": 1}
+
+        # When / Then
+        assert manifest_diff.diff_object(desired, live) == []
+
+    def test_changed_fields_are_reported(self):
+        """레플리카/이미지/라벨 변경은 필드 경로로 보고"""
+        # Given
+        desired = _deployment(replicas=3)
+        desired["metadata"]["labels"]["tier"] = "gold"
+        desired["spec"]["template"]["spec"]["containers"][0]["image"] = "ecp-ai/callbot:v2"
+
+        # When
+        changes = manifest_diff.diff_object(desired, _deployment())
+
+        # Then
+        assert changes == [
+            "metadata.labels.tier",
+            "spec.replicas",
+            "spec.template.spec.containers[0].image",
+        ]
+
+    def test_resource_path(self):
+        """코어/그룹 API 및 클러스터 범위 리소스 경로"""
+        assert manifest_diff.resource_path(_deployment()) == \
+            "/apis/apps/v1/namespaces/acme-ecp-ai/deployments/callbot"
+        assert manifest_diff.resource_path({"apiVersion": "v1", "kind": "Namespace",
+                                            "metadata": {"name": "acme-ecp-ai"}}) == "/api/v1/namespaces/acme-ecp-ai"
+        with pytest.raises(ValueError):
+            manifest_diff.resource_path({"apiVersion": "v1", "kind": "Unknown", "metadata": {"name": "x"}})
+
+    def test_resources_from_manifests(self):
+        """YAML 파일만 파싱하고 네임스페이스 기본값 적용"""
+        # Given
+        manifests = {
+            "00-namespace.yaml": "apiVersion: v1\nkind: Namespace\nmetadata:\n  name: acme-ecp-ai\n",
+            "10-service.yaml": "apiVersion: v1\nkind: Service\nmetadata:\n  name: callbot\n---\n",
+            "deploy.sh": "#!/bin/bash\nkubectl apply -f .\n",
+        }
+
+        # When
+        resources = manifest_diff.resources_from_manifests(manifests, default_namespace="acme-ecp-ai")
+
+        # Then
+        assert [manifest_diff.object_key(r) for r in resources] == [
+            "Namespace/acme-ecp-ai", "Service/acme-ecp-ai/callbot"
+        ]
@@ -0,0 +1,119 @@
+# [advice from AI] ECP-AI 매니페스트 저장소 테스트
+"""
+매니페스트 저장소 테스트 (임시 SQLite 파일 대상)
+- 압축 저장 및 복원
+- 버전 증가 / 동일 내용 중복 저장 방지
+- 본문 지연 로딩 (목록 조회 시 본문 미로드)
+- 기존 manifest_content 컬럼 이전
+"""
+
+import json
+
+import pytest
+from sqlalchemy import create_engine, inspect, select, text
+from sqlalchemy.orm import sessionmaker
+
+import sys
+sys.path.append('/app')
+from app.models.database import Base, Tenant, TenantManifest
+from app.models.migration import migrate_manifest_storage
+from app.services.manifest_store import save_manifest_version, list_manifest_versions, load_manifest
+
+MANIFESTS = {
+    "01-namespace.yaml": "apiVersion: v1\nkind: Namespace\nmetadata:\n  name: acme-ecp-ai\n",
+    "02-callbot.yaml": "apiVersion: apps/v1\nkind: Deployment\n" + "# padding\n" * 200,
+}
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'ecp.db'}")
+    Base.metadata.create_all(engine, tables=[Tenant.__table__, TenantManifest.__table__])
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    session.add(Tenant(tenant_id="acme", preset="micro", status="running",
+                       service_requirements={}, resources={}, sla_target={}))
+    session.commit()
+    yield session
+    session.close()
+
+
+class TestManifestStore:
+    """매니페스트 버전 저장소 테스트 클래스"""
+
+    def test_save_and_load_round_trip(self, db):
+        """압축 저장 후 원본 그대로 복원"""
+        # When
+        manifest = save_manifest_version(db, "acme", MANIFESTS, created_by="api_user")
+        db.commit()
+
+        # Then
+        assert manifest.version == 1
+        assert manifest.file_count == 2
+        assert manifest.compressed_bytes < manifest.size_bytes
+        assert load_manifest(db, "acme") == MANIFESTS
+        assert load_manifest(db, "acme", version=1) == MANIFESTS
+        assert load_manifest(db, "acme", version=2) is None
+        assert load_manifest(db, "other") is None
+
+    def test_versions_increase_and_identical_content_is_deduplicated(self, db):
+        """내용이 바뀔 때만 새 버전 생성"""
+        # Given
+        changed = dict(MANIFESTS, **{"03-chatbot.yaml": "kind: Deployment\n"})
+
+        # When
+        first = save_manifest_version(db, "acme", MANIFESTS)
+        same = save_manifest_version(db, "acme", dict(reversed(MANIFESTS.items())))
+        second = save_manifest_version(db, "acme", changed)
+        db.commit()
+
+        # Then
+        assert same.id == first.id
+        assert second.version == 2
+        assert [v["version"] for v in list_manifest_versions(db, "acme")] == [2, 1]
+        assert load_manifest(db, "acme") == changed
+        assert load_manifest(db, "acme", version=1) == MANIFESTS
+
+    def test_content_and_legacy_columns_are_deferred(self, db):
+        """목록/테넌시 조회 시 매니페스트 본문은 로드하지 않음"""
+        # Given
+        save_manifest_version(db, "acme", MANIFESTS)
+        db.commit()
+        db.expunge_all()
+
+        # When
+        manifest = db.scalar(select(TenantManifest))
+        tenant = db.scalar(select(Tenant))
+
+        # Then
+        assert "content" not in manifest.__dict__
+        assert "manifest_content" not in tenant.__dict__
+        assert "description" not in tenant.__dict__
+        assert tenant.manifest_generated_at is not None
+
+
+class TestManifestStorageMigration:
+    """manifest_content 컬럼 이전 테스트 클래스"""
+
+    def test_legacy_manifest_moves_to_version_table(self, engine, db):
+        """기존 JSON 본문은 버전 1로 이전되고 원래 컬럼은 비움"""
+        # Given
+        db.execute(text("UPDATE tenants SET manifest_content = :content WHERE tenant_id = 'acme'"),
+                   {"content": json.dumps(MANIFESTS)})
+        db.commit()
+
+        # When
+        migrated = migrate_manifest_storage(engine)
+        migrated_again = migrate_manifest_storage(engine)
+
+        # Then
+        assert migrated == 1
+        assert migrated_again == 0
+        assert load_manifest(db, "acme", version=1) == MANIFESTS
+        assert db.execute(text("SELECT manifest_content FROM tenants")).scalar() is None
+        assert "tenant_manifests" in inspect(engine).get_table_names()
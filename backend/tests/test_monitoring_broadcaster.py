@@ -0,0 +1,124 @@
+# [advice from AI] ECP-AI 모니터링 WebSocket 공유 생산자 테스트
+"""
+MonitoringBroadcaster 테스트
+- 구독자 수와 관계없이 주기마다 한 번 계산/직렬화
+- 구독자가 없으면 생산 중지
+- 느린 구독자 큐는 크기 제한 (오래된 메시지 버림)
+- 계산 실패 시 오류 메시지 분배
+"""
+
+import asyncio
+import json
+
+import sys
+sys.path.append('/app')
+from app.core.monitoring_broadcaster import MonitoringBroadcaster
+
+
+def _counting_producer():
+    calls = []
+
+    async def produce():
+        calls.append(1)
+        return {"type": "monitoring_update", "tick": len(calls), "name": "테넌시"}
+
+    return produce, calls
+
+
+class TestMonitoringBroadcaster:
+    """공유 생산자 테스트 클래스"""
+
+    def test_one_computation_per_tick_for_all_subscribers(self):
+        """구독자 20명이어도 주기마다 한 번 계산, 같은 직렬화 문자열 전달"""
+        # Given
+        produce, calls = _counting_producer()
+        broadcaster = MonitoringBroadcaster(produce, interval=0.05)
+
+        async def scenario():
+            queues = [broadcaster.subscribe() for _ in range(20)]
+            first = [await queue.get() for queue in queues]
+            second = [await queue.get() for queue in queues]
+            for queue in queues:
+                broadcaster.unsubscribe(queue)
+            return first, second
+
+        # When
+        first, second = asyncio.run(scenario())
+
+        # Then
+        assert len(calls) == 2
+        assert len(set(first)) == 1 and len(set(second)) == 1
+        assert json.loads(first[0]) == {"type": "monitoring_update", "tick": 1, "name": "테넌시"}
+        assert json.loads(second[0])["tick"] == 2
+        assert broadcaster.stats["produced"] == 2
+
+    def test_idle_without_subscribers(self):
+        """마지막 구독 해제 시 생산 중지, 다시 구독하면 재시작 (직전 메시지 즉시 전달)"""
+        # Given
+        produce, calls = _counting_producer()
+        broadcaster = MonitoringBroadcaster(produce, interval=0.05)
+
+        async def scenario():
+            queue = broadcaster.subscribe()
+            await queue.get()
+            broadcaster.unsubscribe(queue)
+            await asyncio.sleep(0.15)
+            idle_calls = len(calls)
+            idle_status = broadcaster.status()
+
+            broadcaster.interval = 60
+            rejoined = broadcaster.subscribe()
+            latest = rejoined.get_nowait()
+            broadcaster.unsubscribe(rejoined)
+            return idle_calls, idle_status, latest
+
+        # When
+        idle_calls, idle_status, latest = asyncio.run(scenario())
+
+        # Then
+        assert idle_calls == 1
+        assert idle_status["running"] is False
+        assert idle_status["subscribers"] == 0
+        assert json.loads(latest)["tick"] == 1
+
+    def test_slow_subscriber_keeps_latest_messages(self):
+        """느린 구독자 큐는 크기 제한, 가장 오래된 메시지를 버림"""
+        # Given
+        produce, _ = _counting_producer()
+        broadcaster = MonitoringBroadcaster(produce, queue_size=2)
+
+        async def scenario():
+            queue = asyncio.Queue(maxsize=broadcaster.queue_size)
+            broadcaster._subscribers.add(queue)
+            for tick in range(1, 6):
+                broadcaster.publish(json.dumps({"tick": tick}))
+            return [json.loads(queue.get_nowait())["tick"] for _ in range(queue.qsize())]
+
+        # When
+        pending = asyncio.run(scenario())
+
+        # Then
+        assert pending == [4, 5]
+        assert broadcaster.stats["dropped"] == 3
+
+    def test_error_message_on_failure(self):
+        """계산 실패 시 오류 메시지를 구독자에게 전달"""
+        # Given
+        async def failing():
+            raise RuntimeError("simulator down")
+
+        broadcaster = MonitoringBroadcaster(failing, error_interval=60)
+
+        async def scenario():
+            queue = broadcaster.subscribe()
+            message = await queue.get()
+            broadcaster.unsubscribe(queue)
+            return json.loads(message)
+
+        # When
+        message = asyncio.run(scenario())
+
+        # Then
+        assert message["type"] == "error"
+        assert "simulator down" in message["message"]
+        assert broadcaster.stats["errors"] == 1
@@ -0,0 +1,88 @@
+# [advice from AI] ECP-AI 리소스 정수 단위 컬럼 테스트
+"""
+리소스 단위 변환 / 정수 컬럼 동기화 / 백필 마이그레이션 테스트
+- Kubernetes 수량 문자열 → 밀리코어, MiB
+- 모델 문자열 컬럼 쓰기 시 정수 컬럼 자동 동기화
+- 기존 테이블 컬럼 추가 및 배치 백필
+"""
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+import sys
+sys.path.append('/app')
+from app.models.database import Service, Tenant
+from app.models.migration import migrate_resource_units
+from app.models.resource_units import parse_cpu_millicores, parse_memory_mib
+
+
+class TestResourceUnits:
+    """리소스 단위 변환 테스트 클래스"""
+
+    @pytest.mark.parametrize("value, expected", [
+        ("4000m", 4000), ("4", 4000), ("0.5", 500), (2, 2000), ("", None), (None, None), ("abc", None),
+    ])
+    def test_parse_cpu_millicores(self, value, expected):
+        assert parse_cpu_millicores(value) == expected
+
+    @pytest.mark.parametrize("value, expected", [
+        ("8Gi", 8192), ("512Mi", 512), ("1G", 954), ("1.0TB", 953674), ("1Ti", 1048576), ("1048576", 1), ("x", None),
+    ])
+    def test_parse_memory_mib(self, value, expected):
+        assert parse_memory_mib(value) == expected
+
+    def test_model_columns_follow_string_fields(self):
+        """문자열 리소스 컬럼 쓰기 시 정수 컬럼 동기화"""
+        tenant = Tenant(tenant_id="acme", cpu_limit="8000m", memory_limit="16Gi", storage_limit="1.0TB")
+        service = Service(tenant_id="acme", service_name="callbot", cpu_request="500m", memory_request="1Gi")
+
+        tenant.cpu_limit = "12"
+
+        assert (tenant.cpu_millicores, tenant.memory_mib, tenant.storage_mib) == (12000, 16384, 953674)
+        assert (service.cpu_millicores, service.memory_mib) == (500, 1024)
+
+
+class TestResourceUnitsMigration:
+    """리소스 정수 단위 백필 마이그레이션 테스트 클래스"""
+
+    def test_adds_columns_and_backfills_in_batches(self, tmp_path):
+        # Given - 정수 컬럼이 없는 기존 스키마
+        engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE tenants (id INTEGER PRIMARY KEY, tenant_id VARCHAR(100), status VARCHAR(50), "
+                "preset VARCHAR(50), cpu_limit VARCHAR(50), memory_limit VARCHAR(50), storage_limit VARCHAR(50), "
+                "gpu_limit INTEGER)"
+            ))
+            conn.execute(text(
+                "CREATE TABLE services (id INTEGER PRIMARY KEY, tenant_id VARCHAR(100), service_name VARCHAR(100), "
+                "cpu_request VARCHAR(50), memory_request VARCHAR(50), gpu_request INTEGER)"
+            ))
+            conn.execute(text(
+                "INSERT INTO tenants (tenant_id, status, preset, cpu_limit, memory_limit, storage_limit, gpu_limit) "
+                "VALUES (:tenant_id, 'running', 'small', :cpu, '8Gi', '1.0TB', 1)"
+            ), [{"tenant_id": f"t{i}", "cpu": f"{(i + 1) * 1000}m"} for i in range(5)] + [
+                {"tenant_id": "broken", "cpu": "lots"}
+            ])
+            conn.execute(text(
+                "INSERT INTO services (tenant_id, service_name, cpu_request, memory_request, gpu_request) "
+                "VALUES ('t0', 'callbot', '500m', '512Mi', 0)"
+            ))
+
+        # When
+        backfilled = migrate_resource_units(bind=engine, batch_size=2)
+        again = migrate_resource_units(bind=engine, batch_size=2)
+
+        # Then
+        with engine.connect() as conn:
+            cpu_total, memory_total = conn.execute(text(
+                "SELECT SUM(cpu_millicores), SUM(memory_mib) FROM tenants WHERE status = 'running'"
+            )).one()
+            service = conn.execute(text("SELECT cpu_millicores, memory_mib FROM services")).one()
+        assert backfilled == 7
+        assert again == 1  # 해석 불가 cpu 값 행은 다시 검사만 하고 건너뜀
+        assert cpu_total == 15000
+        assert memory_total == 6 * 8192
+        assert tuple(service) == (500, 512)
+        assert "idx_tenant_status_capacity" in {i["name"] for i in inspect(engine).get_indexes("tenants")}
+        engine.dispose()
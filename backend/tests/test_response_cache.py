@@ -0,0 +1,201 @@
+# [advice from AI] ECP-AI 대시보드 응답 캐시 테스트
+"""
+cached_endpoint 테스트
+- 동시 요청은 계산 하나를 공유 (single-flight)
+- 유지 시간 이후 이전 응답 반환 + 백그라운드 재계산 한 번
+- 실패한 결과는 캐시하지 않음
+- Tenant 커밋 시 캐시 무효화 (임시 SQLite 파일)
+- 워커 스레드의 커밋 무효화가 이벤트 루프의 캐시 조회와 겹쳐도 오류 없음
+"""
+
+import asyncio
+import threading
+from collections import OrderedDict
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import sys
+sys.path.append('/app')
+from app.models.database import Base, Tenant
+from app.core.response_cache import TENANT_WRITE_TABLES, cached_endpoint
+
+
+def _counting_endpoint(delay: float = 0.01, **options):
+    calls = []
+
+    @cached_endpoint(**options)
+    async def endpoint(scope: str = "all"):
+        calls.append(scope)
+        version = len(calls)
+        await asyncio.sleep(delay)
+        return {"scope": scope, "version": version}
+
+    return endpoint, calls
+
+
+class TestResponseCache:
+    """응답 캐시 테스트 클래스"""
+
+    def test_concurrent_requests_share_one_computation(self):
+        """동시 요청 50개는 계산 한 번, 다른 인자는 별도 계산"""
+        # Given
+        endpoint, calls = _counting_endpoint(ttl=5)
+
+        async def scenario():
+            results = await asyncio.gather(*(endpoint() for _ in range(50)), endpoint(scope="acme"))
+            cached = await endpoint()
+            return results, cached
+
+        # When
+        results, cached = asyncio.run(scenario())
+
+        # Then
+        assert calls == ["all", "acme"]
+        assert all(result == {"scope": "all", "version": 1} for result in results[:50])
+        assert cached == {"scope": "all", "version": 1}
+        assert endpoint.cache.stats["miss"] == 2
+        assert endpoint.cache.stats["coalesced"] == 49
+        assert endpoint.cache.stats["hit"] == 1
+
+    def test_stale_while_revalidate(self):
+        """유지 시간이 지나면 이전 응답을 바로 주고 백그라운드에서 한 번만 재계산"""
+        # Given
+        endpoint, calls = _counting_endpoint(ttl=0.05, stale_ttl=5)
+
+        async def scenario():
+            first = await endpoint()
+            await asyncio.sleep(0.06)
+            stale = await asyncio.gather(endpoint(), endpoint(), endpoint())
+            await asyncio.sleep(0.03)
+            refreshed = await endpoint()
+            return first, stale, refreshed
+
+        # When
+        first, stale, refreshed = asyncio.run(scenario())
+
+        # Then
+        assert first["version"] == 1
+        assert [result["version"] for result in stale] == [1, 1, 1]
+        assert refreshed["version"] == 2
+        assert len(calls) == 2
+
+    def test_expired_entry_is_recomputed(self):
+        """이전 응답 허용 시간까지 지나면 요청이 새 계산을 기다림"""
+        endpoint, calls = _counting_endpoint(delay=0, ttl=0.01, stale_ttl=0)
+
+        async def scenario():
+            first = await endpoint()
+            await asyncio.sleep(0.02)
+            return first, await endpoint()
+
+        first, second = asyncio.run(scenario())
+
+        assert (first["version"], second["version"]) == (1, 2)
+
+    def test_errors_are_not_cached(self):
+        """실패는 기다리던 요청 모두에 전달되고 다음 요청은 다시 계산"""
+        # Given
+        calls = []
+
+        @cached_endpoint(ttl=5)
+        async def flaky():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            if len(calls) == 1:
+                raise RuntimeError("simulator down")
+            return {"ok": True}
+
+        async def scenario():
+            failures = await asyncio.gather(flaky(), flaky(), return_exceptions=True)
+            return failures, await flaky()
+
+        # When
+        failures, recovered = asyncio.run(scenario())
+
+        # Then
+        assert [type(error) for error in failures] == [RuntimeError, RuntimeError]
+        assert recovered == {"ok": True}
+        assert len(calls) == 2
+
+
+class _CommitDuringLookup(OrderedDict):
+    """캐시 항목 조회 직후 다른 스레드의 커밋 무효화가 끼어드는 저장소"""
+
+    def __init__(self, invalidate):
+        super().__init__()
+        self.invalidate = invalidate
+        self.armed = False
+        self.committer = None
+
+    def get(self, key, default=None):
+        value = super().get(key, default)
+        if self.armed:
+            self.armed = False
+            self.committer = threading.Thread(target=self.invalidate)
+            self.committer.start()
+            self.committer.join(timeout=0.2)  # 잠금으로 보호되면 조회가 끝날 때까지 대기
+        return value
+
+
+class TestResponseCacheInvalidation:
+    """테넌시 쓰기 시 무효화 테스트 클래스"""
+
+    @pytest.fixture
+    def session_factory(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'cache.db'}")
+        Base.metadata.create_all(engine, tables=[Tenant.__table__])
+        yield sessionmaker(bind=engine)
+        engine.dispose()
+
+    def test_committed_tenant_write_invalidates(self, session_factory):
+        """Tenant 커밋 시 관련 캐시만 무효화, 롤백은 무시"""
+        # Given
+        tenant_endpoint, tenant_calls = _counting_endpoint(delay=0, ttl=60, invalidate_on=TENANT_WRITE_TABLES)
+        other_endpoint, other_calls = _counting_endpoint(delay=0, ttl=60, invalidate_on=("alerts",))
+        asyncio.run(tenant_endpoint())
+        asyncio.run(other_endpoint())
+
+        # When - 롤백된 쓰기
+        with session_factory() as db:
+            db.add(Tenant(tenant_id="acme", name="acme", preset="small", service_requirements={},
+                          resources={}, sla_target={}))
+            db.flush()
+            db.rollback()
+        after_rollback = asyncio.run(tenant_endpoint())
+
+        # When - 커밋된 쓰기
+        with session_factory() as db:
+            db.add(Tenant(tenant_id="acme", name="acme", preset="small", service_requirements={},
+                          resources={}, sla_target={}))
+            db.commit()
+        after_commit = asyncio.run(tenant_endpoint())
+        asyncio.run(other_endpoint())
+
+        # Then
+        assert after_rollback["version"] == 1
+        assert after_commit["version"] == 2
+        assert len(other_calls) == 1
+        assert tenant_endpoint.cache.stats["invalidations"] == 1
+
+    def test_invalidate_from_worker_thread_during_lookup(self):
+        """조회와 이동(move_to_end) 사이에 워커 스레드 무효화가 들어와도 KeyError 없음"""
+        # Given
+        endpoint, calls = _counting_endpoint(delay=0, ttl=60)
+        cache = endpoint.cache
+        asyncio.run(endpoint())
+        entries = _CommitDuringLookup(cache.invalidate)
+        entries.update(cache._entries)
+        cache._entries = entries
+
+        # When
+        entries.armed = True
+        hit = asyncio.run(endpoint())
+        entries.committer.join()
+        after_invalidation = asyncio.run(endpoint())
+
+        # Then
+        assert hit == {"scope": "all", "version": 1}
+        assert cache.stats["invalidations"] == 1
+        assert after_invalidation == {"scope": "all", "version": 2}
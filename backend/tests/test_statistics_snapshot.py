@@ -0,0 +1,173 @@
+# [advice from AI] ECP-AI 통계 SQL 집계 및 스냅샷 캐시 테스트
+"""
+통계 집계/스냅샷 테스트 (임시 SQLite 파일)
+- GROUP BY 집계 결과 (리소스 합계, 서비스별 배포 수)
+- 스냅샷 캐시 적중 및 Tenant/Service 커밋 시 해당 구역만 무효화
+- 롤백된 쓰기는 무효화하지 않음
+- 워커 스레드의 무효화가 이벤트 루프의 조회/계산과 겹쳐도 오류 없음
+"""
+
+import asyncio
+import threading
+
+import pytest
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+
+import sys
+sys.path.append('/app')
+from app.models.database import Base, Service, Tenant
+from app.api.v1.statistics import _compute_resource_totals, _compute_service_totals, _compute_tenant_counts
+from app.core.stats_snapshot import StatsSnapshot, stats_snapshot
+
+
+def _tenant(tenant_id: str, preset: str = "small", status: str = "running", cpu: str = "4000m",
+            memory: str = "8Gi", gpu: int = 1) -> Tenant:
+    return Tenant(tenant_id=tenant_id, name=tenant_id, preset=preset, status=status, service_requirements={},
+                  resources={}, sla_target={}, cpu_limit=cpu, memory_limit=memory, gpu_limit=gpu,
+                  storage_limit="100Gi")
+
+
+def _service(tenant_id: str, name: str, cpu: str = "500m", memory: str = "512Mi") -> Service:
+    return Service(tenant_id=tenant_id, service_name=name, service_type="ai_service", image_name=f"ecp-ai/{name}",
+                   image_tag="latest", cpu_request=cpu, memory_request=memory)
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'stats.db'}")
+    Base.metadata.create_all(engine, tables=[Tenant.__table__, Service.__table__])
+    factory = sessionmaker(bind=engine)
+    with factory() as db:
+        db.add_all([
+            _tenant("acme"), _tenant("globex"), _tenant("initech", preset="large", cpu="16000m", gpu=4),
+            _tenant("stopped", status="stopped", gpu=8),
+            _service("acme", "callbot"), _service("acme", "chatbot"), _service("globex", "Callbot"),
+            _service("stopped", "callbot"),
+        ])
+        db.commit()
+    stats_snapshot.invalidate()
+    yield factory
+    engine.dispose()
+
+
+class TestStatisticsAggregates:
+    """통계 SQL 집계 테스트 클래스"""
+
+    def test_resource_totals(self, session_factory):
+        """실행 중 테넌시의 리소스 합계 (프리셋별 포함)"""
+        with session_factory() as db:
+            resources = _compute_resource_totals(db)
+
+        assert resources["totals"] == {"cpu": 24000, "memory": 3 * 8192, "gpu": 6, "storage": 300}
+        assert resources["by_preset"]["cpu"] == {"small": 8000, "medium": 0, "large": 16000}
+        assert resources["by_preset"]["gpu"]["large"] == 4
+
+    def test_service_and_tenant_counts(self, session_factory):
+        """서비스별 배포 수/테넌시 수, 상태별 테넌시 수"""
+        with session_factory() as db:
+            services = _compute_service_totals(db)
+            tenants = _compute_tenant_counts(db)
+
+        assert services["deployed_total"] == 3
+        assert services["service_details"]["callbot"] == {"deployed": 2, "tenants": 2,
+                                                         "resources": {"cpu": 1000, "memory": 1024}}
+        assert services["service_details"]["advisor"]["deployed"] == 0
+        assert {row["status"]: row["count"] for row in tenants["by_status"]} == {"running": 3, "stopped": 1}
+
+
+class TestStatsSnapshot:
+    """통계 스냅샷 캐시 테스트 클래스"""
+
+    def test_cached_until_section_invalidated(self):
+        """최신 구역은 캐시 사용, 무효화된 구역만 다시 계산"""
+        # Given
+        snapshot = StatsSnapshot(max_age=60)
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return {"value": len(calls)}
+
+        # When
+        first, first_meta = asyncio.run(snapshot.get("tenants", compute))
+        second, second_meta = asyncio.run(snapshot.get("tenants", compute))
+        snapshot.invalidate("services")
+        third, _ = asyncio.run(snapshot.get("tenants", compute))
+        snapshot.invalidate("tenants")
+        fourth, _ = asyncio.run(snapshot.get("tenants", compute))
+
+        # Then
+        assert (first, second, third, fourth) == ({"value": 1}, {"value": 1}, {"value": 1}, {"value": 2})
+        assert first_meta["cached"] is False
+        assert second_meta["cached"] is True
+        assert "computed_at" in second_meta
+
+    def test_invalidate_from_worker_threads(self):
+        """여러 워커 스레드가 무효화하는 동안 루프에서 조회/계산해도 오류 없이 마지막 무효화 반영"""
+        # Given
+        snapshot = StatsSnapshot(max_age=60)
+        sections = [f"section-{i}" for i in range(50)]
+        stop = threading.Event()
+
+        def committer():
+            while not stop.is_set():
+                snapshot.invalidate()
+                snapshot.status()
+
+        async def compute():
+            return {}
+
+        async def scenario():
+            for _ in range(20):
+                for section in sections:
+                    await snapshot.get(section, compute)
+
+        # When
+        workers = [threading.Thread(target=committer) for _ in range(2)]
+        for worker in workers:
+            worker.start()
+        try:
+            asyncio.run(scenario())
+        finally:
+            stop.set()
+            for worker in workers:
+                worker.join()
+        snapshot.invalidate()
+
+        # Then
+        assert sorted(snapshot.status()["dirty"]) == sorted(sections)
+        assert snapshot.stats["refreshes"] >= len(sections)
+
+    def test_committed_writes_invalidate_sections(self, session_factory):
+        """Tenant/Service 커밋 시 관련 구역 무효화, 롤백은 무시"""
+        # Given
+        async def compute():
+            return {}
+
+        for section in ("tenants", "resources", "services"):
+            asyncio.run(stats_snapshot.get(section, compute))
+
+        # When - 서비스 쓰기
+        with session_factory() as db:
+            db.add(_service("globex", "advisor"))
+            db.commit()
+        after_service_write = sorted(stats_snapshot.status()["dirty"])
+
+        for section in ("tenants", "resources", "services"):
+            asyncio.run(stats_snapshot.get(section, compute))
+
+        # When - 롤백된 테넌시 쓰기 후 일괄 update 커밋
+        with session_factory() as db:
+            db.add(_tenant("umbrella"))
+            db.flush()
+            db.rollback()
+        after_rollback = sorted(stats_snapshot.status()["dirty"])
+        with session_factory() as db:
+            db.execute(update(Tenant).where(Tenant.tenant_id == "acme").values(status="stopped"))
+            db.commit()
+
+        # Then
+        assert after_service_write == ["services"]
+        assert after_rollback == []
+        assert sorted(stats_snapshot.status()["dirty"]) == ["resources", "services", "tenants"]
@@ -0,0 +1,124 @@
+# [advice from AI] ECP-AI 임계값 규칙 엔진 테스트
+"""
+ThresholdEngine 테스트
+- 임계값 설정 → 규칙 열 컴파일
+- 지속 시간(for_seconds) 충족 후 발생
+- 히스테리시스 기반 해제
+- 변화율 조건
+- 다수 테넌시/서비스 일괄 평가
+"""
+
+import pytest
+
+import sys
+sys.path.append('/app')
+from app.core.threshold_engine import RATE, VALUE, ThresholdEngine, compile_rules
+from app.services.threshold_evaluator import samples_from_monitoring
+
+
+def _sample(value: float, tenant_id: str = "acme", service_name: str = "api-backend", metric: str = "cpu") -> dict:
+    return {"tenant_id": tenant_id, "service_name": service_name, metric: value}
+
+
+def _levels(transitions) -> list:
+    return [(t.previous, t.current) for t in transitions]
+
+
+class TestThresholdEngine:
+    """임계값 규칙 엔진 테스트 클래스"""
+
+    def test_compile_rules(self):
+        """값/변화율 조건을 각각 규칙 열로 컴파일"""
+        columns = compile_rules({
+            "cpu": {"warning": 80, "critical": 90, "rate_critical": 30, "for_seconds": 10},
+            "memory": {"critical": 95},
+            "description": "무시",
+        })
+
+        assert [(c.metric, c.kind) for c in columns] == [("cpu", VALUE), ("cpu", RATE), ("memory", VALUE)]
+        assert columns[1].warning == float("inf")
+        assert columns[0].for_seconds == 10
+
+    def test_for_duration_delays_firing(self):
+        """조건이 지속 시간 동안 유지되어야 발생, 중간에 벗어나면 다시 대기"""
+        # Given
+        engine = ThresholdEngine({"cpu": {"warning": 80, "critical": 90, "for_seconds": 30}})
+
+        # When / Then
+        assert engine.evaluate([_sample(85)], now=0) == []
+        assert engine.evaluate([_sample(70)], now=20) == []
+        assert engine.evaluate([_sample(85)], now=25) == []
+        assert engine.evaluate([_sample(85)], now=50) == []
+        fired = engine.evaluate([_sample(86)], now=55)
+        assert _levels(fired) == [("ok", "warning")]
+        assert fired[0].threshold == 80
+        assert fired[0].value == 86
+
+    def test_hysteresis_and_escalation(self):
+        """상향은 임계값 기준, 해제는 히스테리시스 적용 기준"""
+        # Given
+        engine = ThresholdEngine({"cpu": {"warning": 80, "critical": 90, "for_seconds": 0, "hysteresis": 10}})
+
+        # When / Then
+        assert _levels(engine.evaluate([_sample(95)], now=0)) == [("ok", "critical")]
+        assert engine.evaluate([_sample(85)], now=1) == []  # 90 x 0.9 = 81 이상이면 critical 유지
+        assert _levels(engine.evaluate([_sample(79)], now=2)) == [("critical", "warning")]
+        assert engine.evaluate([_sample(73)], now=3) == []  # 80 x 0.9 = 72 이상이면 warning 유지
+        resolved = engine.evaluate([_sample(70)], now=4)
+        assert _levels(resolved) == [("warning", "ok")]
+        assert not resolved[0].firing
+        assert resolved[0].threshold == 80
+
+    def test_rate_of_change(self):
+        """분당 증가량이 기준을 넘으면 발생, 값이 없는 틱은 상태 유지"""
+        # Given
+        engine = ThresholdEngine({"response_time": {"rate_critical": 100, "for_seconds": 0}})
+
+        # When
+        first = engine.evaluate([_sample(200, metric="response_time")], now=0)
+        spike = engine.evaluate([_sample(300, metric="response_time")], now=30)
+        missing = engine.evaluate([_sample(None, metric="response_time")], now=60)
+        flat = engine.evaluate([_sample(300, metric="response_time")], now=90)
+
+        # Then
+        assert first == []
+        assert _levels(spike) == [("ok", "critical")]
+        assert spike[0].value == pytest.approx(200.0)
+        assert missing == []
+        assert _levels(flat) == [("critical", "ok")]
+
+    def test_vectorized_evaluation_across_series(self):
+        """다수 테넌시/서비스를 한 틱에 평가하고 전이된 시계열만 반환"""
+        # Given
+        thresholds = {metric: {"warning": 80, "critical": 90, "for_seconds": 0}
+                      for metric in ("cpu", "memory", "gpu", "response_time", "error_rate")}
+        engine = ThresholdEngine(thresholds)
+        samples = [{"tenant_id": f"tenant-{i % 200}", "service_name": f"svc-{i}",
+                    **{metric: 50.0 for metric in thresholds}} for i in range(2000)]
+        engine.evaluate(samples, now=0)
+
+        # When
+        samples[7]["memory"] = 95.0
+        samples[1500]["cpu"] = 85.0
+        transitions = engine.evaluate(samples, now=5)
+
+        # Then
+        assert sorted((t.service_name, t.metric, t.current) for t in transitions) == [
+            ("svc-1500", "cpu", "warning"), ("svc-7", "memory", "critical")
+        ]
+        assert engine.last_tick["cells"] == 10000
+        assert engine.status()["firing"] == 2
+
+    def test_samples_from_monitoring(self):
+        """시뮬레이터 서비스 메트릭을 테넌시별 샘플로 변환"""
+        data = {"services": {
+            "acme-ecp-ai-callbot": {"cpu_usage": 50, "memory_percent": 60, "response_time": 120, "error_rate": 0.5},
+            "nginx": {"cpu_usage": 10},
+        }}
+
+        samples = samples_from_monitoring(data, ["acme", "acme-prod"])
+
+        assert samples[0]["tenant_id"] == "acme"
+        assert samples[0]["gpu"] == 40
+        assert samples[1]["tenant_id"] is None
+        assert "gpu" not in samples[1]
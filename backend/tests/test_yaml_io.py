@@ -0,0 +1,130 @@
+# [advice from AI] YAML 입출력 레이어 테스트
+"""
+yaml_io 모듈 테스트
+- 멀티 도큐먼트 스트리밍 파싱 / 직렬화 왕복 검증
+- 기존 yaml.dump 출력과의 호환성 검증
+- libyaml(C) / 순수 Python 백엔드 결과 동일성 검증 (처리량 측정은 scripts/bench_yaml.py)
+"""
+
+import pytest
+import yaml
+
+import sys
+sys.path.append('/app')
+from app.core import yaml_io
+
+
+def _tenant_bundle(tenant_index: int, service_count: int = 20):
+    """테스트용 테넌트 매니페스트 번들 생성 (Namespace + 서비스별 Deployment/Service/HPA)"""
+    namespace = f"tenant-{tenant_index:04d}-ecp-ai"
+    resources = [{
+        "apiVersion": "v1",
+        "kind": "Namespace",
+        "metadata": {"name": namespace, "labels": {"app.kubernetes.io/managed-by": "ecp-orchestrator"}}
+    }]
+    for i in range(service_count):
+        name = f"service-{i:02d}"
+        resources.append({
+            "apiVersion": "apps/v1",
+            "kind": "Deployment",
+            "metadata": {"name": name, "namespace": namespace, "labels": {"app": name}},
+            "spec": {
+                "replicas": 2,
+                "selector": {"matchLabels": {"app": name}},
+                "template": {
+                    "metadata": {"labels": {"app": name}},
+                    "spec": {
+                        "containers": [{
+                            "name": name,
+                            "image": f"ecp-ai/{name}:v1.2.{i}",
+                            "resources": {
+                                "requests": {"cpu": "500m", "memory": "1Gi"},
+                                "limits": {"cpu": "1000m", "memory": "2Gi"}
+                            },
+                            "env": [{"name": f"ENV_{k}", "value": f"value-{k}"} for k in range(10)]
+                        }]
+                    }
+                }
+            }
+        })
+        resources.append({
+            "apiVersion": "v1",
+            "kind": "Service",
+            "metadata": {"name": f"{name}-service", "namespace": namespace},
+            "spec": {"selector": {"app": name}, "ports": [{"port": 80, "targetPort": 8080}]}
+        })
+        resources.append({
+            "apiVersion": "autoscaling/v2",
+            "kind": "HorizontalPodAutoscaler",
+            "metadata": {"name": f"{name}-hpa", "namespace": namespace},
+            "spec": {"minReplicas": 2, "maxReplicas": 10}
+        })
+    return resources
+
+
+class TestYamlIO:
+    """yaml_io 기능 테스트 클래스"""
+
+    def test_dump_all_roundtrip(self):
+        """멀티 도큐먼트 직렬화 후 스트리밍 파싱 왕복"""
+        # Given
+        resources = _tenant_bundle(1, service_count=3)
+
+        # When
+        content = yaml_io.dump_all(resources)
+        parsed = list(yaml_io.iter_documents(content))
+
+        # Then
+        assert parsed == resources
+        assert content.count("\n---\n") == len(resources) - 1
+
+    def test_dump_matches_legacy_output(self):
+        """기존 yaml.dump(default_flow_style=False, allow_unicode=True) 출력과 동일"""
+        # Given
+        resource = {"metadata": {"name": "테넌트", "labels": {"a": "b"}}, "spec": {"replicas": 1}}
+
+        # When / Then
+        assert yaml_io.dump(resource) == yaml.dump(resource, default_flow_style=False, allow_unicode=True)
+
+    def test_load_all_skips_empty_and_scalar_documents(self):
+        """빈 도큐먼트와 스칼라 도큐먼트 제외"""
+        # Given
+        content = "---\nkind: Namespace\n---\n---\njust-a-string\n---\nkind: Service\n"
+
+        # When
+        docs = yaml_io.load_all(content)
+
+        # Then
+        assert [d["kind"] for d in docs] == ["Namespace", "Service"]
+
+    def test_join_documents(self):
+        """직렬화된 문서 연결 시 중복 구분자 제거"""
+        # When
+        joined = yaml_io.join_documents(["---\nkind: A\n", "kind: B\n", "  "])
+
+        # Then
+        assert joined == "kind: A\n---\nkind: B\n"
+        assert [d["kind"] for d in yaml_io.load_all(joined)] == ["A", "B"]
+
+    def test_invalid_yaml_raises_yaml_error(self):
+        """잘못된 YAML은 YAMLError 발생"""
+        with pytest.raises(yaml_io.YAMLError):
+            yaml_io.load_all("kind: [unclosed")
+
+
+class TestYamlBackends:
+    """libyaml / 순수 Python 백엔드 호환성 테스트 클래스"""
+
+    def test_backends_round_trip_identically(self):
+        """두 백엔드의 직렬화 결과가 같고, 서로의 출력을 같은 문서로 파싱"""
+        # Given
+        documents = [doc for i in range(2) for doc in _tenant_bundle(i, service_count=3)]
+
+        # When
+        pure = yaml.dump_all(documents, Dumper=yaml.SafeDumper, **yaml_io.DEFAULT_DUMP_OPTIONS)
+        accelerated = yaml_io.dump_all(documents)
+
+        # Then
+        assert accelerated == pure
+        assert list(yaml.load_all(accelerated, Loader=yaml.SafeLoader)) == documents
+        assert list(yaml_io.iter_documents(pure)) == documents
@@ -98,6 +98,7 @@ const AdvancedMonitoring: React.FC<{ isDemoMode?: boolean }> = ({ isDemoMode = t
   const [alertsPage, setAlertsPage] = useState(1);
   const [alertsLoading, setAlertsLoading] = useState(false);
   const [alertsHasMore, setAlertsHasMore] = useState(true);
+  const [alertsCursor, setAlertsCursor] = useState<string | null>(null);  // [advice from AI] keyset 페이지네이션 커서
   const [alertsTotal, setAlertsTotal] = useState(0);
   
   // WebSocket 상태 관리
@@ -348,7 +349,9 @@ const AdvancedMonitoring: React.FC<{ isDemoMode?: boolean }> = ({ isDemoMode = t
     try {
       setAlertsLoading(true);
       
-      const response = await fetch(`http://localhost:8001/api/v1/alerts/?page=${page}&page_size=50&include_recent=${page === 1}`);  // [advice from AI] 페이지 크기 20→50으로 증가
+      // [advice from AI] 다음 페이지는 이전 응답의 next_cursor로 조회 (OFFSET 미사용)
+      const cursorParam = append && page > 1 && alertsCursor ? `&cursor=${encodeURIComponent(alertsCursor)}` : '';
+      const response = await fetch(`http://localhost:8001/api/v1/alerts/?page=${page}&page_size=50${cursorParam}`);  // [advice from AI] 페이지 크기 20→50으로 증가
       
       if (response.ok) {
         const alertsData = await response.json();
@@ -363,6 +366,7 @@ const AdvancedMonitoring: React.FC<{ isDemoMode?: boolean }> = ({ isDemoMode = t
         }
         
         setAlertsHasMore(alertsData.has_more || false);
+        setAlertsCursor(alertsData.next_cursor || null);
         setAlertsTotal(alertsData.total_count || 0);
         setAlertsPage(page);
       } else {
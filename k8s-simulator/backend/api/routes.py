@@ -1,53 +1,29 @@
 # [advice from AI] FastAPI 라우터 정의 - K8S 시뮬레이터 및 모니터링 API 엔드포인트
-from fastapi import APIRouter, HTTPException, UploadFile, File, Depends, Query
+from fastapi import APIRouter, HTTPException, UploadFile, File, Depends, Query, Request
 from fastapi.responses import JSONResponse
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
+import asyncio
 import yaml
 import json
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
-# [advice from AI] 전역 알림 저장소 - 파일 기반 지속성
-import os
-import json
-from pathlib import Path
+# [advice from AI] 전역 알림 저장소 - SQLite(WAL) 추가 전용 로그 + 최근 알림 deque
+from core.alert_store import AlertStore
 
-ALERTS_FILE_PATH = "/tmp/k8s_simulator_alerts.json"
-GLOBAL_ALERTS = []
-ALERT_ID_COUNTER = 1
+ALERTS_FILE_PATH = "/tmp/k8s_simulator_alerts.json"  # 기존 JSON 저장 파일 (최초 1회 가져오기)
+_alert_store: Optional[AlertStore] = None
 
-def _load_alerts_from_file():
-    """파일에서 알림 데이터 로드"""
-    global GLOBAL_ALERTS, ALERT_ID_COUNTER
-    try:
-        if os.path.exists(ALERTS_FILE_PATH):
-            with open(ALERTS_FILE_PATH, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                GLOBAL_ALERTS = data.get('alerts', [])
-                ALERT_ID_COUNTER = data.get('counter', 1)
-                logger.info(f"알림 데이터 로드 완료: {len(GLOBAL_ALERTS)}개 알림, 카운터: {ALERT_ID_COUNTER}")
-        else:
-            logger.info("알림 파일이 존재하지 않음. 새로 시작합니다.")
-    except Exception as e:
-        logger.error(f"알림 데이터 로드 실패: {e}")
-        GLOBAL_ALERTS = []
-        ALERT_ID_COUNTER = 1
-
-def _save_alerts_to_file():
-    """알림 데이터를 파일에 저장"""
-    try:
-        data = {
-            'alerts': GLOBAL_ALERTS,
-            'counter': ALERT_ID_COUNTER,
-            'last_updated': datetime.now().isoformat()
-        }
-        with open(ALERTS_FILE_PATH, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    except Exception as e:
-        logger.error(f"알림 데이터 저장 실패: {e}")
+def get_alert_store() -> AlertStore:
+    """알림 저장소 인스턴스 반환 (최초 호출 시 열기)"""
+    global _alert_store
+    if _alert_store is None:
+        _alert_store = AlertStore(legacy_json_path=ALERTS_FILE_PATH)
+    return _alert_store
 
 # [advice from AI] 알림 유형별 메시지 템플릿
 ALERT_TEMPLATES = {
@@ -66,9 +42,6 @@ ALERT_TEMPLATES = {
 
 async def _create_alert(alert_type: str, service_name: str = "system", **kwargs):
     """통합 알림 생성 함수"""
-    global ALERT_ID_COUNTER
-    from datetime import datetime
-    
     if alert_type in ALERT_TEMPLATES:
         message_template, default_severity = ALERT_TEMPLATES[alert_type]
         message = message_template.format(**kwargs)
@@ -77,27 +50,16 @@ async def _create_alert(alert_type: str, service_name: str = "system", **kwargs)
         message = kwargs.get('message', f"알 수 없는 이벤트: {alert_type}")
         severity = kwargs.get('severity', 'info')
     
-    alert = {
-        "id": ALERT_ID_COUNTER,
-        "timestamp": datetime.now().isoformat(),
+    # [advice from AI] 메모리 큐에 추가만 하고 기록은 모니터링 틱의 flush가 모아서 수행 (루프에서 SQLite I/O 없음)
+    get_alert_store().append({
         "type": alert_type,
         "severity": severity,
         "service": service_name,
         "message": message,
         "resolved": kwargs.get('resolved', False),
         "resolution_time": kwargs.get('resolution_time', None)
-    }
-    
-    GLOBAL_ALERTS.append(alert)
-    ALERT_ID_COUNTER += 1
+    })
     logger.info(f"알림 생성 [{severity}]: {message}")
-    
-    # 최근 200개 알림만 보관 (더 많은 히스토리 유지)
-    if len(GLOBAL_ALERTS) > 200:
-        GLOBAL_ALERTS.pop(0)
-    
-    # [advice from AI] 파일에 저장하여 지속성 확보
-    _save_alerts_to_file()
 
 async def _create_tenant_deletion_alert(tenant_id: str, deleted_count: int):
     """테넌시 삭제 알림 생성"""
@@ -133,12 +95,11 @@ async def _generate_system_alerts():
         logger.info(f"자동 알림 생성: {alert_type} for {service}")
 
 async def _initialize_base_alerts():
-    """기본 알림 히스토리 초기화 (한 번만 실행)"""
-    # [advice from AI] 먼저 파일에서 기존 알림 로드
-    _load_alerts_from_file()
+    """기본 알림 히스토리 초기화 (저장된 알림이 5개 미만일 때만)"""
+    store = get_alert_store()
+    stored = await asyncio.to_thread(store.count)
     
-    # 파일에서 로드한 알림이 없거나 5개 미만이면 기본 알림 생성
-    if len(GLOBAL_ALERTS) < 5:
+    if stored < 5:
         from datetime import datetime, timedelta
         
         # 과거 알림들 생성 (시간순으로)
@@ -150,30 +111,36 @@ async def _initialize_base_alerts():
             {"type": "maintenance_end", "service": "system", "message": "시스템 유지보수가 완료되었습니다", "severity": "info", "resolved": True, "hours_ago": 1},
         ]
         
-        global ALERT_ID_COUNTER
         for alert_data in base_alerts:
             hours_ago = alert_data.pop("hours_ago")
             timestamp = datetime.now() - timedelta(hours=hours_ago)
-            
-            alert = {
-                "id": ALERT_ID_COUNTER,
-                "timestamp": timestamp.isoformat(),
-                **alert_data
-            }
-            GLOBAL_ALERTS.append(alert)
-            ALERT_ID_COUNTER += 1
-        
-        # 파일에 저장
-        _save_alerts_to_file()
+            store.append({"timestamp": timestamp.isoformat(), **alert_data})
+        
+        await asyncio.to_thread(store.flush)
         logger.info(f"기본 알림 히스토리 초기화: {len(base_alerts)}개 알림 생성")
     else:
-        logger.info(f"기존 알림 히스토리 로드: {len(GLOBAL_ALERTS)}개 알림")
+        logger.debug(f"기존 알림 히스토리 사용: {stored}개 알림")
 
 # Pydantic 모델 정의
 class ManifestRequest(BaseModel):
     manifest: str
     namespace: Optional[str] = "default"
 
+class ManifestApplyRequest(BaseModel):
+    manifest: str
+    tenant_id: Optional[str] = None
+    namespace: Optional[str] = None  # metadata.namespace가 없는 리소스의 기본 네임스페이스 (kubectl -n)
+    deployment_mode: Optional[str] = None  # production/demo - 리소스 어노테이션으로 기록
+
+class BulkTenantManifest(BaseModel):
+    tenant_id: str
+    manifest: str
+
+class BulkDeployRequest(BaseModel):
+    tenants: List[BulkTenantManifest]
+    concurrency: int = Field(8, ge=1, le=64)  # 동시 파싱/배포 테넌트 수
+    batch_size: int = Field(200, ge=1, le=5000)  # DB 배치 저장 단위
+
 class ResourceQuery(BaseModel):
     namespace: Optional[str] = None
     kind: Optional[str] = None
@@ -187,6 +154,23 @@ class AlertRule(BaseModel):
     severity: str  # info, warning, critical
     enabled: bool = True
 
+class ReplayRequest(BaseModel):
+    seed: int = 42
+    speed: float = 1.0  # 1.0 = 실시간, 60.0 = 1분 트레이스를 1초에 재생
+    # [advice from AI] 재생 중 백그라운드 모니터링 루프 주기(초) - 틱당 트레이스 진행 = tick_seconds * speed
+    tick_seconds: float = Field(5.0, ge=0.5, le=300)
+    loop: bool = False
+
+async def _refresh_monitoring_services(simulator):
+    """[advice from AI] 배포된 전체 리소스 기준으로 전역 모니터링 엔진 서비스 목록 갱신"""
+    from main import get_monitoring_engine
+    engine = get_monitoring_engine()
+    
+    # 현재 배포된 모든 리소스 조회
+    all_resources = await simulator.get_resources()
+    await engine.update_services_from_resources(all_resources)
+    logger.info(f"모니터링 엔진 업데이트 완료: {len(all_resources)}개 리소스")
+
 # Router 인스턴스 생성
 k8s_router = APIRouter()
 monitoring_router = APIRouter()
@@ -226,15 +210,9 @@ async def deploy_manifest(request: ManifestRequest):
         # 리소스 배포
         deploy_result = await simulator.deploy_resources(parse_result["resources"])
         
-        # [advice from AI] 배포 성공 시 모니터링 엔진 업데이트
-        if deploy_result["status"] == "success" and deploy_result["deployed_count"] > 0:
-            from core.monitoring_engine import MonitoringEngine
-            engine = MonitoringEngine()
-            
-            # 현재 배포된 모든 리소스 조회
-            all_resources = await simulator.get_resources()
-            await engine.update_services_from_resources(all_resources)
-            logger.info(f"모니터링 엔진 업데이트 완료: {len(all_resources)}개 리소스")
+        # [advice from AI] 배포 성공 시 전역 모니터링 엔진 업데이트 (트레이스 재생 대상 서비스 반영)
+        if deploy_result["status"] in ("success", "completed") and deploy_result["deployed_count"] > 0:
+            await _refresh_monitoring_services(simulator)
         
         return JSONResponse(content={
             "status": deploy_result["status"],
@@ -248,6 +226,172 @@ async def deploy_manifest(request: ManifestRequest):
         logger.error(f"Deployment error: {e}")
         raise HTTPException(status_code=500, detail=f"Deployment failed: {str(e)}")
 
+def _apply_request_defaults(resources: List[Dict[str, Any]], namespace: Optional[str],
+                            deployment_mode: Optional[str]) -> List[Dict[str, Any]]:
+    """요청의 기본 네임스페이스/배포 모드 반영 (파싱 캐시 결과는 수정하지 않고 복사본 반환)"""
+    if not namespace and not deployment_mode:
+        return resources
+    applied = []
+    for resource in resources:
+        metadata = dict(resource.get('metadata') or {})
+        if namespace and not metadata.get('namespace'):
+            metadata['namespace'] = namespace
+        if deployment_mode:
+            metadata['annotations'] = {**(metadata.get('annotations') or {}),
+                                       'ecp.ai/deployment-mode': deployment_mode}
+        applied.append({**resource, 'metadata': metadata})
+    return applied
+
+@k8s_router.post("/manifest/apply")
+async def apply_manifest(request: ManifestApplyRequest):
+    """[advice from AI] 매니페스트 검증 + 파싱 + 배포를 한 번의 요청으로 처리 (파싱 결과는 콘텐츠 해시로 캐시)"""
+    try:
+        from main import get_simulator
+        simulator = get_simulator()
+        
+        started = time.perf_counter()
+        parse_result = await simulator.parse_manifest(request.manifest)
+        if parse_result["status"] == "error":
+            raise HTTPException(status_code=400, detail=parse_result["message"])
+        
+        resources = _apply_request_defaults(parse_result["resources"], request.namespace, request.deployment_mode)
+        if not resources:
+            raise HTTPException(status_code=400, detail="Manifest contains no resources")
+        
+        validation_errors = simulator.validate_resources(resources)
+        if validation_errors:
+            raise HTTPException(status_code=422, detail={
+                "message": "Manifest validation failed",
+                "errors": validation_errors,
+                "content_hash": parse_result["content_hash"]
+            })
+        parse_ms = (time.perf_counter() - started) * 1000
+        
+        deploy_result = await simulator.deploy_resources(resources)
+        deploy_ms = (time.perf_counter() - started) * 1000 - parse_ms
+        
+        if deploy_result["deployed_count"] > 0:
+            await _refresh_monitoring_services(simulator)
+        
+        logger.info(
+            f"Manifest applied: tenant={request.tenant_id}, namespace={request.namespace}, "
+            f"mode={request.deployment_mode}, hash={parse_result['content_hash'][:12]}, "
+            f"cached={parse_result['cached']}, deployed={deploy_result['deployed_count']}"
+        )
+        
+        return JSONResponse(content={
+            "status": deploy_result["status"],
+            "tenant_id": request.tenant_id,
+            "namespace": request.namespace,
+            "deployment_mode": request.deployment_mode,
+            "content_hash": parse_result["content_hash"],
+            "parse_cached": parse_result["cached"],
+            "parsed_count": parse_result["count"],
+            "deployed_count": deploy_result["deployed_count"],
+            "failed_count": deploy_result["failed_count"],
+            "resources": deploy_result["resources"],
+            "timings_ms": {"parse": round(parse_ms, 2), "deploy": round(deploy_ms, 2)},
+            "message": f"Deployed {deploy_result['deployed_count']} resources successfully"
+        })
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Manifest apply error: {e}")
+        raise HTTPException(status_code=500, detail=f"Apply failed: {str(e)}")
+
+async def _run_bulk_deploy(tenant_manifests: List[Dict[str, Any]], concurrency: int, batch_size: int):
+    """대량 배포 실행 후 모니터링 엔진 1회 갱신"""
+    from main import get_simulator
+    simulator = get_simulator()
+    
+    result = await simulator.deploy_bulk(tenant_manifests, concurrency=concurrency, batch_size=batch_size)
+    if result["deployed_resources"] > 0:
+        await _refresh_monitoring_services(simulator)
+    return result
+
+@k8s_router.post("/manifest/bulk")
+async def bulk_deploy_manifests(request: BulkDeployRequest):
+    """[advice from AI] 다수 테넌트 매니페스트 일괄 배포 (동시성 제한, DB 배치 저장, 테넌트별 결과)"""
+    try:
+        if not request.tenants:
+            raise HTTPException(status_code=400, detail="No tenant manifests provided")
+        
+        result = await _run_bulk_deploy(
+            [item.model_dump() for item in request.tenants],
+            concurrency=request.concurrency,
+            batch_size=request.batch_size
+        )
+        return JSONResponse(content=result)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Bulk deploy error: {e}")
+        raise HTTPException(status_code=500, detail=f"Bulk deploy failed: {str(e)}")
+
+@k8s_router.post("/manifest/bulk/ndjson")
+async def bulk_deploy_ndjson(
+    request: Request,
+    concurrency: int = Query(8, ge=1, le=64),
+    batch_size: int = Query(200, ge=1, le=5000)
+):
+    """NDJSON 일괄 배포 - 한 줄에 {"tenant_id": ..., "manifest": ...} 하나씩"""
+    try:
+        body = (await request.body()).decode('utf-8')
+        
+        tenant_manifests = []
+        for line_no, line in enumerate(body.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise HTTPException(status_code=400, detail=f"Invalid NDJSON at line {line_no}: {str(e)}")
+            if not isinstance(item, dict) or "manifest" not in item:
+                raise HTTPException(status_code=400, detail=f"Line {line_no}: 'manifest' field is required")
+            tenant_manifests.append(item)
+        
+        if not tenant_manifests:
+            raise HTTPException(status_code=400, detail="No tenant manifests provided")
+        
+        result = await _run_bulk_deploy(tenant_manifests, concurrency=concurrency, batch_size=batch_size)
+        return JSONResponse(content=result)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Bulk NDJSON deploy error: {e}")
+        raise HTTPException(status_code=500, detail=f"Bulk deploy failed: {str(e)}")
+
+@k8s_router.get("/manifest/cache")
+async def get_parse_cache_stats():
+    """매니페스트 파싱 캐시 통계"""
+    from main import get_simulator
+    return JSONResponse(content=get_simulator().get_parse_cache_stats())
+
+@k8s_router.get("/snapshot")
+async def get_snapshot_status():
+    """[advice from AI] 스냅샷 상태 및 웜 스타트 소요 시간 조회"""
+    from main import get_simulator, get_startup_stats, snapshot_store
+    simulator = get_simulator()
+    return JSONResponse(content={
+        "state_version": simulator.state_version,
+        "resources": len(simulator.resources),
+        "last_snapshot": snapshot_store.last_stats,
+        "warm_start": get_startup_stats()
+    })
+
+@k8s_router.post("/snapshot")
+async def create_snapshot():
+    """현재 상태 스냅샷 즉시 저장"""
+    try:
+        from main import save_snapshot
+        return JSONResponse(content=await save_snapshot(force=True))
+    except Exception as e:
+        logger.error(f"Snapshot error: {e}")
+        raise HTTPException(status_code=500, detail=f"Snapshot failed: {str(e)}")
+
 @k8s_router.post("/manifest/upload")
 async def upload_manifest_file(file: UploadFile = File(...)):
     """YAML 파일 업로드 및 배포"""
@@ -458,6 +602,131 @@ async def get_system_health():
         logger.error(f"Health check error: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to get health status: {str(e)}")
 
+# [advice from AI] 트레이스 기반 부하 재생 API
+@monitoring_router.post("/replay/trace")
+async def upload_replay_trace(file: UploadFile = File(...)):
+    """서비스별 부하 트레이스(CSV/JSON) 업로드"""
+    try:
+        from main import get_monitoring_engine
+        from core.trace_replay import parse_trace
+        
+        content = (await file.read()).decode('utf-8')
+        try:
+            trace = parse_trace(content, filename=file.filename)
+        except (ValueError, KeyError) as e:
+            raise HTTPException(status_code=400, detail=f"Invalid trace: {str(e)}")
+        
+        get_monitoring_engine().load_trace(trace)
+        
+        return JSONResponse(content={
+            "status": "success",
+            "trace": trace.summary()
+        })
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Trace upload error: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to upload trace: {str(e)}")
+
+@monitoring_router.post("/replay/start")
+async def start_replay(request: ReplayRequest):
+    """업로드된 트레이스를 실시간/가속 재생 (재생 중 백그라운드 모니터링은 tick_seconds 주기로 진행)"""
+    try:
+        from main import get_monitoring_engine
+        engine = get_monitoring_engine()
+        
+        try:
+            replay_status = engine.start_replay(
+                seed=request.seed,
+                speed=request.speed,
+                tick_seconds=request.tick_seconds,
+                loop=request.loop
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        return JSONResponse(content={"status": "success", "replay": replay_status})
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Replay start error: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to start replay: {str(e)}")
+
+@monitoring_router.post("/replay/stop")
+async def stop_replay():
+    """트레이스 재생 중지"""
+    try:
+        from main import get_monitoring_engine
+        replay_status = get_monitoring_engine().stop_replay()
+        
+        if replay_status is None:
+            raise HTTPException(status_code=404, detail="No replay in progress")
+        
+        return JSONResponse(content={"status": "success", "replay": replay_status})
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Replay stop error: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to stop replay: {str(e)}")
+
+@monitoring_router.get("/replay/status")
+async def get_replay_status(include_timeline: bool = Query(False)):
+    """트레이스 재생 상태 및 결과 조회"""
+    try:
+        from main import get_monitoring_engine
+        engine = get_monitoring_engine()
+        
+        if engine.trace_replayer is None:
+            return JSONResponse(content={
+                "status": "idle",
+                "trace": engine.loaded_trace.summary() if engine.loaded_trace else None
+            })
+        
+        report = engine.trace_replayer.report(await engine.check_sla())
+        if not include_timeline:
+            report.pop("timeline", None)
+        
+        return JSONResponse(content={"status": "success", "replay": report})
+        
+    except Exception as e:
+        logger.error(f"Replay status error: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to get replay status: {str(e)}")
+
+@monitoring_router.post("/replay/run")
+async def run_replay(request: ReplayRequest):
+    """트레이스 전체를 대기 없이 재생하여 결과 리포트 반환 (전역 엔진 상태에 영향 없음)"""
+    try:
+        from main import get_monitoring_engine
+        from core.monitoring_engine import MonitoringEngine
+        
+        source = get_monitoring_engine()
+        if source.loaded_trace is None:
+            raise HTTPException(status_code=400, detail="No trace loaded")
+        
+        # 현재 배포된 서비스 구성을 복사한 독립 엔진에서 재생
+        engine = MonitoringEngine()
+        engine.services = {name: dict(config) for name, config in source.services.items()}
+        engine.load_trace(source.loaded_trace)
+        
+        report = await engine.run_replay(
+            seed=request.seed,
+            speed=request.speed,
+            tick_seconds=request.tick_seconds
+        )
+        
+        return JSONResponse(content={"status": "success", "replay": report})
+        
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Replay run error: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to run replay: {str(e)}")
+
 # SLA Management API Routes
 @sla_router.get("/status")
 async def get_sla_status():
@@ -548,39 +817,33 @@ async def create_alert_rule(rule: AlertRule):
 @sla_router.get("/alerts/history")
 async def get_alert_history(
     hours: int = Query(24, ge=1, le=168),  # 1시간 ~ 1주일
-    severity: Optional[str] = Query(None)
+    severity: Optional[str] = Query(None),
+    since_id: Optional[int] = Query(None, ge=0, description="이 id 이후 알림만 조회 (증분 동기화용)"),
+    limit: int = Query(500, ge=1, le=1000)
 ):
     """누적형 알림 히스토리 조회"""
     try:
         from datetime import datetime, timedelta
         
-        # [advice from AI] 기본 알림 히스토리 초기화
-        await _initialize_base_alerts()
-        
         # [advice from AI] 확률적 새 알림 생성 (실시간 시스템 이벤트 시뮬레이션)
         await _generate_system_alerts()
+        store = get_alert_store()
         
-        # 시간 필터링 적용
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        filtered_alerts = []
-        
-        for alert in GLOBAL_ALERTS:
-            try:
-                alert_time = datetime.fromisoformat(alert["timestamp"].replace('Z', '+00:00'))
-                if alert_time >= cutoff_time:
-                    # 심각도 필터링 적용
-                    if not severity or alert.get("severity") == severity:
-                        filtered_alerts.append(alert)
-            except Exception as e:
-                # 시간 파싱 실패 시 포함 (최근 알림으로 간주)
-                if not severity or alert.get("severity") == severity:
-                    filtered_alerts.append(alert)
-                logger.warning(f"알림 시간 파싱 실패: {e}")
-        
-        # 시간순 정렬 (최신순)
-        filtered_alerts.sort(key=lambda x: x["timestamp"], reverse=True)
+        # [advice from AI] 증분 조회: since_id 이후 알림만 id 오름차순으로 반환
+        if since_id is not None:
+            alerts = await asyncio.to_thread(store.since, since_id, limit=limit, severity=severity)
+            return JSONResponse(content={
+                "status": "success",
+                "since_id": since_id,
+                "last_id": alerts[-1]["id"] if alerts else since_id,
+                "alerts": alerts
+            })
         
-        alerts = filtered_alerts
+        # 시간 범위 조회 (최신순, timestamp 인덱스 사용) - SQLite 조회는 스레드에서
+        alerts = await asyncio.to_thread(
+            store.between, start=datetime.now() - timedelta(hours=hours), severity=severity, limit=limit
+        )
+        total_stored = await asyncio.to_thread(store.count)
         
         # [advice from AI] 통계 정보 계산
         total_alerts = len(alerts)
@@ -594,7 +857,7 @@ async def get_alert_history(
             "total_alerts": total_alerts,
             "unresolved_alerts": unresolved_alerts,
             "critical_alerts": critical_alerts,
-            "total_stored_alerts": len(GLOBAL_ALERTS),
+            "total_stored_alerts": total_stored,
             "alerts": alerts
         })
         
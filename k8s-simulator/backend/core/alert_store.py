@@ -0,0 +1,197 @@
+# [advice from AI] 알림 저장소 - SQLite(WAL) 추가 전용 로그 + 메모리 최근 구간
+"""
+- 알림은 추가 전용(append-only)으로 기록, 알림마다 파일 전체를 다시 쓰지 않음
+- append는 메모리 큐에 추가만 하고, 기록은 모니터링 틱의 flush(스레드)가 한 트랜잭션으로 모아서 수행
+- 조회/flush는 SQLite I/O를 하므로 이벤트 루프에서는 asyncio.to_thread로 호출
+- 최근 알림은 deque(hot window)에서 바로 조회, 범위를 벗어나면 SQLite 인덱스 조회
+- id 이후 조회(증분 동기화) / 시간 범위 조회 지원
+- 보존 기간/최대 개수 초과분은 주기적으로 정리
+- 기존 JSON 파일(/tmp/k8s_simulator_alerts.json)이 있으면 최초 1회 가져오기
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# [advice from AI] 저장소 설정 (환경 변수로 조정)
+ALERT_STORE_PATH = os.getenv("SIMULATOR_ALERT_STORE_PATH", "/tmp/k8s_simulator_alerts.db")
+ALERT_HOT_WINDOW = int(os.getenv("SIMULATOR_ALERT_HOT_WINDOW", "500"))
+ALERT_RETENTION_DAYS = float(os.getenv("SIMULATOR_ALERT_RETENTION_DAYS", "7"))
+ALERT_RETENTION_MAX_ROWS = int(os.getenv("SIMULATOR_ALERT_RETENTION_MAX_ROWS", "100000"))
+RETENTION_CHECK_INTERVAL = 60.0
+
+
+class AlertStore:
+    """추가 전용 알림 저장소 (스레드 안전)"""
+
+    def __init__(self,
+                 path: str = ALERT_STORE_PATH,
+                 hot_window: int = ALERT_HOT_WINDOW,
+                 retention_days: float = ALERT_RETENTION_DAYS,
+                 retention_max_rows: int = ALERT_RETENTION_MAX_ROWS,
+                 legacy_json_path: Optional[str] = None):
+        self.path = path
+        self.retention_days = retention_days
+        self.retention_max_rows = retention_max_rows
+        self.hot: Deque[Dict[str, Any]] = deque(maxlen=hot_window)
+        self._pending: List[Dict[str, Any]] = []
+        self._lock = threading.RLock()
+        self._last_retention = 0.0
+        self.stats = {"appended": 0, "flushes": 0, "pruned": 0}
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS alerts (
+                id INTEGER PRIMARY KEY,
+                timestamp TEXT NOT NULL,
+                severity TEXT,
+                body TEXT NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_alerts_timestamp ON alerts(timestamp)")
+
+        if legacy_json_path:
+            self._import_legacy_json(legacy_json_path)
+        self._next_id = (self._conn.execute("SELECT MAX(id) FROM alerts").fetchone()[0] or 0) + 1
+        self._load_hot_window()
+
+    # ------------------------------------------------------------------
+    # 초기화
+    # ------------------------------------------------------------------
+    def _import_legacy_json(self, json_path: str):
+        """기존 JSON 파일 알림을 가져온 뒤 파일 이름 변경 (최초 1회)"""
+        if not os.path.exists(json_path):
+            return
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                alerts = json.load(f).get("alerts", [])
+            self._write([a for a in alerts if a.get("id") is not None])
+            os.replace(json_path, f"{json_path}.migrated")
+            logger.info(f"기존 알림 파일 가져오기 완료: {len(alerts)}개")
+        except (OSError, ValueError, sqlite3.Error) as e:
+            logger.error(f"기존 알림 파일 가져오기 실패: {e}")
+
+    def _load_hot_window(self):
+        rows = self._conn.execute(
+            "SELECT body FROM alerts ORDER BY id DESC LIMIT ?", (self.hot.maxlen,)
+        ).fetchall()
+        self.hot.extend(json.loads(body) for (body,) in reversed(rows))
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+    def append(self, alert: Dict[str, Any]) -> Dict[str, Any]:
+        """알림 추가 (id/timestamp 미지정 시 자동 부여) - 메모리에만 추가, 파일 기록은 flush에서"""
+        with self._lock:
+            record = {"id": self._next_id, "timestamp": datetime.now().isoformat(), **alert}
+            record["id"] = self._next_id
+            self._next_id += 1
+            self.hot.append(record)
+            self._pending.append(record)
+            self.stats["appended"] += 1
+            return record
+
+    def _write(self, records: List[Dict[str, Any]]):
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO alerts (id, timestamp, severity, body) VALUES (?, ?, ?, ?)",
+                [(r["id"], r["timestamp"], r.get("severity"), json.dumps(r, ensure_ascii=False))
+                 for r in records]
+            )
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def flush(self) -> int:
+        """대기 중인 알림을 한 트랜잭션으로 기록"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            if pending:
+                try:
+                    self._write(pending)
+                except sqlite3.Error:
+                    self._pending = pending + self._pending
+                    raise
+                self.stats["flushes"] += 1
+            if time.monotonic() - self._last_retention >= RETENTION_CHECK_INTERVAL:
+                self.apply_retention()
+            return len(pending)
+
+    def apply_retention(self) -> int:
+        """보존 기간/최대 개수를 넘는 오래된 알림 삭제"""
+        with self._lock:
+            self._last_retention = time.monotonic()
+            cutoff = (datetime.now() - timedelta(days=self.retention_days)).isoformat()
+            deleted = self._conn.execute("DELETE FROM alerts WHERE timestamp < ?", (cutoff,)).rowcount
+            deleted += self._conn.execute(
+                "DELETE FROM alerts WHERE id <= (SELECT id FROM alerts ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                (self.retention_max_rows,)
+            ).rowcount
+            self.stats["pruned"] += deleted
+            return deleted
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def _query(self, sql: str, params: tuple) -> List[Dict[str, Any]]:
+        self.flush()
+        return [json.loads(body) for (body,) in self._conn.execute(sql, params).fetchall()]
+
+    def since(self, since_id: int, limit: int = 500, severity: Optional[str] = None) -> List[Dict[str, Any]]:
+        """since_id 이후 알림 (id 오름차순)"""
+        with self._lock:
+            if self.hot and since_id >= self.hot[0]["id"] - 1:
+                alerts = [a for a in self.hot
+                          if a["id"] > since_id and (not severity or a.get("severity") == severity)]
+                return alerts[:limit]
+            sql = "SELECT body FROM alerts WHERE id > ?"
+            params: tuple = (since_id,)
+            if severity:
+                sql += " AND severity = ?"
+                params += (severity,)
+            return self._query(sql + " ORDER BY id LIMIT ?", params + (limit,))
+
+    def between(self,
+                start: Optional[datetime] = None,
+                end: Optional[datetime] = None,
+                severity: Optional[str] = None,
+                limit: int = 1000) -> List[Dict[str, Any]]:
+        """시간 범위 알림 (최신순)"""
+        clauses, params = [], []
+        if start:
+            clauses.append("timestamp >= ?")
+            params.append(start.isoformat())
+        if end:
+            clauses.append("timestamp < ?")
+            params.append(end.isoformat())
+        if severity:
+            clauses.append("severity = ?")
+            params.append(severity)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            return self._query(f"SELECT body FROM alerts {where} ORDER BY timestamp DESC, id DESC LIMIT ?",
+                               tuple(params) + (limit,))
+
+    def count(self) -> int:
+        """저장된 알림 개수 (대기 중인 알림 포함)"""
+        with self._lock:
+            self.flush()
+            return self._conn.execute("SELECT COUNT(*) FROM alerts").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            self._conn.close()
@@ -1,50 +1,83 @@
 # [advice from AI] K8S 매니페스트 파서 및 가상 인스턴스 시뮬레이터
-import yaml
 import json
 import asyncio
 import random
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from core.database import get_db, K8sResource
+from core import yaml_io
 import logging
 
 logger = logging.getLogger(__name__)
 
+# [advice from AI] 매니페스트 파싱 결과 캐시 크기 (콘텐츠 해시 기준 LRU)
+PARSE_CACHE_SIZE = 64
+
+# [advice from AI] 대량 배포 기본값 (동시 처리 테넌트 수, DB 배치 저장 단위)
+BULK_DEFAULT_CONCURRENCY = 8
+BULK_MAX_CONCURRENCY = 64
+DB_BATCH_SIZE = 200
+
 class K8sSimulator:
     """쿠버네티스 시뮬레이터 메인 클래스"""
     
     def __init__(self):
         self.resources: Dict[str, Dict] = {}
+        # [advice from AI] 네임스페이스 -> 리소스 ID 인덱스 (네임스페이스 단위 조회/삭제용)
+        self.namespace_index: Dict[str, Set[str]] = {}
+        # 상태 변경 카운터 (변경이 있을 때만 스냅샷 저장)
+        self.state_version = 0
         self.running = False
+        self._parse_cache: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        self.parse_cache_hits = 0
+        self.parse_cache_misses = 0
+    
+    @staticmethod
+    def manifest_hash(manifest_content: str) -> str:
+        """매니페스트 콘텐츠 해시 (파싱 캐시 키)"""
+        return hashlib.sha256(manifest_content.encode("utf-8")).hexdigest()
     
     async def parse_manifest(self, manifest_content: str) -> Dict[str, Any]:
-        """YAML 매니페스트 파일 파싱"""
+        """YAML 매니페스트 파일 파싱 (동일 콘텐츠는 캐시된 결과 재사용)"""
+        content_hash = self.manifest_hash(manifest_content)
+        cached = self._parse_cache.get(content_hash)
+        if cached is not None:
+            self._parse_cache.move_to_end(content_hash)
+            self.parse_cache_hits += 1
+            return {
+                "status": "success",
+                "resources": cached,
+                "count": len(cached),
+                "content_hash": content_hash,
+                "cached": True
+            }
+        self.parse_cache_misses += 1
+        
         try:
-            # Parse YAML content - always try multi-document first
-            parsed_resources = []
-            try:
-                # Try multi-document parsing
-                documents = yaml.safe_load_all(manifest_content)
-                for doc in documents:
-                    if doc and isinstance(doc, dict):
-                        parsed_resources.append(doc)
-            except:
-                # Fallback to single document
-                single_doc = yaml.safe_load(manifest_content)
-                if single_doc and isinstance(single_doc, dict):
-                    parsed_resources = [single_doc]
+            # [advice from AI] YAML 파싱은 스레드에서 실행 (대량 배포 시 동시성 한도만큼 병렬 파싱)
+            parsed_resources = await asyncio.to_thread(self._parse_documents, manifest_content)
             
             result = {
                 "status": "success",
                 "resources": parsed_resources,
-                "count": len(parsed_resources)
+                "count": len(parsed_resources),
+                "content_hash": content_hash,
+                "cached": False
             }
             
+            self._parse_cache[content_hash] = parsed_resources
+            if len(self._parse_cache) > PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+            
             logger.info(f"Parsed {len(parsed_resources)} K8S resources")
             return result
             
-        except yaml.YAMLError as e:
+        except yaml_io.YAMLError as e:
             logger.error(f"YAML parsing error: {e}")
             return {
                 "status": "error",
@@ -53,8 +86,56 @@ class K8sSimulator:
                 "count": 0
             }
     
-    async def deploy_resources(self, resources: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """리소스 배포 시뮬레이션"""
+    @staticmethod
+    def _parse_documents(manifest_content: str) -> List[Dict[str, Any]]:
+        """YAML 도큐먼트 파싱 (멀티 도큐먼트 우선, 실패 시 단일 도큐먼트)"""
+        # [advice from AI] libyaml(C) 로더로 도큐먼트를 한 건씩 스트리밍 파싱
+        parsed_resources = []
+        try:
+            # Try multi-document parsing
+            for doc in yaml_io.iter_documents(manifest_content):
+                if doc and isinstance(doc, dict):
+                    parsed_resources.append(doc)
+        except yaml_io.YAMLError:
+            # Fallback to single document
+            single_doc = yaml_io.load(manifest_content)
+            if single_doc and isinstance(single_doc, dict):
+                parsed_resources = [single_doc]
+        return parsed_resources
+    
+    def validate_resources(self, resources: List[Dict[str, Any]]) -> List[str]:
+        """리소스 필수 필드 검증 (apiVersion, kind, metadata.name)"""
+        errors = []
+        for index, resource in enumerate(resources):
+            metadata = resource.get('metadata')
+            name = metadata.get('name') if isinstance(metadata, dict) else None
+            label = f"#{index} {resource.get('kind', 'Unknown')}/{name or '?'}"
+            
+            if not resource.get('apiVersion'):
+                errors.append(f"{label}: apiVersion is required")
+            if not resource.get('kind'):
+                errors.append(f"{label}: kind is required")
+            if not isinstance(metadata, dict) or not name:
+                errors.append(f"{label}: metadata.name is required")
+        return errors
+    
+    def get_parse_cache_stats(self) -> Dict[str, Any]:
+        """파싱 캐시 통계"""
+        total = self.parse_cache_hits + self.parse_cache_misses
+        return {
+            "size": len(self._parse_cache),
+            "capacity": PARSE_CACHE_SIZE,
+            "hits": self.parse_cache_hits,
+            "misses": self.parse_cache_misses,
+            "hit_rate": round(self.parse_cache_hits / total, 4) if total else 0.0
+        }
+    
+    async def deploy_resources(self, resources: List[Dict[str, Any]], persist: bool = True,
+                               start_completion: bool = True) -> Dict[str, Any]:
+        """리소스 배포 시뮬레이션 (DB 저장은 배치 단위로 수행)
+        
+        - 배포 완료 처리(상태 DB 갱신)는 행 저장 후 시작 (persist=False면 호출 측이 저장 후 시작)
+        """
         deployed_resources = []
         
         for resource in resources:
@@ -69,12 +150,10 @@ class K8sSimulator:
                 resource_id = f"{namespace}/{kind}/{name}"
                 
                 # Simulate deployment process
-                deployed_resource = await self._simulate_resource_deployment(resource_id, resource)
+                deployed_resource = await self._simulate_resource_deployment(resource_id, resource,
+                                                                             start_completion=False)
                 deployed_resources.append(deployed_resource)
                 
-                # Store in database
-                await self._store_resource_in_db(deployed_resource)
-                
                 logger.info(f"Deployed resource: {resource_id}")
                 
             except Exception as e:
@@ -85,6 +164,12 @@ class K8sSimulator:
                     "error": str(e)
                 })
         
+        # Store in database
+        if persist:
+            await self._store_resources_in_db([r for r in deployed_resources if r.get('status') != 'Failed'])
+        if start_completion:
+            self._start_completions(r for r in deployed_resources if r.get('status') != 'Failed')
+        
         return {
             "status": "completed",
             "deployed_count": len([r for r in deployed_resources if r.get('status') != 'Failed']),
@@ -92,7 +177,94 @@ class K8sSimulator:
             "resources": deployed_resources
         }
     
-    async def _simulate_resource_deployment(self, resource_id: str, resource: Dict[str, Any]) -> Dict[str, Any]:
+    async def deploy_bulk(
+        self,
+        tenant_manifests: List[Dict[str, Any]],
+        concurrency: int = BULK_DEFAULT_CONCURRENCY,
+        batch_size: int = DB_BATCH_SIZE
+    ) -> Dict[str, Any]:
+        """[advice from AI] 다수 테넌트 매니페스트 동시 배포
+        
+        - 테넌트 단위 병렬 처리 (세마포어로 동시성 제한)
+        - DB 저장은 전체 배포 후 batch_size 단위로 일괄 수행, 배포 완료 처리는 저장 후 시작
+        - 테넌트별 결과 반환 (한 테넌트 실패가 전체에 영향 없음)
+        """
+        concurrency = max(1, min(BULK_MAX_CONCURRENCY, concurrency))
+        batch_size = max(1, batch_size)
+        semaphore = asyncio.Semaphore(concurrency)
+        pending_rows: List[Dict[str, Any]] = []
+        started = time.perf_counter()
+        
+        async def deploy_one(index: int, item: Dict[str, Any]) -> Dict[str, Any]:
+            tenant_id = item.get("tenant_id") or f"tenant-{index}"
+            async with semaphore:
+                try:
+                    parse_result = await self.parse_manifest(item.get("manifest") or "")
+                    if parse_result["status"] == "error":
+                        return {"tenant_id": tenant_id, "status": "invalid", "error": parse_result["message"]}
+                    
+                    resources = parse_result["resources"]
+                    errors = self.validate_resources(resources) if resources else ["Manifest contains no resources"]
+                    if errors:
+                        return {
+                            "tenant_id": tenant_id,
+                            "status": "invalid",
+                            "content_hash": parse_result["content_hash"],
+                            "errors": errors
+                        }
+                    
+                    deploy_result = await self.deploy_resources(resources, persist=False, start_completion=False)
+                    pending_rows.extend(r for r in deploy_result["resources"] if r.get('status') != 'Failed')
+                    
+                    return {
+                        "tenant_id": tenant_id,
+                        "status": "success" if deploy_result["failed_count"] == 0 else "partial",
+                        "content_hash": parse_result["content_hash"],
+                        "parse_cached": parse_result["cached"],
+                        "deployed_count": deploy_result["deployed_count"],
+                        "failed_count": deploy_result["failed_count"]
+                    }
+                except Exception as e:
+                    logger.error(f"Bulk deploy error for {tenant_id}: {e}")
+                    return {"tenant_id": tenant_id, "status": "failed", "error": str(e)}
+        
+        results = await asyncio.gather(*(
+            deploy_one(index, item) for index, item in enumerate(tenant_manifests)
+        ))
+        deploy_seconds = time.perf_counter() - started
+        
+        persisted = 0
+        for offset in range(0, len(pending_rows), batch_size):
+            persisted += await self._store_resources_in_db(pending_rows[offset:offset + batch_size])
+        # 행이 저장된 뒤 완료 처리 시작 (완료 시 상태 갱신이 저장 전 행을 놓치지 않도록)
+        self._start_completions(pending_rows)
+        
+        total_seconds = time.perf_counter() - started
+        succeeded = sum(1 for r in results if r["status"] == "success")
+        logger.info(
+            f"Bulk deploy: {succeeded}/{len(results)} tenants, {len(pending_rows)} resources, "
+            f"{total_seconds:.2f}s (concurrency={concurrency})"
+        )
+        
+        return {
+            "status": "completed",
+            "tenant_count": len(results),
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "deployed_resources": len(pending_rows),
+            "persisted_resources": persisted,
+            "concurrency": concurrency,
+            "batch_size": batch_size,
+            "timings_ms": {
+                "deploy": round(deploy_seconds * 1000, 2),
+                "persist": round((total_seconds - deploy_seconds) * 1000, 2),
+                "total": round(total_seconds * 1000, 2)
+            },
+            "results": results
+        }
+    
+    async def _simulate_resource_deployment(self, resource_id: str, resource: Dict[str, Any],
+                                            start_completion: bool = True) -> Dict[str, Any]:
         """개별 리소스 배포 시뮬레이션"""
         kind = resource.get('kind', 'Unknown')
         metadata = resource.get('metadata', {})
@@ -141,13 +313,19 @@ class K8sSimulator:
             })
         
         # Store in memory
-        self.resources[resource_id] = deployed_resource
+        self._put_resource(resource_id, deployed_resource)
         
         # Simulate async deployment completion
-        asyncio.create_task(self._complete_deployment(resource_id, deployment_delay))
+        if start_completion:
+            asyncio.create_task(self._complete_deployment(resource_id, deployment_delay))
         
         return deployed_resource
     
+    def _start_completions(self, deployed_resources):
+        """배포 완료 시뮬레이션 태스크 시작"""
+        for resource in deployed_resources:
+            asyncio.create_task(self._complete_deployment(resource['id'], resource['deployment_time']))
+    
     async def _complete_deployment(self, resource_id: str, delay: float):
         """배포 완료 시뮬레이션"""
         await asyncio.sleep(delay)
@@ -172,26 +350,40 @@ class K8sSimulator:
                 resource['error'] = 'Simulated deployment failure'
             
             resource['updated_at'] = datetime.now().isoformat()
+            self.state_version += 1
             
             # Update in database
             await self._update_resource_in_db(resource)
     
-    async def _store_resource_in_db(self, resource: Dict[str, Any]):
-        """리소스를 데이터베이스에 저장"""
+    async def _store_resources_in_db(self, resources: List[Dict[str, Any]]) -> int:
+        """리소스 목록을 단일 트랜잭션으로 데이터베이스에 저장 (저장 건수 반환)"""
+        if not resources:
+            return 0
         try:
-            db = next(get_db())
-            db_resource = K8sResource(
-                name=resource['name'],
-                namespace=resource['namespace'],
-                kind=resource['kind'],
-                status=resource['status'],
-                manifest=resource['manifest']
-            )
-            db.add(db_resource)
-            db.commit()
-            db.close()
+            return await asyncio.to_thread(self._store_resources_batch, resources)
         except Exception as e:
             logger.error(f"Database storage error: {e}")
+            return 0
+    
+    def _store_resources_batch(self, resources: List[Dict[str, Any]]) -> int:
+        """배치 저장 (스레드에서 실행)"""
+        db = next(get_db())
+        try:
+            db.add_all([
+                K8sResource(
+                    name=resource['name'],
+                    namespace=resource['namespace'],
+                    kind=resource['kind'],
+                    # 저장 시점의 최신 상태 기록 (배치 저장 전 완료된 배포 반영)
+                    status=resource['status'],
+                    manifest=resource['manifest']
+                )
+                for resource in resources
+            ])
+            db.commit()
+            return len(resources)
+        finally:
+            db.close()
     
     async def _update_resource_in_db(self, resource: Dict[str, Any]):
         """데이터베이스의 리소스 상태 업데이트"""
@@ -210,13 +402,130 @@ class K8sSimulator:
         except Exception as e:
             logger.error(f"Database update error: {e}")
     
+    async def _delete_resource_from_db(self, resource: Dict[str, Any]):
+        """데이터베이스에서 리소스 행 삭제 (DB 복원 시 삭제된 리소스가 되살아나지 않도록)"""
+        try:
+            await asyncio.to_thread(self._delete_resource_rows, resource)
+        except Exception as e:
+            logger.error(f"Database delete error: {e}")
+    
+    def _delete_resource_rows(self, resource: Dict[str, Any]):
+        db = next(get_db())
+        try:
+            db.query(K8sResource).filter(
+                K8sResource.name == resource['name'],
+                K8sResource.namespace == resource['namespace'],
+                K8sResource.kind == resource['kind']
+            ).delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+    
+    def _put_resource(self, resource_id: str, resource: Dict[str, Any]):
+        """메모리 저장소 및 네임스페이스 인덱스에 리소스 등록"""
+        previous = self.resources.get(resource_id)
+        if previous is not None:
+            self._unindex_resource(resource_id, previous)
+        self.resources[resource_id] = resource
+        self.namespace_index.setdefault(resource.get('namespace', 'default'), set()).add(resource_id)
+        self.state_version += 1
+    
+    def _pop_resource(self, resource_id: str) -> Dict[str, Any]:
+        """메모리 저장소 및 인덱스에서 리소스 제거"""
+        resource = self.resources.pop(resource_id)
+        self._unindex_resource(resource_id, resource)
+        self.state_version += 1
+        return resource
+    
+    def _unindex_resource(self, resource_id: str, resource: Dict[str, Any]):
+        namespace = resource.get('namespace', 'default')
+        ids = self.namespace_index.get(namespace)
+        if ids is not None:
+            ids.discard(resource_id)
+            if not ids:
+                del self.namespace_index[namespace]
+    
+    def export_resources(self) -> List[Dict[str, Any]]:
+        """스냅샷용 리소스 목록 (얕은 복사본)"""
+        return [dict(resource) for resource in self.resources.values()]
+    
+    def restore_resources(self, resources: List[Dict[str, Any]]):
+        """[advice from AI] 스냅샷에서 리소스 복원 및 인덱스 재구성
+        
+        Pending 상태였던 리소스는 배포 완료 시뮬레이션을 다시 예약
+        """
+        self.resources = {}
+        self.namespace_index = {}
+        for resource in resources:
+            resource_id = resource.get('id') or f"{resource.get('namespace', 'default')}/{resource.get('kind')}/{resource.get('name')}"
+            self._put_resource(resource_id, resource)
+            if resource.get('status') == 'Pending':
+                asyncio.create_task(self._complete_deployment(resource_id, resource.get('deployment_time', 1)))
+        logger.info(f"Restored {len(self.resources)} resources in {len(self.namespace_index)} namespaces")
+    
+    async def restore_from_db(self) -> int:
+        """스냅샷이 없을 때 k8s_resources 테이블에서 리소스 복원 (리소스별 최신 행 기준)"""
+        try:
+            rows = await asyncio.to_thread(self._load_resource_rows)
+        except Exception as e:
+            logger.error(f"Database restore error: {e}")
+            return 0
+        
+        latest: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            resource_id = f"{row.namespace}/{row.kind}/{row.name}"
+            latest[resource_id] = {
+                "id": resource_id,
+                "name": row.name,
+                "namespace": row.namespace,
+                "kind": row.kind,
+                "status": row.status,
+                "manifest": row.manifest or {},
+                "created_at": row.created_at.isoformat() if row.created_at else datetime.now().isoformat()
+            }
+        
+        self.restore_resources(list(latest.values()))
+        return len(latest)
+    
+    async def db_watermark(self) -> Optional[Dict[str, Any]]:
+        """k8s_resources 테이블 변경 기준점 (행 수 / 최대 id / 최신 updated_at), 조회 실패 시 None"""
+        try:
+            return await asyncio.to_thread(self._load_db_watermark)
+        except Exception as e:
+            logger.error(f"Database watermark error: {e}")
+            return None
+    
+    def _load_db_watermark(self) -> Dict[str, Any]:
+        db = next(get_db())
+        try:
+            rows, max_id, max_updated_at = db.query(
+                func.count(K8sResource.id), func.max(K8sResource.id), func.max(K8sResource.updated_at)
+            ).one()
+            return {
+                "rows": rows,
+                "max_id": max_id,
+                "max_updated_at": max_updated_at.isoformat() if max_updated_at else None
+            }
+        finally:
+            db.close()
+    
+    def _load_resource_rows(self) -> List[K8sResource]:
+        db = next(get_db())
+        try:
+            return db.query(K8sResource).order_by(K8sResource.id).all()
+        finally:
+            db.close()
+    
     async def get_resources(self, namespace: Optional[str] = None, kind: Optional[str] = None) -> List[Dict[str, Any]]:
         """배포된 리소스 목록 조회"""
         filtered_resources = []
         
-        for resource_id, resource in self.resources.items():
-            if namespace and resource.get('namespace') != namespace:
-                continue
+        if namespace:
+            candidates = (self.resources[rid] for rid in self.namespace_index.get(namespace, ()))
+        else:
+            candidates = self.resources.values()
+        
+        for resource in candidates:
             if kind and resource.get('kind') != kind:
                 continue
             filtered_resources.append(resource)
@@ -236,7 +545,8 @@ class K8sSimulator:
                     break
         
         if found_resource:
-            deleted_resource = self.resources.pop(found_resource)
+            deleted_resource = self._pop_resource(found_resource)
+            await self._delete_resource_from_db(deleted_resource)
             return {
                 "status": "deleted",
                 "resource": deleted_resource
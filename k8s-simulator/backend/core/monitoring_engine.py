@@ -8,9 +8,15 @@ from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 import logging
 import math
+import os
+
+from core.trace_replay import LoadTrace, TraceReplayer
 
 logger = logging.getLogger(__name__)
 
+# [advice from AI] 일괄 재생 시 이벤트 루프 양보 간격 (틱 수) - 헬스 체크/WebSocket/백그라운드 틱이 멈추지 않도록
+REPLAY_YIELD_TICKS = max(1, int(os.getenv("SIMULATOR_REPLAY_YIELD_TICKS", "20")))
+
 @dataclass
 class MetricPoint:
     """메트릭 데이터 포인트"""
@@ -28,6 +34,10 @@ class MonitoringEngine:
         self.metrics_history = {}
         self.sla_target = 99.5  # 99.5% SLA 목표
         self.incident_scenarios = []
+        # [advice from AI] 재현 가능한 시뮬레이션을 위한 엔진 전용 난수 생성기
+        self.rng = random.Random()
+        self.loaded_trace: Optional[LoadTrace] = None
+        self.trace_replayer: Optional[TraceReplayer] = None
         self._init_default_services()
         self._init_incident_scenarios()
     
@@ -129,13 +139,70 @@ class MonitoringEngine:
             "response_time": 100.0  # 기본 100ms 응답시간
         }
 
+    def load_trace(self, trace: LoadTrace):
+        """재생할 부하 트레이스 등록"""
+        self.loaded_trace = trace
+        logger.info(f"부하 트레이스 로드: {len(trace.series)}개 서비스, {trace.duration_seconds}초")
+    
+    def start_replay(
+        self,
+        seed: int = 42,
+        speed: float = 1.0,
+        tick_seconds: float = 5.0,
+        loop: bool = False
+    ) -> Dict[str, Any]:
+        """로드된 트레이스 재생 시작 (시드 고정, 메트릭 히스토리 초기화)"""
+        if self.loaded_trace is None:
+            raise ValueError("로드된 트레이스가 없습니다")
+        
+        self.rng.seed(seed)
+        self.metrics_history = {}
+        self.trace_replayer = TraceReplayer(
+            self.loaded_trace, speed=speed, seed=seed, tick_seconds=tick_seconds, loop=loop
+        )
+        logger.info(f"트레이스 재생 시작: seed={seed}, speed={speed}x, tick={tick_seconds}s")
+        return self.trace_replayer.status()
+    
+    def tick_interval(self, default: float) -> float:
+        """백그라운드 모니터링 루프 주기 (재생 중이면 재생 tick_seconds)"""
+        if self.trace_replayer is not None and self.trace_replayer.active:
+            return self.trace_replayer.tick_seconds
+        return default
+    
+    def stop_replay(self) -> Optional[Dict[str, Any]]:
+        """트레이스 재생 중지 후 일반 모드로 복귀"""
+        if self.trace_replayer is None:
+            return None
+        self.trace_replayer.active = False
+        self.rng = random.Random()
+        logger.info("트레이스 재생 중지")
+        return self.trace_replayer.status()
+    
+    async def run_replay(
+        self,
+        seed: int = 42,
+        speed: float = 1.0,
+        tick_seconds: float = 5.0
+    ) -> Dict[str, Any]:
+        """트레이스 전체를 대기 없이 재생하고 결과 리포트 반환 (일정 틱마다 이벤트 루프 양보)"""
+        self.start_replay(seed=seed, speed=speed, tick_seconds=tick_seconds, loop=False)
+        replayer = self.trace_replayer
+        while replayer.active:
+            await self.generate_metrics()
+            if replayer.tick % REPLAY_YIELD_TICKS == 0:
+                await asyncio.sleep(0)
+        return replayer.report(await self.check_sla())
+    
     async def generate_metrics(self) -> Dict[str, Any]:
         """실제와 유사한 모니터링 메트릭 생성"""
-        current_time = datetime.now()
+        replayer = self.trace_replayer if self.trace_replayer and self.trace_replayer.active else None
+        current_time = replayer.current_time() if replayer else datetime.now()
         all_metrics = {}
         
         # [advice from AI] 배포된 서비스가 없으면 빈 메트릭 반환
         if not self.services:
+            if replayer:
+                replayer.advance()
             return {
                 "timestamp": current_time.isoformat(),
                 "services": {},
@@ -150,13 +217,19 @@ class MonitoringEngine:
                 }
             }
         
-        for service_name, service_config in self.services.items():
+        # [advice from AI] 재생 중에는 난수 소비 순서를 고정하기 위해 서비스명 순으로 처리
+        service_items = sorted(self.services.items()) if replayer else self.services.items()
+        
+        for service_name, service_config in service_items:
             # 시간대별 트래픽 패턴 시뮬레이션 (업무시간 vs 야간)
             hour = current_time.hour
-            traffic_multiplier = self._get_traffic_multiplier(hour)
+            trace_multiplier = replayer.traffic_multiplier(service_name) if replayer else None
+            traffic_multiplier = trace_multiplier if trace_multiplier is not None else self._get_traffic_multiplier(hour)
+            if replayer:
+                service_config = replayer.scaled_config(service_name, service_config, traffic_multiplier)
             
             # 장애 시나리오 적용 여부 확인
-            incident_impact = self._check_incident_scenarios(service_name)
+            incident_impact = self._check_incident_scenarios(service_name, schedule_recovery=replayer is None)
             
             # 기본 메트릭 생성
             metrics = await self._generate_service_metrics(
@@ -166,19 +239,31 @@ class MonitoringEngine:
                 incident_impact
             )
             
+            if replayer:
+                metrics["hpa"] = replayer.record_hpa_decision(
+                    service_name, service_config, metrics["cpu"]["usage_percent"]
+                )
+            
             all_metrics[service_name] = metrics
         
         # 전체 클러스터 메트릭 생성
         cluster_metrics = await self._generate_cluster_metrics(all_metrics)
         all_metrics["cluster"] = cluster_metrics
         
+        summary = self._generate_summary_metrics(all_metrics)
+        
         # 메트릭 히스토리에 저장
-        self._store_metrics_history(current_time, all_metrics)
+        self._store_metrics_history(current_time, {"services": all_metrics, "summary": summary})
+        
+        if replayer:
+            replayer.record_tick(summary)
+            replayer.advance()
         
         return {
             "timestamp": current_time.isoformat(),
             "services": all_metrics,
-            "summary": self._generate_summary_metrics(all_metrics)
+            "summary": summary,
+            **({"replay": replayer.status()} if replayer else {})
         }
     
     def _get_traffic_multiplier(self, hour: int) -> float:
@@ -187,23 +272,24 @@ class MonitoringEngine:
         if 9 <= hour <= 18:
             return 1.0 + 0.3 * math.sin((hour - 9) * math.pi / 9)  # 0.7 ~ 1.3
         elif 22 <= hour or hour <= 6:
-            return 0.2 + 0.1 * random.random()  # 0.2 ~ 0.3
+            return 0.2 + 0.1 * self.rng.random()  # 0.2 ~ 0.3
         else:
-            return 0.5 + 0.3 * random.random()  # 0.5 ~ 0.8
+            return 0.5 + 0.3 * self.rng.random()  # 0.5 ~ 0.8
     
-    def _check_incident_scenarios(self, service_name: str) -> Dict[str, float]:
-        """장애 시나리오 확인 및 적용"""
+    def _check_incident_scenarios(self, service_name: str, schedule_recovery: bool = True) -> Dict[str, float]:
+        """장애 시나리오 확인 및 적용 (재생 중에는 틱 단위로만 적용, 벽시계 기준 복구 태스크 생략)"""
         impact = {}
         
         for scenario in self.incident_scenarios:
-            if random.random() < scenario["probability"]:
+            if self.rng.random() < scenario["probability"]:
                 logger.warning(f"Incident '{scenario['name']}' triggered for {service_name}")
                 impact.update(scenario["impact"])
                 
                 # 장애 지속 시간 후 자동 복구 스케줄링
-                asyncio.create_task(
-                    self._schedule_incident_recovery(service_name, scenario["duration"])
-                )
+                if schedule_recovery:
+                    asyncio.create_task(
+                        self._schedule_incident_recovery(service_name, scenario["duration"])
+                    )
         
         return impact
     
@@ -223,40 +309,40 @@ class MonitoringEngine:
         
         # CPU 사용률 (실제 서버와 유사한 패턴)
         base_cpu = config["cpu_baseline"]
-        cpu_variance = random.uniform(-10, 15)  # 자연스러운 변동
+        cpu_variance = self.rng.uniform(-10, 15)  # 자연스러운 변동
         cpu_usage = base_cpu + cpu_variance * traffic_multiplier
         cpu_usage *= incident_impact.get("cpu", 1.0)  # 장애 영향 적용
         cpu_usage = max(0, min(100, cpu_usage))  # 0-100% 범위 제한
         
         # 메모리 사용률
         base_memory = config["memory_baseline"]
-        memory_variance = random.uniform(-50, 100)
+        memory_variance = self.rng.uniform(-50, 100)
         memory_usage = base_memory + memory_variance * traffic_multiplier
         memory_usage *= incident_impact.get("memory", 1.0)
         memory_usage = max(0, memory_usage)
         
         # 네트워크 메트릭
         base_rps = config["requests_per_second"]
-        rps = base_rps * traffic_multiplier * random.uniform(0.8, 1.2)
+        rps = base_rps * traffic_multiplier * self.rng.uniform(0.8, 1.2)
         
         # 응답 시간 (ms)
         base_response_time = config["response_time"]
-        response_time = base_response_time * random.uniform(0.7, 1.5)
+        response_time = base_response_time * self.rng.uniform(0.7, 1.5)
         response_time *= incident_impact.get("response_time", 1.0)
         
         # 에러율 (%)
         base_error_rate = config["error_rate"]
-        error_rate = base_error_rate + random.uniform(-0.01, 0.02)
+        error_rate = base_error_rate + self.rng.uniform(-0.01, 0.02)
         error_rate += incident_impact.get("error_rate", 0.0)
         error_rate = max(0, error_rate)
         
         # 디스크 I/O
-        disk_read = random.uniform(10, 500) * traffic_multiplier  # MB/s
-        disk_write = random.uniform(5, 200) * traffic_multiplier  # MB/s
+        disk_read = self.rng.uniform(10, 500) * traffic_multiplier  # MB/s
+        disk_write = self.rng.uniform(5, 200) * traffic_multiplier  # MB/s
         
         # 네트워크 I/O
-        network_in = rps * random.uniform(1, 5)  # KB/s
-        network_out = rps * random.uniform(2, 10)  # KB/s
+        network_in = rps * self.rng.uniform(1, 5)  # KB/s
+        network_out = rps * self.rng.uniform(2, 10)  # KB/s
         
         return {
             "cpu": {
@@ -280,7 +366,7 @@ class MonitoringEngine:
             "disk": {
                 "read_mb_per_sec": round(disk_read, 2),
                 "write_mb_per_sec": round(disk_write, 2),
-                "usage_percent": round(random.uniform(40, 85), 2)
+                "usage_percent": round(self.rng.uniform(40, 85), 2)
             },
             "replicas": {
                 "desired": config["replicas"],
@@ -289,7 +375,7 @@ class MonitoringEngine:
             },
             "health": {
                 "status": "healthy" if error_rate < 1.0 and cpu_usage < 90 else "warning" if error_rate < 5.0 else "critical",
-                "uptime_seconds": random.randint(3600, 86400 * 7)  # 1시간 ~ 7일
+                "uptime_seconds": self.rng.randint(3600, 86400 * 7)  # 1시간 ~ 7일
             }
         }
     
@@ -360,7 +446,7 @@ class MonitoringEngine:
             "total_services": services.get("total", 0),
             "healthy_services": services.get("healthy", 0),
             "total_requests_per_second": traffic.get("total_rps", 0),
-            "average_response_time": round(random.uniform(50, 150), 2)
+            "average_response_time": round(self.rng.uniform(50, 150), 2)
         }
     
     def _store_metrics_history(self, timestamp: datetime, metrics: Dict[str, Any]):
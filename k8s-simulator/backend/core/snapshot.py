@@ -0,0 +1,160 @@
+# [advice from AI] 시뮬레이터 상태 스냅샷/복원 - 재시작 시 대규모 플릿 빠른 복구
+"""
+- 리소스 상태를 압축 바이너리 스냅샷(msgpack, 미설치 시 JSON)으로 저장
+- 임시 파일에 쓴 뒤 교체하는 원자적 저장
+- 시작 시 스냅샷(없으면 k8s_resources 테이블)에서 웜 스타트 후 인덱스/모니터링 서비스 재구성
+- 스냅샷에 저장 시점의 DB 기준점(db_watermark)을 기록, 이후 DB가 변경됐으면 스냅샷 대신 DB에서 복원
+"""
+import json
+import logging
+import os
+import time
+import zlib
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    msgpack = None
+    HAS_MSGPACK = False
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"ECPSNAP1"
+FORMAT_MSGPACK = 1
+FORMAT_JSON = 2
+SNAPSHOT_SCHEMA_VERSION = 2
+
+
+class SnapshotStore:
+    """스냅샷 파일 저장소 (헤더: MAGIC + 포맷 1바이트, 본문: zlib 압축)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.last_saved_at: Optional[str] = None
+        self.last_stats: Dict[str, Any] = {}
+
+    def encode(self, state: Dict[str, Any]) -> bytes:
+        if HAS_MSGPACK:
+            payload = msgpack.packb(state, use_bin_type=True, default=str)
+            fmt = FORMAT_MSGPACK
+        else:
+            payload = json.dumps(state, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+            fmt = FORMAT_JSON
+        return SNAPSHOT_MAGIC + bytes([fmt]) + zlib.compress(payload, 6)
+
+    def decode(self, data: bytes) -> Dict[str, Any]:
+        if not data.startswith(SNAPSHOT_MAGIC):
+            raise ValueError("스냅샷 형식이 올바르지 않습니다")
+        fmt = data[len(SNAPSHOT_MAGIC)]
+        payload = zlib.decompress(data[len(SNAPSHOT_MAGIC) + 1:])
+        if fmt == FORMAT_MSGPACK:
+            if not HAS_MSGPACK:
+                raise ValueError("msgpack 스냅샷을 읽으려면 msgpack 패키지가 필요합니다")
+            return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+        if fmt == FORMAT_JSON:
+            return json.loads(payload.decode("utf-8"))
+        raise ValueError(f"알 수 없는 스냅샷 포맷: {fmt}")
+
+    def save(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """스냅샷 저장 (동기 - 스레드에서 호출)"""
+        started = time.perf_counter()
+        data = self.encode(state)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
+
+        self.last_saved_at = datetime.now().isoformat()
+        self.last_stats = {
+            "path": self.path,
+            "format": "msgpack" if HAS_MSGPACK else "json",
+            "bytes": len(data),
+            "resources": len(state.get("resources", [])),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+            "saved_at": self.last_saved_at
+        }
+        return self.last_stats
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """스냅샷 로드 (없으면 None)"""
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, "rb") as f:
+            state = self.decode(f.read())
+        if state.get("schema_version") != SNAPSHOT_SCHEMA_VERSION:
+            logger.warning(f"스냅샷 스키마 버전 불일치: {state.get('schema_version')}")
+            return None
+        return state
+
+
+def build_snapshot(simulator, db_watermark: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """시뮬레이터 상태를 스냅샷 딕셔너리로 변환
+
+    db_watermark는 리소스를 내보내기 전에 조회해야 함 (메모리가 DB보다 먼저 갱신되므로
+    기준점에 반영된 DB 변경은 모두 스냅샷에도 포함됨)
+    """
+    return {
+        "schema_version": SNAPSHOT_SCHEMA_VERSION,
+        "created_at": datetime.now().isoformat(),
+        "state_version": simulator.state_version,
+        "db_watermark": db_watermark,
+        "resources": simulator.export_resources()
+    }
+
+
+async def warm_start(simulator, engine, store: SnapshotStore) -> Dict[str, Any]:
+    """스냅샷(없거나 DB보다 오래되면 DB)에서 상태 복원 후 모니터링 서비스 재구성, 단계별 소요 시간 반환"""
+    started = time.perf_counter()
+    stats: Dict[str, Any] = {"source": "empty", "resources": 0}
+
+    try:
+        state = store.load()
+    except Exception as e:
+        logger.error(f"스냅샷 로드 실패: {e}")
+        state = None
+    
+    if state is not None:
+        # [advice from AI] 스냅샷 이후 DB가 변경됐으면 (배포/상태 변경/삭제) 스냅샷은 오래된 상태
+        current_watermark = await simulator.db_watermark()
+        if current_watermark is not None and current_watermark != state.get("db_watermark"):
+            logger.warning(
+                f"스냅샷이 DB보다 오래됨 (snapshot={state.get('db_watermark')}, db={current_watermark}), DB에서 복원"
+            )
+            stats["stale_snapshot_created_at"] = state.get("created_at")
+            state = None
+    load_ms = (time.perf_counter() - started) * 1000
+
+    if state is not None:
+        simulator.restore_resources(state.get("resources", []))
+        stats["source"] = "snapshot"
+        stats["snapshot_created_at"] = state.get("created_at")
+    else:
+        restored = await simulator.restore_from_db()
+        if restored:
+            stats["source"] = "database"
+    restore_ms = (time.perf_counter() - started) * 1000 - load_ms
+
+    resources = await simulator.get_resources()
+    await engine.update_services_from_resources(resources)
+    total_ms = (time.perf_counter() - started) * 1000
+
+    stats.update({
+        "resources": len(resources),
+        "namespaces": len(simulator.namespace_index),
+        "monitored_services": len(engine.services),
+        "timings_ms": {
+            "load": round(load_ms, 2),
+            "restore": round(restore_ms, 2),
+            "monitoring": round(total_ms - load_ms - restore_ms, 2),
+            "total": round(total_ms, 2)
+        },
+        "completed_at": datetime.now().isoformat()
+    })
+    logger.info(
+        f"웜 스타트 완료: source={stats['source']}, 리소스 {stats['resources']}개, "
+        f"{stats['timings_ms']['total']}ms"
+    )
+    return stats
@@ -0,0 +1,333 @@
+# [advice from AI] 트레이스 기반 부하 재생 - 서비스별 호출량 시계열을 결정적으로 재생
+"""
+- CSV(long: timestamp,service,volume / wide: timestamp,서비스1,서비스2...) 또는 JSON 시계열 파싱
+- 재생 속도(speed)와 고정 시드로 틱 단위 결정적 재생 (벽시계가 아닌 틱 수 기준으로 시간 진행)
+- 트레이스 볼륨 기반 트래픽 배수 및 HPA 스케일링 결정 기록
+"""
+import bisect
+import csv
+import hashlib
+import io
+import json
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Tuple
+
+# [advice from AI] HPA 기본값 (Kubernetes HPA 컨트롤러 기본 동작과 동일한 허용 오차)
+HPA_TARGET_CPU_PERCENT = 70.0
+HPA_TOLERANCE = 0.1
+HPA_MAX_REPLICA_FACTOR = 5
+MAX_TIMELINE_POINTS = 10000
+
+
+def _parse_timestamp(value: str) -> Tuple[Optional[datetime], Optional[float]]:
+    """타임스탬프 문자열을 (datetime, 초 오프셋) 중 하나로 해석"""
+    value = value.strip()
+    try:
+        return None, float(value)
+    except ValueError:
+        pass
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).replace(tzinfo=None), None
+
+
+@dataclass
+class LoadTrace:
+    """서비스별 부하 시계열 (오프셋 초 기준 계단형)"""
+    start_time: datetime
+    series: Dict[str, List[Tuple[float, float]]] = field(default_factory=dict)
+    source: str = "upload"
+
+    def __post_init__(self):
+        for points in self.series.values():
+            points.sort(key=lambda p: p[0])
+        self._offsets = {name: [p[0] for p in points] for name, points in self.series.items()}
+        self._means = {
+            name: (sum(p[1] for p in points) / len(points)) if points else 0.0
+            for name, points in self.series.items()
+        }
+
+    @property
+    def duration_seconds(self) -> float:
+        """트레이스 전체 길이 (마지막 샘플 오프셋)"""
+        return max((points[-1][0] for points in self.series.values() if points), default=0.0)
+
+    @property
+    def point_count(self) -> int:
+        return sum(len(points) for points in self.series.values())
+
+    def volume_at(self, service: str, offset: float) -> Optional[float]:
+        """오프셋 시점의 볼륨 (직전 샘플 유지)"""
+        points = self.series.get(service)
+        if not points:
+            return None
+        idx = bisect.bisect_right(self._offsets[service], offset) - 1
+        return points[max(idx, 0)][1]
+
+    def mean_volume(self, service: str) -> float:
+        return self._means.get(service, 0.0)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "source": self.source,
+            "start_time": self.start_time.isoformat(),
+            "duration_seconds": self.duration_seconds,
+            "services": sorted(self.series.keys()),
+            "point_count": self.point_count
+        }
+
+    @classmethod
+    def from_rows(cls, rows: List[Tuple[str, str, float]], source: str = "upload") -> "LoadTrace":
+        """(timestamp, service, volume) 행 목록에서 트레이스 생성"""
+        if not rows:
+            raise ValueError("트레이스에 데이터가 없습니다")
+
+        parsed = []
+        for ts, service, volume in rows:
+            dt, offset = _parse_timestamp(ts)
+            parsed.append((dt, offset, service, float(volume)))
+
+        datetimes = [p[0] for p in parsed if p[0] is not None]
+        if datetimes and len(datetimes) != len(parsed):
+            raise ValueError("타임스탬프 형식이 혼재되어 있습니다 (ISO 시각 또는 초 오프셋 중 하나만 사용)")
+
+        start_time = min(datetimes) if datetimes else datetime(2024, 1, 1)
+        series: Dict[str, List[Tuple[float, float]]] = {}
+        for dt, offset, service, volume in parsed:
+            if dt is not None:
+                offset = (dt - start_time).total_seconds()
+            series.setdefault(service, []).append((offset, max(0.0, volume)))
+
+        return cls(start_time=start_time, series=series, source=source)
+
+    @classmethod
+    def from_csv(cls, content: str, source: str = "csv") -> "LoadTrace":
+        """CSV 트레이스 파싱 (long/wide 형식 자동 판별)"""
+        reader = csv.reader(io.StringIO(content.strip()))
+        header = [h.strip() for h in next(reader, [])]
+        if len(header) < 2:
+            raise ValueError("CSV 헤더가 올바르지 않습니다")
+
+        lowered = [h.lower() for h in header]
+        rows: List[Tuple[str, str, float]] = []
+
+        if "service" in lowered and "volume" in lowered:
+            ts_idx = lowered.index("timestamp") if "timestamp" in lowered else 0
+            svc_idx = lowered.index("service")
+            vol_idx = lowered.index("volume")
+            for row in reader:
+                if not row:
+                    continue
+                rows.append((row[ts_idx], row[svc_idx].strip(), float(row[vol_idx])))
+        else:
+            # wide 형식: 첫 컬럼이 타임스탬프, 나머지는 서비스별 볼륨
+            services = header[1:]
+            for row in reader:
+                if not row:
+                    continue
+                for service, value in zip(services, row[1:]):
+                    if value.strip():
+                        rows.append((row[0], service, float(value)))
+
+        return cls.from_rows(rows, source=source)
+
+    @classmethod
+    def from_json(cls, content: str, source: str = "json") -> "LoadTrace":
+        """JSON 트레이스 파싱
+
+        - {"interval_seconds": 60, "series": {"callbot": [10, 12, ...]}}
+        - [{"timestamp": ..., "service": ..., "volume": ...}, ...]
+        """
+        data = json.loads(content)
+        rows: List[Tuple[str, str, float]] = []
+
+        if isinstance(data, dict) and "series" in data:
+            interval = float(data.get("interval_seconds", 60))
+            for service, values in data["series"].items():
+                for i, value in enumerate(values):
+                    rows.append((str(i * interval), service, float(value)))
+            trace = cls.from_rows(rows, source=source)
+            if data.get("start_time"):
+                trace.start_time = datetime.fromisoformat(data["start_time"])
+            return trace
+
+        if isinstance(data, list):
+            for item in data:
+                rows.append((str(item["timestamp"]), item["service"], float(item["volume"])))
+            return cls.from_rows(rows, source=source)
+
+        raise ValueError("지원하지 않는 JSON 트레이스 형식입니다")
+
+
+def parse_trace(content: str, filename: Optional[str] = None) -> LoadTrace:
+    """파일명/내용으로 형식을 판별하여 트레이스 파싱"""
+    stripped = content.lstrip()
+    if (filename or "").lower().endswith(".json") or stripped.startswith(("{", "[")):
+        return LoadTrace.from_json(content, source=filename or "json")
+    return LoadTrace.from_csv(content, source=filename or "csv")
+
+
+class TraceReplayer:
+    """틱 단위 결정적 트레이스 재생기"""
+
+    def __init__(
+        self,
+        trace: LoadTrace,
+        speed: float = 1.0,
+        seed: int = 42,
+        tick_seconds: float = 5.0,
+        loop: bool = False,
+        hpa_target_cpu: float = HPA_TARGET_CPU_PERCENT
+    ):
+        if speed <= 0 or tick_seconds <= 0:
+            raise ValueError("speed와 tick_seconds는 0보다 커야 합니다")
+
+        self.trace = trace
+        self.speed = speed
+        self.seed = seed
+        self.tick_seconds = tick_seconds
+        self.loop = loop
+        self.hpa_target_cpu = hpa_target_cpu
+
+        self.active = True
+        self.finished = False
+        self.tick = 0
+        self.offset = 0.0
+        self.started_at = datetime.now()
+        self.replicas: Dict[str, int] = {}
+        self.scale_events = 0
+        self.timeline = deque(maxlen=MAX_TIMELINE_POINTS)
+        self._digest = hashlib.sha256()
+        self._service_map: Dict[str, Optional[str]] = {}
+
+    @property
+    def step_seconds(self) -> float:
+        """틱당 진행되는 트레이스 시간 (초)"""
+        return self.tick_seconds * self.speed
+
+    def current_time(self) -> datetime:
+        """현재 재생 중인 트레이스 시각"""
+        return self.trace.start_time + timedelta(seconds=self.offset)
+
+    def resolve_service(self, service_name: str) -> Optional[str]:
+        """시뮬레이터 서비스명을 트레이스 서비스명에 매칭 (정확히 일치 → 부분 일치)"""
+        if service_name not in self._service_map:
+            match = None
+            if service_name in self.trace.series:
+                match = service_name
+            else:
+                for trace_service in sorted(self.trace.series.keys(), key=len, reverse=True):
+                    if trace_service in service_name:
+                        match = trace_service
+                        break
+            self._service_map[service_name] = match
+        return self._service_map[service_name]
+
+    def traffic_multiplier(self, service_name: str) -> Optional[float]:
+        """트레이스 평균 대비 현재 볼륨 비율 (매칭되는 시계열이 없으면 None)"""
+        trace_service = self.resolve_service(service_name)
+        if trace_service is None:
+            return None
+        mean = self.trace.mean_volume(trace_service)
+        volume = self.trace.volume_at(trace_service, self.offset) or 0.0
+        return volume / mean if mean > 0 else 0.0
+
+    def scaled_config(self, service_name: str, config: Dict[str, Any], traffic_multiplier: float) -> Dict[str, Any]:
+        """현재 HPA 레플리카 수와 부하를 반영한 서비스 설정"""
+        base_replicas = max(1, int(config.get("replicas", 1)))
+        current = self.replicas.setdefault(service_name, base_replicas)
+        load_factor = traffic_multiplier * base_replicas / current
+
+        scaled = dict(config)
+        scaled["replicas"] = current
+        scaled["cpu_baseline"] = config["cpu_baseline"] * load_factor
+        scaled["requests_per_second"] = config["requests_per_second"] * current / base_replicas
+        scaled["base_replicas"] = base_replicas
+        return scaled
+
+    def record_hpa_decision(self, service_name: str, config: Dict[str, Any], cpu_usage: float) -> Dict[str, Any]:
+        """HPA 공식(desired = ceil(current * current/target))으로 다음 레플리카 수 결정"""
+        base_replicas = config.get("base_replicas", config.get("replicas", 1))
+        min_replicas = max(1, int(base_replicas))
+        max_replicas = int(config.get("max_replicas") or min_replicas * HPA_MAX_REPLICA_FACTOR)
+        current = self.replicas.get(service_name, min_replicas)
+
+        ratio = cpu_usage / self.hpa_target_cpu if self.hpa_target_cpu > 0 else 1.0
+        if abs(ratio - 1.0) <= HPA_TOLERANCE:
+            desired = current
+        else:
+            desired = math.ceil(current * ratio)
+        desired = max(min_replicas, min(max_replicas, desired))
+
+        if desired != current:
+            self.scale_events += 1
+        self.replicas[service_name] = desired
+
+        return {
+            "current_replicas": current,
+            "desired_replicas": desired,
+            "target_cpu_percent": self.hpa_target_cpu,
+            "scaled": desired != current
+        }
+
+    def record_tick(self, summary: Dict[str, Any]):
+        """틱 결과를 타임라인과 결정성 검증용 다이제스트에 기록"""
+        point = {
+            "tick": self.tick,
+            "offset_seconds": round(self.offset, 3),
+            "sla_percentage": summary.get("sla_percentage"),
+            "overall_health": summary.get("overall_health"),
+            "total_requests_per_second": summary.get("total_requests_per_second"),
+            "replicas": dict(sorted(self.replicas.items()))
+        }
+        self.timeline.append(point)
+        self._digest.update(json.dumps(point, sort_keys=True).encode("utf-8"))
+
+    def advance(self):
+        """다음 틱으로 진행"""
+        self.tick += 1
+        self.offset += self.step_seconds
+        if self.offset > self.trace.duration_seconds:
+            if self.loop and self.trace.duration_seconds > 0:
+                self.offset = self.offset % (self.trace.duration_seconds + self.step_seconds)
+            else:
+                self.finished = True
+                self.active = False
+
+    def status(self) -> Dict[str, Any]:
+        duration = self.trace.duration_seconds
+        return {
+            "active": self.active,
+            "finished": self.finished,
+            "seed": self.seed,
+            "speed": self.speed,
+            "tick_seconds": self.tick_seconds,
+            "loop": self.loop,
+            "tick": self.tick,
+            "offset_seconds": round(self.offset, 3),
+            "progress_percent": round(min(100.0, self.offset / duration * 100), 2) if duration > 0 else 100.0,
+            "trace_time": self.current_time().isoformat(),
+            "replicas": dict(sorted(self.replicas.items())),
+            "scale_events": self.scale_events,
+            "result_digest": self._digest.hexdigest(),
+            "started_at": self.started_at.isoformat()
+        }
+
+    def report(self, sla_status: Dict[str, Any]) -> Dict[str, Any]:
+        """재생 결과 리포트 (매니페스트 버전 간 비교용)"""
+        points = list(self.timeline)
+        sla_values = [p["sla_percentage"] for p in points if p["sla_percentage"] is not None]
+        return {
+            **self.status(),
+            "trace": self.trace.summary(),
+            "sla": sla_status,
+            "ticks_recorded": len(points),
+            "min_sla_percentage": min(sla_values) if sla_values else None,
+            "breached_ticks": sum(1 for p in points if p["overall_health"] == "critical"),
+            "peak_replicas": {
+                name: max(p["replicas"].get(name, 0) for p in points)
+                for name in self.replicas
+            } if points else {},
+            "timeline": points
+        }
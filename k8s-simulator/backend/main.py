@@ -5,7 +5,8 @@ from fastapi.responses import JSONResponse
 import asyncio
 import json
 import logging
-from typing import List, Dict, Any
+import time
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 import os
 
@@ -14,6 +15,7 @@ from core.database import init_db
 from core.k8s_simulator import K8sSimulator
 from core.monitoring_engine import MonitoringEngine
 from core.websocket_manager import WebSocketManager
+from core.snapshot import SnapshotStore, build_snapshot, warm_start
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -40,10 +42,44 @@ k8s_simulator = K8sSimulator()
 monitoring_engine = MonitoringEngine()
 websocket_manager = WebSocketManager()
 
+# [advice from AI] 상태 스냅샷 설정 (주기적 저장 + 시작 시 웜 스타트)
+SNAPSHOT_PATH = os.getenv("SIMULATOR_SNAPSHOT_PATH", "/tmp/k8s_simulator_snapshot.bin")
+SNAPSHOT_INTERVAL_SECONDS = int(os.getenv("SIMULATOR_SNAPSHOT_INTERVAL", "60"))
+snapshot_store = SnapshotStore(SNAPSHOT_PATH)
+startup_stats: Dict[str, Any] = {}
+
+# [advice from AI] 백그라운드 모니터링 주기 (트레이스 재생 중에는 재생 tick_seconds 사용) / 시스템 알림 생성 주기
+MONITORING_INTERVAL_SECONDS = float(os.getenv("SIMULATOR_MONITORING_INTERVAL", "5"))
+SYSTEM_ALERT_INTERVAL_SECONDS = float(os.getenv("SIMULATOR_SYSTEM_ALERT_INTERVAL", "120"))
+_last_snapshot_version = -1
+_last_snapshot_watermark: Optional[Dict[str, Any]] = None
+
 def get_simulator():
     """전역 시뮬레이터 인스턴스 반환"""
     return k8s_simulator
 
+def get_monitoring_engine():
+    """전역 모니터링 엔진 인스턴스 반환"""
+    return monitoring_engine
+
+def get_startup_stats() -> Dict[str, Any]:
+    """웜 스타트 소요 시간 통계 반환"""
+    return startup_stats
+
+async def save_snapshot(force: bool = False) -> Dict[str, Any]:
+    """시뮬레이터 상태 스냅샷 저장 (메모리/DB 모두 변경이 없으면 건너뜀)"""
+    global _last_snapshot_version, _last_snapshot_watermark
+    version = k8s_simulator.state_version
+    # [advice from AI] DB 기준점은 리소스를 내보내기 전에 조회 (스냅샷이 기준점보다 오래되지 않도록)
+    db_watermark = await k8s_simulator.db_watermark()
+    if not force and version == _last_snapshot_version and db_watermark == _last_snapshot_watermark:
+        return {"status": "unchanged", **snapshot_store.last_stats}
+    
+    state = build_snapshot(k8s_simulator, db_watermark)
+    stats = await asyncio.to_thread(snapshot_store.save, state)
+    _last_snapshot_version, _last_snapshot_watermark = version, db_watermark
+    return {"status": "saved", **stats}
+
 @app.on_event("startup")
 async def startup_event():
     """애플리케이션 시작 시 초기화"""
@@ -52,6 +88,11 @@ async def startup_event():
     # Initialize database
     await init_db()
     
+    # [advice from AI] 스냅샷(없거나 DB보다 오래되면 DB)에서 상태 복원 및 모니터링 서비스 재구성
+    global _last_snapshot_version
+    startup_stats.update(await warm_start(k8s_simulator, monitoring_engine, snapshot_store))
+    _last_snapshot_version = k8s_simulator.state_version
+    
     # [advice from AI] 알림 시스템 초기화
     from api.routes import _initialize_base_alerts
     await _initialize_base_alerts()
@@ -61,6 +102,7 @@ async def startup_event():
     
     # Start background tasks
     asyncio.create_task(background_monitoring_task())
+    asyncio.create_task(background_snapshot_task())
     
     logger.info("K8S Simulator started successfully!")
 
@@ -69,11 +111,20 @@ async def shutdown_event():
     """애플리케이션 종료 시 정리"""
     logger.info("K8S Simulator shutting down...")
     await monitoring_engine.stop()
+    try:
+        await save_snapshot()
+    except Exception as e:
+        logger.error(f"Shutdown snapshot error: {e}")
+    try:
+        from api.routes import get_alert_store
+        get_alert_store().close()
+    except Exception as e:
+        logger.error(f"Shutdown alert store error: {e}")
     logger.info("K8S Simulator stopped.")
 
 async def background_monitoring_task():
     """백그라운드 모니터링 태스크"""
-    alert_counter = 0  # [advice from AI] 알림 생성 주기 관리
+    last_system_alert = time.monotonic()  # [advice from AI] 알림 생성 주기 관리 (틱 주기와 무관하게 시간 기준)
     
     while True:
         try:
@@ -83,12 +134,15 @@ async def background_monitoring_task():
             # Check SLA status
             sla_status = await monitoring_engine.check_sla()
             
-            # [advice from AI] 주기적으로 새로운 알림 생성 (2분마다)
-            alert_counter += 1
-            if alert_counter >= 24:  # 5초 * 24 = 2분
+            # [advice from AI] 주기적으로 새로운 알림 생성 (기본 2분마다)
+            if time.monotonic() - last_system_alert >= SYSTEM_ALERT_INTERVAL_SECONDS:
                 from api.routes import _generate_system_alerts
                 await _generate_system_alerts()
-                alert_counter = 0
+                last_system_alert = time.monotonic()
+            
+            # [advice from AI] 그룹 커밋 대기 중인 알림 기록 (알림이 뜸해도 한 틱 내 반영)
+            from api.routes import get_alert_store
+            await asyncio.to_thread(get_alert_store().flush)
             
             # Broadcast to WebSocket clients
             await websocket_manager.broadcast({
@@ -98,13 +152,24 @@ async def background_monitoring_task():
                 "timestamp": datetime.now().isoformat()
             })
             
-            # Wait 5 seconds before next update
-            await asyncio.sleep(5)
+            # [advice from AI] 다음 틱까지 대기 (재생 중이면 재생 tick_seconds)
+            await asyncio.sleep(monitoring_engine.tick_interval(MONITORING_INTERVAL_SECONDS))
             
         except Exception as e:
             logger.error(f"Background monitoring task error: {e}")
             await asyncio.sleep(10)
 
+async def background_snapshot_task():
+    """[advice from AI] 주기적 상태 스냅샷 저장 태스크"""
+    while True:
+        await asyncio.sleep(SNAPSHOT_INTERVAL_SECONDS)
+        try:
+            result = await save_snapshot()
+            if result["status"] == "saved":
+                logger.info(f"스냅샷 저장: {result['resources']}개 리소스, {result['bytes']} bytes, {result['elapsed_ms']}ms")
+        except Exception as e:
+            logger.error(f"Background snapshot task error: {e}")
+
 @app.get("/")
 async def root():
     """루트 엔드포인트"""
@@ -121,6 +186,7 @@ async def health_check():
         "status": "healthy",
         "service": "k8s-simulator",
         "version": "1.54.0",
+        "warm_start": startup_stats,
         "timestamp": datetime.now().isoformat()
     }
 
@@ -0,0 +1,166 @@
+# [advice from AI] K8S Simulator 알림 저장소 테스트
+"""
+AlertStore 테스트 (임시 SQLite 파일)
+- 추가/조회 (id 자동 부여, 심각도 필터, 시간 범위 최신순)
+- since_id 커서 (최근 구간 deque / 범위 밖 SQLite 조회)
+- append는 메모리에만 추가, flush/조회 시 한 트랜잭션으로 기록
+- 라우트는 SQLite 조회를 스레드에서 수행
+- 재시작 후 유지 (id 이어서 부여)
+- 기존 JSON 파일 최초 1회 가져오기
+"""
+
+import asyncio
+import json
+import random
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+import sys
+sys.path.append('/app')
+from api import routes
+from core.alert_store import AlertStore
+
+
+def _open(path, **options):
+    return AlertStore(path=str(path), **options)
+
+
+def _rows_on_disk(path) -> int:
+    conn = sqlite3.connect(str(path))
+    try:
+        return conn.execute("SELECT COUNT(*) FROM alerts").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestAlertStore:
+    """알림 저장소 테스트 클래스"""
+
+    @pytest.fixture
+    def store_path(self, tmp_path):
+        return tmp_path / "alerts.db"
+
+    def test_append_and_query(self, store_path):
+        """id/timestamp 자동 부여, 심각도 필터와 시간 범위 조회"""
+        # Given
+        store = _open(store_path)
+
+        # When
+        first = store.append({"severity": "warning", "message": "CPU 사용률 높음"})
+        store.append({"severity": "critical", "message": "파드 재시작"})
+        store.append({"severity": "warning", "message": "메모리 사용률 높음"})
+
+        # Then
+        assert first["id"] == 1 and "timestamp" in first
+        assert [a["id"] for a in store.since(0)] == [1, 2, 3]
+        assert [a["id"] for a in store.since(0, severity="warning")] == [1, 3]
+        recent = store.between(start=datetime.now() - timedelta(minutes=1))
+        assert [a["id"] for a in recent] == [3, 2, 1]
+        assert store.between(end=datetime.now() - timedelta(days=1)) == []
+        assert store.count() == 3
+        store.close()
+
+    def test_since_cursor_beyond_hot_window(self, store_path):
+        """최근 구간을 벗어난 since_id는 SQLite에서 id 오름차순으로 조회"""
+        # Given
+        store = _open(store_path, hot_window=2)
+        for index in range(6):
+            store.append({"severity": "info", "message": f"알림 {index}"})
+
+        # When
+        from_hot = store.since(4)
+        from_disk = store.since(1, limit=3)
+        latest = store.since(6)
+
+        # Then
+        assert [a["id"] for a in store.hot] == [5, 6]
+        assert [a["id"] for a in from_hot] == [5, 6]
+        assert [a["id"] for a in from_disk] == [2, 3, 4]
+        assert latest == []
+        store.close()
+
+    def test_append_only_enqueues(self, store_path):
+        """append는 파일에 기록하지 않고, flush 시 대기 중인 알림을 한 트랜잭션으로 기록"""
+        # Given
+        store = _open(store_path)
+
+        # When
+        for _ in range(100):
+            store.append({"severity": "info"})
+        pending_on_disk = _rows_on_disk(store_path)
+        flushed = store.flush()
+
+        # Then
+        assert pending_on_disk == 0
+        assert flushed == 100
+        assert _rows_on_disk(store_path) == 100
+        assert store.stats["flushes"] == 1
+        store.close()
+
+    def test_history_route_reads_off_loop(self, store_path, monkeypatch):
+        """알림 히스토리 조회는 SQLite 조회/flush를 이벤트 루프 스레드가 아닌 곳에서 수행"""
+        # Given
+        store = _open(store_path)
+        store.append({"severity": "warning", "message": "CPU 사용률 높음"})
+        monkeypatch.setattr(routes, "_alert_store", store)
+        monkeypatch.setattr(random, "random", lambda: 1.0)  # 확률적 시스템 알림 생성 안 함
+        query_threads = []
+        original_query = store._query
+
+        def tracking_query(sql, params):
+            query_threads.append(threading.current_thread())
+            return original_query(sql, params)
+
+        monkeypatch.setattr(store, "_query", tracking_query)
+
+        async def scenario():
+            response = await routes.get_alert_history(hours=1, severity=None, since_id=None, limit=10)
+            return threading.current_thread(), json.loads(response.body)
+
+        # When
+        loop_thread, body = asyncio.run(scenario())
+
+        # Then
+        assert body["total_alerts"] == 1 and body["total_stored_alerts"] == 1
+        assert query_threads and all(t is not loop_thread for t in query_threads)
+        store.close()
+
+    def test_persists_across_restart(self, store_path):
+        """닫았다 다시 열면 기록 유지, 최근 구간 복원, id 이어서 부여"""
+        # Given
+        store = _open(store_path)
+        store.append({"severity": "warning", "message": "재시작 전"})
+        store.append({"severity": "critical", "message": "재시작 전"})
+        store.close()
+
+        # When
+        reopened = _open(store_path)
+        record = reopened.append({"severity": "info", "message": "재시작 후"})
+
+        # Then
+        assert record["id"] == 3
+        assert [a["message"] for a in reopened.since(0)] == ["재시작 전", "재시작 전", "재시작 후"]
+        assert reopened.count() == 3
+        reopened.close()
+
+    def test_imports_legacy_json_once(self, store_path, tmp_path):
+        """기존 JSON 알림을 가져온 뒤 파일 이름 변경"""
+        # Given
+        legacy = tmp_path / "alerts.json"
+        legacy.write_text(json.dumps({"alerts": [
+            {"id": 7, "timestamp": datetime.now().isoformat(), "severity": "warning", "message": "기존 알림"}
+        ], "counter": 8}), encoding="utf-8")
+
+        # When
+        store = _open(store_path, legacy_json_path=str(legacy))
+        record = store.append({"severity": "info"})
+
+        # Then
+        assert not legacy.exists()
+        assert (tmp_path / "alerts.json.migrated").exists()
+        assert [a["id"] for a in store.since(0)] == [7, 8]
+        assert record["id"] == 8
+        store.close()
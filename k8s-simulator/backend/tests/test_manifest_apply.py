@@ -0,0 +1,299 @@
+# [advice from AI] K8S Simulator 매니페스트 적용/파싱 캐시 테스트
+"""
+매니페스트 적용 테스트 (임시 SQLite 파일)
+- 콘텐츠 해시 파싱 캐시 적중/미스, PARSE_CACHE_SIZE 초과 시 LRU 제거
+- 요청 기본 네임스페이스/배포 모드 반영 (캐시된 파싱 결과는 변경하지 않음)
+- /manifest/apply 라우트: 배포 결과, 검증 실패 422, YAML 오류/빈 매니페스트 400
+- 대량 배포: 테넌트별 성공/실패 격리, 행 저장 후 배포 완료 처리 시작, 옵션 범위 검증
+- /manifest/bulk, /manifest/bulk/ndjson 라우트 (NDJSON 줄 파싱, 잘못된 줄은 400)
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import sys
+sys.path.append('/app')
+import main
+from api import routes
+from api.routes import BulkDeployRequest, ManifestApplyRequest, _apply_request_defaults
+from core import k8s_simulator as simulator_module
+from core.database import Base, K8sResource
+from core.k8s_simulator import K8sSimulator
+from core.monitoring_engine import MonitoringEngine
+
+
+def _manifest(name: str, namespace: str = "") -> str:
+    namespace_line = f"\n  namespace: {namespace}" if namespace else ""
+    return (f"apiVersion: apps/v1\nkind: Deployment\nmetadata:\n  name: {name}{namespace_line}\n"
+            f"spec:\n  replicas: 2\n---\napiVersion: v1\nkind: Service\nmetadata:\n  name: {name}-svc"
+            f"{namespace_line}\n")
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    """시뮬레이터 DB를 임시 SQLite 파일로 교체"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'simulator.db'}")
+    Base.metadata.create_all(engine, tables=[K8sResource.__table__])
+    session_factory = sessionmaker(bind=engine)
+
+    def get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(simulator_module, "get_db", get_db)
+    yield session_factory
+    engine.dispose()
+
+
+@pytest.fixture
+def simulator(database, monkeypatch):
+    """임시 DB를 쓰는 전역 시뮬레이터/모니터링 엔진"""
+    instance = K8sSimulator()
+    monkeypatch.setattr(main, "k8s_simulator", instance)
+    monkeypatch.setattr(main, "monitoring_engine", MonitoringEngine())
+    return instance
+
+
+def _row_count(session_factory) -> int:
+    with session_factory() as db:
+        return db.query(K8sResource).count()
+
+
+class TestParseCache:
+    """파싱 캐시 테스트 클래스"""
+
+    def test_hit_and_miss(self):
+        """같은 콘텐츠는 캐시 적중 (같은 해시), 다른 콘텐츠는 미스"""
+        # Given
+        simulator = K8sSimulator()
+
+        async def scenario():
+            return (await simulator.parse_manifest(_manifest("callbot")),
+                    await simulator.parse_manifest(_manifest("callbot")),
+                    await simulator.parse_manifest(_manifest("chatbot")))
+
+        # When
+        first, second, other = asyncio.run(scenario())
+
+        # Then
+        assert first["cached"] is False and second["cached"] is True
+        assert first["count"] == second["count"] == 2
+        assert first["content_hash"] == second["content_hash"] != other["content_hash"]
+        assert other["cached"] is False
+        stats = simulator.get_parse_cache_stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 2, 2)
+
+    def test_lru_eviction(self, monkeypatch):
+        """PARSE_CACHE_SIZE 초과 시 가장 오래 사용하지 않은 항목 제거"""
+        # Given
+        monkeypatch.setattr(simulator_module, "PARSE_CACHE_SIZE", 2)
+        simulator = K8sSimulator()
+
+        async def scenario():
+            await simulator.parse_manifest(_manifest("a"))
+            await simulator.parse_manifest(_manifest("b"))
+            await simulator.parse_manifest(_manifest("a"))  # a 최근 사용
+            await simulator.parse_manifest(_manifest("c"))  # b 제거
+            return (await simulator.parse_manifest(_manifest("a")),
+                    await simulator.parse_manifest(_manifest("b")))
+
+        # When
+        a, b = asyncio.run(scenario())
+
+        # Then
+        assert a["cached"] is True
+        assert b["cached"] is False
+        assert simulator.get_parse_cache_stats()["size"] == 2
+
+    def test_yaml_error_not_cached(self):
+        """YAML 오류는 오류 결과를 반환하고 캐시하지 않음"""
+        simulator = K8sSimulator()
+
+        result = asyncio.run(simulator.parse_manifest("kind: [unclosed"))
+
+        assert result["status"] == "error"
+        assert simulator.get_parse_cache_stats()["size"] == 0
+
+
+class TestApplyRequestDefaults:
+    """요청 기본값 반영 테스트 클래스"""
+
+    def test_namespace_and_deployment_mode(self):
+        """네임스페이스가 없는 리소스에만 기본 네임스페이스, 모든 리소스에 배포 모드 어노테이션"""
+        # Given
+        resources = [
+            {"kind": "Deployment", "metadata": {"name": "callbot"}},
+            {"kind": "Service", "metadata": {"name": "callbot-svc", "namespace": "other",
+                                             "annotations": {"team": "ai"}}},
+        ]
+
+        # When
+        applied = _apply_request_defaults(resources, "acme-ecp-ai", "production")
+
+        # Then
+        assert [r["metadata"]["namespace"] for r in applied] == ["acme-ecp-ai", "other"]
+        assert applied[0]["metadata"]["annotations"] == {"ecp.ai/deployment-mode": "production"}
+        assert applied[1]["metadata"]["annotations"] == {"team": "ai", "ecp.ai/deployment-mode": "production"}
+        assert resources[0]["metadata"] == {"name": "callbot"}
+        assert resources[1]["metadata"]["annotations"] == {"team": "ai"}
+
+    def test_no_defaults_returns_resources_unchanged(self):
+        """기본값이 없으면 파싱 결과를 그대로 반환"""
+        resources = [{"kind": "Deployment", "metadata": {"name": "callbot"}}]
+
+        assert _apply_request_defaults(resources, None, None) is resources
+
+
+class TestApplyRoute:
+    """/manifest/apply 라우트 테스트 클래스"""
+
+    def test_apply_deploys_with_defaults(self, simulator):
+        """파싱+검증+배포 후 기본 네임스페이스로 저장, 같은 매니페스트 재적용은 캐시 적중"""
+        # Given
+        request = ManifestApplyRequest(manifest=_manifest("callbot"), tenant_id="acme",
+                                       namespace="acme-ecp-ai", deployment_mode="production")
+
+        async def scenario():
+            first = await routes.apply_manifest(request)
+            second = await routes.apply_manifest(request)
+            return first, second
+
+        # When
+        first, second = asyncio.run(scenario())
+        body, again = [json.loads(r.body) for r in (first, second)]
+
+        # Then
+        assert body["deployed_count"] == 2 and body["failed_count"] == 0
+        assert body["parse_cached"] is False and again["parse_cached"] is True
+        assert sorted(simulator.resources) == ["acme-ecp-ai/Deployment/callbot", "acme-ecp-ai/Service/callbot-svc"]
+        annotations = simulator.resources["acme-ecp-ai/Deployment/callbot"]["manifest"]["metadata"]["annotations"]
+        assert annotations == {"ecp.ai/deployment-mode": "production"}
+        assert "callbot" in main.monitoring_engine.services
+
+    def test_validation_errors(self, simulator):
+        """필수 필드 누락은 422, YAML 오류/빈 매니페스트는 400, 아무것도 배포하지 않음"""
+        # Given
+        missing_name = "apiVersion: v1\nkind: ConfigMap\nmetadata: {}\n"
+
+        async def status_of(manifest):
+            try:
+                await routes.apply_manifest(ManifestApplyRequest(manifest=manifest))
+            except HTTPException as e:
+                return e.status_code, e.detail
+            return 200, None
+
+        # When
+        invalid = asyncio.run(status_of(missing_name))
+        broken = asyncio.run(status_of("kind: [unclosed"))
+        empty = asyncio.run(status_of("# no resources\n"))
+
+        # Then
+        assert invalid[0] == 422
+        assert invalid[1]["errors"] == ["#0 ConfigMap/?: metadata.name is required"]
+        assert broken[0] == 400 and empty[0] == 400
+        assert simulator.resources == {}
+
+
+class TestBulkDeploy:
+    """대량 배포 테스트 클래스"""
+
+    TENANTS = [
+        {"tenant_id": "acme", "manifest": _manifest("callbot", "acme-ecp-ai")},
+        {"tenant_id": "broken", "manifest": "kind: [unclosed"},
+        {"tenant_id": "unnamed", "manifest": "apiVersion: v1\nkind: ConfigMap\nmetadata: {}\n"},
+        {"tenant_id": "globex", "manifest": _manifest("chatbot", "globex-ecp-ai")},
+    ]
+
+    def test_tenant_failures_are_isolated(self, simulator, database):
+        """한 테넌트의 YAML 오류/검증 실패가 다른 테넌트 배포에 영향 없음"""
+        # When
+        result = asyncio.run(simulator.deploy_bulk(self.TENANTS, concurrency=2, batch_size=1))
+
+        # Then
+        statuses = {r["tenant_id"]: r["status"] for r in result["results"]}
+        assert statuses == {"acme": "success", "broken": "invalid", "unnamed": "invalid", "globex": "success"}
+        assert (result["succeeded"], result["failed"]) == (2, 2)
+        assert result["deployed_resources"] == result["persisted_resources"] == 4
+        assert sorted(simulator.namespace_index) == ["acme-ecp-ai", "globex-ecp-ai"]
+        assert _row_count(database) == 4
+
+    def test_rows_persisted_before_completions_start(self, simulator, database, monkeypatch):
+        """배포 완료 처리는 모든 행이 배치 저장된 뒤 한 번 시작"""
+        # Given
+        rows_at_start = []
+        monkeypatch.setattr(simulator, "_start_completions", lambda resources: rows_at_start.append(
+            (_row_count(database), len(list(resources)))))
+
+        # When
+        asyncio.run(simulator.deploy_bulk(self.TENANTS, batch_size=3))
+
+        # Then
+        assert rows_at_start == [(4, 4)]
+
+    def test_option_bounds(self):
+        """concurrency 1..64, batch_size 1..5000 범위 밖은 거부"""
+        tenants = [{"tenant_id": "acme", "manifest": _manifest("callbot")}]
+
+        assert BulkDeployRequest(tenants=tenants, concurrency=64, batch_size=5000).concurrency == 64
+        for options in ({"concurrency": 0}, {"concurrency": 65}, {"batch_size": 0}, {"batch_size": 5001}):
+            with pytest.raises(ValidationError):
+                BulkDeployRequest(tenants=tenants, **options)
+
+
+class TestBulkRoutes:
+    """/manifest/bulk, /manifest/bulk/ndjson 라우트 테스트 클래스"""
+
+    def test_bulk_json(self, simulator):
+        """JSON 대량 배포는 테넌트별 결과 반환, 빈 목록은 400, 범위 밖 옵션은 422"""
+        client = TestClient(main.app)
+
+        response = client.post("/k8s/manifest/bulk", json={"tenants": TestBulkDeploy.TENANTS[:2]})
+
+        assert response.status_code == 200
+        assert [r["status"] for r in response.json()["results"]] == ["success", "invalid"]
+        assert client.post("/k8s/manifest/bulk", json={"tenants": []}).status_code == 400
+        assert client.post("/k8s/manifest/bulk", json={"tenants": TestBulkDeploy.TENANTS,
+                                                       "concurrency": 100}).status_code == 422
+
+    def test_ndjson_lines(self, simulator):
+        """빈 줄은 건너뛰고 한 줄에 테넌트 하나, 테넌트 예외는 해당 테넌트만 failed"""
+        # Given
+        lines = [json.dumps(TestBulkDeploy.TENANTS[0]), "", json.dumps({"tenant_id": "numeric", "manifest": 123}),
+                 json.dumps({"manifest": _manifest("advisor", "initech-ecp-ai")})]
+
+        # When
+        response = TestClient(main.app).post("/k8s/manifest/bulk/ndjson?concurrency=2", content="\n".join(lines))
+
+        # Then
+        assert response.status_code == 200
+        body = response.json()
+        assert [(r["tenant_id"], r["status"]) for r in body["results"]] == [
+            ("acme", "success"), ("numeric", "failed"), ("tenant-2", "success")]
+        assert body["concurrency"] == 2 and body["deployed_resources"] == 4
+
+    def test_ndjson_bad_line(self, simulator):
+        """JSON이 아닌 줄/manifest 없는 줄은 줄 번호와 함께 400, 아무것도 배포하지 않음"""
+        # Given
+        client = TestClient(main.app)
+        good = json.dumps(TestBulkDeploy.TENANTS[0])
+
+        # When
+        invalid_json = client.post("/k8s/manifest/bulk/ndjson", content=f"{good}\n{{not json\n")
+        missing_manifest = client.post("/k8s/manifest/bulk/ndjson", content=f'{good}\n\n{{"tenant_id": "x"}}\n')
+        out_of_range = client.post("/k8s/manifest/bulk/ndjson?batch_size=0", content=good)
+
+        # Then
+        assert invalid_json.status_code == 400 and "line 2" in invalid_json.json()["detail"]
+        assert missing_manifest.status_code == 400 and missing_manifest.json()["detail"].startswith("Line 3")
+        assert out_of_range.status_code == 422
+        assert simulator.resources == {}
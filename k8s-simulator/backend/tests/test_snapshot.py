@@ -0,0 +1,167 @@
+# [advice from AI] K8S Simulator 상태 스냅샷/웜 스타트 테스트
+"""
+스냅샷 테스트 (임시 SQLite 파일)
+- msgpack / JSON 폴백 인코딩 왕복
+- 스냅샷 이후 DB가 변경됐으면 DB에서 복원 (오래된 스냅샷 무시)
+- 웜 스타트 후 네임스페이스 인덱스와 모니터링 서비스 재구성
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import sys
+sys.path.append('/app')
+from core import k8s_simulator as simulator_module
+from core import snapshot
+from core.database import Base, K8sResource
+from core.k8s_simulator import K8sSimulator
+from core.monitoring_engine import MonitoringEngine
+from core.snapshot import SnapshotStore, build_snapshot, warm_start
+
+
+def _resource(name: str, namespace: str, kind: str = "Deployment"):
+    return {
+        "id": f"{namespace}/{kind}/{name}",
+        "name": name,
+        "namespace": namespace,
+        "kind": kind,
+        "status": "Running",
+        "manifest": {"kind": kind, "metadata": {"name": name, "namespace": namespace}},
+        "created_at": "2026-01-01T00:00:00"
+    }
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    """시뮬레이터 DB를 임시 SQLite 파일로 교체"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'simulator.db'}")
+    Base.metadata.create_all(engine, tables=[K8sResource.__table__])
+    session_factory = sessionmaker(bind=engine)
+
+    def get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(simulator_module, "get_db", get_db)
+    yield session_factory
+    engine.dispose()
+
+
+def _insert_rows(session_factory, resources):
+    with session_factory() as db:
+        db.add_all([K8sResource(name=r["name"], namespace=r["namespace"], kind=r["kind"],
+                                status=r["status"], manifest=r["manifest"]) for r in resources])
+        db.commit()
+
+
+class TestSnapshotEncoding:
+    """스냅샷 인코딩 테스트 클래스"""
+
+    STATE = {"schema_version": snapshot.SNAPSHOT_SCHEMA_VERSION, "state_version": 3,
+             "db_watermark": {"rows": 1, "max_id": 1, "max_updated_at": None},
+             "resources": [_resource("callbot", "acme-ecp-ai")]}
+
+    @pytest.mark.skipif(not snapshot.HAS_MSGPACK, reason="msgpack 미설치")
+    def test_msgpack_round_trip(self, tmp_path):
+        """msgpack 스냅샷 저장/로드 왕복"""
+        store = SnapshotStore(str(tmp_path / "snapshot.bin"))
+
+        stats = store.save(self.STATE)
+
+        assert stats["format"] == "msgpack"
+        assert store.load() == self.STATE
+
+    def test_json_fallback_round_trip(self, tmp_path, monkeypatch):
+        """msgpack이 없으면 JSON으로 저장, 헤더 포맷으로 판별해 로드"""
+        # Given
+        monkeypatch.setattr(snapshot, "HAS_MSGPACK", False)
+        store = SnapshotStore(str(tmp_path / "snapshot.bin"))
+
+        # When
+        stats = store.save(self.STATE)
+        data = (tmp_path / "snapshot.bin").read_bytes()
+
+        # Then
+        assert stats["format"] == "json"
+        assert data[len(snapshot.SNAPSHOT_MAGIC)] == snapshot.FORMAT_JSON
+        assert store.load() == self.STATE
+
+    def test_rejects_foreign_and_old_snapshots(self, tmp_path, monkeypatch):
+        """형식이 다른 파일은 오류, 이전 스키마 버전 스냅샷은 무시"""
+        monkeypatch.setattr(snapshot, "HAS_MSGPACK", False)
+        store = SnapshotStore(str(tmp_path / "snapshot.bin"))
+
+        with pytest.raises(ValueError):
+            store.decode(b"not a snapshot")
+
+        store.save({**self.STATE, "schema_version": 1})
+        assert store.load() is None
+
+
+class TestWarmStart:
+    """웜 스타트 테스트 클래스"""
+
+    def test_warm_start_rebuilds_indexes_and_services(self, database, tmp_path, monkeypatch):
+        """DB와 일치하는 스냅샷에서 복원 후 네임스페이스 인덱스/모니터링 서비스 재구성"""
+        # Given
+        monkeypatch.setattr(snapshot, "HAS_MSGPACK", False)
+        resources = [_resource("callbot", "acme-ecp-ai"), _resource("callbot-svc", "acme-ecp-ai", "Service"),
+                     _resource("advisor", "globex-ecp-ai")]
+        _insert_rows(database, resources)
+        source = K8sSimulator()
+        store = SnapshotStore(str(tmp_path / "snapshot.bin"))
+
+        async def scenario():
+            source.restore_resources(resources)
+            store.save(build_snapshot(source, await source.db_watermark()))
+            simulator, engine = K8sSimulator(), MonitoringEngine()
+            return simulator, engine, await warm_start(simulator, engine, store)
+
+        # When
+        simulator, engine, stats = asyncio.run(scenario())
+
+        # Then
+        assert stats["source"] == "snapshot"
+        assert stats["resources"] == 3 and stats["namespaces"] == 2
+        assert simulator.namespace_index == {
+            "acme-ecp-ai": {"acme-ecp-ai/Deployment/callbot", "acme-ecp-ai/Service/callbot-svc"},
+            "globex-ecp-ai": {"globex-ecp-ai/Deployment/advisor"},
+        }
+        assert sorted(engine.services) == ["advisor", "callbot"]
+        assert stats["monitored_services"] == 2
+
+    def test_stale_snapshot_falls_back_to_database(self, database, tmp_path, monkeypatch):
+        """스냅샷 이후 DB에 배포/삭제가 반영됐으면 스냅샷 대신 DB에서 복원"""
+        # Given - 스냅샷 시점에는 callbot만 존재
+        monkeypatch.setattr(snapshot, "HAS_MSGPACK", False)
+        callbot, advisor = _resource("callbot", "acme-ecp-ai"), _resource("advisor", "acme-ecp-ai")
+        _insert_rows(database, [callbot])
+        store = SnapshotStore(str(tmp_path / "snapshot.bin"))
+
+        async def scenario():
+            source = K8sSimulator()
+            source.restore_resources([callbot])
+            store.save(build_snapshot(source, await source.db_watermark()))
+
+            # 스냅샷 이후 advisor 배포, callbot 삭제 (DB에는 반영, 스냅샷은 그대로)
+            source.restore_resources([callbot, advisor])
+            await source._store_resources_in_db([advisor])
+            await source.delete_resource("callbot", "acme-ecp-ai", "Deployment")
+
+            simulator = K8sSimulator()
+            return simulator, await warm_start(simulator, MonitoringEngine(), store)
+
+        # When
+        simulator, stats = asyncio.run(scenario())
+
+        # Then
+        assert stats["source"] == "database"
+        assert "stale_snapshot_created_at" in stats
+        assert sorted(simulator.resources) == ["acme-ecp-ai/Deployment/advisor"]
+        assert simulator.namespace_index == {"acme-ecp-ai": {"acme-ecp-ai/Deployment/advisor"}}
@@ -0,0 +1,167 @@
+# [advice from AI] K8S Simulator 트레이스 재생 테스트
+"""
+트레이스 재생 테스트
+- CSV(long/wide) / JSON 트레이스 파싱
+- 같은 시드는 같은 result_digest, 다른 시드는 다른 result_digest
+- 볼륨 급증 시 HPA 스케일 아웃 기록
+- 일괄 재생 중 이벤트 루프 양보, 장애 복구 태스크 미생성
+- 재생 중 백그라운드 모니터링 주기는 tick_seconds, 재생이 끝나면 기본 주기
+- 요청의 tick_seconds 범위 검증
+"""
+
+import asyncio
+import json
+
+import pytest
+from pydantic import ValidationError
+
+import sys
+sys.path.append('/app')
+from api.routes import ReplayRequest
+from core.monitoring_engine import MonitoringEngine
+from core.trace_replay import LoadTrace, parse_trace
+
+
+TRACE_CSV = "timestamp,service,volume\n0,callbot,10\n60,callbot,30\n"
+
+
+def _replay_engine(volumes, interval: int = 60) -> MonitoringEngine:
+    """callbot Deployment(레플리카 2) 하나와 분 단위 볼륨 트레이스를 가진 엔진"""
+    engine = MonitoringEngine()
+    engine.services = {"callbot": engine._create_service_config_from_resource(
+        {"kind": "Deployment", "spec": {"replicas": 2}}
+    )}
+    engine.load_trace(LoadTrace.from_json(json.dumps(
+        {"interval_seconds": interval, "series": {"callbot": volumes}}
+    )))
+    return engine
+
+
+class TestTraceParsing:
+    """트레이스 파싱 테스트 클래스"""
+
+    def test_csv_long_and_wide(self):
+        """long(timestamp,service,volume)과 wide(서비스별 컬럼) 형식은 같은 시계열"""
+        long_csv = ("timestamp,service,volume\n"
+                    "2024-05-01T09:00:00,callbot,10\n2024-05-01T09:01:00,callbot,20\n"
+                    "2024-05-01T09:00:00,chatbot,5\n")
+        wide_csv = "timestamp,callbot,chatbot\n2024-05-01T09:00:00,10,5\n2024-05-01T09:01:00,20,\n"
+
+        long_trace, wide_trace = parse_trace(long_csv, "trace.csv"), parse_trace(wide_csv, "trace.csv")
+
+        for trace in (long_trace, wide_trace):
+            assert trace.series == {"callbot": [(0.0, 10.0), (60.0, 20.0)], "chatbot": [(0.0, 5.0)]}
+            assert trace.duration_seconds == 60.0
+            assert trace.volume_at("callbot", 59) == 10.0 and trace.volume_at("callbot", 60) == 20.0
+
+    def test_json_series_and_rows(self):
+        """JSON 간격 시계열과 행 목록 형식"""
+        series = parse_trace(json.dumps({"interval_seconds": 30, "start_time": "2024-05-01T09:00:00",
+                                         "series": {"callbot": [1, 2, 3]}}))
+        rows = parse_trace(json.dumps([{"timestamp": 0, "service": "callbot", "volume": 4},
+                                       {"timestamp": 30, "service": "callbot", "volume": 8}]), "trace.json")
+
+        assert series.series == {"callbot": [(0.0, 1.0), (30.0, 2.0), (60.0, 3.0)]}
+        assert series.start_time.isoformat() == "2024-05-01T09:00:00"
+        assert rows.series == {"callbot": [(0.0, 4.0), (30.0, 8.0)]}
+
+    def test_invalid_traces(self):
+        """빈 트레이스/혼재된 타임스탬프는 거부"""
+        with pytest.raises(ValueError):
+            parse_trace("timestamp,service,volume\n")
+        with pytest.raises(ValueError):
+            parse_trace("timestamp,service,volume\n0,callbot,1\n2024-05-01T09:00:00,callbot,2\n")
+
+
+class TestReplayRun:
+    """일괄 재생 테스트 클래스"""
+
+    VOLUMES = [10, 12, 11, 60, 80, 75, 20, 10, 12, 11]
+
+    def test_same_seed_same_digest(self):
+        """같은 시드는 같은 결과 다이제스트, 다른 시드는 다른 다이제스트"""
+        # When
+        first = asyncio.run(_replay_engine(self.VOLUMES).run_replay(seed=42, speed=60, tick_seconds=1))
+        second = asyncio.run(_replay_engine(self.VOLUMES).run_replay(seed=42, speed=60, tick_seconds=1))
+        other = asyncio.run(_replay_engine(self.VOLUMES).run_replay(seed=7, speed=60, tick_seconds=1))
+
+        # Then
+        assert first["finished"] is True
+        assert first["ticks_recorded"] == len(self.VOLUMES)
+        assert first["result_digest"] == second["result_digest"]
+        assert first["timeline"] == second["timeline"]
+        assert other["result_digest"] != first["result_digest"]
+
+    def test_hpa_scales_out_on_volume_spike(self):
+        """볼륨 급증 구간에서 HPA 레플리카 증가 후 기본 레플리카로 복귀"""
+        # When
+        report = asyncio.run(_replay_engine(self.VOLUMES).run_replay(seed=42, speed=60, tick_seconds=1))
+        replicas = [point["replicas"]["callbot"] for point in report["timeline"]]
+
+        # Then
+        assert report["scale_events"] >= 2
+        assert report["peak_replicas"]["callbot"] > 2
+        assert max(replicas[3:6]) > max(replicas[:3])
+        assert replicas[-1] < report["peak_replicas"]["callbot"]
+
+    def test_run_yields_to_event_loop_without_incident_tasks(self):
+        """일괄 재생 중에도 다른 태스크가 실행되고, 장애 복구 태스크는 만들지 않음"""
+        # Given - 매 틱 장애 발생
+        engine = _replay_engine([10] * 200, interval=1)
+        for scenario in engine.incident_scenarios:
+            scenario["probability"] = 1.0
+
+        async def scenario():
+            ticks = []
+
+            async def ticker():
+                while True:
+                    ticks.append(1)
+                    await asyncio.sleep(0)
+
+            task = asyncio.create_task(ticker())
+            await asyncio.sleep(0)
+            started = len(ticks)
+            await engine.run_replay(seed=1, speed=1, tick_seconds=1)
+            during = len(ticks) - started
+            task.cancel()
+            others = [t for t in asyncio.all_tasks() if t is not asyncio.current_task() and t is not task]
+            return during, others
+
+        # When
+        during, others = asyncio.run(scenario())
+
+        # Then
+        assert during >= 5
+        assert others == []
+
+
+class TestReplayTick:
+    """재생 주기 테스트 클래스"""
+
+    def test_monitoring_interval_follows_tick_seconds(self):
+        """재생 중에는 tick_seconds 주기, 중지 후에는 기본 주기"""
+        # Given
+        engine = MonitoringEngine()
+        engine.load_trace(LoadTrace.from_csv(TRACE_CSV))
+
+        # When
+        idle = engine.tick_interval(5.0)
+        engine.start_replay(speed=10.0, tick_seconds=1.0)
+        replaying = engine.tick_interval(5.0)
+        step = engine.trace_replayer.step_seconds
+        engine.stop_replay()
+
+        # Then
+        assert idle == 5.0
+        assert replaying == 1.0
+        assert step == 10.0
+        assert engine.tick_interval(5.0) == 5.0
+
+    def test_tick_seconds_bounds(self):
+        """루프가 바쁘게 돌 만큼 짧은 주기나 과도하게 긴 주기는 거부"""
+        assert ReplayRequest(tick_seconds=1.0).tick_seconds == 1.0
+        with pytest.raises(ValidationError):
+            ReplayRequest(tick_seconds=0.01)
+        with pytest.raises(ValidationError):
+            ReplayRequest(tick_seconds=3600)